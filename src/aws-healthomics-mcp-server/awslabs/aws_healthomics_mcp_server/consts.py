@@ -48,6 +48,7 @@ HEALTHOMICS_SUPPORTED_REGIONS = [
 HEALTHOMICS_PRINCIPAL = 'omics.amazonaws.com'
 ECR_REQUIRED_REGISTRY_ACTIONS = ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage']
 ECR_REQUIRED_REPOSITORY_ACTIONS = ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer']
+ECR_CLIENT_MAX_POOL_CONNECTIONS = 32
 
 # Default ECR repository prefixes
 DEFAULT_ECR_PREFIXES = {
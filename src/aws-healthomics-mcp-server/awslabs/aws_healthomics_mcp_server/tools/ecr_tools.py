@@ -14,9 +14,12 @@
 
 """ECR container tools for the AWS HealthOmics MCP server."""
 
+import asyncio
 import botocore
 import botocore.exceptions
 import json
+import re
+import time
 from awslabs.aws_healthomics_mcp_server.consts import (
     DEFAULT_ECR_PREFIXES,
     ECR_REQUIRED_REGISTRY_ACTIONS,
@@ -25,20 +28,30 @@ from awslabs.aws_healthomics_mcp_server.consts import (
 )
 from awslabs.aws_healthomics_mcp_server.models.ecr import (
     UPSTREAM_REGISTRY_URLS,
+    CloneContainerResponse,
     ContainerAvailabilityResponse,
     ContainerImage,
     ECRRepository,
     ECRRepositoryListResponse,
+    GrantAccessResponse,
     HealthOmicsAccessStatus,
     PullThroughCacheListResponse,
     PullThroughCacheRule,
     UpstreamRegistry,
+    ValidationIssue,
+    ValidationResult,
 )
 from awslabs.aws_healthomics_mcp_server.utils.aws_utils import (
+    get_account_id,
+    get_codebuild_client,
     get_ecr_client,
+    get_iam_client,
+    get_region,
 )
 from awslabs.aws_healthomics_mcp_server.utils.ecr_utils import (
+    check_registry_policy_healthomics_access,
     check_repository_healthomics_access,
+    check_repository_template_healthomics_access,
     evaluate_pull_through_cache_healthomics_usability,
     get_pull_through_cache_rule_for_repository,
     initiate_pull_through_cache,
@@ -48,7 +61,8 @@ from datetime import datetime
 from loguru import logger
 from mcp.server.fastmcp import Context
 from pydantic import Field
-from typing import Any, Dict, List, Optional
+from pydantic_core import from_json
+from typing import Any, Dict, List, Optional, Tuple
 
 
 async def list_ecr_repositories(
@@ -106,41 +120,33 @@ async def list_ecr_repositories(
     try:
         response = client.describe_repositories(**params)
 
+        repos = response.get('repositories', [])
+
+        # Look up repository policies concurrently; each lookup is an independent round trip
+        loop = asyncio.get_running_loop()
+        access_results = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    None,
+                    _get_repository_healthomics_access,
+                    client,
+                    repo.get('repositoryName', ''),
+                )
+                for repo in repos
+            ]
+        )
+
         # Process each repository
         repositories: List[ECRRepository] = []
-        for repo in response.get('repositories', []):
+        for repo, (healthomics_accessible, missing_permissions, policy_error) in zip(
+            repos, access_results
+        ):
             repository_name = repo.get('repositoryName', '')
             repository_arn = repo.get('repositoryArn', '')
             repository_uri = repo.get('repositoryUri', '')
             created_at = repo.get('createdAt')
 
-            # Check HealthOmics accessibility by getting the repository policy
-            healthomics_accessible = HealthOmicsAccessStatus.UNKNOWN
-            missing_permissions: List[str] = []
-
-            try:
-                policy_response = client.get_repository_policy(repositoryName=repository_name)
-                policy_text = policy_response.get('policyText')
-                healthomics_accessible, missing_permissions = check_repository_healthomics_access(
-                    policy_text
-                )
-            except botocore.exceptions.ClientError as policy_error:
-                error_code = policy_error.response.get('Error', {}).get('Code', '')
-                if error_code == 'RepositoryPolicyNotFoundException':
-                    # No policy means HealthOmics cannot access the repository
-                    healthomics_accessible = HealthOmicsAccessStatus.NOT_ACCESSIBLE
-                    missing_permissions = list(ECR_REQUIRED_REPOSITORY_ACTIONS)
-                    logger.debug(
-                        f'Repository {repository_name} has no policy, '
-                        'marking as not accessible by HealthOmics'
-                    )
-                else:
-                    # Other errors - mark as unknown
-                    logger.warning(
-                        f'Failed to get policy for repository {repository_name}: '
-                        f'{error_code} - {policy_error.response.get("Error", {}).get("Message", "")}'
-                    )
-                    healthomics_accessible = HealthOmicsAccessStatus.UNKNOWN
+            if policy_error is not None:
                 await ctx.error(f'Failed to get repository policy: {policy_error}')
 
             # Apply filter if requested
@@ -173,6 +179,64 @@ async def list_ecr_repositories(
         return await handle_tool_error(ctx, e, 'Error listing ECR repositories')
 
 
+def _get_repository_healthomics_access(
+    client: Any,
+    repository_name: str,
+) -> Tuple[HealthOmicsAccessStatus, List[str], Optional[botocore.exceptions.ClientError]]:
+    """Determine HealthOmics access to a repository from its repository policy.
+
+    Args:
+        client: boto3 ECR client
+        repository_name: The ECR repository name to check
+
+    Returns:
+        Tuple of (access_status, missing_permissions, policy_error):
+        - access_status: HealthOmicsAccessStatus indicating accessibility
+        - missing_permissions: List of missing permission actions
+        - policy_error: The ClientError raised by get_repository_policy, if any
+    """
+    try:
+        policy_response = client.get_repository_policy(repositoryName=repository_name)
+    except botocore.exceptions.ClientError as policy_error:
+        error_code = policy_error.response.get('Error', {}).get('Code', '')
+        if error_code == 'RepositoryPolicyNotFoundException':
+            # No policy means HealthOmics cannot access the repository
+            logger.debug(
+                f'Repository {repository_name} has no policy, '
+                'marking as not accessible by HealthOmics'
+            )
+            return (
+                HealthOmicsAccessStatus.NOT_ACCESSIBLE,
+                list(ECR_REQUIRED_REPOSITORY_ACTIONS),
+                policy_error,
+            )
+        # Other errors - mark as unknown
+        logger.warning(
+            f'Failed to get policy for repository {repository_name}: '
+            f'{error_code} - {policy_error.response.get("Error", {}).get("Message", "")}'
+        )
+        return HealthOmicsAccessStatus.UNKNOWN, [], policy_error
+
+    healthomics_accessible, missing_permissions = check_repository_healthomics_access(
+        policy_response.get('policyText')
+    )
+    return healthomics_accessible, missing_permissions, None
+
+
+def _has_default_pull_through_cache_prefix(repository_name: str) -> bool:
+    """Check if a repository name starts with one of the default pull-through cache prefixes.
+
+    Args:
+        repository_name: The ECR repository name to check
+
+    Returns:
+        True if the name is under a default pull-through cache prefix, False otherwise
+    """
+    return any(
+        repository_name.startswith(f'{prefix}/') for prefix in DEFAULT_ECR_PREFIXES.values()
+    )
+
+
 def _is_pull_through_cache_repository(
     repository_name: str,
     region_name: str | None = None,
@@ -227,25 +291,16 @@ def _is_pull_through_cache_repository(
                 'Access denied to describe pull-through cache rules, '
                 'falling back to default prefix check'
             )
-            for prefix in DEFAULT_ECR_PREFIXES.values():
-                if repository_name.startswith(f'{prefix}/'):
-                    return True
-            return False
+            return _has_default_pull_through_cache_prefix(repository_name)
         else:
             logger.warning(f'Error checking pull-through cache rules: {e}')
             # Fall back to default prefix check on other errors
-            for prefix in DEFAULT_ECR_PREFIXES.values():
-                if repository_name.startswith(f'{prefix}/'):
-                    return True
-            return False
+            return _has_default_pull_through_cache_prefix(repository_name)
 
     except Exception as e:
         logger.warning(f'Unexpected error checking pull-through cache rules: {e}')
         # Fall back to default prefix check
-        for prefix in DEFAULT_ECR_PREFIXES.values():
-            if repository_name.startswith(f'{prefix}/'):
-                return True
-        return False
+        return _has_default_pull_through_cache_prefix(repository_name)
 
 
 def _check_pull_through_cache_healthomics_usability(
@@ -274,12 +329,7 @@ def _check_pull_through_cache_healthomics_usability(
     """
     client = get_ecr_client(region_name=region_name, profile_name=profile_name)
 
-    result: Dict[str, Any] = {
-        'is_ptc': False,
-        'healthomics_usable': False,
-        'ptc_rule': None,
-        'usability_details': None,
-    }
+    matching_rule: Optional[Dict[str, Any]] = None
 
     try:
         # Get all pull-through cache rules
@@ -301,10 +351,13 @@ def _check_pull_through_cache_healthomics_usability(
         # Find matching rule
         matching_rule = get_pull_through_cache_rule_for_repository(repository_name, ptc_rules)
         if not matching_rule:
-            return result
+            return {
+                'is_ptc': False,
+                'healthomics_usable': False,
+                'ptc_rule': None,
+                'usability_details': None,
+            }
 
-        result['is_ptc'] = True
-        result['ptc_rule'] = matching_rule
         ecr_repository_prefix = matching_rule.get('ecrRepositoryPrefix', '')
 
         # Get registry permissions policy
@@ -338,14 +391,80 @@ def _check_pull_through_cache_healthomics_usability(
             ecr_repository_prefix=ecr_repository_prefix,
         )
 
-        result['healthomics_usable'] = usability['healthomics_usable']
-        result['usability_details'] = usability
-
-        return result
+        return {
+            'is_ptc': True,
+            'healthomics_usable': usability['healthomics_usable'],
+            'ptc_rule': matching_rule,
+            'usability_details': usability,
+        }
 
     except Exception as e:
         logger.warning(f'Error checking pull-through cache HealthOmics usability: {e}')
-        return result
+        return {
+            'is_ptc': matching_rule is not None,
+            'healthomics_usable': False,
+            'ptc_rule': matching_rule,
+            'usability_details': None,
+        }
+
+
+def _build_image_available_response(
+    repository_name: str,
+    image_tag: Optional[str],
+    image_detail: Dict[str, Any],
+    is_ptc: bool,
+    healthomics_accessible: HealthOmicsAccessStatus,
+    missing_permissions: List[str],
+) -> ContainerAvailabilityResponse:
+    """Assemble the availability response for an image found in ECR.
+
+    This performs no AWS calls; callers gather the image detail and access status first.
+
+    Args:
+        repository_name: The ECR repository name
+        image_tag: The requested image tag, if any
+        image_detail: The image entry returned by describe_images
+        is_ptc: Whether the repository is a pull-through cache repository
+        healthomics_accessible: HealthOmics access status from the repository policy
+        missing_permissions: Permissions HealthOmics is missing, if any
+
+    Returns:
+        ContainerAvailabilityResponse describing the available image
+    """
+    digest = image_detail.get('imageDigest', '')
+
+    # Get the tag - use the requested tag or the first available tag
+    tags = image_detail.get('imageTags', [])
+    tag = image_tag if image_tag in tags else (tags[0] if tags else None)
+
+    container_image = ContainerImage(
+        repository_name=repository_name,
+        image_tag=tag,
+        image_digest=digest,
+        image_size_bytes=image_detail.get('imageSizeInBytes'),
+        pushed_at=image_detail.get('imagePushedAt'),
+        exists=True,
+    )
+
+    # Build message based on availability and accessibility
+    message = f'Image found: {repository_name}:{tag or digest}'
+    if healthomics_accessible == HealthOmicsAccessStatus.NOT_ACCESSIBLE:
+        message += (
+            '. WARNING: HealthOmics cannot access this image - missing permissions: '
+            + ', '.join(missing_permissions)
+        )
+    elif healthomics_accessible == HealthOmicsAccessStatus.UNKNOWN:
+        message += '. HealthOmics accessibility could not be determined.'
+
+    return ContainerAvailabilityResponse(
+        available=True,
+        image=container_image,
+        repository_exists=True,
+        is_pull_through_cache=is_ptc,
+        healthomics_accessible=healthomics_accessible,
+        missing_permissions=missing_permissions,
+        message=message,
+    )
 
 
 async def check_container_availability(
@@ -437,11 +556,6 @@ async def check_container_availability(
                 message='Invalid image digest format. Must start with "sha256:"',
             ).model_dump()
 
-    # Detect if this is a pull-through cache repository
-    is_ptc = _is_pull_through_cache_repository(
-        repository_name, region_name=aws_region, profile_name=aws_profile
-    )
-
     client = get_ecr_client(region_name=aws_region, profile_name=aws_profile)
 
     # Build image identifier for describe_images API
@@ -451,81 +565,47 @@ async def check_container_availability(
     else:
         image_ids.append({'imageTag': image_tag})
 
+    # Detect if this is a pull-through cache repository while the image lookup runs;
+    # the two calls are independent round trips
+    loop = asyncio.get_running_loop()
+    is_ptc, describe_images_result = await asyncio.gather(
+        loop.run_in_executor(
+            None, _is_pull_through_cache_repository, repository_name, aws_region, aws_profile
+        ),
+        loop.run_in_executor(
+            None,
+            lambda: client.describe_images(
+                repositoryName=repository_name,
+                imageIds=image_ids,
+            ),
+        ),
+        return_exceptions=True,
+    )
+
+    if isinstance(is_ptc, BaseException):
+        logger.warning(f'Unexpected error checking pull-through cache rules: {is_ptc}')
+        is_ptc = _has_default_pull_through_cache_prefix(repository_name)
+
     try:
-        response = client.describe_images(
-            repositoryName=repository_name,
-            imageIds=image_ids,
-        )
+        if isinstance(describe_images_result, BaseException):
+            raise describe_images_result
+        response = describe_images_result
 
         # Process the image details
         image_details = response.get('imageDetails', [])
         if image_details:
-            image_detail = image_details[0]
-
-            # Extract image information
-            digest = image_detail.get('imageDigest', '')
-            size_bytes = image_detail.get('imageSizeInBytes')
-            pushed_at = image_detail.get('imagePushedAt')
-
-            # Get the tag - use the requested tag or the first available tag
-            tags = image_detail.get('imageTags', [])
-            tag = image_tag if image_tag in tags else (tags[0] if tags else None)
-
-            container_image = ContainerImage(
-                repository_name=repository_name,
-                image_tag=tag,
-                image_digest=digest,
-                image_size_bytes=size_bytes,
-                pushed_at=pushed_at,
-                exists=True,
-            )
-
             # Check HealthOmics accessibility by getting the repository policy
-            healthomics_accessible = HealthOmicsAccessStatus.UNKNOWN
-            missing_permissions: List[str] = []
-
-            try:
-                policy_response = client.get_repository_policy(repositoryName=repository_name)
-                policy_text = policy_response.get('policyText')
-                healthomics_accessible, missing_permissions = check_repository_healthomics_access(
-                    policy_text
-                )
-            except botocore.exceptions.ClientError as policy_error:
-                error_code = policy_error.response.get('Error', {}).get('Code', '')
-                if error_code == 'RepositoryPolicyNotFoundException':
-                    # No policy means HealthOmics cannot access the repository
-                    healthomics_accessible = HealthOmicsAccessStatus.NOT_ACCESSIBLE
-                    missing_permissions = list(ECR_REQUIRED_REPOSITORY_ACTIONS)
-                    logger.debug(
-                        f'Repository {repository_name} has no policy, '
-                        'marking as not accessible by HealthOmics'
-                    )
-                else:
-                    # Other errors - mark as unknown
-                    logger.warning(
-                        f'Failed to get policy for repository {repository_name}: '
-                        f'{error_code} - {policy_error.response.get("Error", {}).get("Message", "")}'
-                    )
-                    healthomics_accessible = HealthOmicsAccessStatus.UNKNOWN
-
-            # Build message based on availability and accessibility
-            message = f'Image found: {repository_name}:{tag or digest}'
-            if healthomics_accessible == HealthOmicsAccessStatus.NOT_ACCESSIBLE:
-                message += (
-                    '. WARNING: HealthOmics cannot access this image - missing permissions: '
-                    + ', '.join(missing_permissions)
-                )
-            elif healthomics_accessible == HealthOmicsAccessStatus.UNKNOWN:
-                message += '. HealthOmics accessibility could not be determined.'
+            healthomics_accessible, missing_permissions, _ = _get_repository_healthomics_access(
+                client, repository_name
+            )
 
-            return ContainerAvailabilityResponse(
-                available=True,
-                image=container_image,
-                repository_exists=True,
-                is_pull_through_cache=is_ptc,
-                healthomics_accessible=healthomics_accessible,
-                missing_permissions=missing_permissions,
-                message=message,
+            return _build_image_available_response(
+                repository_name,
+                image_tag,
+                image_details[0],
+                is_ptc,
+                healthomics_accessible,
+                missing_permissions,
             ).model_dump()
         else:
             # No image details returned - image not found
@@ -692,6 +772,98 @@ async def check_container_availability(
         return await handle_tool_error(ctx, e, 'Error checking container availability')
 
 
+def _describe_repository_creation_templates(
+    client: Any,
+    prefixes: List[str],
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch every page of repository creation templates for the given prefixes.
+
+    Args:
+        client: boto3 ECR client
+        prefixes: Non-empty ECR repository prefixes to look up
+
+    Returns:
+        Mapping of prefix to its repository creation template
+
+    Raises:
+        botocore.exceptions.ClientError: If the lookup fails
+    """
+    templates: Dict[str, Dict[str, Any]] = {}
+    params: Dict[str, Any] = {'prefixes': prefixes}
+    while True:
+        response = client.describe_repository_creation_templates(**params)
+        for template in response.get('repositoryCreationTemplates', []):
+            templates[template.get('prefix', '')] = template
+
+        next_token = response.get('nextToken')
+        if not next_token:
+            return templates
+        params['nextToken'] = next_token
+
+
+def _log_template_lookup_error(
+    template_error: botocore.exceptions.ClientError, prefix: str
+) -> None:
+    """Log a failed repository creation template lookup for a single prefix.
+
+    Args:
+        template_error: The error raised by describe_repository_creation_templates
+        prefix: ECR repository prefix that was looked up
+    """
+    error_code = template_error.response.get('Error', {}).get('Code', '')
+    if error_code == 'TemplateNotFoundException':
+        logger.debug(f'No repository creation template found for prefix: {prefix}')
+    else:
+        logger.warning(
+            f'Failed to get repository creation template for {prefix}: {error_code} - '
+            f'{template_error.response.get("Error", {}).get("Message", "")}'
+        )
+
+
+def _get_repository_creation_templates(
+    client: Any,
+    prefixes: List[str],
+) -> Dict[str, Dict[str, Any]]:
+    """Look up the repository creation templates for several prefixes.
+
+    describe_repository_creation_templates accepts a list of prefixes, so templates
+    for every pull-through cache rule are first requested together. If that request
+    fails, each prefix is looked up on its own so one missing template, a throttled
+    call or an invalid prefix does not hide the templates of the other rules.
+
+    Args:
+        client: boto3 ECR client
+        prefixes: ECR repository prefixes to look up; empty prefixes are skipped
+
+    Returns:
+        Mapping of prefix to its repository creation template. Prefixes without a
+        template, or whose own lookup failed, are absent.
+    """
+    unique_prefixes = [prefix for prefix in dict.fromkeys(prefixes) if prefix]
+    if not unique_prefixes:
+        return {}
+
+    try:
+        return _describe_repository_creation_templates(client, unique_prefixes)
+    except botocore.exceptions.ClientError as batch_error:
+        if len(unique_prefixes) == 1:
+            _log_template_lookup_error(batch_error, unique_prefixes[0])
+            return {}
+        logger.debug(
+            'Batched repository creation template lookup failed '
+            f'({batch_error.response.get("Error", {}).get("Code", "")}); '
+            'looking up each prefix separately'
+        )
+
+    templates: Dict[str, Dict[str, Any]] = {}
+    for prefix in unique_prefixes:
+        try:
+            templates.update(_describe_repository_creation_templates(client, [prefix]))
+        except botocore.exceptions.ClientError as template_error:
+            _log_template_lookup_error(template_error, prefix)
+    return templates
+
+
 async def list_pull_through_cache_rules(
     ctx: Context,
     max_results: int = Field(
@@ -771,6 +943,11 @@ async def list_pull_through_cache_rules(
                 )
                 registry_policy_text = None
 
+        # Get the repository creation templates for every rule's prefix in one request
+        templates = _get_repository_creation_templates(
+            client, [ptc_rule.get('ecrRepositoryPrefix', '') for ptc_rule in ptc_rules]
+        )
+
         # Process each pull-through cache rule
         rules: List[PullThroughCacheRule] = []
         for ptc_rule in ptc_rules:
@@ -780,30 +957,11 @@ async def list_pull_through_cache_rules(
             created_at = ptc_rule.get('createdAt')
             updated_at = ptc_rule.get('updatedAt')
 
-            # Get repository creation template for this prefix
-            template_policy_text: Optional[str] = None
-            try:
-                template_response = client.describe_repository_creation_templates(
-                    prefixes=[ecr_repository_prefix]
-                )
-                templates = template_response.get('repositoryCreationTemplates', [])
-                if templates:
-                    # Get the applied policy from the template
-                    template = templates[0]
-                    template_policy_text = template.get('repositoryPolicy')
-            except botocore.exceptions.ClientError as template_error:
-                error_code = template_error.response.get('Error', {}).get('Code', '')
-                if error_code == 'TemplateNotFoundException':
-                    logger.debug(
-                        f'No repository creation template found for prefix: {ecr_repository_prefix}'
-                    )
-                    template_policy_text = None
-                else:
-                    logger.warning(
-                        f'Failed to get repository creation template for {ecr_repository_prefix}: '
-                        f'{error_code} - {template_error.response.get("Error", {}).get("Message", "")}'
-                    )
-                    template_policy_text = None
+            # Get the applied policy from the template for this prefix
+            template = templates.get(ecr_repository_prefix)
+            template_policy_text: Optional[str] = (
+                template.get('repositoryPolicy') if template else None
+            )
 
             # Evaluate HealthOmics usability
             usability = evaluate_pull_through_cache_healthomics_usability(
@@ -1128,7 +1286,7 @@ async def _update_registry_policy_for_healthomics(
             policy_response = client.get_registry_policy()
             policy_text = policy_response.get('policyText')
             if policy_text:
-                existing_policy = json.loads(policy_text)
+                existing_policy = from_json(policy_text)
         except botocore.exceptions.ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
             if error_code == 'RegistryPolicyNotFoundException':
@@ -1328,15 +1486,6 @@ async def validate_healthomics_ecr_config(
         - pull_through_caches_checked: Number of pull-through cache rules checked
         - repositories_checked: Number of repositories checked
     """
-    from awslabs.aws_healthomics_mcp_server.models.ecr import (
-        ValidationIssue,
-        ValidationResult,
-    )
-    from awslabs.aws_healthomics_mcp_server.utils.ecr_utils import (
-        check_registry_policy_healthomics_access,
-        check_repository_template_healthomics_access,
-    )
-
     client = get_ecr_client(region_name=aws_region, profile_name=aws_profile)
     issues: List[ValidationIssue] = []
     pull_through_caches_checked = 0
@@ -1441,40 +1590,21 @@ async def validate_healthomics_ecr_config(
                     )
                 )
 
-        # Step 3 & 4: Check repository creation templates for each prefix
+        # Step 3 & 4: Check repository creation templates for each prefix, fetching
+        # the templates for every prefix in one request
+        templates = _get_repository_creation_templates(
+            client, [ptc_rule.get('ecrRepositoryPrefix', '') for ptc_rule in ptc_rules]
+        )
+
         for ptc_rule in ptc_rules:
             ecr_repository_prefix = ptc_rule.get('ecrRepositoryPrefix', '')
             upstream_registry_url = ptc_rule.get('upstreamRegistryUrl', '')
 
             # Get repository creation template for this prefix
-            template_policy_text: Optional[str] = None
-            template_found = False
-
-            try:
-                template_response = client.describe_repository_creation_templates(
-                    prefixes=[ecr_repository_prefix]
-                )
-                templates = template_response.get('repositoryCreationTemplates', [])
-                if templates:
-                    template_found = True
-                    template = templates[0]
-                    template_policy_text = template.get('repositoryPolicy')
-            except botocore.exceptions.ClientError as template_error:
-                error_code = template_error.response.get('Error', {}).get('Code', '')
-                if error_code == 'TemplateNotFoundException':
-                    logger.debug(
-                        f'No repository creation template found for prefix: {ecr_repository_prefix}'
-                    )
-                    template_found = False
-                else:
-                    logger.warning(
-                        f'Failed to get repository creation template for {ecr_repository_prefix}: '
-                        f'{error_code} - {template_error.response.get("Error", {}).get("Message", "")}'
-                    )
-                    template_found = False
+            template = templates.get(ecr_repository_prefix)
 
             # Check template existence
-            if not template_found:
+            if template is None:
                 issues.append(
                     ValidationIssue(
                         severity='error',
@@ -1496,6 +1626,7 @@ async def validate_healthomics_ecr_config(
                 continue
 
             # Check template permissions
+            template_policy_text: Optional[str] = template.get('repositoryPolicy')
             template_exists, template_permission_granted, missing_template_permissions = (
                 check_repository_template_healthomics_access(template_policy_text)
             )
@@ -1613,8 +1744,6 @@ async def grant_healthomics_repository_access(
         - current_healthomics_accessible: Current accessibility status after update
         - message: Human-readable status message
     """
-    from awslabs.aws_healthomics_mcp_server.models.ecr import GrantAccessResponse
-
     # Validate repository name
     if not repository_name or not repository_name.strip():
         await ctx.error('Repository name is required and cannot be empty')
@@ -1635,7 +1764,7 @@ async def grant_healthomics_repository_access(
         policy_response = client.get_repository_policy(repositoryName=repository_name)
         policy_text = policy_response.get('policyText')
         if policy_text:
-            existing_policy = json.loads(policy_text)
+            existing_policy = from_json(policy_text)
             previous_status, _ = check_repository_healthomics_access(policy_text)
     except botocore.exceptions.ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', '')
@@ -1839,8 +1968,6 @@ async def create_container_registry_map(
         - json_output: Pretty-printed JSON string ready for use
         - usage_hint: Instructions for using the generated map
     """
-    from awslabs.aws_healthomics_mcp_server.utils.aws_utils import get_account_id, get_region
-
     # Resolve account ID
     resolved_account_id = ecr_account_id
     if not resolved_account_id:
@@ -1880,15 +2007,15 @@ async def create_container_registry_map(
             )
             rules = ptc_result.get('rules', [])
 
-            for rule in rules:
-                if rule.get('healthomics_usable'):
-                    registry_mappings.append(
-                        {
-                            'upstreamRegistryUrl': rule['upstream_registry_url'],
-                            'ecrRepositoryPrefix': rule['ecr_repository_prefix'],
-                        }
-                    )
-                    discovered_count += 1
+            registry_mappings = [
+                {
+                    'upstreamRegistryUrl': rule['upstream_registry_url'],
+                    'ecrRepositoryPrefix': rule['ecr_repository_prefix'],
+                }
+                for rule in rules
+                if rule.get('healthomics_usable')
+            ]
+            discovered_count = len(registry_mappings)
 
             logger.info(
                 f'Discovered {discovered_count} HealthOmics-usable pull-through cache rules'
@@ -1971,6 +2098,17 @@ REGISTRY_URL_TO_TYPE = {
 }
 
 
+# Image reference grammar: an optional registry (a leading path segment containing
+# '.' or ':'), the repository path, then either '@digest' (split at the last '@')
+# or ':tag' (only within the last path segment)
+_IMAGE_REFERENCE_PATTERN = re.compile(
+    r'(?:(?P<registry>[^/@]*[.:][^/@]*)/)?'
+    r'(?P<repository>.*?)'
+    r'(?:@(?P<digest>[^@]*)|:(?P<tag>[^/:@]*))?',
+    re.DOTALL,
+)
+
+
 def _parse_container_image_reference(image_ref: str) -> Dict[str, Any]:
     """Parse a container image reference into its components.
 
@@ -1991,46 +2129,18 @@ def _parse_container_image_reference(image_ref: str) -> Dict[str, Any]:
         - digest: The image digest (e.g., 'sha256:...') or None
         - full_reference: The fully qualified image reference
     """
-    # Default values
-    registry = 'registry-1.docker.io'
-    repository = ''
-    tag: Optional[str] = None
-    digest: Optional[str] = None
-
-    # Check for digest
-    if '@' in image_ref:
-        ref_part, digest = image_ref.rsplit('@', 1)
-        image_ref = ref_part
-    elif ':' in image_ref:
-        # Check if the colon is for a tag (not a port in registry)
-        parts = image_ref.split('/')
-        if ':' in parts[-1]:
-            # The colon is in the last part, so it's a tag
-            last_part = parts[-1]
-            if ':' in last_part:
-                name, tag = last_part.rsplit(':', 1)
-                parts[-1] = name
-                image_ref = '/'.join(parts)
+    # The pattern accepts any string, so there is always a match
+    match = _IMAGE_REFERENCE_PATTERN.fullmatch(image_ref)
+    explicit_registry, repository, digest, tag = match.groups()  # type: ignore[union-attr]
+    registry = explicit_registry or 'registry-1.docker.io'
 
     # Default tag if neither tag nor digest specified
     if tag is None and digest is None:
         tag = 'latest'
 
-    # Parse registry and repository
-    parts = image_ref.split('/')
-
-    # Check if first part looks like a registry (contains . or :)
-    if len(parts) > 1 and ('.' in parts[0] or ':' in parts[0]):
-        registry = parts[0]
-        repository = '/'.join(parts[1:])
-    elif len(parts) == 1:
-        # Single name like 'ubuntu' -> library/ubuntu on Docker Hub
-        registry = 'registry-1.docker.io'
-        repository = f'library/{parts[0]}'
-    else:
-        # org/image format -> Docker Hub
-        registry = 'registry-1.docker.io'
-        repository = '/'.join(parts)
+    # Single name like 'ubuntu' -> library/ubuntu on Docker Hub
+    if explicit_registry is None and '/' not in repository:
+        repository = f'library/{repository}'
 
     # Normalize docker.io to registry-1.docker.io
     if registry == 'docker.io':
@@ -2134,7 +2244,11 @@ def _get_or_create_codebuild_project(
     try:
         iam_client.get_role(RoleName=role_name)
         logger.debug(f'IAM role {role_name} already exists')
-    except iam_client.exceptions.NoSuchEntityException:
+    except botocore.exceptions.ClientError as e:
+        error_code = e.response.get('Error', {}).get('Code', '')
+        if error_code != 'NoSuchEntity':
+            raise
+
         logger.info(f'Creating IAM role: {role_name}')
 
         # Trust policy for CodeBuild
@@ -2192,8 +2306,6 @@ def _get_or_create_codebuild_project(
         )
 
         # Wait for role to propagate
-        import time
-
         time.sleep(10)
 
     # Create CodeBuild project
@@ -2262,11 +2374,6 @@ async def _copy_image_via_codebuild(
     Returns:
         Dictionary with success status, digest, and message
     """
-    from awslabs.aws_healthomics_mcp_server.utils.aws_utils import (
-        get_codebuild_client,
-        get_iam_client,
-    )
-
     codebuild_client = get_codebuild_client(region_name=region_name, profile_name=profile_name)
     iam_client = get_iam_client(region_name=region_name, profile_name=profile_name)
 
@@ -2297,8 +2404,6 @@ async def _copy_image_via_codebuild(
         logger.info(f'Started CodeBuild build: {build_id}')
 
         # Poll for completion
-        import asyncio
-
         max_wait_seconds = 300  # 5 minutes
         poll_interval = 10
         elapsed = 0
@@ -2452,12 +2557,6 @@ async def clone_container_to_ecr(
         - healthomics_accessible: Whether HealthOmics can access the image
         - message: Human-readable status message
     """
-    from awslabs.aws_healthomics_mcp_server.models.ecr import (
-        CloneContainerResponse,
-        HealthOmicsAccessStatus,
-    )
-    from awslabs.aws_healthomics_mcp_server.utils.aws_utils import get_account_id, get_region
-
     # Validate source image
     if not source_image or not source_image.strip():
         await ctx.error('Source image is required and cannot be empty')
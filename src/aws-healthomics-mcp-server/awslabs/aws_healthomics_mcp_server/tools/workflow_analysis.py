@@ -21,7 +21,65 @@ from datetime import datetime, timezone
 from loguru import logger
 from mcp.server.fastmcp import Context
 from pydantic import Field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+
+def _iso_to_ms(value: str) -> int:
+    """Convert an ISO format time string to CloudWatch epoch milliseconds.
+
+    Args:
+        value: ISO format time string, optionally with a trailing 'Z'
+
+    Returns:
+        Milliseconds since the epoch
+    """
+    # Ensure value is a string before calling replace
+    value_str = str(value) if not isinstance(value, str) else value
+    dt = datetime.fromisoformat(value_str.replace('Z', '+00:00'))
+    return int(dt.timestamp() * 1000)
+
+
+def _ms_to_iso(timestamp_ms: int) -> str:
+    """Convert a CloudWatch epoch-millisecond timestamp to a UTC ISO string.
+
+    Args:
+        timestamp_ms: Timestamp in milliseconds since the epoch
+
+    Returns:
+        ISO format string with a trailing 'Z'
+    """
+    timestamp_dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+    return timestamp_dt.isoformat().replace('+00:00', 'Z')
+
+
+def _project_log_events(
+    raw_events: List[Dict[str, Any]], iso_timestamps: bool = True
+) -> List[Dict[str, Any]]:
+    """Project raw CloudWatch log events down to their timestamp and message.
+
+    Keys such as ``ingestionTime`` are dropped at the boto3 boundary so they are
+    never copied into the tool response.
+
+    Args:
+        raw_events: Events as returned by the CloudWatch Logs API
+        iso_timestamps: Whether to convert timestamps to ISO format (True) or keep
+            them as epoch milliseconds (False)
+
+    Returns:
+        List of events containing only ``timestamp`` and ``message``
+    """
+    if not iso_timestamps:
+        return [
+            {'timestamp': event.get('timestamp', 0), 'message': event.get('message', '')}
+            for event in raw_events
+        ]
+    return [
+        {
+            'timestamp': _ms_to_iso(event.get('timestamp', 0)),
+            'message': event.get('message', ''),
+        }
+        for event in raw_events
+    ]
 
 
 async def _get_logs_from_stream(
@@ -33,6 +91,7 @@ async def _get_logs_from_stream(
     limit: int = 100,
     next_token: Optional[str] = None,
     start_from_head: bool = True,
+    iso_timestamps: bool = True,
 ) -> Dict[str, Any]:
     """Helper function to retrieve logs from a specific CloudWatch log stream.
 
@@ -45,6 +104,7 @@ async def _get_logs_from_stream(
         limit: Maximum number of log events to return
         next_token: Token for pagination
         start_from_head: Whether to start from the beginning (True) or end (False) of the log stream
+        iso_timestamps: Whether to return event timestamps in ISO format (True) or as epoch milliseconds (False)
 
     Returns:
         Dictionary containing log events and next token if available
@@ -60,39 +120,72 @@ async def _get_logs_from_stream(
         params['nextToken'] = next_token
 
     if start_time:
-        # Ensure start_time is a string before calling replace
-        start_time_str = str(start_time) if not isinstance(start_time, str) else start_time
-        start_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-        params['startTime'] = int(start_dt.timestamp() * 1000)
+        params['startTime'] = _iso_to_ms(start_time)
 
     if end_time:
-        # Ensure end_time is a string before calling replace
-        end_time_str = str(end_time) if not isinstance(end_time, str) else end_time
-        end_dt = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-        params['endTime'] = int(end_dt.timestamp() * 1000)
+        params['endTime'] = _iso_to_ms(end_time)
 
     response = client.get_log_events(**params)
 
-    # Transform the response to a more user-friendly format
-    events = []
-    for event in response.get('events', []):
-        # Convert timestamp from milliseconds to UTC ISO format
-        timestamp_ms = event.get('timestamp', 0)
-        timestamp_dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-        events.append(
-            {
-                'timestamp': timestamp_dt.isoformat().replace('+00:00', 'Z'),
-                'message': event.get('message', ''),
-            }
-        )
-
-    result = {'events': events}
+    result = {'events': _project_log_events(response.get('events', []), iso_timestamps)}
     if 'nextForwardToken' in response:
         result['nextToken'] = response['nextForwardToken']
 
     return result
 
 
+async def _filter_logs_by_stream_prefix(
+    client,
+    log_group_name: str,
+    log_stream_name_prefix: str,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    limit: int = 100,
+    next_token: Optional[str] = None,
+    iso_timestamps: bool = True,
+) -> Dict[str, Any]:
+    """Helper function to retrieve logs from all CloudWatch log streams sharing a prefix.
+
+    Events from every matching stream are merged server-side by a single
+    ``filter_log_events`` call, ordered from oldest to newest.
+
+    Args:
+        client: CloudWatch Logs client
+        log_group_name: Name of the log group
+        log_stream_name_prefix: Prefix of the log streams to read
+        start_time: Optional start time for log retrieval (ISO format)
+        end_time: Optional end time for log retrieval (ISO format)
+        limit: Maximum number of log events to return
+        next_token: Token for pagination
+        iso_timestamps: Whether to return event timestamps in ISO format (True) or as epoch milliseconds (False)
+
+    Returns:
+        Dictionary containing log events and next token if available
+    """
+    params = {
+        'logGroupName': log_group_name,
+        'logStreamNamePrefix': log_stream_name_prefix,
+        'limit': limit,
+    }
+
+    if next_token:
+        params['nextToken'] = next_token
+
+    if start_time:
+        params['startTime'] = _iso_to_ms(start_time)
+
+    if end_time:
+        params['endTime'] = _iso_to_ms(end_time)
+
+    response = client.filter_log_events(**params)
+
+    result = {'events': _project_log_events(response.get('events', []), iso_timestamps)}
+    if 'nextToken' in response:
+        result['nextToken'] = response['nextToken']
+
+    return result
+
+
 async def get_run_logs(
     ctx: Context,
     run_id: str = Field(
@@ -121,6 +214,10 @@ async def get_run_logs(
         True,
         description='Whether to start from the beginning (True) or end (False) of the log stream',
     ),
+    iso_timestamps: bool = Field(
+        True,
+        description='Whether to return event timestamps in ISO format (True) or as epoch milliseconds (False)',
+    ),
     aws_profile: Optional[str] = Field(
         None,
         description='AWS profile name for this operation. Overrides the default credential chain.',
@@ -147,6 +244,7 @@ async def get_run_logs(
         limit: Maximum number of log events to return (default: 100)
         next_token: Token for pagination from a previous response
         start_from_head: Whether to start from the beginning (True) or end (False) of the log stream
+        iso_timestamps: Whether to return event timestamps in ISO format (True) or as epoch milliseconds (False)
         aws_profile: Optional AWS profile name override
         aws_region: Optional AWS region override
 
@@ -167,6 +265,7 @@ async def get_run_logs(
             limit,
             next_token,
             start_from_head,
+            iso_timestamps,
         )
     except Exception as e:
         return await handle_tool_error(ctx, e, 'Error retrieving run logs')
@@ -198,33 +297,15 @@ async def _get_run_manifest_logs_internal(
             params['nextToken'] = next_token
 
         if start_time:
-            # Ensure start_time is a string before calling replace
-            start_time_str = str(start_time) if not isinstance(start_time, str) else start_time
-            start_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-            params['startTime'] = int(start_dt.timestamp() * 1000)
+            params['startTime'] = _iso_to_ms(start_time)
 
         if end_time:
-            # Ensure end_time is a string before calling replace
-            end_time_str = str(end_time) if not isinstance(end_time, str) else end_time
-            end_dt = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-            params['endTime'] = int(end_dt.timestamp() * 1000)
+            params['endTime'] = _iso_to_ms(end_time)
 
         response = client.get_log_events(**params)
 
-        # Transform the response to a more user-friendly format
-        events = []
-        for event in response.get('events', []):
-            timestamp_ms = event.get('timestamp', 0)
-            timestamp_dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-            events.append(
-                {
-                    'timestamp': timestamp_dt.isoformat().replace('+00:00', 'Z'),
-                    'message': event.get('message', ''),
-                }
-            )
-
         return {
-            'events': events,
+            'events': _project_log_events(response.get('events', [])),
             'nextForwardToken': response.get('nextForwardToken'),
             'nextBackwardToken': response.get('nextBackwardToken'),
         }
@@ -274,6 +355,10 @@ async def get_run_manifest_logs(
         True,
         description='Whether to start from the beginning (True) or end (False) of the log stream',
     ),
+    iso_timestamps: bool = Field(
+        True,
+        description='Whether to return event timestamps in ISO format (True) or as epoch milliseconds (False)',
+    ),
     aws_profile: Optional[str] = Field(
         None,
         description='AWS profile name for this operation. Overrides the default credential chain.',
@@ -294,12 +379,15 @@ async def get_run_manifest_logs(
     Args:
         ctx: MCP context for error reporting
         run_id: ID of the run
-        run_uuid: Optional UUID of the run
+        run_uuid: Optional UUID of the run. When omitted, events from every
+            manifest/run/{run_id}/ stream (HealthOmics names manifest streams by run ID
+            and UUID) are merged oldest first, so start_from_head must be True
         start_time: Optional start time for log retrieval (ISO format)
         end_time: Optional end time for log retrieval (ISO format)
         limit: Maximum number of log events to return (default: 100)
         next_token: Token for pagination from a previous response
         start_from_head: Whether to start from the beginning (True) or end (False) of the log stream
+        iso_timestamps: Whether to return event timestamps in ISO format (True) or as epoch milliseconds (False)
         aws_profile: Optional AWS profile name override
         aws_region: Optional AWS region override
 
@@ -308,17 +396,32 @@ async def get_run_manifest_logs(
     """
     client = get_logs_client(region_name=aws_region, profile_name=aws_profile)
     log_group_name = '/aws/omics/WorkflowLog'
-    log_stream_name = f'manifest/run/{run_id}/{run_uuid}' if run_uuid else f'manifest/run/{run_id}'
     try:
+        if not run_uuid:
+            # filter_log_events can only read forwards, so a tail read needs the exact stream
+            if not start_from_head:
+                raise ValueError('start_from_head=False requires run_uuid for manifest logs')
+            # Without the UUID, read every manifest stream for the run in one call
+            return await _filter_logs_by_stream_prefix(
+                client,
+                log_group_name,
+                f'manifest/run/{run_id}/',
+                start_time,
+                end_time,
+                limit,
+                next_token,
+                iso_timestamps,
+            )
         return await _get_logs_from_stream(
             client,
             log_group_name,
-            log_stream_name,
+            f'manifest/run/{run_id}/{run_uuid}',
             start_time,
             end_time,
             limit,
             next_token,
             start_from_head,
+            iso_timestamps,
         )
     except Exception as e:
         return await handle_tool_error(ctx, e, 'Error retrieving manifest logs')
@@ -352,6 +455,10 @@ async def get_run_engine_logs(
         True,
         description='Whether to start from the beginning (True) or end (False) of the log stream',
     ),
+    iso_timestamps: bool = Field(
+        True,
+        description='Whether to return event timestamps in ISO format (True) or as epoch milliseconds (False)',
+    ),
     aws_profile: Optional[str] = Field(
         None,
         description='AWS profile name for this operation. Overrides the default credential chain.',
@@ -377,6 +484,7 @@ async def get_run_engine_logs(
         limit: Maximum number of log events to return (default: 100)
         next_token: Token for pagination from a previous response
         start_from_head: Whether to start from the beginning (True) or end (False) of the log stream
+        iso_timestamps: Whether to return event timestamps in ISO format (True) or as epoch milliseconds (False)
         aws_profile: Optional AWS profile name override
         aws_region: Optional AWS region override
 
@@ -397,6 +505,7 @@ async def get_run_engine_logs(
             limit,
             next_token,
             start_from_head,
+            iso_timestamps,
         )
     except Exception as e:
         return await handle_tool_error(ctx, e, 'Error retrieving engine logs')
@@ -434,6 +543,10 @@ async def get_task_logs(
         True,
         description='Whether to start from the beginning (True) or end (False) of the log stream',
     ),
+    iso_timestamps: bool = Field(
+        True,
+        description='Whether to return event timestamps in ISO format (True) or as epoch milliseconds (False)',
+    ),
     aws_profile: Optional[str] = Field(
         None,
         description='AWS profile name for this operation. Overrides the default credential chain.',
@@ -459,6 +572,7 @@ async def get_task_logs(
         limit: Maximum number of log events to return (default: 100)
         next_token: Token for pagination from a previous response
         start_from_head: Whether to start from the beginning (True) or end (False) of the log stream
+        iso_timestamps: Whether to return event timestamps in ISO format (True) or as epoch milliseconds (False)
         aws_profile: Optional AWS profile name override
         aws_region: Optional AWS region override
 
@@ -479,6 +593,7 @@ async def get_task_logs(
             limit,
             next_token,
             start_from_head,
+            iso_timestamps,
         )
     except Exception as e:
         return await handle_tool_error(ctx, e, 'Error retrieving task logs')
@@ -501,13 +616,12 @@ async def get_run_manifest_logs_internal(
     """Internal wrapper for get_run_manifest_logs without Pydantic Field decorators."""
     client = get_logs_client(region_name=region_name, profile_name=profile_name)
     log_group_name = '/aws/omics/WorkflowLog'
-    log_stream_name = f'manifest/run/{run_id}/{run_uuid}' if run_uuid else f'manifest/run/{run_id}'
 
     try:
         return await _get_logs_from_stream(
             client,
             log_group_name,
-            log_stream_name,
+            f'manifest/run/{run_id}/{run_uuid}',
             start_time,
             end_time,
             limit,
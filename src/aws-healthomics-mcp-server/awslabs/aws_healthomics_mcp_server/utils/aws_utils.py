@@ -25,7 +25,9 @@ from awslabs.aws_healthomics_mcp_server.consts import (
     AGENT_ENV,
     DEFAULT_OMICS_SERVICE_NAME,
     DEFAULT_REGION,
+    ECR_CLIENT_MAX_POOL_CONNECTIONS,
 )
+from botocore.config import Config
 from functools import lru_cache
 from loguru import logger
 from typing import Any, Dict
@@ -211,6 +213,7 @@ def create_aws_client(
     service_name: str,
     region_name: str | None = None,
     profile_name: str | None = None,
+    config: Config | None = None,
 ) -> Any:
     """Generic AWS client factory for any service.
 
@@ -218,6 +221,7 @@ def create_aws_client(
         service_name: Name of the AWS service (e.g., 'omics', 'logs', 's3')
         region_name: Optional region override
         profile_name: Optional AWS profile override
+        config: Optional botocore client configuration
 
     Returns:
         boto3.client: Configured AWS service client
@@ -227,7 +231,7 @@ def create_aws_client(
     """
     session = get_aws_session(region_name=region_name, profile_name=profile_name)
     try:
-        return session.client(service_name)
+        return session.client(service_name, config=config)
     except Exception as e:
         logger.error(
             f'Failed to create {service_name} client in region {region_name or get_region()}: {str(e)}'
@@ -309,7 +313,10 @@ def get_ecr_client(
     region_name: str | None = None,
     profile_name: str | None = None,
 ) -> Any:
-    """Get an AWS ECR client.
+    """Get an AWS ECR client (cached by region/profile).
+
+    ECR tools often request a client several times per invocation, so clients are
+    reused for the same resolved region and profile.
 
     Args:
         region_name: Optional region override
@@ -321,7 +328,34 @@ def get_ecr_client(
     Raises:
         Exception: If client creation fails
     """
-    return create_aws_client('ecr', region_name=region_name, profile_name=profile_name)
+    # Handle FieldInfo objects from Pydantic (FastMCP compatibility)
+    if not isinstance(region_name, (str, type(None))):
+        region_name = None
+    if not isinstance(profile_name, (str, type(None))):
+        profile_name = None
+
+    return _create_ecr_client_for_region(region_name or get_region(), profile_name)
+
+
+# ECR tools fan policy lookups out across executor threads, which share one cached
+# client per region; size its connection pool to match
+_ECR_CLIENT_CONFIG = Config(max_pool_connections=ECR_CLIENT_MAX_POOL_CONNECTIONS)
+
+
+@lru_cache(maxsize=32)
+def _create_ecr_client_for_region(region_name: str, profile_name: str | None) -> Any:
+    """Create an ECR client for a resolved region, reusing it on later calls.
+
+    Args:
+        region_name: Resolved AWS region
+        profile_name: Optional AWS profile override
+
+    Returns:
+        boto3.client: Configured ECR client
+    """
+    return create_aws_client(
+        'ecr', region_name=region_name, profile_name=profile_name, config=_ECR_CLIENT_CONFIG
+    )
 
 
 def get_codebuild_client(
@@ -14,15 +14,21 @@
 
 """ECR utility functions for permission checking and HealthOmics integration."""
 
-import json
 from awslabs.aws_healthomics_mcp_server.consts import (
     ECR_REQUIRED_REGISTRY_ACTIONS,
     ECR_REQUIRED_REPOSITORY_ACTIONS,
     HEALTHOMICS_PRINCIPAL,
 )
 from awslabs.aws_healthomics_mcp_server.models.ecr import HealthOmicsAccessStatus
+from functools import lru_cache
 from loguru import logger
-from typing import Any, Dict, List, Optional, Set, Tuple
+from pydantic_core import from_json
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+# Hashable views of the required actions, built once for the cached policy analysis
+_REPOSITORY_ACTIONS: Tuple[str, ...] = tuple(ECR_REQUIRED_REPOSITORY_ACTIONS)
+_REGISTRY_ACTIONS: Tuple[str, ...] = tuple(ECR_REQUIRED_REGISTRY_ACTIONS)
 
 
 def _normalize_actions(actions: Any) -> Set[str]:
@@ -98,29 +104,80 @@ def _check_actions_allowed(
     Returns:
         Tuple of (all_allowed, missing_actions)
     """
-    missing_actions = []
+    granted_actions = _granted_actions(statement_actions, required_actions, allow_wildcards)
+    missing_actions = [action for action in required_actions if action not in granted_actions]
+
+    return len(missing_actions) == 0, missing_actions
+
 
+def _granted_actions(
+    statement_actions: Set[str], required_actions: List[str], allow_wildcards: bool = True
+) -> Set[str]:
+    """Return the required actions granted by a statement's actions.
+
+    Args:
+        statement_actions: Set of actions from the policy statement (normalized to lowercase)
+        required_actions: List of required actions to check
+        allow_wildcards: Whether to allow wildcard actions (e.g., 'ecr:*')
+
+    Returns:
+        Set of the required actions (in their original case) that the statement grants
+    """
+    # A global wildcard grants every required action
+    if allow_wildcards and '*' in statement_actions:
+        return set(required_actions)
+
+    granted_actions: Set[str] = set()
     for required_action in required_actions:
         required_lower = required_action.lower()
-        action_allowed = False
-
         # Check for exact match
         if required_lower in statement_actions:
-            action_allowed = True
-        # Check for wildcard match (e.g., 'ecr:*' allows all ecr actions)
-        elif allow_wildcards:
-            # Check for service-level wildcard (e.g., 'ecr:*')
-            service_prefix = required_lower.split(':')[0] + ':*'
-            if service_prefix in statement_actions:
-                action_allowed = True
-            # Check for global wildcard
-            elif '*' in statement_actions:
-                action_allowed = True
-
-        if not action_allowed:
-            missing_actions.append(required_action)
+            granted_actions.add(required_action)
+        # Check for service-level wildcard (e.g., 'ecr:*')
+        elif allow_wildcards and required_lower.split(':')[0] + ':*' in statement_actions:
+            granted_actions.add(required_action)
 
-    return len(missing_actions) == 0, missing_actions
+    return granted_actions
+
+
+def _healthomics_granted_actions(policy: Dict[str, Any], required_actions: List[str]) -> Set[str]:
+    """Collect the required actions a policy grants to the HealthOmics principal.
+
+    Statements are scanned once and the scan stops as soon as every required
+    action has been granted.
+
+    Args:
+        policy: Parsed IAM policy document
+        required_actions: List of required actions to check
+
+    Returns:
+        Set of the required actions (in their original case) granted to HealthOmics
+    """
+    statements = policy.get('Statement', [])
+    if not isinstance(statements, list):
+        statements = [statements]
+
+    granted_actions: Set[str] = set()
+    for statement in statements:
+        if not isinstance(statement, dict):
+            continue
+
+        # Only consider Allow statements
+        effect = statement.get('Effect', '').lower()
+        if effect != 'allow':
+            continue
+
+        # Check if principal matches HealthOmics
+        principal = statement.get('Principal')
+        if not _check_principal_match(principal, HEALTHOMICS_PRINCIPAL):
+            continue
+
+        statement_actions = _normalize_actions(statement.get('Action'))
+        granted_actions |= _granted_actions(statement_actions, required_actions)
+        if len(granted_actions) == len(required_actions):
+            break
+
+    return granted_actions
 
 
 def _parse_policy_document(policy_text: Optional[str]) -> Optional[Dict[str, Any]]:
@@ -136,12 +193,39 @@ def _parse_policy_document(policy_text: Optional[str]) -> Optional[Dict[str, Any
         return None
 
     try:
-        return json.loads(policy_text)
-    except json.JSONDecodeError as e:
+        # pydantic_core's Rust JSON parser is faster than json.loads for large policies
+        return from_json(policy_text)
+    except ValueError as e:
         logger.warning(f'Failed to parse policy document: {e}')
         return None
 
 
+@lru_cache(maxsize=256)
+def _healthomics_granted_actions_for_text(
+    policy_text: str, required_actions: Tuple[str, ...]
+) -> Optional[FrozenSet[str]]:
+    """Collect the required actions a policy text grants to HealthOmics (cached by input).
+
+    Validation re-checks the same registry and template policy text for every
+    pull-through cache rule, so the analysis result is shared across those calls.
+    Parsing happens inside this call, so this is the only cache layer and the
+    parsed document itself is never shared.
+
+    Args:
+        policy_text: JSON string of the policy document
+        required_actions: Tuple of required actions to check
+
+    Returns:
+        Frozen set of the required actions granted to HealthOmics, or None if the
+        policy cannot be parsed
+    """
+    policy = _parse_policy_document(policy_text)
+    if policy is None:
+        return None
+
+    return frozenset(_healthomics_granted_actions(policy, list(required_actions)))
+
+
 def check_repository_healthomics_access(
     policy_text: Optional[str],
 ) -> Tuple[HealthOmicsAccessStatus, List[str]]:
@@ -164,44 +248,10 @@ def check_repository_healthomics_access(
     if policy_text is None:
         return HealthOmicsAccessStatus.UNKNOWN, []
 
-    policy = _parse_policy_document(policy_text)
-    if policy is None:
+    granted_actions = _healthomics_granted_actions_for_text(policy_text, _REPOSITORY_ACTIONS)
+    if granted_actions is None:
         return HealthOmicsAccessStatus.UNKNOWN, []
 
-    statements = policy.get('Statement', [])
-    if not isinstance(statements, list):
-        statements = [statements]
-
-    # Track which required actions are granted
-    granted_actions: Set[str] = set()
-
-    for statement in statements:
-        if not isinstance(statement, dict):
-            continue
-
-        # Only consider Allow statements
-        effect = statement.get('Effect', '').lower()
-        if effect != 'allow':
-            continue
-
-        # Check if principal matches HealthOmics
-        principal = statement.get('Principal')
-        if not _check_principal_match(principal, HEALTHOMICS_PRINCIPAL):
-            continue
-
-        # Get actions from this statement
-        actions = statement.get('Action')
-        statement_actions = _normalize_actions(actions)
-
-        # Check which required actions are granted by this statement
-        for required_action in ECR_REQUIRED_REPOSITORY_ACTIONS:
-            required_lower = required_action.lower()
-            if required_lower in statement_actions:
-                granted_actions.add(required_action)
-            # Check for wildcards
-            elif 'ecr:*' in statement_actions or '*' in statement_actions:
-                granted_actions.add(required_action)
-
     # Determine missing actions
     missing_actions = [
         action for action in ECR_REQUIRED_REPOSITORY_ACTIONS if action not in granted_actions
@@ -237,44 +287,10 @@ def check_registry_policy_healthomics_access(
     if policy_text is None:
         return False, list(ECR_REQUIRED_REGISTRY_ACTIONS)
 
-    policy = _parse_policy_document(policy_text)
-    if policy is None:
+    granted_actions = _healthomics_granted_actions_for_text(policy_text, _REGISTRY_ACTIONS)
+    if granted_actions is None:
         return False, list(ECR_REQUIRED_REGISTRY_ACTIONS)
 
-    statements = policy.get('Statement', [])
-    if not isinstance(statements, list):
-        statements = [statements]
-
-    # Track which required actions are granted
-    granted_actions: Set[str] = set()
-
-    for statement in statements:
-        if not isinstance(statement, dict):
-            continue
-
-        # Only consider Allow statements
-        effect = statement.get('Effect', '').lower()
-        if effect != 'allow':
-            continue
-
-        # Check if principal matches HealthOmics
-        principal = statement.get('Principal')
-        if not _check_principal_match(principal, HEALTHOMICS_PRINCIPAL):
-            continue
-
-        # Get actions from this statement
-        actions = statement.get('Action')
-        statement_actions = _normalize_actions(actions)
-
-        # Check which required actions are granted by this statement
-        for required_action in ECR_REQUIRED_REGISTRY_ACTIONS:
-            required_lower = required_action.lower()
-            if required_lower in statement_actions:
-                granted_actions.add(required_action)
-            # Check for wildcards
-            elif 'ecr:*' in statement_actions or '*' in statement_actions:
-                granted_actions.add(required_action)
-
     # Determine missing actions
     missing_actions = [
         action for action in ECR_REQUIRED_REGISTRY_ACTIONS if action not in granted_actions
@@ -307,44 +323,12 @@ def check_repository_template_healthomics_access(
     if template_policy_text is None:
         return False, False, list(ECR_REQUIRED_REPOSITORY_ACTIONS)
 
-    policy = _parse_policy_document(template_policy_text)
-    if policy is None:
+    granted_actions = _healthomics_granted_actions_for_text(
+        template_policy_text, _REPOSITORY_ACTIONS
+    )
+    if granted_actions is None:
         return True, False, list(ECR_REQUIRED_REPOSITORY_ACTIONS)
 
-    statements = policy.get('Statement', [])
-    if not isinstance(statements, list):
-        statements = [statements]
-
-    # Track which required actions are granted
-    granted_actions: Set[str] = set()
-
-    for statement in statements:
-        if not isinstance(statement, dict):
-            continue
-
-        # Only consider Allow statements
-        effect = statement.get('Effect', '').lower()
-        if effect != 'allow':
-            continue
-
-        # Check if principal matches HealthOmics
-        principal = statement.get('Principal')
-        if not _check_principal_match(principal, HEALTHOMICS_PRINCIPAL):
-            continue
-
-        # Get actions from this statement
-        actions = statement.get('Action')
-        statement_actions = _normalize_actions(actions)
-
-        # Check which required actions are granted by this statement
-        for required_action in ECR_REQUIRED_REPOSITORY_ACTIONS:
-            required_lower = required_action.lower()
-            if required_lower in statement_actions:
-                granted_actions.add(required_action)
-            # Check for wildcards
-            elif 'ecr:*' in statement_actions or '*' in statement_actions:
-                granted_actions.add(required_action)
-
     # Determine missing actions
     missing_actions = [
         action for action in ECR_REQUIRED_REPOSITORY_ACTIONS if action not in granted_actions
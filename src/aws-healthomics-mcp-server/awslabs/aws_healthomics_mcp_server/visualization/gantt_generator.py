@@ -14,11 +14,16 @@
 
 """Gantt chart generation for workflow timeline visualization."""
 
+import re
 from awslabs.aws_healthomics_mcp_server.visualization.svg_builder import SVGBuilder
 from datetime import datetime
 from typing import Union
 
 
+# Splits an ISO timestamp into its first six fractional digits, any extra digits, and the offset
+_ISO_FRACTION_PATTERN = re.compile(r'(.+\.\d{1,6})(\d*)([+-]\d{2}:\d{2})?$')
+
+
 class GanttGenerator:
     """Generates Gantt-style timeline visualizations.
 
@@ -164,9 +169,7 @@ class GanttGenerator:
         iso_string = time_str.replace('Z', '+00:00')
         # Normalize fractional seconds to 6 digits for Python 3.10 compatibility
         # Python 3.10's fromisoformat only accepts 3 or 6 decimal places
-        import re
-
-        match = re.match(r'(.+\.\d{1,6})(\d*)([+-]\d{2}:\d{2})?$', iso_string)
+        match = _ISO_FRACTION_PATTERN.match(iso_string)
         if match:
             base, extra_digits, tz = match.groups()
             # Pad to 6 digits if needed
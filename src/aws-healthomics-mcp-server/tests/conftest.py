@@ -17,6 +17,8 @@
 import os
 import pytest
 from mcp.server.fastmcp import Context
+from tests.test_helpers import FakeCtx, FakeLogsClient, Recorder
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 
@@ -41,11 +43,22 @@ def mock_omics_client():
     return client
 
 
+@pytest.fixture
+def ctx():
+    """Provide a lightweight MCP context stub."""
+    return FakeCtx()
+
+
+@pytest.fixture
+def omics_client():
+    """Create a stub HealthOmics client with recording get_run and list_runs methods."""
+    return SimpleNamespace(get_run=Recorder(), list_runs=Recorder())
+
+
 @pytest.fixture
 def mock_logs_client():
-    """Create a mock CloudWatch Logs client."""
-    client = MagicMock()
-    return client
+    """Create a stub CloudWatch Logs client."""
+    return FakeLogsClient()
 
 
 @pytest.fixture
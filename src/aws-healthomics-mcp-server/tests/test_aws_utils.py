@@ -20,8 +20,10 @@ import os
 import pytest
 import string
 import zipfile
-from awslabs.aws_healthomics_mcp_server.consts import AGENT_ENV
+from awslabs.aws_healthomics_mcp_server.consts import AGENT_ENV, ECR_CLIENT_MAX_POOL_CONNECTIONS
 from awslabs.aws_healthomics_mcp_server.utils.aws_utils import (
+    _ECR_CLIENT_CONFIG,
+    _create_ecr_client_for_region,
     create_aws_client,
     create_zip_file,
     decode_from_base64,
@@ -30,6 +32,7 @@ from awslabs.aws_healthomics_mcp_server.utils.aws_utils import (
     get_agent_value,
     get_aws_session,
     get_codeconnections_client,
+    get_ecr_client,
     get_logs_client,
     get_omics_client,
     get_omics_endpoint_url,
@@ -37,9 +40,10 @@ from awslabs.aws_healthomics_mcp_server.utils.aws_utils import (
     get_partition,
     get_region,
 )
+from botocore.config import Config
 from hypothesis import given, settings
 from hypothesis import strategies as st
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 
 class TestGetRegion:
@@ -340,10 +344,23 @@ class TestCreateAwsClient:
 
         result = create_aws_client('s3')
 
-        mock_get_session.assert_called_once_with(region_name=None, profile_name=None)
-        mock_session.client.assert_called_once_with('s3')
+        assert mock_get_session.mock_calls == [
+            call(region_name=None, profile_name=None),
+            call().client('s3', config=None),
+        ]
         assert result == mock_client
 
+    @patch('awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_aws_session')
+    def test_create_aws_client_passes_config(self, mock_get_session):
+        """Test that a client configuration is forwarded to the session."""
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+        config = Config(max_pool_connections=5)
+
+        create_aws_client('ecr', config=config)
+
+        mock_session.client.assert_called_once_with('ecr', config=config)
+
     @patch('awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_aws_session')
     def test_create_aws_client_failure(self, mock_get_session):
         """Test client creation failure."""
@@ -512,6 +529,64 @@ class TestGetCodeconnectionsClient:
             get_codeconnections_client()
 
 
+class TestGetEcrClient:
+    """Test cases for get_ecr_client function."""
+
+    def setup_method(self):
+        """Clear the client cache before each test."""
+        _create_ecr_client_for_region.cache_clear()
+
+    def teardown_method(self):
+        """Drop mock clients so they are not served to other test modules."""
+        _create_ecr_client_for_region.cache_clear()
+
+    @patch('awslabs.aws_healthomics_mcp_server.utils.aws_utils.create_aws_client')
+    def test_get_ecr_client_same_region_reuses_client(self, mock_create_client):
+        """Test that repeated calls for the same region share one client."""
+        mock_create_client.return_value = MagicMock()
+
+        first = get_ecr_client(region_name='us-west-2')
+        second = get_ecr_client(region_name='us-west-2')
+
+        assert first is second
+        mock_create_client.assert_called_once_with(
+            'ecr', region_name='us-west-2', profile_name=None, config=_ECR_CLIENT_CONFIG
+        )
+
+    @patch('awslabs.aws_healthomics_mcp_server.utils.aws_utils.create_aws_client')
+    def test_get_ecr_client_different_region(self, mock_create_client):
+        """Test that each region and profile gets its own client."""
+        mock_create_client.side_effect = lambda *args, **kwargs: MagicMock()
+
+        west = get_ecr_client(region_name='us-west-2')
+        east = get_ecr_client(region_name='us-east-1')
+        profiled = get_ecr_client(region_name='us-west-2', profile_name='dev')
+
+        assert len({id(west), id(east), id(profiled)}) == 3
+        assert mock_create_client.call_count == 3
+
+    @patch('awslabs.aws_healthomics_mcp_server.utils.aws_utils.create_aws_client')
+    def test_get_ecr_client_default_region_resolved(self, mock_create_client):
+        """Test that the default region is resolved before the cache lookup."""
+        mock_create_client.return_value = MagicMock()
+
+        assert get_ecr_client() is get_ecr_client(region_name='us-east-1')
+        mock_create_client.assert_called_once_with(
+            'ecr', region_name='us-east-1', profile_name=None, config=_ECR_CLIENT_CONFIG
+        )
+
+    @patch('awslabs.aws_healthomics_mcp_server.utils.aws_utils.create_aws_client')
+    def test_ecr_client_config_sizes_pool(self, mock_create_client):
+        """Test that ECR clients get a larger connection pool."""
+        mock_create_client.return_value = MagicMock()
+
+        get_ecr_client(region_name='eu-west-1')
+
+        config = mock_create_client.call_args.kwargs['config']
+        assert config.max_pool_connections == ECR_CLIENT_MAX_POOL_CONNECTIONS
+        assert config.retries is None
+
+
 class TestUtilityFunctions:
     """Test cases for utility functions."""
 
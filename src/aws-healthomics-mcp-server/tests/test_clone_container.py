@@ -17,12 +17,15 @@
 Feature: ecr-container-clone
 """
 
+import asyncio
 import botocore
 import botocore.exceptions
 import pytest
+from awslabs.aws_healthomics_mcp_server.tools import ecr_tools
 from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
     CODEBUILD_PROJECT_NAME,
     PULL_THROUGH_CACHE_SUPPORTED_REGISTRIES,
+    _copy_image_via_codebuild,
     _find_matching_pull_through_cache,
     _get_or_create_codebuild_project,
     _parse_container_image_reference,
@@ -32,6 +35,58 @@ from tests.test_helpers import MCPToolTestWrapper
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+@pytest.fixture
+def mock_iam():
+    """Provide an IAM client mock."""
+    return MagicMock()
+
+
+@pytest.fixture
+def clone_identity(monkeypatch):
+    """Resolve the clone target to a fixed account and region without calling STS."""
+    monkeypatch.setattr(ecr_tools, 'get_account_id', lambda **kwargs: '123456789012')
+    monkeypatch.setattr(ecr_tools, 'get_region', lambda: 'us-east-1')
+
+
+@pytest.fixture
+def codebuild_factory():
+    """Provide a factory for CodeBuild client mocks with the clone project already present.
+
+    The factory takes one or more batch_get_builds responses; several responses are
+    returned on successive polls.
+    """
+
+    def make_codebuild(*batch_get_builds_responses):
+        client = MagicMock()
+        client.batch_get_projects.return_value = {'projects': [{'name': CODEBUILD_PROJECT_NAME}]}
+        client.start_build.return_value = {'build': {'id': 'build-123'}}
+        if len(batch_get_builds_responses) == 1:
+            client.batch_get_builds.return_value = batch_get_builds_responses[0]
+        else:
+            client.batch_get_builds.side_effect = list(batch_get_builds_responses)
+        return client
+
+    return make_codebuild
+
+
+@pytest.fixture
+def patch_codebuild_clients(monkeypatch, mock_iam):
+    """Route the CodeBuild copy path to test clients and skip its polling delay.
+
+    Returns a function taking the CodeBuild client and an optional ECR client; the IAM
+    client is always the mock_iam fixture.
+    """
+
+    def install(codebuild, ecr=None):
+        monkeypatch.setattr(ecr_tools, 'get_codebuild_client', lambda **kwargs: codebuild)
+        monkeypatch.setattr(ecr_tools, 'get_iam_client', lambda **kwargs: mock_iam)
+        if ecr is not None:
+            monkeypatch.setattr(ecr_tools, 'get_ecr_client', lambda **kwargs: ecr)
+        monkeypatch.setattr(asyncio, 'sleep', AsyncMock())
+
+    return install
+
+
 # =============================================================================
 # Tests for _parse_container_image_reference
 # =============================================================================
@@ -96,6 +151,28 @@ class TestParseContainerImageReference:
         assert result['tag'] is None
         assert result['digest'] == digest
 
+    def test_registry_with_port_and_tag(self):
+        """Test that a registry port is not mistaken for a tag."""
+        result = _parse_container_image_reference('localhost:5000/team/tool:2.1')
+        assert result['registry'] == 'localhost:5000'
+        assert result['repository'] == 'team/tool'
+        assert result['tag'] == '2.1'
+
+        result = _parse_container_image_reference('localhost:5000/team/tool')
+        assert result['registry'] == 'localhost:5000'
+        assert result['repository'] == 'team/tool'
+        assert result['tag'] == 'latest'
+
+    def test_registry_image_with_digest(self):
+        """Test that a digest is split at the last '@' and suppresses the default tag."""
+        digest = 'sha256:abc123def456'
+        result = _parse_container_image_reference(f'quay.io/biocontainers/samtools@{digest}')
+        assert result['registry'] == 'quay.io'
+        assert result['repository'] == 'biocontainers/samtools'
+        assert result['tag'] is None
+        assert result['digest'] == digest
+        assert result['full_reference'] == f'quay.io/biocontainers/samtools@{digest}'
+
     def test_docker_io_normalized_to_registry_1(self):
         """Test that docker.io is normalized to registry-1.docker.io."""
         result = _parse_container_image_reference('docker.io/library/ubuntu:latest')
@@ -128,6 +205,20 @@ class TestParseContainerImageReference:
         assert result['repository'] == 'org/sub/image'
         assert result['tag'] == 'v1'
 
+    def test_registry_port_without_tag(self):
+        """Test that a registry port colon is not mistaken for a tag."""
+        result = _parse_container_image_reference('localhost:5000/myimage')
+        assert result['registry'] == 'localhost:5000'
+        assert result['repository'] == 'myimage'
+        assert result['tag'] == 'latest'
+
+    def test_registry_port_with_tag(self):
+        """Test parsing image with both a registry port and a tag."""
+        result = _parse_container_image_reference('localhost:5000/org/myimage:v2')
+        assert result['registry'] == 'localhost:5000'
+        assert result['repository'] == 'org/myimage'
+        assert result['tag'] == 'v2'
+
 
 # =============================================================================
 # Tests for _find_matching_pull_through_cache
@@ -197,13 +288,12 @@ class TestFindMatchingPullThroughCache:
 class TestGetOrCreateCodeBuildProject:
     """Tests for the _get_or_create_codebuild_project helper function."""
 
-    def test_project_exists_returns_name(self):
+    def test_project_exists_returns_name(self, mock_iam):
         """Test that existing project returns project name without creating."""
         mock_codebuild = MagicMock()
         mock_codebuild.batch_get_projects.return_value = {
             'projects': [{'name': CODEBUILD_PROJECT_NAME}]
         }
-        mock_iam = MagicMock()
 
         result = _get_or_create_codebuild_project(
             mock_codebuild, mock_iam, '123456789012', 'us-east-1'
@@ -213,15 +303,15 @@ class TestGetOrCreateCodeBuildProject:
         mock_codebuild.create_project.assert_not_called()
         mock_iam.create_role.assert_not_called()
 
-    def test_project_not_exists_creates_role_and_project(self):
+    def test_project_not_exists_creates_role_and_project(self, mock_iam):
         """Test that missing project creates IAM role and CodeBuild project."""
         mock_codebuild = MagicMock()
         mock_codebuild.batch_get_projects.return_value = {'projects': []}
         mock_codebuild.create_project.return_value = {}
 
-        mock_iam = MagicMock()
-        mock_iam.exceptions.NoSuchEntityException = Exception
-        mock_iam.get_role.side_effect = mock_iam.exceptions.NoSuchEntityException()
+        mock_iam.get_role.side_effect = botocore.exceptions.ClientError(
+            {'Error': {'Code': 'NoSuchEntity', 'Message': 'Role not found'}}, 'GetRole'
+        )
         mock_iam.create_role.return_value = {}
         mock_iam.put_role_policy.return_value = {}
 
@@ -235,13 +325,12 @@ class TestGetOrCreateCodeBuildProject:
         mock_iam.put_role_policy.assert_called_once()
         mock_codebuild.create_project.assert_called_once()
 
-    def test_role_exists_skips_role_creation(self):
+    def test_role_exists_skips_role_creation(self, mock_iam):
         """Test that existing IAM role skips role creation."""
         mock_codebuild = MagicMock()
         mock_codebuild.batch_get_projects.return_value = {'projects': []}
         mock_codebuild.create_project.return_value = {}
 
-        mock_iam = MagicMock()
         mock_iam.get_role.return_value = {'Role': {'Arn': 'arn:aws:iam::123:role/test'}}
 
         result = _get_or_create_codebuild_project(
@@ -252,14 +341,26 @@ class TestGetOrCreateCodeBuildProject:
         mock_iam.create_role.assert_not_called()
         mock_codebuild.create_project.assert_called_once()
 
-    def test_client_error_not_resource_not_found_raises(self):
+    def test_role_lookup_other_error_raises(self, mock_iam):
+        """Test that role lookup failures other than NoSuchEntity are not swallowed."""
+        mock_codebuild = MagicMock()
+        mock_codebuild.batch_get_projects.return_value = {'projects': []}
+        mock_iam.get_role.side_effect = botocore.exceptions.ClientError(
+            {'Error': {'Code': 'Throttling', 'Message': 'Rate exceeded'}}, 'GetRole'
+        )
+
+        with pytest.raises(botocore.exceptions.ClientError):
+            _get_or_create_codebuild_project(mock_codebuild, mock_iam, '123456789012', 'us-east-1')
+
+        mock_iam.create_role.assert_not_called()
+
+    def test_client_error_not_resource_not_found_raises(self, mock_iam):
         """Test that non-ResourceNotFoundException errors are raised."""
         mock_codebuild = MagicMock()
         error_response = {'Error': {'Code': 'AccessDeniedException', 'Message': 'Access denied'}}
         mock_codebuild.batch_get_projects.side_effect = botocore.exceptions.ClientError(
             error_response, 'BatchGetProjects'
         )
-        mock_iam = MagicMock()
 
         with pytest.raises(botocore.exceptions.ClientError):
             _get_or_create_codebuild_project(mock_codebuild, mock_iam, '123456789012', 'us-east-1')
@@ -274,99 +375,62 @@ class TestCopyImageViaCodeBuild:
     """Tests for the _copy_image_via_codebuild async function."""
 
     @pytest.mark.asyncio
-    async def test_successful_build_returns_digest(self):
+    async def test_successful_build_returns_digest(
+        self, ctx, codebuild_factory, patch_codebuild_clients
+    ):
         """Test successful CodeBuild returns image digest."""
-        mock_ctx = AsyncMock()
-        mock_codebuild = MagicMock()
-        mock_codebuild.batch_get_projects.return_value = {
-            'projects': [{'name': CODEBUILD_PROJECT_NAME}]
-        }
-        mock_codebuild.start_build.return_value = {'build': {'id': 'build-123'}}
-        mock_codebuild.batch_get_builds.return_value = {'builds': [{'buildStatus': 'SUCCEEDED'}]}
+        mock_codebuild = codebuild_factory({'builds': [{'buildStatus': 'SUCCEEDED'}]})
 
         mock_ecr = MagicMock()
         mock_ecr.describe_images.return_value = {
             'imageDetails': [{'imageDigest': 'sha256:abc123'}]
         }
 
-        mock_iam = MagicMock()
+        patch_codebuild_clients(mock_codebuild, ecr=mock_ecr)
 
-        with (
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_codebuild_client',
-                return_value=mock_codebuild,
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_iam_client',
-                return_value=mock_iam,
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-                return_value=mock_ecr,
-            ),
-            patch('asyncio.sleep', new_callable=AsyncMock),
-        ):
-            from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-                _copy_image_via_codebuild,
-            )
-
-            result = await _copy_image_via_codebuild(
-                ctx=mock_ctx,
-                source_image='ubuntu:latest',
-                target_repo='my-repo',
-                target_tag='latest',
-                account_id='123456789012',
-                region='us-east-1',
-            )
+        result = await _copy_image_via_codebuild(
+            ctx=ctx,
+            source_image='ubuntu:latest',
+            target_repo='my-repo',
+            target_tag='latest',
+            account_id='123456789012',
+            region='us-east-1',
+        )
 
         assert result['success'] is True
         assert result['digest'] == 'sha256:abc123'
 
     @pytest.mark.asyncio
-    async def test_build_failed_returns_error(self):
+    async def test_build_failed_returns_error(
+        self, ctx, codebuild_factory, patch_codebuild_clients
+    ):
         """Test failed CodeBuild returns error message."""
-        mock_ctx = AsyncMock()
-        mock_codebuild = MagicMock()
-        mock_codebuild.batch_get_projects.return_value = {
-            'projects': [{'name': CODEBUILD_PROJECT_NAME}]
-        }
-        mock_codebuild.start_build.return_value = {'build': {'id': 'build-123'}}
-        mock_codebuild.batch_get_builds.return_value = {
-            'builds': [
-                {
-                    'buildStatus': 'FAILED',
-                    'phases': [
-                        {'phaseStatus': 'FAILED', 'contexts': [{'message': 'Docker pull failed'}]}
-                    ],
-                }
-            ]
-        }
-
-        mock_iam = MagicMock()
+        mock_codebuild = codebuild_factory(
+            {
+                'builds': [
+                    {
+                        'buildStatus': 'FAILED',
+                        'phases': [
+                            {
+                                'phaseStatus': 'FAILED',
+                                'contexts': [{'message': 'Docker pull failed'}],
+                            }
+                        ],
+                    }
+                ]
+            }
+        )
 
-        with (
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_codebuild_client',
-                return_value=mock_codebuild,
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_iam_client',
-                return_value=mock_iam,
-            ),
-            patch('asyncio.sleep', new_callable=AsyncMock),
-        ):
-            from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-                _copy_image_via_codebuild,
-            )
+        patch_codebuild_clients(mock_codebuild)
 
-            result = await _copy_image_via_codebuild(
-                ctx=mock_ctx,
-                source_image='ubuntu:latest',
-                target_repo='my-repo',
-                target_tag='latest',
-                account_id='123456789012',
-                region='us-east-1',
-            )
+        result = await _copy_image_via_codebuild(
+            ctx=ctx,
+            source_image='ubuntu:latest',
+            target_repo='my-repo',
+            target_tag='latest',
+            account_id='123456789012',
+            region='us-east-1',
+        )
 
         assert result['success'] is False
         assert 'FAILED' in result['message']
@@ -382,31 +446,28 @@ class TestCloneContainerToECR:
     """Tests for the clone_container_to_ecr MCP tool."""
 
     @pytest.mark.asyncio
-    async def test_empty_source_image_returns_error(self):
+    async def test_empty_source_image_returns_error(self, ctx):
         """Test that empty source image returns error."""
-        mock_ctx = AsyncMock()
         wrapper = MCPToolTestWrapper(clone_container_to_ecr)
 
-        result = await wrapper.call(ctx=mock_ctx, source_image='')
+        result = await wrapper.call(ctx=ctx, source_image='')
 
         assert result['success'] is False
         assert 'required' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_whitespace_source_image_returns_error(self):
+    async def test_whitespace_source_image_returns_error(self, ctx):
         """Test that whitespace-only source image returns error."""
-        mock_ctx = AsyncMock()
         wrapper = MCPToolTestWrapper(clone_container_to_ecr)
 
-        result = await wrapper.call(ctx=mock_ctx, source_image='   ')
+        result = await wrapper.call(ctx=ctx, source_image='   ')
 
         assert result['success'] is False
         assert 'required' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_failed_account_id_returns_error(self):
+    async def test_failed_account_id_returns_error(self, ctx):
         """Test that failure to get account ID returns error."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
 
         with (
@@ -415,20 +476,19 @@ class TestCloneContainerToECR:
                 return_value=mock_ecr,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 side_effect=Exception('STS error'),
             ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(ctx=mock_ctx, source_image='ubuntu:latest')
+            result = await wrapper.call(ctx=ctx, source_image='ubuntu:latest')
 
         assert result['success'] is False
         assert 'account' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_pull_through_cache_success(self):
+    async def test_pull_through_cache_success(self, ctx, clone_identity):
         """Test successful clone via pull-through cache."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {
             'pullThroughCacheRules': [
@@ -446,17 +506,9 @@ class TestCloneContainerToECR:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(ctx=mock_ctx, source_image='ubuntu:latest')
+            result = await wrapper.call(ctx=ctx, source_image='ubuntu:latest')
 
         assert result['success'] is True
         assert result['used_pull_through_cache'] is True
@@ -464,9 +516,8 @@ class TestCloneContainerToECR:
         assert 'docker/library/ubuntu' in result['ecr_uri']
 
     @pytest.mark.asyncio
-    async def test_pull_through_cache_failure(self):
+    async def test_pull_through_cache_failure(self, ctx, clone_identity):
         """Test pull-through cache failure returns error."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {
             'pullThroughCacheRules': [
@@ -483,25 +534,16 @@ class TestCloneContainerToECR:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(ctx=mock_ctx, source_image='ubuntu:latest')
+            result = await wrapper.call(ctx=ctx, source_image='ubuntu:latest')
 
         assert result['success'] is False
         assert 'ImageNotFound' in result['message']
 
     @pytest.mark.asyncio
-    async def test_pull_through_cache_no_images(self):
+    async def test_pull_through_cache_no_images(self, ctx, clone_identity):
         """Test pull-through cache returns no images."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {
             'pullThroughCacheRules': [
@@ -515,25 +557,16 @@ class TestCloneContainerToECR:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(ctx=mock_ctx, source_image='ubuntu:latest')
+            result = await wrapper.call(ctx=ctx, source_image='ubuntu:latest')
 
         assert result['success'] is False
         assert 'no images' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_no_ptc_supported_registry_suggests_creating(self):
+    async def test_no_ptc_supported_registry_suggests_creating(self, ctx, clone_identity):
         """Test no PTC for supported registry suggests creating one."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
         mock_ecr.describe_repositories.side_effect = botocore.exceptions.ClientError(
@@ -550,26 +583,19 @@ class TestCloneContainerToECR:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(ctx=mock_ctx, source_image='ubuntu:latest')
+            result = await wrapper.call(ctx=ctx, source_image='ubuntu:latest')
 
         assert result['success'] is False
         assert result['repository_created'] is True
         assert 'CreatePullThroughCacheForHealthOmics' in result['message']
 
     @pytest.mark.asyncio
-    async def test_no_ptc_unsupported_registry_uses_codebuild(self):
+    async def test_no_ptc_unsupported_registry_uses_codebuild(
+        self, ctx, codebuild_factory, mock_iam, clone_identity
+    ):
         """Test no PTC for unsupported registry uses CodeBuild."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
         mock_ecr.describe_repositories.side_effect = botocore.exceptions.ClientError(
@@ -584,14 +610,7 @@ class TestCloneContainerToECR:
             'imageDetails': [{'imageDigest': 'sha256:abc123'}]
         }
 
-        mock_codebuild = MagicMock()
-        mock_codebuild.batch_get_projects.return_value = {
-            'projects': [{'name': CODEBUILD_PROJECT_NAME}]
-        }
-        mock_codebuild.start_build.return_value = {'build': {'id': 'build-123'}}
-        mock_codebuild.batch_get_builds.return_value = {'builds': [{'buildStatus': 'SUCCEEDED'}]}
-
-        mock_iam = MagicMock()
+        mock_codebuild = codebuild_factory({'builds': [{'buildStatus': 'SUCCEEDED'}]})
 
         with (
             patch(
@@ -599,36 +618,27 @@ class TestCloneContainerToECR:
                 return_value=mock_ecr,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_codebuild_client',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_codebuild_client',
                 return_value=mock_codebuild,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_iam_client',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_iam_client',
                 return_value=mock_iam,
             ),
             patch('asyncio.sleep', new_callable=AsyncMock),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(
-                ctx=mock_ctx, source_image='wave.seqera.io/wt/abc123:latest'
-            )
+            result = await wrapper.call(ctx=ctx, source_image='wave.seqera.io/wt/abc123:latest')
 
         assert result['success'] is True
         assert result['used_codebuild'] is True
         assert result['used_pull_through_cache'] is False
 
     @pytest.mark.asyncio
-    async def test_codebuild_failure_returns_manual_instructions(self):
+    async def test_codebuild_failure_returns_manual_instructions(
+        self, ctx, codebuild_factory, mock_iam, clone_identity
+    ):
         """Test CodeBuild failure returns manual push instructions."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
         mock_ecr.describe_repositories.return_value = {'repositories': [{}]}
@@ -637,16 +647,7 @@ class TestCloneContainerToECR:
         )
         mock_ecr.set_repository_policy.return_value = {}
 
-        mock_codebuild = MagicMock()
-        mock_codebuild.batch_get_projects.return_value = {
-            'projects': [{'name': CODEBUILD_PROJECT_NAME}]
-        }
-        mock_codebuild.start_build.return_value = {'build': {'id': 'build-123'}}
-        mock_codebuild.batch_get_builds.return_value = {
-            'builds': [{'buildStatus': 'FAILED', 'phases': []}]
-        }
-
-        mock_iam = MagicMock()
+        mock_codebuild = codebuild_factory({'builds': [{'buildStatus': 'FAILED', 'phases': []}]})
 
         with (
             patch(
@@ -654,27 +655,17 @@ class TestCloneContainerToECR:
                 return_value=mock_ecr,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_codebuild_client',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_codebuild_client',
                 return_value=mock_codebuild,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_iam_client',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_iam_client',
                 return_value=mock_iam,
             ),
             patch('asyncio.sleep', new_callable=AsyncMock),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(
-                ctx=mock_ctx, source_image='wave.seqera.io/wt/abc123:latest'
-            )
+            result = await wrapper.call(ctx=ctx, source_image='wave.seqera.io/wt/abc123:latest')
 
         assert result['success'] is False
         assert result['used_codebuild'] is False
@@ -682,9 +673,8 @@ class TestCloneContainerToECR:
         assert 'docker push' in result['message']
 
     @pytest.mark.asyncio
-    async def test_access_denied_error(self):
+    async def test_access_denied_error(self, ctx, clone_identity):
         """Test AccessDeniedException returns proper error."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
         mock_ecr.describe_repositories.side_effect = botocore.exceptions.ClientError(
@@ -697,27 +687,16 @@ class TestCloneContainerToECR:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(
-                ctx=mock_ctx, source_image='wave.seqera.io/wt/abc123:latest'
-            )
+            result = await wrapper.call(ctx=ctx, source_image='wave.seqera.io/wt/abc123:latest')
 
         assert result['success'] is False
         assert 'Access denied' in result['message']
 
     @pytest.mark.asyncio
-    async def test_other_client_error(self):
+    async def test_other_client_error(self, ctx, clone_identity):
         """Test other ClientError returns proper error."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
         mock_ecr.describe_repositories.side_effect = botocore.exceptions.ClientError(
@@ -730,27 +709,16 @@ class TestCloneContainerToECR:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(
-                ctx=mock_ctx, source_image='wave.seqera.io/wt/abc123:latest'
-            )
+            result = await wrapper.call(ctx=ctx, source_image='wave.seqera.io/wt/abc123:latest')
 
         assert result['success'] is False
         assert 'Rate exceeded' in result['message']
 
     @pytest.mark.asyncio
-    async def test_botocore_error(self):
+    async def test_botocore_error(self, ctx, clone_identity):
         """Test BotoCoreError returns proper error."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
         mock_ecr.describe_repositories.side_effect = botocore.exceptions.BotoCoreError()
@@ -760,27 +728,16 @@ class TestCloneContainerToECR:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(
-                ctx=mock_ctx, source_image='wave.seqera.io/wt/abc123:latest'
-            )
+            result = await wrapper.call(ctx=ctx, source_image='wave.seqera.io/wt/abc123:latest')
 
         assert 'error' in result
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_unexpected_error(self):
+    async def test_unexpected_error(self, ctx, clone_identity):
         """Test unexpected error returns proper error."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
         mock_ecr.describe_repositories.side_effect = RuntimeError('Unexpected')
@@ -790,27 +747,16 @@ class TestCloneContainerToECR:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(
-                ctx=mock_ctx, source_image='wave.seqera.io/wt/abc123:latest'
-            )
+            result = await wrapper.call(ctx=ctx, source_image='wave.seqera.io/wt/abc123:latest')
 
         assert 'error' in result
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_pull_through_cache_with_digest(self):
+    async def test_pull_through_cache_with_digest(self, ctx, clone_identity):
         """Test pull-through cache with digest instead of tag."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {
             'pullThroughCacheRules': [
@@ -828,26 +774,17 @@ class TestCloneContainerToECR:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(ctx=mock_ctx, source_image='ubuntu@sha256:originaldigest')
+            result = await wrapper.call(ctx=ctx, source_image='ubuntu@sha256:originaldigest')
 
         assert result['success'] is True
         call_args = mock_ecr.batch_get_image.call_args
         assert 'imageDigest' in str(call_args)
 
     @pytest.mark.asyncio
-    async def test_custom_target_repository_name(self):
+    async def test_custom_target_repository_name(self, ctx, clone_identity):
         """Test custom target repository name is used."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
         mock_ecr.describe_repositories.side_effect = botocore.exceptions.ClientError(
@@ -864,18 +801,10 @@ class TestCloneContainerToECR:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
             result = await wrapper.call(
-                ctx=mock_ctx,
+                ctx=ctx,
                 source_image='ubuntu:latest',
                 target_repository_name='my-custom-repo',
             )
@@ -922,95 +851,51 @@ class TestCodeBuildEdgeCases:
     """Additional tests for CodeBuild edge cases."""
 
     @pytest.mark.asyncio
-    async def test_build_with_empty_builds_response(self):
+    async def test_build_with_empty_builds_response(
+        self, ctx, codebuild_factory, patch_codebuild_clients
+    ):
         """Test handling when batch_get_builds returns empty builds."""
-        mock_ctx = AsyncMock()
-        mock_codebuild = MagicMock()
-        mock_codebuild.batch_get_projects.return_value = {
-            'projects': [{'name': CODEBUILD_PROJECT_NAME}]
-        }
-        mock_codebuild.start_build.return_value = {'build': {'id': 'build-123'}}
         # First call returns empty, then SUCCEEDED
-        mock_codebuild.batch_get_builds.side_effect = [
+        mock_codebuild = codebuild_factory(
             {'builds': []},
             {'builds': [{'buildStatus': 'SUCCEEDED'}]},
-        ]
+        )
 
         mock_ecr = MagicMock()
         mock_ecr.describe_images.return_value = {
             'imageDetails': [{'imageDigest': 'sha256:abc123'}]
         }
 
-        mock_iam = MagicMock()
-
-        with (
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_codebuild_client',
-                return_value=mock_codebuild,
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_iam_client',
-                return_value=mock_iam,
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-                return_value=mock_ecr,
-            ),
-            patch('asyncio.sleep', new_callable=AsyncMock),
-        ):
-            from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-                _copy_image_via_codebuild,
-            )
+        patch_codebuild_clients(mock_codebuild, ecr=mock_ecr)
 
-            result = await _copy_image_via_codebuild(
-                ctx=mock_ctx,
-                source_image='ubuntu:latest',
-                target_repo='my-repo',
-                target_tag='latest',
-                account_id='123456789012',
-                region='us-east-1',
-            )
+        result = await _copy_image_via_codebuild(
+            ctx=ctx,
+            source_image='ubuntu:latest',
+            target_repo='my-repo',
+            target_tag='latest',
+            account_id='123456789012',
+            region='us-east-1',
+        )
 
         assert result['success'] is True
 
     @pytest.mark.asyncio
-    async def test_build_with_stopped_status(self):
+    async def test_build_with_stopped_status(
+        self, ctx, codebuild_factory, patch_codebuild_clients
+    ):
         """Test handling STOPPED build status."""
-        mock_ctx = AsyncMock()
-        mock_codebuild = MagicMock()
-        mock_codebuild.batch_get_projects.return_value = {
-            'projects': [{'name': CODEBUILD_PROJECT_NAME}]
-        }
-        mock_codebuild.start_build.return_value = {'build': {'id': 'build-123'}}
-        mock_codebuild.batch_get_builds.return_value = {
-            'builds': [{'buildStatus': 'STOPPED', 'phases': []}]
-        }
+        mock_codebuild = codebuild_factory({'builds': [{'buildStatus': 'STOPPED', 'phases': []}]})
 
-        mock_iam = MagicMock()
+        patch_codebuild_clients(mock_codebuild)
 
-        with (
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_codebuild_client',
-                return_value=mock_codebuild,
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_iam_client',
-                return_value=mock_iam,
-            ),
-            patch('asyncio.sleep', new_callable=AsyncMock),
-        ):
-            from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-                _copy_image_via_codebuild,
-            )
-
-            result = await _copy_image_via_codebuild(
-                ctx=mock_ctx,
-                source_image='ubuntu:latest',
-                target_repo='my-repo',
-                target_tag='latest',
-                account_id='123456789012',
-                region='us-east-1',
-            )
+        result = await _copy_image_via_codebuild(
+            ctx=ctx,
+            source_image='ubuntu:latest',
+            target_repo='my-repo',
+            target_tag='latest',
+            account_id='123456789012',
+            region='us-east-1',
+        )
 
         assert result['success'] is False
         assert 'STOPPED' in result['message']
@@ -1020,9 +905,8 @@ class TestCloneContainerEdgeCases:
     """Additional edge case tests for clone_container_to_ecr."""
 
     @pytest.mark.asyncio
-    async def test_ptc_rules_check_exception_continues(self):
+    async def test_ptc_rules_check_exception_continues(self, ctx, clone_identity):
         """Test that exception checking PTC rules doesn't stop execution."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.side_effect = Exception('PTC check failed')
         mock_ecr.describe_repositories.side_effect = botocore.exceptions.ClientError(
@@ -1039,25 +923,16 @@ class TestCloneContainerEdgeCases:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(ctx=mock_ctx, source_image='ubuntu:latest')
+            result = await wrapper.call(ctx=ctx, source_image='ubuntu:latest')
 
         # Should continue even if PTC check fails
         assert result['repository_created'] is True
 
     @pytest.mark.asyncio
-    async def test_grant_access_exception_continues(self):
+    async def test_grant_access_exception_continues(self, ctx, clone_identity):
         """Test that exception granting access doesn't stop execution."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {
             'pullThroughCacheRules': [
@@ -1074,26 +949,17 @@ class TestCloneContainerEdgeCases:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(ctx=mock_ctx, source_image='ubuntu:latest')
+            result = await wrapper.call(ctx=ctx, source_image='ubuntu:latest')
 
         # Should succeed even if grant access fails
         assert result['success'] is True
         assert result['used_pull_through_cache'] is True
 
     @pytest.mark.asyncio
-    async def test_repository_already_exists(self):
+    async def test_repository_already_exists(self, ctx, clone_identity):
         """Test handling when repository already exists."""
-        mock_ctx = AsyncMock()
         mock_ecr = MagicMock()
         mock_ecr.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
         mock_ecr.describe_repositories.return_value = {
@@ -1109,17 +975,9 @@ class TestCloneContainerEdgeCases:
                 'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
                 return_value=mock_ecr,
             ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
-                return_value='123456789012',
-            ),
-            patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
-                return_value='us-east-1',
-            ),
         ):
             wrapper = MCPToolTestWrapper(clone_container_to_ecr)
-            result = await wrapper.call(ctx=mock_ctx, source_image='ubuntu:latest')
+            result = await wrapper.call(ctx=ctx, source_image='ubuntu:latest')
 
         # Repository should not be created since it exists
         assert result['repository_created'] is False
@@ -79,11 +79,11 @@ class TestCreateContainerRegistryMap:
                 return_value=mock_ptc_rules_response,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -133,11 +133,11 @@ class TestCreateContainerRegistryMap:
         """Test with pull-through cache discovery disabled."""
         with (
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -169,11 +169,11 @@ class TestCreateContainerRegistryMap:
                 return_value=mock_ptc_rules_response,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -211,11 +211,11 @@ class TestCreateContainerRegistryMap:
                 return_value=mock_ptc_rules_response,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -250,11 +250,11 @@ class TestCreateContainerRegistryMap:
 
         with (
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -289,11 +289,11 @@ class TestCreateContainerRegistryMap:
                 return_value=mock_ptc_rules_response,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -319,11 +319,11 @@ class TestCreateContainerRegistryMap:
                 return_value=mock_ptc_rules_response,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -349,11 +349,11 @@ class TestCreateContainerRegistryMap:
 
         with (
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -380,11 +380,11 @@ class TestCreateContainerRegistryMap:
 
         with (
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -421,11 +421,11 @@ class TestCreateContainerRegistryMap:
                 return_value=ptc_response,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -445,11 +445,11 @@ class TestCreateContainerRegistryMap:
                 side_effect=Exception('Access denied'),
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -469,7 +469,7 @@ class TestCreateContainerRegistryMap:
     async def test_account_id_resolution_failure(self, mock_ctx, tool_wrapper):
         """Test handling of account ID resolution failure."""
         with patch(
-            'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+            'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
             side_effect=Exception('STS access denied'),
         ):
             result = await tool_wrapper.call(ctx=mock_ctx)
@@ -482,11 +482,11 @@ class TestCreateContainerRegistryMap:
         """Test that usage hint is included in response."""
         with (
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -510,11 +510,11 @@ class TestCreateContainerRegistryMap:
                 return_value=ptc_response,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
@@ -21,17 +21,30 @@ import botocore
 import botocore.exceptions
 import json
 import pytest
+from awslabs.aws_healthomics_mcp_server.consts import (
+    ECR_REQUIRED_REGISTRY_ACTIONS,
+    ECR_REQUIRED_REPOSITORY_ACTIONS,
+)
+from awslabs.aws_healthomics_mcp_server.models.ecr import HealthOmicsAccessStatus
 from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
+    _build_image_available_response,
     _check_pull_through_cache_healthomics_usability,
+    _get_repository_creation_templates,
     _is_pull_through_cache_repository,
     check_container_availability,
     create_container_registry_map,
+    create_pull_through_cache_for_healthomics,
+    grant_healthomics_repository_access,
     list_ecr_repositories,
+    list_pull_through_cache_rules,
     validate_healthomics_ecr_config,
 )
 from awslabs.aws_healthomics_mcp_server.utils.ecr_utils import (
     _check_actions_allowed,
     _check_principal_match,
+    _granted_actions,
+    _healthomics_granted_actions,
+    _healthomics_granted_actions_for_text,
     _normalize_actions,
     _parse_policy_document,
     check_registry_policy_healthomics_access,
@@ -39,7 +52,73 @@ from awslabs.aws_healthomics_mcp_server.utils.ecr_utils import (
     initiate_pull_through_cache,
 )
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from tests.test_helpers import Recorder
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, patch
+
+
+def _healthomics_grant_policy_text(actions):
+    """Serialize a policy granting the HealthOmics service principal the given actions."""
+    return json.dumps(
+        {
+            'Version': '2012-10-17',
+            'Statement': [
+                {
+                    'Effect': 'Allow',
+                    'Principal': {'Service': 'omics.amazonaws.com'},
+                    'Action': actions,
+                }
+            ],
+        }
+    )
+
+
+# Serialized once at import time and shared by the tool tests below
+_REGISTRY_POLICY_TEXT = _healthomics_grant_policy_text(ECR_REQUIRED_REGISTRY_ACTIONS)
+_TEMPLATE_POLICY_TEXT = _healthomics_grant_policy_text(ECR_REQUIRED_REPOSITORY_ACTIONS)
+
+# Read-only describe_pull_through_cache_rules responses shared across tests
+_NO_PTC_RULES_RESPONSE = MappingProxyType({'pullThroughCacheRules': ()})
+_DOCKER_HUB_PTC_RULES_RESPONSE = MappingProxyType(
+    {'pullThroughCacheRules': (MappingProxyType({'ecrRepositoryPrefix': 'docker-hub'}),)}
+)
+_DOCKER_HUB_UPSTREAM_PTC_RULES_RESPONSE = MappingProxyType(
+    {
+        'pullThroughCacheRules': (
+            MappingProxyType(
+                {'ecrRepositoryPrefix': 'docker-hub', 'upstreamRegistryUrl': 'https://docker.io'}
+            ),
+        )
+    }
+)
+
+# Read-only describe_repository_creation_templates responses shared across tests
+_TEMPLATE_RESPONSE = MappingProxyType(
+    {
+        'repositoryCreationTemplates': (
+            MappingProxyType({'prefix': 'docker-hub', 'repositoryPolicy': _TEMPLATE_POLICY_TEXT}),
+        )
+    }
+)
+_NO_TEMPLATES_RESPONSE = MappingProxyType({'repositoryCreationTemplates': ()})
+
+
+# ECR operations the ecr_stub fixture records
+_ECR_OPERATIONS = (
+    'batch_get_image',
+    'describe_images',
+    'describe_repositories',
+    'describe_pull_through_cache_rules',
+    'describe_repository_creation_templates',
+    'get_registry_policy',
+    'get_repository_policy',
+)
+
+
+@pytest.fixture
+def ecr_stub():
+    """Provide a fresh ECR client stub for each test."""
+    return SimpleNamespace(**{operation: Recorder() for operation in _ECR_OPERATIONS})
 
 
 # =============================================================================
@@ -160,7 +239,7 @@ class TestCheckActionsAllowed:
     def test_service_wildcard_allowed(self):
         """Test that service-level wildcard allows all actions."""
         statement_actions = {'ecr:*'}
-        required_actions = ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer']
+        required_actions = ECR_REQUIRED_REPOSITORY_ACTIONS
         allowed, missing = _check_actions_allowed(statement_actions, required_actions)
         assert allowed is True
         assert missing == []
@@ -168,7 +247,7 @@ class TestCheckActionsAllowed:
     def test_global_wildcard_allowed(self):
         """Test that global wildcard allows all actions."""
         statement_actions = {'*'}
-        required_actions = ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer']
+        required_actions = ECR_REQUIRED_REPOSITORY_ACTIONS
         allowed, missing = _check_actions_allowed(statement_actions, required_actions)
         assert allowed is True
         assert missing == []
@@ -176,7 +255,7 @@ class TestCheckActionsAllowed:
     def test_missing_actions_returned(self):
         """Test that missing actions are correctly identified."""
         statement_actions = {'ecr:batchgetimage'}
-        required_actions = ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer']
+        required_actions = ECR_REQUIRED_REPOSITORY_ACTIONS
         allowed, missing = _check_actions_allowed(statement_actions, required_actions)
         assert allowed is False
         assert missing == ['ecr:GetDownloadUrlForLayer']
@@ -192,6 +271,102 @@ class TestCheckActionsAllowed:
         assert missing == ['ecr:BatchGetImage']
 
 
+class TestGrantedActions:
+    """Tests for _granted_actions utility function."""
+
+    def test_exact_matches_keep_original_case(self):
+        """Test that granted actions are returned in their required casing."""
+        statement_actions = {'ecr:batchgetimage', 'ecr:describeimages'}
+        required_actions = ECR_REQUIRED_REPOSITORY_ACTIONS
+        assert _granted_actions(statement_actions, required_actions) == {'ecr:BatchGetImage'}
+
+    @pytest.mark.parametrize('statement_actions', [{'ecr:*'}, {'*'}])
+    def test_wildcards_grant_everything(self, statement_actions):
+        """Test that service-level and global wildcards grant all required actions."""
+        required_actions = ECR_REQUIRED_REPOSITORY_ACTIONS
+        assert _granted_actions(statement_actions, required_actions) == set(required_actions)
+
+    @pytest.mark.parametrize('statement_actions', [{'ecr:*'}, {'*'}])
+    def test_wildcards_ignored_when_disabled(self, statement_actions):
+        """Test that wildcards grant nothing when wildcard matching is disabled."""
+        required_actions = ECR_REQUIRED_REPOSITORY_ACTIONS
+        assert (
+            _granted_actions(statement_actions, required_actions, allow_wildcards=False) == set()
+        )
+
+    def test_no_overlap(self):
+        """Test that unrelated actions grant nothing."""
+        assert _granted_actions({'s3:getobject'}, ['ecr:BatchGetImage']) == set()
+
+
+class TestHealthOmicsGrantedActions:
+    """Tests for _healthomics_granted_actions utility function."""
+
+    def test_stops_scanning_once_all_actions_granted(self):
+        """Test that statements after a full grant are not inspected."""
+        policy = {
+            'Statement': [
+                {
+                    'Effect': 'Allow',
+                    'Principal': {'Service': 'omics.amazonaws.com'},
+                    'Action': 'ecr:*',
+                },
+                # Scanning this statement would fail on the non-string Effect
+                {'Effect': None},
+            ]
+        }
+
+        granted = _healthomics_granted_actions(policy, ['ecr:BatchGetImage'])
+
+        assert granted == {'ecr:BatchGetImage'}
+
+    def test_single_statement_dict(self):
+        """Test that a bare statement dict is treated as a one-item list."""
+        policy = {
+            'Statement': {
+                'Effect': 'Allow',
+                'Principal': {'Service': 'omics.amazonaws.com'},
+                'Action': 'ecr:BatchGetImage',
+            }
+        }
+
+        granted = _healthomics_granted_actions(policy, ECR_REQUIRED_REPOSITORY_ACTIONS)
+
+        assert granted == {'ecr:BatchGetImage'}
+
+
+class TestHealthOmicsGrantedActionsForText:
+    """Tests for _healthomics_granted_actions_for_text utility function."""
+
+    def test_repeated_calls_share_cached_result(self):
+        """Test that identical policy text and actions reuse the same analysis result."""
+        required_actions = tuple(ECR_REQUIRED_REPOSITORY_ACTIONS)
+
+        first = _healthomics_granted_actions_for_text(_TEMPLATE_POLICY_TEXT, required_actions)
+        second = _healthomics_granted_actions_for_text(_TEMPLATE_POLICY_TEXT, required_actions)
+
+        assert first == frozenset(ECR_REQUIRED_REPOSITORY_ACTIONS)
+        assert second is first
+
+    def test_repeated_calls_parse_policy_once(self):
+        """Test that the cached analysis also covers parsing the policy text."""
+        _healthomics_granted_actions_for_text.cache_clear()
+        required_actions = tuple(ECR_REQUIRED_REPOSITORY_ACTIONS)
+
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.utils.ecr_utils._parse_policy_document',
+            wraps=_parse_policy_document,
+        ) as mock_parse:
+            _healthomics_granted_actions_for_text(_TEMPLATE_POLICY_TEXT, required_actions)
+            _healthomics_granted_actions_for_text(_TEMPLATE_POLICY_TEXT, required_actions)
+
+        mock_parse.assert_called_once_with(_TEMPLATE_POLICY_TEXT)
+
+    def test_invalid_json_returns_none(self):
+        """Test that unparseable policy text yields None."""
+        assert _healthomics_granted_actions_for_text('not json', ('ecr:BatchGetImage',)) is None
+
+
 class TestParsePolicyDocument:
     """Tests for _parse_policy_document utility function."""
 
@@ -211,6 +386,18 @@ class TestParsePolicyDocument:
         result = _parse_policy_document('not valid json')
         assert result is None
 
+    def test_parse_returns_independent_documents(self):
+        """Test that mutating a parsed document does not affect later parses."""
+        policy_text = '{"Version": "2012-10-17", "Statement": [{"Sid": "original"}]}'
+        first = _parse_policy_document(policy_text)
+        assert first is not None
+        first['Statement'].append({'Sid': 'added'})
+
+        assert _parse_policy_document(policy_text) == {
+            'Version': '2012-10-17',
+            'Statement': [{'Sid': 'original'}],
+        }
+
 
 class TestCheckRegistryPolicyHealthOmicsAccess:
     """Tests for check_registry_policy_healthomics_access function."""
@@ -229,17 +416,7 @@ class TestCheckRegistryPolicyHealthOmicsAccess:
 
     def test_valid_policy_with_healthomics_access(self):
         """Test that valid policy with HealthOmics access returns granted."""
-        policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                }
-            ],
-        }
-        granted, missing = check_registry_policy_healthomics_access(json.dumps(policy))
+        granted, missing = check_registry_policy_healthomics_access(_REGISTRY_POLICY_TEXT)
         assert granted is True
         assert missing == []
 
@@ -287,62 +464,67 @@ class TestCheckRegistryPolicyHealthOmicsAccess:
         assert granted is True
 
 
-class TestCheckRepositoryTemplateHealthOmicsAccess:
-    """Tests for check_repository_template_healthomics_access function."""
+_SINGLE_STATEMENT_TEMPLATE_POLICY_TEXT = json.dumps(
+    {
+        'Version': '2012-10-17',
+        'Statement': {
+            'Effect': 'Allow',
+            'Principal': {'Service': 'omics.amazonaws.com'},
+            'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
+        },
+    }
+)
 
-    def test_no_template_returns_not_exists(self):
-        """Test that None template returns template doesn't exist."""
-        exists, granted, missing = check_repository_template_healthomics_access(None)
-        assert exists is False
-        assert granted is False
-        assert len(missing) > 0
+_TEMPLATE_ACCESS_CASES = [
+    pytest.param(
+        None,
+        False,
+        False,
+        ECR_REQUIRED_REPOSITORY_ACTIONS,
+        id='no-template',
+    ),
+    pytest.param(
+        'invalid json',
+        True,
+        False,
+        ECR_REQUIRED_REPOSITORY_ACTIONS,
+        id='invalid-json',
+    ),
+    pytest.param(_TEMPLATE_POLICY_TEXT, True, True, [], id='full-grant'),
+    pytest.param(_SINGLE_STATEMENT_TEMPLATE_POLICY_TEXT, True, True, [], id='single-statement'),
+    pytest.param(
+        _healthomics_grant_policy_text(['ecr:BatchGetImage']),
+        True,
+        False,
+        ['ecr:GetDownloadUrlForLayer'],
+        id='partial-grant',
+    ),
+]
 
-    def test_invalid_json_returns_exists_but_not_granted(self):
-        """Test that invalid JSON returns exists but not granted."""
-        exists, granted, missing = check_repository_template_healthomics_access('invalid json')
-        assert exists is True
-        assert granted is False
-        assert len(missing) > 0
 
-    def test_valid_template_with_healthomics_access(self):
-        """Test that valid template with HealthOmics access returns granted."""
-        policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                }
-            ],
-        }
-        exists, granted, missing = check_repository_template_healthomics_access(json.dumps(policy))
-        assert exists is True
-        assert granted is True
-        assert missing == []
+class TestCheckRepositoryTemplateHealthOmicsAccess:
+    """Tests for check_repository_template_healthomics_access function."""
 
-    def test_template_with_single_statement_dict(self):
-        """Test that single statement as dict is handled."""
-        policy = {
-            'Version': '2012-10-17',
-            'Statement': {
-                'Effect': 'Allow',
-                'Principal': {'Service': 'omics.amazonaws.com'},
-                'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-            },
-        }
-        exists, granted, missing = check_repository_template_healthomics_access(json.dumps(policy))
-        assert exists is True
-        assert granted is True
+    @pytest.mark.parametrize(
+        'policy_text,expected_exists,expected_granted,expected_missing',
+        _TEMPLATE_ACCESS_CASES,
+    )
+    def test_template_access(
+        self, policy_text, expected_exists, expected_granted, expected_missing
+    ):
+        """Test template existence, grant status and missing actions for each policy shape."""
+        exists, granted, missing = check_repository_template_healthomics_access(policy_text)
+        assert exists is expected_exists
+        assert granted is expected_granted
+        assert missing == expected_missing
 
 
 class TestInitiatePullThroughCache:
     """Tests for initiate_pull_through_cache function."""
 
-    def test_successful_pull_through(self):
+    def test_successful_pull_through(self, ecr_stub):
         """Test successful pull-through cache initiation."""
-        mock_client = MagicMock()
-        mock_client.batch_get_image.return_value = {
+        ecr_stub.batch_get_image.ret = {
             'images': [
                 {
                     'imageId': {
@@ -355,7 +537,7 @@ class TestInitiatePullThroughCache:
         }
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/library/ubuntu', image_tag='latest'
+            ecr_stub, 'docker-hub/library/ubuntu', image_tag='latest'
         )
 
         assert success is True
@@ -363,10 +545,9 @@ class TestInitiatePullThroughCache:
         assert details is not None
         assert details['imageDigest'] == 'sha256:abc123'
 
-    def test_pull_through_with_digest(self):
+    def test_pull_through_with_digest(self, ecr_stub):
         """Test pull-through cache with digest instead of tag."""
-        mock_client = MagicMock()
-        mock_client.batch_get_image.return_value = {
+        ecr_stub.batch_get_image.ret = {
             'images': [
                 {
                     'imageId': {
@@ -378,18 +559,16 @@ class TestInitiatePullThroughCache:
         }
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/library/ubuntu', image_digest='sha256:abc123'
+            ecr_stub, 'docker-hub/library/ubuntu', image_digest='sha256:abc123'
         )
 
         assert success is True
-        mock_client.batch_get_image.assert_called_once()
-        call_args = mock_client.batch_get_image.call_args
-        assert call_args[1]['imageIds'] == [{'imageDigest': 'sha256:abc123'}]
+        assert len(ecr_stub.batch_get_image.calls) == 1
+        assert ecr_stub.batch_get_image.calls[0]['imageIds'] == [{'imageDigest': 'sha256:abc123'}]
 
-    def test_pull_through_image_not_found_failure(self):
+    def test_pull_through_image_not_found_failure(self, ecr_stub):
         """Test pull-through when image not found in upstream."""
-        mock_client = MagicMock()
-        mock_client.batch_get_image.return_value = {
+        ecr_stub.batch_get_image.ret = {
             'images': [],
             'failures': [
                 {
@@ -400,17 +579,16 @@ class TestInitiatePullThroughCache:
         }
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/library/nonexistent', image_tag='latest'
+            ecr_stub, 'docker-hub/library/nonexistent', image_tag='latest'
         )
 
         assert success is False
         assert 'not found' in message.lower()
         assert details is None
 
-    def test_pull_through_repository_not_found_failure(self):
+    def test_pull_through_repository_not_found_failure(self, ecr_stub):
         """Test pull-through when repository not found."""
-        mock_client = MagicMock()
-        mock_client.batch_get_image.return_value = {
+        ecr_stub.batch_get_image.ret = {
             'images': [],
             'failures': [
                 {
@@ -421,17 +599,16 @@ class TestInitiatePullThroughCache:
         }
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/nonexistent/repo', image_tag='latest'
+            ecr_stub, 'docker-hub/nonexistent/repo', image_tag='latest'
         )
 
         assert success is False
         assert 'not found' in message.lower()
         assert details is None
 
-    def test_pull_through_other_failure(self):
+    def test_pull_through_other_failure(self, ecr_stub):
         """Test pull-through with other failure code."""
-        mock_client = MagicMock()
-        mock_client.batch_get_image.return_value = {
+        ecr_stub.batch_get_image.ret = {
             'images': [],
             'failures': [
                 {
@@ -442,138 +619,130 @@ class TestInitiatePullThroughCache:
         }
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/library/ubuntu', image_tag='latest'
+            ecr_stub, 'docker-hub/library/ubuntu', image_tag='latest'
         )
 
         assert success is False
         assert 'failed' in message.lower()
         assert details is None
 
-    def test_pull_through_no_images_no_failures(self):
+    def test_pull_through_no_images_no_failures(self, ecr_stub):
         """Test pull-through when response has no images and no failures."""
-        mock_client = MagicMock()
-        mock_client.batch_get_image.return_value = {
+        ecr_stub.batch_get_image.ret = {
             'images': [],
             'failures': [],
         }
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/library/ubuntu', image_tag='latest'
+            ecr_stub, 'docker-hub/library/ubuntu', image_tag='latest'
         )
 
         assert success is False
         assert 'no images' in message.lower()
         assert details is None
 
-    def test_pull_through_repository_not_found_exception(self):
+    def test_pull_through_repository_not_found_exception(self, ecr_stub):
         """Test pull-through when RepositoryNotFoundException is raised."""
-        mock_client = MagicMock()
         error_response = {
             'Error': {
                 'Code': 'RepositoryNotFoundException',
                 'Message': 'Repository does not exist',
             }
         }
-        mock_client.batch_get_image.side_effect = botocore.exceptions.ClientError(
+        ecr_stub.batch_get_image.exc = botocore.exceptions.ClientError(
             error_response, 'BatchGetImage'
         )
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/library/ubuntu', image_tag='latest'
+            ecr_stub, 'docker-hub/library/ubuntu', image_tag='latest'
         )
 
         assert success is False
         assert 'does not exist' in message.lower()
         assert details is None
 
-    def test_pull_through_image_not_found_exception(self):
+    def test_pull_through_image_not_found_exception(self, ecr_stub):
         """Test pull-through when ImageNotFoundException is raised."""
-        mock_client = MagicMock()
         error_response = {
             'Error': {
                 'Code': 'ImageNotFoundException',
                 'Message': 'Image not found',
             }
         }
-        mock_client.batch_get_image.side_effect = botocore.exceptions.ClientError(
+        ecr_stub.batch_get_image.exc = botocore.exceptions.ClientError(
             error_response, 'BatchGetImage'
         )
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/library/ubuntu', image_tag='latest'
+            ecr_stub, 'docker-hub/library/ubuntu', image_tag='latest'
         )
 
         assert success is False
         assert 'not found' in message.lower()
         assert details is None
 
-    def test_pull_through_access_denied_exception(self):
+    def test_pull_through_access_denied_exception(self, ecr_stub):
         """Test pull-through when AccessDeniedException is raised."""
-        mock_client = MagicMock()
         error_response = {
             'Error': {
                 'Code': 'AccessDeniedException',
                 'Message': 'Access denied',
             }
         }
-        mock_client.batch_get_image.side_effect = botocore.exceptions.ClientError(
+        ecr_stub.batch_get_image.exc = botocore.exceptions.ClientError(
             error_response, 'BatchGetImage'
         )
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/library/ubuntu', image_tag='latest'
+            ecr_stub, 'docker-hub/library/ubuntu', image_tag='latest'
         )
 
         assert success is False
         assert 'access denied' in message.lower()
         assert details is None
 
-    def test_pull_through_other_client_error(self):
+    def test_pull_through_other_client_error(self, ecr_stub):
         """Test pull-through when other ClientError is raised."""
-        mock_client = MagicMock()
         error_response = {
             'Error': {
                 'Code': 'InternalServerError',
                 'Message': 'Internal error',
             }
         }
-        mock_client.batch_get_image.side_effect = botocore.exceptions.ClientError(
+        ecr_stub.batch_get_image.exc = botocore.exceptions.ClientError(
             error_response, 'BatchGetImage'
         )
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/library/ubuntu', image_tag='latest'
+            ecr_stub, 'docker-hub/library/ubuntu', image_tag='latest'
         )
 
         assert success is False
         assert 'failed' in message.lower()
         assert details is None
 
-    def test_pull_through_unexpected_exception(self):
+    def test_pull_through_unexpected_exception(self, ecr_stub):
         """Test pull-through when unexpected exception is raised."""
-        mock_client = MagicMock()
-        mock_client.batch_get_image.side_effect = Exception('Unexpected error')
+        ecr_stub.batch_get_image.exc = Exception('Unexpected error')
 
         success, message, details = initiate_pull_through_cache(
-            mock_client, 'docker-hub/library/ubuntu', image_tag='latest'
+            ecr_stub, 'docker-hub/library/ubuntu', image_tag='latest'
         )
 
         assert success is False
         assert 'unexpected' in message.lower()
         assert details is None
 
-    def test_pull_through_default_tag(self):
+    def test_pull_through_default_tag(self, ecr_stub):
         """Test pull-through uses 'latest' as default tag."""
-        mock_client = MagicMock()
-        mock_client.batch_get_image.return_value = {
+        ecr_stub.batch_get_image.ret = {
             'images': [{'imageId': {'imageDigest': 'sha256:abc', 'imageTag': 'latest'}}],
             'failures': [],
         }
 
-        initiate_pull_through_cache(mock_client, 'docker-hub/library/ubuntu')
+        initiate_pull_through_cache(ecr_stub, 'docker-hub/library/ubuntu')
 
-        call_args = mock_client.batch_get_image.call_args
-        assert call_args[1]['imageIds'] == [{'imageTag': 'latest'}]
+        assert ecr_stub.batch_get_image.calls[-1]['imageIds'] == [{'imageTag': 'latest'}]
 
 
 # =============================================================================
@@ -584,46 +753,43 @@ class TestInitiatePullThroughCache:
 class TestIsPullThroughCacheRepository:
     """Additional tests for _is_pull_through_cache_repository function."""
 
-    def test_other_client_error_fallback(self):
+    def test_other_client_error_fallback(self, ecr_stub):
         """Test fallback to default prefixes on non-AccessDenied ClientError."""
-        mock_client = MagicMock()
         error_response = {
             'Error': {
                 'Code': 'InternalServerError',
                 'Message': 'Internal error',
             }
         }
-        mock_client.describe_pull_through_cache_rules.side_effect = (
-            botocore.exceptions.ClientError(error_response, 'DescribePullThroughCacheRules')
+        ecr_stub.describe_pull_through_cache_rules.exc = botocore.exceptions.ClientError(
+            error_response, 'DescribePullThroughCacheRules'
         )
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             # Should fall back to default prefix check
             result = _is_pull_through_cache_repository('docker-hub/library/ubuntu')
 
         assert result is True
 
-    def test_unexpected_exception_fallback(self):
+    def test_unexpected_exception_fallback(self, ecr_stub):
         """Test fallback to default prefixes on unexpected exception."""
-        mock_client = MagicMock()
-        mock_client.describe_pull_through_cache_rules.side_effect = Exception('Unexpected')
+        ecr_stub.describe_pull_through_cache_rules.exc = Exception('Unexpected')
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             result = _is_pull_through_cache_repository('docker-hub/library/ubuntu')
 
         assert result is True
 
-    def test_pagination_handling(self):
+    def test_pagination_handling(self, ecr_stub):
         """Test that pagination is handled correctly."""
-        mock_client = MagicMock()
         # First page returns nextToken, second page doesn't
-        mock_client.describe_pull_through_cache_rules.side_effect = [
+        ecr_stub.describe_pull_through_cache_rules.outcomes = [
             {
                 'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}],
                 'nextToken': 'token123',
@@ -635,205 +801,218 @@ class TestIsPullThroughCacheRepository:
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             result = _is_pull_through_cache_repository('quay/myimage')
 
         assert result is True
-        assert mock_client.describe_pull_through_cache_rules.call_count == 2
+        assert len(ecr_stub.describe_pull_through_cache_rules.calls) == 2
+
+
+class TestGetRepositoryCreationTemplates:
+    """Tests for _get_repository_creation_templates function."""
+
+    def test_fetches_all_prefixes_in_one_request_per_page(self, ecr_stub):
+        """Test that templates for all prefixes are requested together and paged through."""
+        ecr_stub.describe_repository_creation_templates.outcomes = [
+            {'repositoryCreationTemplates': [{'prefix': 'docker-hub'}], 'nextToken': 'page2'},
+            {'repositoryCreationTemplates': [{'prefix': 'quay'}]},
+        ]
+
+        templates = _get_repository_creation_templates(
+            ecr_stub, ['docker-hub', 'quay', 'docker-hub', 'ecr-public']
+        )
+
+        assert set(templates) == {'docker-hub', 'quay'}
+        assert ecr_stub.describe_repository_creation_templates.calls == [
+            {'prefixes': ['docker-hub', 'quay', 'ecr-public']},
+            {'prefixes': ['docker-hub', 'quay', 'ecr-public'], 'nextToken': 'page2'},
+        ]
+
+    def test_no_prefixes_makes_no_request(self, ecr_stub):
+        """Test that an empty prefix list skips the API call."""
+        assert _get_repository_creation_templates(ecr_stub, []) == {}
+        assert ecr_stub.describe_repository_creation_templates.calls == []
+
+    def test_client_error_returns_no_templates(self, ecr_stub):
+        """Test that a failed lookup is treated as no templates."""
+        error_response = {'Error': {'Code': 'AccessDeniedException', 'Message': 'Denied'}}
+        ecr_stub.describe_repository_creation_templates.exc = botocore.exceptions.ClientError(
+            error_response, 'DescribeRepositoryCreationTemplates'
+        )
+
+        assert _get_repository_creation_templates(ecr_stub, ['docker-hub']) == {}
+
+    def test_empty_prefixes_are_not_requested(self, ecr_stub):
+        """Test that empty prefixes are dropped before the lookup."""
+        ecr_stub.describe_repository_creation_templates.ret = _TEMPLATE_RESPONSE
+
+        templates = _get_repository_creation_templates(ecr_stub, ['', 'docker-hub', ''])
+
+        assert set(templates) == {'docker-hub'}
+        assert ecr_stub.describe_repository_creation_templates.calls == [
+            {'prefixes': ['docker-hub']}
+        ]
+
+    def test_batch_error_falls_back_to_per_prefix_lookups(self, ecr_stub):
+        """Test that a failed batched lookup does not hide the templates of other prefixes."""
+        ecr_stub.describe_repository_creation_templates.outcomes = [
+            botocore.exceptions.ClientError(
+                {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+                'DescribeRepositoryCreationTemplates',
+            ),
+            _TEMPLATE_RESPONSE,
+            botocore.exceptions.ClientError(
+                {'Error': {'Code': 'TemplateNotFoundException', 'Message': 'Not found'}},
+                'DescribeRepositoryCreationTemplates',
+            ),
+        ]
+
+        templates = _get_repository_creation_templates(ecr_stub, ['docker-hub', 'quay'])
+
+        assert set(templates) == {'docker-hub'}
+        assert ecr_stub.describe_repository_creation_templates.calls == [
+            {'prefixes': ['docker-hub', 'quay']},
+            {'prefixes': ['docker-hub']},
+            {'prefixes': ['quay']},
+        ]
 
 
 class TestCheckPullThroughCacheHealthOmicsUsability:
     """Tests for _check_pull_through_cache_healthomics_usability function."""
 
-    def test_no_matching_rule(self):
+    def test_no_matching_rule(self, ecr_stub):
         """Test when no matching PTC rule exists."""
-        mock_client = MagicMock()
-        mock_client.describe_pull_through_cache_rules.return_value = {
+        ecr_stub.describe_pull_through_cache_rules.ret = {
             'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'other-prefix'}]
         }
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             result = _check_pull_through_cache_healthomics_usability('docker-hub/library/ubuntu')
 
         assert result['is_ptc'] is False
         assert result['healthomics_usable'] is False
 
-    def test_matching_rule_with_full_permissions(self):
+    def test_matching_rule_with_full_permissions(self, ecr_stub):
         """Test when matching rule exists with full HealthOmics permissions."""
-        mock_client = MagicMock()
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [
-                {'ecrRepositoryPrefix': 'docker-hub', 'upstreamRegistryUrl': 'https://docker.io'}
-            ]
-        }
-        mock_client.get_registry_policy.return_value = {
-            'policyText': json.dumps(
-                {
-                    'Version': '2012-10-17',
-                    'Statement': [
-                        {
-                            'Effect': 'Allow',
-                            'Principal': {'Service': 'omics.amazonaws.com'},
-                            'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                        }
-                    ],
-                }
-            )
-        }
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': [
-                {
-                    'repositoryPolicy': json.dumps(
-                        {
-                            'Version': '2012-10-17',
-                            'Statement': [
-                                {
-                                    'Effect': 'Allow',
-                                    'Principal': {'Service': 'omics.amazonaws.com'},
-                                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                                }
-                            ],
-                        }
-                    )
-                }
-            ]
-        }
+        ecr_stub.describe_pull_through_cache_rules.ret = _DOCKER_HUB_UPSTREAM_PTC_RULES_RESPONSE
+        ecr_stub.get_registry_policy.ret = {'policyText': _REGISTRY_POLICY_TEXT}
+        ecr_stub.describe_repository_creation_templates.ret = _TEMPLATE_RESPONSE
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             result = _check_pull_through_cache_healthomics_usability('docker-hub/library/ubuntu')
 
         assert result['is_ptc'] is True
         assert result['healthomics_usable'] is True
 
-    def test_registry_policy_not_found(self):
+    def test_registry_policy_not_found(self, ecr_stub):
         """Test when registry policy doesn't exist."""
-        mock_client = MagicMock()
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}]
-        }
+        ecr_stub.describe_pull_through_cache_rules.ret = _DOCKER_HUB_PTC_RULES_RESPONSE
         error_response = {
             'Error': {'Code': 'RegistryPolicyNotFoundException', 'Message': 'Not found'}
         }
-        mock_client.get_registry_policy.side_effect = botocore.exceptions.ClientError(
+        ecr_stub.get_registry_policy.exc = botocore.exceptions.ClientError(
             error_response, 'GetRegistryPolicy'
         )
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': []
-        }
+        ecr_stub.describe_repository_creation_templates.ret = _NO_TEMPLATES_RESPONSE
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             result = _check_pull_through_cache_healthomics_usability('docker-hub/library/ubuntu')
 
         assert result['is_ptc'] is True
         assert result['healthomics_usable'] is False
 
-    def test_registry_policy_other_error(self):
+    def test_registry_policy_other_error(self, ecr_stub):
         """Test when registry policy fetch fails with other error."""
-        mock_client = MagicMock()
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}]
-        }
+        ecr_stub.describe_pull_through_cache_rules.ret = _DOCKER_HUB_PTC_RULES_RESPONSE
         error_response = {'Error': {'Code': 'InternalServerError', 'Message': 'Error'}}
-        mock_client.get_registry_policy.side_effect = botocore.exceptions.ClientError(
+        ecr_stub.get_registry_policy.exc = botocore.exceptions.ClientError(
             error_response, 'GetRegistryPolicy'
         )
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': []
-        }
+        ecr_stub.describe_repository_creation_templates.ret = _NO_TEMPLATES_RESPONSE
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             result = _check_pull_through_cache_healthomics_usability('docker-hub/library/ubuntu')
 
         assert result['is_ptc'] is True
 
-    def test_template_not_found(self):
+    def test_template_not_found(self, ecr_stub):
         """Test when repository creation template doesn't exist."""
-        mock_client = MagicMock()
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}]
-        }
-        mock_client.get_registry_policy.return_value = {'policyText': '{}'}
+        ecr_stub.describe_pull_through_cache_rules.ret = _DOCKER_HUB_PTC_RULES_RESPONSE
+        ecr_stub.get_registry_policy.ret = {'policyText': '{}'}
         error_response = {'Error': {'Code': 'TemplateNotFoundException', 'Message': 'Not found'}}
-        mock_client.describe_repository_creation_templates.side_effect = (
-            botocore.exceptions.ClientError(error_response, 'DescribeRepositoryCreationTemplates')
+        ecr_stub.describe_repository_creation_templates.exc = botocore.exceptions.ClientError(
+            error_response, 'DescribeRepositoryCreationTemplates'
         )
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             result = _check_pull_through_cache_healthomics_usability('docker-hub/library/ubuntu')
 
         assert result['is_ptc'] is True
         assert result['healthomics_usable'] is False
 
-    def test_template_other_error(self):
+    def test_template_other_error(self, ecr_stub):
         """Test when template fetch fails with other error."""
-        mock_client = MagicMock()
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}]
-        }
-        mock_client.get_registry_policy.return_value = {'policyText': '{}'}
+        ecr_stub.describe_pull_through_cache_rules.ret = _DOCKER_HUB_PTC_RULES_RESPONSE
+        ecr_stub.get_registry_policy.ret = {'policyText': '{}'}
         error_response = {'Error': {'Code': 'InternalServerError', 'Message': 'Error'}}
-        mock_client.describe_repository_creation_templates.side_effect = (
-            botocore.exceptions.ClientError(error_response, 'DescribeRepositoryCreationTemplates')
+        ecr_stub.describe_repository_creation_templates.exc = botocore.exceptions.ClientError(
+            error_response, 'DescribeRepositoryCreationTemplates'
         )
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             result = _check_pull_through_cache_healthomics_usability('docker-hub/library/ubuntu')
 
         assert result['is_ptc'] is True
 
-    def test_unexpected_exception(self):
+    def test_unexpected_exception(self, ecr_stub):
         """Test when unexpected exception occurs."""
-        mock_client = MagicMock()
-        mock_client.describe_pull_through_cache_rules.side_effect = Exception('Unexpected')
+        ecr_stub.describe_pull_through_cache_rules.exc = Exception('Unexpected')
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             result = _check_pull_through_cache_healthomics_usability('docker-hub/library/ubuntu')
 
         assert result['is_ptc'] is False
         assert result['healthomics_usable'] is False
 
-    def test_pagination_handling(self):
+    def test_pagination_handling(self, ecr_stub):
         """Test that pagination is handled when fetching PTC rules."""
-        mock_client = MagicMock()
-        mock_client.describe_pull_through_cache_rules.side_effect = [
+        ecr_stub.describe_pull_through_cache_rules.outcomes = [
             {'pullThroughCacheRules': [], 'nextToken': 'token1'},
-            {'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}]},
+            _DOCKER_HUB_PTC_RULES_RESPONSE,
         ]
-        mock_client.get_registry_policy.return_value = {'policyText': '{}'}
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': []
-        }
+        ecr_stub.get_registry_policy.ret = {'policyText': '{}'}
+        ecr_stub.describe_repository_creation_templates.ret = _NO_TEMPLATES_RESPONSE
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
+            return_value=ecr_stub,
         ):
             result = _check_pull_through_cache_healthomics_usability('docker-hub/library/ubuntu')
 
         assert result['is_ptc'] is True
-        assert mock_client.describe_pull_through_cache_rules.call_count == 2
+        assert len(ecr_stub.describe_pull_through_cache_rules.calls) == 2
 
 
 # =============================================================================
@@ -845,10 +1024,9 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
     """Tests for check_container_availability with initiate_pull_through=True."""
 
     @pytest.mark.asyncio
-    async def test_initiate_pull_through_on_repo_not_found_success(self):
+    async def test_initiate_pull_through_on_repo_not_found_success(self, ctx):
         """Test successful pull-through initiation when repository not found."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         # First call raises RepositoryNotFoundException
         error_response = {'Error': {'Code': 'RepositoryNotFoundException', 'Message': 'Not found'}}
@@ -857,41 +1035,11 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
         )
 
         # PTC rules exist
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}]
-        }
+        mock_client.describe_pull_through_cache_rules.return_value = _DOCKER_HUB_PTC_RULES_RESPONSE
 
         # Registry policy and template grant HealthOmics access
-        mock_client.get_registry_policy.return_value = {
-            'policyText': json.dumps(
-                {
-                    'Statement': [
-                        {
-                            'Effect': 'Allow',
-                            'Principal': {'Service': 'omics.amazonaws.com'},
-                            'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                        }
-                    ]
-                }
-            )
-        }
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': [
-                {
-                    'repositoryPolicy': json.dumps(
-                        {
-                            'Statement': [
-                                {
-                                    'Effect': 'Allow',
-                                    'Principal': {'Service': 'omics.amazonaws.com'},
-                                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                                }
-                            ]
-                        }
-                    )
-                }
-            ]
-        }
+        mock_client.get_registry_policy.return_value = {'policyText': _REGISTRY_POLICY_TEXT}
+        mock_client.describe_repository_creation_templates.return_value = _TEMPLATE_RESPONSE
 
         # batch_get_image succeeds
         mock_client.batch_get_image.return_value = {
@@ -904,7 +1052,7 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='docker-hub/library/ubuntu',
                 image_tag='latest',
                 image_digest=None,
@@ -915,10 +1063,9 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
         assert result['pull_through_initiated'] is True
 
     @pytest.mark.asyncio
-    async def test_initiate_pull_through_on_repo_not_found_not_usable(self):
+    async def test_initiate_pull_through_on_repo_not_found_not_usable(self, ctx):
         """Test pull-through not initiated when PTC not usable by HealthOmics."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         error_response = {'Error': {'Code': 'RepositoryNotFoundException', 'Message': 'Not found'}}
         mock_client.describe_images.side_effect = botocore.exceptions.ClientError(
@@ -926,25 +1073,21 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
         )
 
         # PTC rules exist but no permissions
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}]
-        }
+        mock_client.describe_pull_through_cache_rules.return_value = _DOCKER_HUB_PTC_RULES_RESPONSE
         error_response2 = {
             'Error': {'Code': 'RegistryPolicyNotFoundException', 'Message': 'Not found'}
         }
         mock_client.get_registry_policy.side_effect = botocore.exceptions.ClientError(
             error_response2, 'GetRegistryPolicy'
         )
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': []
-        }
+        mock_client.describe_repository_creation_templates.return_value = _NO_TEMPLATES_RESPONSE
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='docker-hub/library/ubuntu',
                 image_tag='latest',
                 image_digest=None,
@@ -956,49 +1099,18 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
         assert 'not usable' in result['pull_through_initiation_message'].lower()
 
     @pytest.mark.asyncio
-    async def test_initiate_pull_through_on_image_not_found_success(self):
+    async def test_initiate_pull_through_on_image_not_found_success(self, ctx):
         """Test successful pull-through initiation when image not found."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         error_response = {'Error': {'Code': 'ImageNotFoundException', 'Message': 'Not found'}}
         mock_client.describe_images.side_effect = botocore.exceptions.ClientError(
             error_response, 'DescribeImages'
         )
 
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}]
-        }
-        mock_client.get_registry_policy.return_value = {
-            'policyText': json.dumps(
-                {
-                    'Statement': [
-                        {
-                            'Effect': 'Allow',
-                            'Principal': {'Service': 'omics.amazonaws.com'},
-                            'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                        }
-                    ]
-                }
-            )
-        }
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': [
-                {
-                    'repositoryPolicy': json.dumps(
-                        {
-                            'Statement': [
-                                {
-                                    'Effect': 'Allow',
-                                    'Principal': {'Service': 'omics.amazonaws.com'},
-                                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                                }
-                            ]
-                        }
-                    )
-                }
-            ]
-        }
+        mock_client.describe_pull_through_cache_rules.return_value = _DOCKER_HUB_PTC_RULES_RESPONSE
+        mock_client.get_registry_policy.return_value = {'policyText': _REGISTRY_POLICY_TEXT}
+        mock_client.describe_repository_creation_templates.return_value = _TEMPLATE_RESPONSE
         mock_client.batch_get_image.return_value = {
             'images': [{'imageId': {'imageDigest': 'sha256:abc', 'imageTag': 'latest'}}],
             'failures': [],
@@ -1009,7 +1121,7 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='docker-hub/library/ubuntu',
                 image_tag='latest',
                 image_digest=None,
@@ -1020,49 +1132,18 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
         assert result['pull_through_initiated'] is True
 
     @pytest.mark.asyncio
-    async def test_initiate_pull_through_failure(self):
+    async def test_initiate_pull_through_failure(self, ctx):
         """Test when pull-through initiation fails."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         error_response = {'Error': {'Code': 'ImageNotFoundException', 'Message': 'Not found'}}
         mock_client.describe_images.side_effect = botocore.exceptions.ClientError(
             error_response, 'DescribeImages'
         )
 
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}]
-        }
-        mock_client.get_registry_policy.return_value = {
-            'policyText': json.dumps(
-                {
-                    'Statement': [
-                        {
-                            'Effect': 'Allow',
-                            'Principal': {'Service': 'omics.amazonaws.com'},
-                            'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                        }
-                    ]
-                }
-            )
-        }
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': [
-                {
-                    'repositoryPolicy': json.dumps(
-                        {
-                            'Statement': [
-                                {
-                                    'Effect': 'Allow',
-                                    'Principal': {'Service': 'omics.amazonaws.com'},
-                                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                                }
-                            ]
-                        }
-                    )
-                }
-            ]
-        }
+        mock_client.describe_pull_through_cache_rules.return_value = _DOCKER_HUB_PTC_RULES_RESPONSE
+        mock_client.get_registry_policy.return_value = {'policyText': _REGISTRY_POLICY_TEXT}
+        mock_client.describe_repository_creation_templates.return_value = _TEMPLATE_RESPONSE
         # batch_get_image fails
         mock_client.batch_get_image.return_value = {
             'images': [],
@@ -1074,7 +1155,7 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='docker-hub/library/ubuntu',
                 image_tag='latest',
                 image_digest=None,
@@ -1085,10 +1166,9 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
         assert result['pull_through_initiated'] is False
 
     @pytest.mark.asyncio
-    async def test_no_initiate_when_not_ptc(self):
+    async def test_no_initiate_when_not_ptc(self, ctx):
         """Test that pull-through is not initiated for non-PTC repositories."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         error_response = {'Error': {'Code': 'RepositoryNotFoundException', 'Message': 'Not found'}}
         mock_client.describe_images.side_effect = botocore.exceptions.ClientError(
@@ -1096,14 +1176,14 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
         )
 
         # No PTC rules match
-        mock_client.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
+        mock_client.describe_pull_through_cache_rules.return_value = _NO_PTC_RULES_RESPONSE
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-private-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -1116,24 +1196,63 @@ class TestCheckContainerAvailabilityPullThroughInitiation:
         mock_client.batch_get_image.assert_not_called()
 
 
+class TestBuildImageAvailableResponse:
+    """Tests for _build_image_available_response function."""
+
+    def test_prefers_requested_tag(self):
+        """Test that the requested tag is reported when the image carries it."""
+        response = _build_image_available_response(
+            'my-repo',
+            'v2',
+            {'imageDigest': 'sha256:abc', 'imageTags': ['latest', 'v2'], 'imageSizeInBytes': 10},
+            False,
+            HealthOmicsAccessStatus.ACCESSIBLE,
+            [],
+        )
+
+        assert response.available is True
+        assert response.image is not None
+        assert response.image.image_tag == 'v2'
+        assert response.image.image_size_bytes == 10
+        assert response.message == 'Image found: my-repo:v2'
+
+    def test_not_accessible_lists_missing_permissions(self):
+        """Test that missing permissions are reported and the digest is used when untagged."""
+        response = _build_image_available_response(
+            'my-repo',
+            None,
+            {'imageDigest': 'sha256:abc'},
+            True,
+            HealthOmicsAccessStatus.NOT_ACCESSIBLE,
+            ['ecr:BatchGetImage'],
+        )
+
+        assert response.image is not None
+        assert response.image.image_tag is None
+        assert response.is_pull_through_cache is True
+        assert response.message == (
+            'Image found: my-repo:sha256:abc. WARNING: HealthOmics cannot access this '
+            'image - missing permissions: ecr:BatchGetImage'
+        )
+
+
 class TestCheckContainerAvailabilityEdgeCases:
     """Additional edge case tests for check_container_availability."""
 
     @pytest.mark.asyncio
-    async def test_empty_image_details_response(self):
+    async def test_empty_image_details_response(self, ctx):
         """Test when describe_images returns empty imageDetails."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
-
-        mock_client.describe_images.return_value = {'imageDetails': []}
-        mock_client.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
+        mock_client = SimpleNamespace(
+            describe_images=Recorder(ret={'imageDetails': []}),
+            describe_pull_through_cache_rules=Recorder(ret=_NO_PTC_RULES_RESPONSE),
+        )
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -1144,20 +1263,19 @@ class TestCheckContainerAvailabilityEdgeCases:
         assert 'not found' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_botocore_error_handling(self):
+    async def test_botocore_error_handling(self, ctx):
         """Test BotoCoreError handling."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         mock_client.describe_images.side_effect = botocore.exceptions.BotoCoreError()
-        mock_client.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
+        mock_client.describe_pull_through_cache_rules.return_value = _NO_PTC_RULES_RESPONSE
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -1168,20 +1286,19 @@ class TestCheckContainerAvailabilityEdgeCases:
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_unexpected_exception_handling(self):
+    async def test_unexpected_exception_handling(self, ctx):
         """Test unexpected exception handling."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         mock_client.describe_images.side_effect = Exception('Unexpected error')
-        mock_client.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
+        mock_client.describe_pull_through_cache_rules.return_value = _NO_PTC_RULES_RESPONSE
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -1201,10 +1318,9 @@ class TestListECRRepositoriesEdgeCases:
     """Additional edge case tests for list_ecr_repositories."""
 
     @pytest.mark.asyncio
-    async def test_unexpected_exception(self):
+    async def test_unexpected_exception(self, ctx):
         """Test unexpected exception handling."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         mock_client.describe_repositories.side_effect = Exception('Unexpected error')
 
@@ -1213,7 +1329,7 @@ class TestListECRRepositoriesEdgeCases:
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1232,151 +1348,62 @@ class TestValidateHealthOmicsECRConfigAdditional:
     """Additional tests for validate_healthomics_ecr_config."""
 
     @pytest.mark.asyncio
-    async def test_registry_policy_missing_actions(self):
-        """Test validation when registry policy is missing some actions."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
-
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [{'ecrRepositoryPrefix': 'docker-hub'}]
-        }
-        # Policy exists but missing BatchImportUpstreamImage
-        mock_client.get_registry_policy.return_value = {
-            'policyText': json.dumps(
-                {
-                    'Statement': [
-                        {
-                            'Effect': 'Allow',
-                            'Principal': {'Service': 'omics.amazonaws.com'},
-                            'Action': ['ecr:CreateRepository'],  # Missing BatchImportUpstreamImage
-                        }
-                    ]
-                }
-            )
-        }
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': [
-                {
-                    'repositoryPolicy': json.dumps(
-                        {
-                            'Statement': [
-                                {
-                                    'Effect': 'Allow',
-                                    'Principal': {'Service': 'omics.amazonaws.com'},
-                                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                                }
-                            ]
-                        }
-                    )
-                }
-            ]
-        }
-
-        with patch(
-            'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
-        ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
-
-        assert result['valid'] is False
-        assert any('registry_policy' in issue['component'] for issue in result['issues'])
-
-    @pytest.mark.asyncio
-    async def test_template_without_policy(self):
-        """Test validation when template exists but has no policy."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
-
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [
-                {'ecrRepositoryPrefix': 'docker-hub', 'upstreamRegistryUrl': 'https://docker.io'}
-            ]
-        }
-        mock_client.get_registry_policy.return_value = {
-            'policyText': json.dumps(
-                {
-                    'Statement': [
-                        {
-                            'Effect': 'Allow',
-                            'Principal': {'Service': 'omics.amazonaws.com'},
-                            'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                        }
-                    ]
-                }
-            )
-        }
-        # Template exists but has no repositoryPolicy
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': [{'prefix': 'docker-hub'}]  # No repositoryPolicy
-        }
-
-        with patch(
-            'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
-            return_value=mock_client,
-        ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
-
-        assert result['valid'] is False
-
-    @pytest.mark.asyncio
-    async def test_template_missing_permissions(self):
-        """Test validation when template policy is missing permissions."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
-
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [
-                {'ecrRepositoryPrefix': 'docker-hub', 'upstreamRegistryUrl': 'https://docker.io'}
-            ]
-        }
-        mock_client.get_registry_policy.return_value = {
-            'policyText': json.dumps(
-                {
-                    'Statement': [
-                        {
-                            'Effect': 'Allow',
-                            'Principal': {'Service': 'omics.amazonaws.com'},
-                            'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                        }
-                    ]
-                }
-            )
-        }
-        # Template policy missing GetDownloadUrlForLayer
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': [
+    @pytest.mark.parametrize(
+        'ptc_rules_response,registry_policy_text,template,expected_component',
+        [
+            pytest.param(
+                _DOCKER_HUB_PTC_RULES_RESPONSE,
+                # Policy exists but missing BatchImportUpstreamImage
+                _healthomics_grant_policy_text(['ecr:CreateRepository']),
+                {'prefix': 'docker-hub', 'repositoryPolicy': _TEMPLATE_POLICY_TEXT},
+                'registry_policy',
+                id='registry_policy_missing_actions',
+            ),
+            pytest.param(
+                _DOCKER_HUB_UPSTREAM_PTC_RULES_RESPONSE,
+                _REGISTRY_POLICY_TEXT,
+                {'prefix': 'docker-hub'},  # No repositoryPolicy
+                'repository_template',
+                id='template_without_policy',
+            ),
+            pytest.param(
+                _DOCKER_HUB_UPSTREAM_PTC_RULES_RESPONSE,
+                _REGISTRY_POLICY_TEXT,
+                # Template policy missing GetDownloadUrlForLayer
                 {
-                    'repositoryPolicy': json.dumps(
-                        {
-                            'Statement': [
-                                {
-                                    'Effect': 'Allow',
-                                    'Principal': {'Service': 'omics.amazonaws.com'},
-                                    'Action': [
-                                        'ecr:BatchGetImage'
-                                    ],  # Missing GetDownloadUrlForLayer
-                                }
-                            ]
-                        }
-                    )
-                }
-            ]
-        }
+                    'prefix': 'docker-hub',
+                    'repositoryPolicy': _healthomics_grant_policy_text(['ecr:BatchGetImage']),
+                },
+                'repository_template',
+                id='template_missing_permissions',
+            ),
+        ],
+    )
+    async def test_invalid_healthomics_permissions(
+        self, ctx, ptc_rules_response, registry_policy_text, template, expected_component
+    ):
+        """Test validation reports the component whose HealthOmics permissions are lacking."""
+        mock_client = SimpleNamespace(
+            describe_pull_through_cache_rules=Recorder(ret=ptc_rules_response),
+            get_registry_policy=Recorder(ret={'policyText': registry_policy_text}),
+            describe_repository_creation_templates=Recorder(
+                ret={'repositoryCreationTemplates': [template]}
+            ),
+        )
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         assert result['valid'] is False
-        assert any('repository_template' in issue['component'] for issue in result['issues'])
+        assert any(expected_component in issue['component'] for issue in result['issues'])
 
     @pytest.mark.asyncio
-    async def test_unexpected_exception(self):
+    async def test_unexpected_exception(self, ctx):
         """Test unexpected exception handling."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         mock_client.describe_pull_through_cache_rules.side_effect = Exception('Unexpected')
 
@@ -1384,7 +1411,7 @@ class TestValidateHealthOmicsECRConfigAdditional:
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         assert 'error' in result
         assert 'Error' in result['error']
@@ -1399,50 +1426,23 @@ class TestCreateContainerRegistryMap:
     """Tests for create_container_registry_map function."""
 
     @pytest.mark.asyncio
-    async def test_successful_map_creation_with_discovered_caches(self):
+    async def test_successful_map_creation_with_discovered_caches(self, ctx):
         """Test successful map creation with discovered PTC rules."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
-
         # Mock PTC rules discovery
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [
-                {
-                    'ecrRepositoryPrefix': 'docker-hub',
-                    'upstreamRegistryUrl': 'https://registry-1.docker.io',
-                }
-            ]
-        }
-        mock_client.get_registry_policy.return_value = {
-            'policyText': json.dumps(
-                {
-                    'Statement': [
+        mock_client = SimpleNamespace(
+            describe_pull_through_cache_rules=Recorder(
+                ret={
+                    'pullThroughCacheRules': [
                         {
-                            'Effect': 'Allow',
-                            'Principal': {'Service': 'omics.amazonaws.com'},
-                            'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
+                            'ecrRepositoryPrefix': 'docker-hub',
+                            'upstreamRegistryUrl': 'https://registry-1.docker.io',
                         }
                     ]
                 }
-            )
-        }
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': [
-                {
-                    'repositoryPolicy': json.dumps(
-                        {
-                            'Statement': [
-                                {
-                                    'Effect': 'Allow',
-                                    'Principal': {'Service': 'omics.amazonaws.com'},
-                                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                                }
-                            ]
-                        }
-                    )
-                }
-            ]
-        }
+            ),
+            get_registry_policy=Recorder(ret={'policyText': _REGISTRY_POLICY_TEXT}),
+            describe_repository_creation_templates=Recorder(ret=_TEMPLATE_RESPONSE),
+        )
 
         with (
             patch(
@@ -1450,16 +1450,16 @@ class TestCreateContainerRegistryMap:
                 return_value=mock_client,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
             result = await create_container_registry_map(
-                ctx=mock_ctx,
+                ctx=ctx,
                 ecr_account_id=None,
                 ecr_region=None,
                 include_pull_through_caches=True,
@@ -1475,19 +1475,18 @@ class TestCreateContainerRegistryMap:
         assert 'registryMappings' in result['container_registry_map']
 
     @pytest.mark.asyncio
-    async def test_map_creation_with_explicit_account_and_region(self):
+    async def test_map_creation_with_explicit_account_and_region(self, ctx):
         """Test map creation with explicit account ID and region."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
-
-        mock_client.describe_pull_through_cache_rules.return_value = {'pullThroughCacheRules': []}
+        mock_client = SimpleNamespace(
+            describe_pull_through_cache_rules=Recorder(ret=_NO_PTC_RULES_RESPONSE)
+        )
 
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_container_registry_map(
-                ctx=mock_ctx,
+                ctx=ctx,
                 ecr_account_id='987654321098',
                 ecr_region='eu-west-1',
                 include_pull_through_caches=True,
@@ -1501,22 +1500,20 @@ class TestCreateContainerRegistryMap:
         assert result['region'] == 'eu-west-1'
 
     @pytest.mark.asyncio
-    async def test_map_creation_without_ptc_discovery(self):
+    async def test_map_creation_without_ptc_discovery(self, ctx):
         """Test map creation with include_pull_through_caches=False."""
-        mock_ctx = AsyncMock()
-
         with (
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
             result = await create_container_registry_map(
-                ctx=mock_ctx,
+                ctx=ctx,
                 ecr_account_id=None,
                 ecr_region=None,
                 include_pull_through_caches=False,
@@ -1536,22 +1533,20 @@ class TestCreateContainerRegistryMap:
         assert len(result['container_registry_map']['registryMappings']) == 1
 
     @pytest.mark.asyncio
-    async def test_map_creation_with_image_mappings(self):
+    async def test_map_creation_with_image_mappings(self, ctx):
         """Test map creation with image mappings."""
-        mock_ctx = AsyncMock()
-
         with (
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
             result = await create_container_registry_map(
-                ctx=mock_ctx,
+                ctx=ctx,
                 ecr_account_id=None,
                 ecr_region=None,
                 include_pull_through_caches=False,
@@ -1570,22 +1565,20 @@ class TestCreateContainerRegistryMap:
         assert len(result['container_registry_map']['imageMappings']) == 1
 
     @pytest.mark.asyncio
-    async def test_map_creation_with_invalid_registry_mapping(self):
+    async def test_map_creation_with_invalid_registry_mapping(self, ctx):
         """Test that invalid registry mappings are skipped."""
-        mock_ctx = AsyncMock()
-
         with (
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
             result = await create_container_registry_map(
-                ctx=mock_ctx,
+                ctx=ctx,
                 ecr_account_id=None,
                 ecr_region=None,
                 include_pull_through_caches=False,
@@ -1603,22 +1596,20 @@ class TestCreateContainerRegistryMap:
         assert len(result['container_registry_map']['registryMappings']) == 1
 
     @pytest.mark.asyncio
-    async def test_map_creation_with_invalid_image_mapping(self):
+    async def test_map_creation_with_invalid_image_mapping(self, ctx):
         """Test that invalid image mappings are skipped."""
-        mock_ctx = AsyncMock()
-
         with (
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
             result = await create_container_registry_map(
-                ctx=mock_ctx,
+                ctx=ctx,
                 ecr_account_id=None,
                 ecr_region=None,
                 include_pull_through_caches=False,
@@ -1635,16 +1626,14 @@ class TestCreateContainerRegistryMap:
         assert len(result['container_registry_map']['imageMappings']) == 1
 
     @pytest.mark.asyncio
-    async def test_map_creation_account_id_error(self):
+    async def test_map_creation_account_id_error(self, ctx):
         """Test error handling when account ID cannot be retrieved."""
-        mock_ctx = AsyncMock()
-
         with patch(
-            'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+            'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
             side_effect=Exception('Failed to get account ID'),
         ):
             result = await create_container_registry_map(
-                ctx=mock_ctx,
+                ctx=ctx,
                 ecr_account_id=None,
                 ecr_region=None,
                 include_pull_through_caches=False,
@@ -1657,10 +1646,9 @@ class TestCreateContainerRegistryMap:
         assert 'Failed to get AWS account ID' in result['message']
 
     @pytest.mark.asyncio
-    async def test_map_creation_ptc_discovery_error(self):
+    async def test_map_creation_ptc_discovery_error(self, ctx):
         """Test graceful handling when PTC discovery fails."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         mock_client.describe_pull_through_cache_rules.side_effect = Exception('Discovery failed')
 
@@ -1670,16 +1658,16 @@ class TestCreateContainerRegistryMap:
                 return_value=mock_client,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
             result = await create_container_registry_map(
-                ctx=mock_ctx,
+                ctx=ctx,
                 ecr_account_id=None,
                 ecr_region=None,
                 include_pull_through_caches=True,
@@ -1693,49 +1681,22 @@ class TestCreateContainerRegistryMap:
         assert result['discovered_healthomics_usable_caches'] == 0
 
     @pytest.mark.asyncio
-    async def test_map_creation_merge_additional_mappings(self):
+    async def test_map_creation_merge_additional_mappings(self, ctx):
         """Test that additional mappings are merged with discovered ones."""
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
-
-        mock_client.describe_pull_through_cache_rules.return_value = {
-            'pullThroughCacheRules': [
-                {
-                    'ecrRepositoryPrefix': 'docker-hub',
-                    'upstreamRegistryUrl': 'https://registry-1.docker.io',
-                }
-            ]
-        }
-        mock_client.get_registry_policy.return_value = {
-            'policyText': json.dumps(
-                {
-                    'Statement': [
+        mock_client = SimpleNamespace(
+            describe_pull_through_cache_rules=Recorder(
+                ret={
+                    'pullThroughCacheRules': [
                         {
-                            'Effect': 'Allow',
-                            'Principal': {'Service': 'omics.amazonaws.com'},
-                            'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
+                            'ecrRepositoryPrefix': 'docker-hub',
+                            'upstreamRegistryUrl': 'https://registry-1.docker.io',
                         }
                     ]
                 }
-            )
-        }
-        mock_client.describe_repository_creation_templates.return_value = {
-            'repositoryCreationTemplates': [
-                {
-                    'repositoryPolicy': json.dumps(
-                        {
-                            'Statement': [
-                                {
-                                    'Effect': 'Allow',
-                                    'Principal': {'Service': 'omics.amazonaws.com'},
-                                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                                }
-                            ]
-                        }
-                    )
-                }
-            ]
-        }
+            ),
+            get_registry_policy=Recorder(ret={'policyText': _REGISTRY_POLICY_TEXT}),
+            describe_repository_creation_templates=Recorder(ret=_TEMPLATE_RESPONSE),
+        )
 
         with (
             patch(
@@ -1743,16 +1704,16 @@ class TestCreateContainerRegistryMap:
                 return_value=mock_client,
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_account_id',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_account_id',
                 return_value='123456789012',
             ),
             patch(
-                'awslabs.aws_healthomics_mcp_server.utils.aws_utils.get_region',
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_region',
                 return_value='us-east-1',
             ),
         ):
             result = await create_container_registry_map(
-                ctx=mock_ctx,
+                ctx=ctx,
                 ecr_account_id=None,
                 ecr_region=None,
                 include_pull_through_caches=True,
@@ -1789,14 +1750,9 @@ class TestListPullThroughCacheRulesEdgeCases:
     """Additional edge case tests for list_pull_through_cache_rules."""
 
     @pytest.mark.asyncio
-    async def test_unexpected_exception_handling(self):
+    async def test_unexpected_exception_handling(self, ctx):
         """Test unexpected exception handling."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            list_pull_through_cache_rules,
-        )
-
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         mock_client.describe_pull_through_cache_rules.side_effect = Exception('Unexpected error')
 
@@ -1805,7 +1761,7 @@ class TestListPullThroughCacheRulesEdgeCases:
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -1814,40 +1770,69 @@ class TestListPullThroughCacheRulesEdgeCases:
         assert 'Error' in result['error']
 
 
+# Existing repository policy with Statement as dict (not list)
+_SINGLE_STATEMENT_DICT_REPOSITORY_POLICY_TEXT = json.dumps(
+    {
+        'Version': '2012-10-17',
+        'Statement': {
+            'Sid': 'ExistingStatement',
+            'Effect': 'Allow',
+            'Principal': {'AWS': 'arn:aws:iam::123456789012:root'},
+            'Action': ['ecr:GetDownloadUrlForLayer'],
+        },
+    }
+)
+
+# Existing repository policy with HealthOmics in Service list
+_SERVICE_LIST_REPOSITORY_POLICY_TEXT = json.dumps(
+    {
+        'Version': '2012-10-17',
+        'Statement': [
+            {
+                'Sid': 'ExistingHealthOmics',
+                'Effect': 'Allow',
+                'Principal': {'Service': ['omics.amazonaws.com', 'other.amazonaws.com']},
+                'Action': ['ecr:GetDownloadUrlForLayer'],
+            }
+        ],
+    }
+)
+
+# Existing repository policy with HealthOmics as string principal
+_STRING_PRINCIPAL_REPOSITORY_POLICY_TEXT = json.dumps(
+    {
+        'Version': '2012-10-17',
+        'Statement': [
+            {
+                'Sid': 'ExistingHealthOmics',
+                'Effect': 'Allow',
+                'Principal': 'omics.amazonaws.com',
+                'Action': ['ecr:GetDownloadUrlForLayer'],
+            }
+        ],
+    }
+)
+
+
 class TestGrantHealthOmicsRepositoryAccessEdgeCases:
     """Additional edge case tests for grant_healthomics_repository_access."""
 
     @pytest.mark.asyncio
-    async def test_policy_with_single_statement_dict(self):
+    async def test_policy_with_single_statement_dict(self, ctx):
         """Test handling when existing policy has Statement as dict instead of list."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            grant_healthomics_repository_access,
+        mock_client = SimpleNamespace(
+            get_repository_policy=Recorder(
+                ret={'policyText': _SINGLE_STATEMENT_DICT_REPOSITORY_POLICY_TEXT}
+            ),
+            set_repository_policy=Recorder(ret={}),
         )
 
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
-
-        # Existing policy with Statement as dict (not list)
-        existing_policy = {
-            'Version': '2012-10-17',
-            'Statement': {
-                'Sid': 'ExistingStatement',
-                'Effect': 'Allow',
-                'Principal': {'AWS': 'arn:aws:iam::123456789012:root'},
-                'Action': ['ecr:GetDownloadUrlForLayer'],
-            },
-        }
-        mock_client.get_repository_policy.return_value = {
-            'policyText': json.dumps(existing_policy)
-        }
-        mock_client.set_repository_policy.return_value = {}
-
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await grant_healthomics_repository_access(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
             )
 
@@ -1855,38 +1840,21 @@ class TestGrantHealthOmicsRepositoryAccessEdgeCases:
         assert result['policy_updated'] is True
 
     @pytest.mark.asyncio
-    async def test_policy_with_healthomics_service_in_list(self):
+    async def test_policy_with_healthomics_service_in_list(self, ctx):
         """Test handling when existing policy has HealthOmics in Service list."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            grant_healthomics_repository_access,
+        mock_client = SimpleNamespace(
+            get_repository_policy=Recorder(
+                ret={'policyText': _SERVICE_LIST_REPOSITORY_POLICY_TEXT}
+            ),
+            set_repository_policy=Recorder(ret={}),
         )
 
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
-
-        # Existing policy with HealthOmics in Service list
-        existing_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'ExistingHealthOmics',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': ['omics.amazonaws.com', 'other.amazonaws.com']},
-                    'Action': ['ecr:GetDownloadUrlForLayer'],
-                }
-            ],
-        }
-        mock_client.get_repository_policy.return_value = {
-            'policyText': json.dumps(existing_policy)
-        }
-        mock_client.set_repository_policy.return_value = {}
-
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await grant_healthomics_repository_access(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
             )
 
@@ -1895,38 +1863,21 @@ class TestGrantHealthOmicsRepositoryAccessEdgeCases:
         assert result['policy_updated'] is True
 
     @pytest.mark.asyncio
-    async def test_policy_with_healthomics_as_string_principal(self):
+    async def test_policy_with_healthomics_as_string_principal(self, ctx):
         """Test handling when existing policy has HealthOmics as string principal."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            grant_healthomics_repository_access,
+        mock_client = SimpleNamespace(
+            get_repository_policy=Recorder(
+                ret={'policyText': _STRING_PRINCIPAL_REPOSITORY_POLICY_TEXT}
+            ),
+            set_repository_policy=Recorder(ret={}),
         )
 
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
-
-        # Existing policy with HealthOmics as string principal
-        existing_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'ExistingHealthOmics',
-                    'Effect': 'Allow',
-                    'Principal': 'omics.amazonaws.com',
-                    'Action': ['ecr:GetDownloadUrlForLayer'],
-                }
-            ],
-        }
-        mock_client.get_repository_policy.return_value = {
-            'policyText': json.dumps(existing_policy)
-        }
-        mock_client.set_repository_policy.return_value = {}
-
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await grant_healthomics_repository_access(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
             )
 
@@ -1934,14 +1885,9 @@ class TestGrantHealthOmicsRepositoryAccessEdgeCases:
         assert result['policy_updated'] is True
 
     @pytest.mark.asyncio
-    async def test_verify_policy_update_fails(self):
+    async def test_verify_policy_update_fails(self, ctx):
         """Test handling when policy verification fails after update."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            grant_healthomics_repository_access,
-        )
-
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         # No existing policy
         error_response = {
@@ -1958,7 +1904,7 @@ class TestGrantHealthOmicsRepositoryAccessEdgeCases:
             return_value=mock_client,
         ):
             result = await grant_healthomics_repository_access(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
             )
 
@@ -1967,14 +1913,9 @@ class TestGrantHealthOmicsRepositoryAccessEdgeCases:
         assert result['policy_created'] is True
 
     @pytest.mark.asyncio
-    async def test_other_client_error_on_get_policy(self):
+    async def test_other_client_error_on_get_policy(self, ctx):
         """Test handling of other ClientError when getting policy."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            grant_healthomics_repository_access,
-        )
-
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         error_response = {'Error': {'Code': 'InternalServerError', 'Message': 'Error'}}
         mock_client.get_repository_policy.side_effect = botocore.exceptions.ClientError(
@@ -1987,19 +1928,14 @@ class TestGrantHealthOmicsRepositoryAccessEdgeCases:
         ):
             with pytest.raises(botocore.exceptions.ClientError):
                 await grant_healthomics_repository_access(
-                    ctx=mock_ctx,
+                    ctx=ctx,
                     repository_name='my-repo',
                 )
 
     @pytest.mark.asyncio
-    async def test_other_client_error_on_set_policy(self):
+    async def test_other_client_error_on_set_policy(self, ctx):
         """Test handling of other ClientError when setting policy."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            grant_healthomics_repository_access,
-        )
-
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         # No existing policy
         error_response = {
@@ -2021,7 +1957,7 @@ class TestGrantHealthOmicsRepositoryAccessEdgeCases:
         ):
             with pytest.raises(botocore.exceptions.ClientError):
                 await grant_healthomics_repository_access(
-                    ctx=mock_ctx,
+                    ctx=ctx,
                     repository_name='my-repo',
                 )
 
@@ -2030,14 +1966,9 @@ class TestCreatePullThroughCacheEdgeCases:
     """Additional edge case tests for create_pull_through_cache_for_healthomics."""
 
     @pytest.mark.asyncio
-    async def test_template_update_fails_but_has_policy(self):
+    async def test_template_update_fails_but_has_policy(self, ctx):
         """Test when template update fails but existing template has policy."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            create_pull_through_cache_for_healthomics,
-        )
-
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         # PTC rule creation succeeds
         mock_client.create_pull_through_cache_rule.return_value = {
@@ -2077,7 +2008,7 @@ class TestCreatePullThroughCacheEdgeCases:
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -2087,14 +2018,9 @@ class TestCreatePullThroughCacheEdgeCases:
         assert result['repository_template_created'] is True
 
     @pytest.mark.asyncio
-    async def test_template_update_fails_no_policy(self):
+    async def test_template_update_fails_no_policy(self, ctx):
         """Test when template update fails and existing template has no policy."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            create_pull_through_cache_for_healthomics,
-        )
-
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         mock_client.create_pull_through_cache_rule.return_value = {
             'ecrRepositoryPrefix': 'quay',
@@ -2125,7 +2051,7 @@ class TestCreatePullThroughCacheEdgeCases:
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -2135,14 +2061,9 @@ class TestCreatePullThroughCacheEdgeCases:
         assert result['repository_template_created'] is False
 
     @pytest.mark.asyncio
-    async def test_template_describe_fails_after_update_failure(self):
+    async def test_template_describe_fails_after_update_failure(self, ctx):
         """Test when template describe fails after update failure."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            create_pull_through_cache_for_healthomics,
-        )
-
-        mock_client = MagicMock()
-        mock_ctx = AsyncMock()
+        mock_client = Mock()
 
         mock_client.create_pull_through_cache_rule.return_value = {
             'ecrRepositoryPrefix': 'quay',
@@ -2172,7 +2093,7 @@ class TestCreatePullThroughCacheEdgeCases:
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
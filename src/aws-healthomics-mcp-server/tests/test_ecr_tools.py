@@ -21,6 +21,7 @@ import botocore
 import botocore.exceptions
 import json
 import pytest
+import threading
 from awslabs.aws_healthomics_mcp_server.consts import DEFAULT_ECR_PREFIXES
 from awslabs.aws_healthomics_mcp_server.models.ecr import (
     UPSTREAM_REGISTRY_URLS,
@@ -33,12 +34,13 @@ from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
     grant_healthomics_repository_access,
     list_ecr_repositories,
     list_pull_through_cache_rules,
+    validate_healthomics_ecr_config,
 )
 from datetime import datetime, timezone
 from hypothesis import given, settings
 from hypothesis import strategies as st
 from typing import Any, Dict, Optional
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 
 # =============================================================================
@@ -267,14 +269,14 @@ def _create_mock_ptc_rules_response(prefixes: list) -> dict:
     }
 
 
-def _create_mock_ecr_client() -> MagicMock:
+def _create_mock_ecr_client() -> Mock:
     """Create a mock ECR client with default PTC rules configured.
 
     This ensures that _is_pull_through_cache_repository doesn't hang waiting
     for a real AWS API response when tests don't explicitly configure PTC rules.
     Also configures a default repository policy that grants HealthOmics access.
     """
-    mock_client = MagicMock()
+    mock_client = Mock()
     # Default to returning the standard PTC prefixes
     mock_client.describe_pull_through_cache_rules.return_value = _create_mock_ptc_rules_response(
         list(DEFAULT_ECR_PREFIXES.values())
@@ -625,8 +627,6 @@ class TestPullThroughCacheDetection:
         For any repository name that matches a pull-through cache prefix pattern,
         the is_pull_through_cache field SHALL be True even when the image is not found.
         """
-        import botocore.exceptions
-
         # Create mock ECR client that raises ImageNotFoundException
         mock_client = _create_mock_ecr_client()
         error_response = {
@@ -673,8 +673,6 @@ class TestPullThroughCacheDetection:
         the is_pull_through_cache field SHALL be True even when the repository
         does not exist (it may be created on first pull).
         """
-        import botocore.exceptions
-
         # Create mock ECR client that raises RepositoryNotFoundException
         mock_client = _create_mock_ecr_client()
         error_response = {
@@ -1069,8 +1067,6 @@ class TestPaginationTokenPreservation:
 
 def _create_policy_not_found_exception():
     """Create a mock RepositoryPolicyNotFoundException for testing."""
-    import botocore.exceptions
-
     error_response = {
         'Error': {
             'Code': 'RepositoryPolicyNotFoundException',
@@ -1082,8 +1078,6 @@ def _create_policy_not_found_exception():
 
 def _create_access_denied_exception(operation_name: str = 'DescribeRepositories'):
     """Create a mock AccessDeniedException for testing."""
-    import botocore.exceptions
-
     error_response = {
         'Error': {
             'Code': 'AccessDeniedException',
@@ -1095,8 +1089,6 @@ def _create_access_denied_exception(operation_name: str = 'DescribeRepositories'
 
 def _create_client_error(code: str, message: str, operation_name: str = 'DescribeRepositories'):
     """Create a mock ClientError for testing."""
-    import botocore.exceptions
-
     error_response = {
         'Error': {
             'Code': code,
@@ -1180,7 +1172,7 @@ class TestListECRRepositoriesUnit:
     """
 
     @pytest.mark.asyncio
-    async def test_successful_listing_single_repository(self):
+    async def test_successful_listing_single_repository(self, ctx):
         """Test successful listing with a single repository."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1189,15 +1181,13 @@ class TestListECRRepositoriesUnit:
         }
         mock_client.get_repository_policy.side_effect = _create_policy_not_found_exception()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1211,7 +1201,7 @@ class TestListECRRepositoriesUnit:
         assert result['next_token'] is None
 
     @pytest.mark.asyncio
-    async def test_successful_listing_multiple_repositories(self):
+    async def test_successful_listing_multiple_repositories(self, ctx):
         """Test successful listing with multiple repositories."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1224,15 +1214,13 @@ class TestListECRRepositoriesUnit:
         }
         mock_client.get_repository_policy.side_effect = _create_policy_not_found_exception()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1247,7 +1235,7 @@ class TestListECRRepositoriesUnit:
         assert 'repo-3' in repo_names
 
     @pytest.mark.asyncio
-    async def test_empty_repository_list(self):
+    async def test_empty_repository_list(self, ctx):
         """Test handling of empty repository list."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1255,15 +1243,13 @@ class TestListECRRepositoriesUnit:
             'repositories': [],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1275,7 +1261,7 @@ class TestListECRRepositoriesUnit:
         assert result['next_token'] is None
 
     @pytest.mark.asyncio
-    async def test_pagination_input_token_passed_to_api(self):
+    async def test_pagination_input_token_passed_to_api(self, ctx):
         """Test that input next_token is passed to the AWS API."""
         # Arrange
         input_token = 'test-pagination-token-12345'
@@ -1285,15 +1271,13 @@ class TestListECRRepositoriesUnit:
         }
         mock_client.get_repository_policy.side_effect = _create_policy_not_found_exception()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=input_token,
                 filter_healthomics_accessible=False,
@@ -1305,7 +1289,7 @@ class TestListECRRepositoriesUnit:
         assert call_kwargs['nextToken'] == input_token
 
     @pytest.mark.asyncio
-    async def test_pagination_output_token_returned(self):
+    async def test_pagination_output_token_returned(self, ctx):
         """Test that output next_token from AWS is returned in response."""
         # Arrange
         output_token = 'next-page-token-67890'
@@ -1316,15 +1300,13 @@ class TestListECRRepositoriesUnit:
         }
         mock_client.get_repository_policy.side_effect = _create_policy_not_found_exception()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1334,7 +1316,7 @@ class TestListECRRepositoriesUnit:
         assert result['next_token'] == output_token
 
     @pytest.mark.asyncio
-    async def test_pagination_no_token_on_last_page(self):
+    async def test_pagination_no_token_on_last_page(self, ctx):
         """Test that next_token is None when no more pages exist."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1344,15 +1326,13 @@ class TestListECRRepositoriesUnit:
         }
         mock_client.get_repository_policy.side_effect = _create_policy_not_found_exception()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1362,7 +1342,7 @@ class TestListECRRepositoriesUnit:
         assert result['next_token'] is None
 
     @pytest.mark.asyncio
-    async def test_max_results_passed_to_api(self):
+    async def test_max_results_passed_to_api(self, ctx):
         """Test that max_results parameter is passed to the AWS API."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1370,15 +1350,13 @@ class TestListECRRepositoriesUnit:
             'repositories': [],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=50,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1390,21 +1368,19 @@ class TestListECRRepositoriesUnit:
         assert call_kwargs['maxResults'] == 50
 
     @pytest.mark.asyncio
-    async def test_error_access_denied_exception(self):
+    async def test_error_access_denied_exception(self, ctx):
         """Test handling of AccessDeniedException."""
         # Arrange
         mock_client = _create_mock_ecr_client()
         mock_client.describe_repositories.side_effect = _create_access_denied_exception()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1415,7 +1391,7 @@ class TestListECRRepositoriesUnit:
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_error_other_client_error(self):
+    async def test_error_other_client_error(self, ctx):
         """Test handling of other ClientError types."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1424,15 +1400,13 @@ class TestListECRRepositoriesUnit:
             'The service is temporarily unavailable',
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1443,23 +1417,19 @@ class TestListECRRepositoriesUnit:
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_error_botocore_error(self):
+    async def test_error_botocore_error(self, ctx):
         """Test handling of BotoCoreError."""
-        import botocore.exceptions
-
         # Arrange
         mock_client = _create_mock_ecr_client()
         mock_client.describe_repositories.side_effect = botocore.exceptions.BotoCoreError()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1470,7 +1440,7 @@ class TestListECRRepositoriesUnit:
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_healthomics_accessible_repository(self):
+    async def test_healthomics_accessible_repository(self, ctx):
         """Test repository with HealthOmics access permissions."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1481,15 +1451,13 @@ class TestListECRRepositoriesUnit:
             'policyText': _create_healthomics_policy(),
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1501,7 +1469,7 @@ class TestListECRRepositoriesUnit:
         assert result['repositories'][0]['missing_permissions'] == []
 
     @pytest.mark.asyncio
-    async def test_healthomics_not_accessible_no_policy(self):
+    async def test_healthomics_not_accessible_no_policy(self, ctx):
         """Test repository without policy is marked as not accessible."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1510,15 +1478,13 @@ class TestListECRRepositoriesUnit:
         }
         mock_client.get_repository_policy.side_effect = _create_policy_not_found_exception()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1530,7 +1496,7 @@ class TestListECRRepositoriesUnit:
         assert len(result['repositories'][0]['missing_permissions']) > 0
 
     @pytest.mark.asyncio
-    async def test_healthomics_not_accessible_partial_permissions(self):
+    async def test_healthomics_not_accessible_partial_permissions(self, ctx):
         """Test repository with partial HealthOmics permissions."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1541,15 +1507,13 @@ class TestListECRRepositoriesUnit:
             'policyText': _create_partial_healthomics_policy(),
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1561,7 +1525,7 @@ class TestListECRRepositoriesUnit:
         assert 'ecr:GetDownloadUrlForLayer' in result['repositories'][0]['missing_permissions']
 
     @pytest.mark.asyncio
-    async def test_filter_healthomics_accessible_true(self):
+    async def test_filter_healthomics_accessible_true(self, ctx):
         """Test filtering to only return HealthOmics accessible repositories."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1581,15 +1545,13 @@ class TestListECRRepositoriesUnit:
 
         mock_client.get_repository_policy.side_effect = get_policy_side_effect
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=True,
@@ -1601,7 +1563,7 @@ class TestListECRRepositoriesUnit:
         assert result['total_count'] == 1
 
     @pytest.mark.asyncio
-    async def test_filter_healthomics_accessible_false(self):
+    async def test_filter_healthomics_accessible_false(self, ctx):
         """Test that all repositories are returned when filter is False."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1620,15 +1582,13 @@ class TestListECRRepositoriesUnit:
 
         mock_client.get_repository_policy.side_effect = get_policy_side_effect
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1639,7 +1599,52 @@ class TestListECRRepositoriesUnit:
         assert result['total_count'] == 2
 
     @pytest.mark.asyncio
-    async def test_filter_healthomics_accessible_empty_result(self):
+    async def test_repository_policies_fetched_concurrently(self, ctx):
+        """Test that policy lookups overlap and results keep the listing order."""
+        # Arrange
+        mock_client = _create_mock_ecr_client()
+        mock_client.describe_repositories.return_value = {
+            'repositories': [
+                _create_sample_repository('accessible-repo'),
+                _create_sample_repository('not-accessible-repo'),
+            ],
+        }
+
+        # Each lookup blocks until the other has started, so serial calls would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_policy_side_effect(repositoryName):
+            barrier.wait()
+            if repositoryName == 'accessible-repo':
+                return {'policyText': _create_healthomics_policy()}
+            raise _create_policy_not_found_exception()
+
+        mock_client.get_repository_policy.side_effect = get_policy_side_effect
+
+        # Act
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
+            return_value=mock_client,
+        ):
+            result = await list_ecr_repositories(
+                ctx=ctx,
+                max_results=100,
+                next_token=None,
+                filter_healthomics_accessible=False,
+            )
+
+        # Assert
+        assert [r['repository_name'] for r in result['repositories']] == [
+            'accessible-repo',
+            'not-accessible-repo',
+        ]
+        assert [r['healthomics_accessible'] for r in result['repositories']] == [
+            'accessible',
+            'not_accessible',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_filter_healthomics_accessible_empty_result(self, ctx):
         """Test filtering when no repositories are accessible."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1651,15 +1656,13 @@ class TestListECRRepositoriesUnit:
         }
         mock_client.get_repository_policy.side_effect = _create_policy_not_found_exception()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=True,
@@ -1670,7 +1673,7 @@ class TestListECRRepositoriesUnit:
         assert result['total_count'] == 0
 
     @pytest.mark.asyncio
-    async def test_repository_policy_check_error_marks_unknown(self):
+    async def test_repository_policy_check_error_marks_unknown(self, ctx):
         """Test that policy check errors result in unknown accessibility status."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1684,15 +1687,13 @@ class TestListECRRepositoriesUnit:
             'GetRepositoryPolicy',
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1703,7 +1704,7 @@ class TestListECRRepositoriesUnit:
         assert result['repositories'][0]['healthomics_accessible'] == 'unknown'
 
     @pytest.mark.asyncio
-    async def test_repository_fields_populated_correctly(self):
+    async def test_repository_fields_populated_correctly(self, ctx):
         """Test that all repository fields are populated correctly."""
         # Arrange
         created_time = datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc)
@@ -1722,15 +1723,13 @@ class TestListECRRepositoriesUnit:
         }
         mock_client.get_repository_policy.side_effect = _create_policy_not_found_exception()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1744,7 +1743,7 @@ class TestListECRRepositoriesUnit:
         assert repo['created_at'] == created_time
 
     @pytest.mark.asyncio
-    async def test_mixed_accessibility_statuses(self):
+    async def test_mixed_accessibility_statuses(self, ctx):
         """Test handling of repositories with mixed accessibility statuses."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1770,15 +1769,13 @@ class TestListECRRepositoriesUnit:
 
         mock_client.get_repository_policy.side_effect = get_policy_side_effect
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_ecr_repositories(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
                 filter_healthomics_accessible=False,
@@ -1819,7 +1816,7 @@ class TestCheckContainerAvailabilityUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_image_exists_returns_details(self):
+    async def test_image_exists_returns_details(self, ctx):
         """Test that existing image returns full details."""
         # Arrange
         pushed_time = datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc)
@@ -1835,15 +1832,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -1859,7 +1854,81 @@ class TestCheckContainerAvailabilityUnit:
         assert result['image']['repository_name'] == 'my-repo'
 
     @pytest.mark.asyncio
-    async def test_image_exists_with_specific_tag(self):
+    async def test_cache_rule_lookup_overlaps_image_lookup(self, ctx):
+        """Test that the pull-through cache check runs alongside describe_images."""
+        # Arrange
+        mock_client = _create_mock_ecr_client()
+        images_started = threading.Event()
+        waited = []
+
+        def describe_images_side_effect(**kwargs):
+            images_started.set()
+            return {'imageDetails': []}
+
+        def describe_rules_side_effect(**kwargs):
+            # Serial calls would leave the image lookup unstarted here
+            waited.append(images_started.wait(timeout=2))
+            return {'pullThroughCacheRules': []}
+
+        mock_client.describe_images.side_effect = describe_images_side_effect
+        mock_client.describe_pull_through_cache_rules.side_effect = describe_rules_side_effect
+
+        # Act
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
+            return_value=mock_client,
+        ):
+            result = await check_container_availability(
+                ctx=ctx,
+                repository_name='my-repo',
+                image_tag='latest',
+                image_digest=None,
+            )
+
+        # Assert
+        assert waited == [True]
+        assert result['available'] is False
+
+    @pytest.mark.asyncio
+    async def test_cache_rule_lookup_failure_still_reports_image_error(self, ctx):
+        """Test that a failed pull-through cache check does not mask the image lookup result."""
+        # Arrange
+        mock_client = _create_mock_ecr_client()
+        error_response = {
+            'Error': {
+                'Code': 'RepositoryNotFoundException',
+                'Message': 'The repository with name docker-hub/library/ubuntu does not exist',
+            }
+        }
+        mock_client.describe_images.side_effect = botocore.exceptions.ClientError(
+            error_response, 'DescribeImages'
+        )
+
+        # Act
+        with (
+            patch(
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
+                return_value=mock_client,
+            ),
+            patch(
+                'awslabs.aws_healthomics_mcp_server.tools.ecr_tools._is_pull_through_cache_repository',
+                side_effect=RuntimeError('credentials expired'),
+            ),
+        ):
+            result = await check_container_availability(
+                ctx=ctx,
+                repository_name='docker-hub/library/ubuntu',
+                image_tag='latest',
+                image_digest=None,
+            )
+
+        # Assert
+        assert result['available'] is False
+        assert result['repository_exists'] is False
+        assert result['is_pull_through_cache'] is True
+
+    @pytest.mark.asyncio
+    async def test_image_exists_with_specific_tag(self, ctx):
         """Test that image with specific tag returns correct tag in response."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1874,15 +1943,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='v2.0.0',
                 image_digest=None,
@@ -1893,7 +1960,7 @@ class TestCheckContainerAvailabilityUnit:
         assert result['image']['image_tag'] == 'v2.0.0'
 
     @pytest.mark.asyncio
-    async def test_image_exists_with_digest(self):
+    async def test_image_exists_with_digest(self, ctx):
         """Test that image lookup by digest works correctly."""
         # Arrange
         digest = 'sha256:abc123def456'
@@ -1909,15 +1976,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=digest,
@@ -1936,7 +2001,7 @@ class TestCheckContainerAvailabilityUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_image_not_found_returns_clear_message(self):
+    async def test_image_not_found_returns_clear_message(self, ctx):
         """Test that image not found returns available=False with clear message."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1950,15 +2015,13 @@ class TestCheckContainerAvailabilityUnit:
             error_response, 'DescribeImages'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='nonexistent-tag',
                 image_digest=None,
@@ -1972,7 +2035,7 @@ class TestCheckContainerAvailabilityUnit:
         assert 'my-repo' in result['message']
 
     @pytest.mark.asyncio
-    async def test_image_not_found_empty_image_details(self):
+    async def test_image_not_found_empty_image_details(self, ctx):
         """Test that empty imageDetails returns available=False."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -1980,15 +2043,13 @@ class TestCheckContainerAvailabilityUnit:
             'imageDetails': []  # Empty list - no images found
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='missing-tag',
                 image_digest=None,
@@ -2004,7 +2065,7 @@ class TestCheckContainerAvailabilityUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_repository_not_found(self):
+    async def test_repository_not_found(self, ctx):
         """Test that repository not found returns repository_exists=False."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2018,15 +2079,13 @@ class TestCheckContainerAvailabilityUnit:
             error_response, 'DescribeImages'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='nonexistent-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -2040,7 +2099,7 @@ class TestCheckContainerAvailabilityUnit:
         assert 'nonexistent-repo' in result['message']
 
     @pytest.mark.asyncio
-    async def test_repository_not_found_ptc_message(self):
+    async def test_repository_not_found_ptc_message(self, ctx):
         """Test that PTC repository not found includes helpful message."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2054,15 +2113,13 @@ class TestCheckContainerAvailabilityUnit:
             error_response, 'DescribeImages'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='docker-hub/library/ubuntu',
                 image_tag='latest',
                 image_digest=None,
@@ -2080,7 +2137,7 @@ class TestCheckContainerAvailabilityUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_ptc_detection_docker_hub(self):
+    async def test_ptc_detection_docker_hub(self, ctx):
         """Test pull-through cache detection for docker-hub prefix."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2095,15 +2152,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='docker-hub/library/nginx',
                 image_tag='latest',
                 image_digest=None,
@@ -2113,7 +2168,7 @@ class TestCheckContainerAvailabilityUnit:
         assert result['is_pull_through_cache'] is True
 
     @pytest.mark.asyncio
-    async def test_ptc_detection_quay(self):
+    async def test_ptc_detection_quay(self, ctx):
         """Test pull-through cache detection for quay prefix."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2128,15 +2183,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='quay/biocontainers/samtools',
                 image_tag='v1.0',
                 image_digest=None,
@@ -2146,7 +2199,7 @@ class TestCheckContainerAvailabilityUnit:
         assert result['is_pull_through_cache'] is True
 
     @pytest.mark.asyncio
-    async def test_ptc_detection_ecr_public(self):
+    async def test_ptc_detection_ecr_public(self, ctx):
         """Test pull-through cache detection for ecr-public prefix."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2161,15 +2214,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='ecr-public/aws-genomics/nextflow',
                 image_tag='stable',
                 image_digest=None,
@@ -2179,7 +2230,7 @@ class TestCheckContainerAvailabilityUnit:
         assert result['is_pull_through_cache'] is True
 
     @pytest.mark.asyncio
-    async def test_non_ptc_repository(self):
+    async def test_non_ptc_repository(self, ctx):
         """Test that regular repositories are not marked as pull-through cache."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2194,15 +2245,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-custom-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -2212,7 +2261,7 @@ class TestCheckContainerAvailabilityUnit:
         assert result['is_pull_through_cache'] is False
 
     @pytest.mark.asyncio
-    async def test_ptc_image_not_found_message(self):
+    async def test_ptc_image_not_found_message(self, ctx):
         """Test that PTC image not found includes helpful message about first access."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2226,15 +2275,13 @@ class TestCheckContainerAvailabilityUnit:
             error_response, 'DescribeImages'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='docker-hub/library/python',
                 image_tag='3.11',
                 image_digest=None,
@@ -2251,14 +2298,11 @@ class TestCheckContainerAvailabilityUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_empty_repository_name(self):
+    async def test_empty_repository_name(self, ctx):
         """Test that empty repository name returns validation error."""
-        # Arrange
-        mock_ctx = AsyncMock()
-
         # Act - no need to mock ECR client since validation should fail first
         result = await check_container_availability(
-            ctx=mock_ctx,
+            ctx=ctx,
             repository_name='',
             image_tag='latest',
             image_digest=None,
@@ -2270,14 +2314,11 @@ class TestCheckContainerAvailabilityUnit:
         assert 'required' in result['message'].lower() or 'empty' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_whitespace_only_repository_name(self):
+    async def test_whitespace_only_repository_name(self, ctx):
         """Test that whitespace-only repository name returns validation error."""
-        # Arrange
-        mock_ctx = AsyncMock()
-
         # Act
         result = await check_container_availability(
-            ctx=mock_ctx,
+            ctx=ctx,
             repository_name='   ',
             image_tag='latest',
             image_digest=None,
@@ -2289,14 +2330,11 @@ class TestCheckContainerAvailabilityUnit:
         assert 'required' in result['message'].lower() or 'empty' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_invalid_digest_format_no_sha256_prefix(self):
+    async def test_invalid_digest_format_no_sha256_prefix(self, ctx):
         """Test that digest without sha256: prefix returns validation error."""
-        # Arrange
-        mock_ctx = AsyncMock()
-
         # Act
         result = await check_container_availability(
-            ctx=mock_ctx,
+            ctx=ctx,
             repository_name='my-repo',
             image_tag='latest',
             image_digest='abc123def456',  # pragma: allowlist secret
@@ -2307,14 +2345,11 @@ class TestCheckContainerAvailabilityUnit:
         assert 'sha256' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_invalid_digest_format_wrong_prefix(self):
+    async def test_invalid_digest_format_wrong_prefix(self, ctx):
         """Test that digest with wrong prefix returns validation error."""
-        # Arrange
-        mock_ctx = AsyncMock()
-
         # Act
         result = await check_container_availability(
-            ctx=mock_ctx,
+            ctx=ctx,
             repository_name='my-repo',
             image_tag='latest',
             image_digest='md5:abc123def456',  # Wrong prefix
@@ -2325,7 +2360,33 @@ class TestCheckContainerAvailabilityUnit:
         assert 'sha256' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_valid_digest_format_accepted(self):
+    async def test_invalid_digest_reports_custom_prefix_cache(self, ctx):
+        """Test that a malformed digest still detects a custom pull-through cache prefix."""
+        # Arrange
+        mock_client = _create_mock_ecr_client()
+        mock_client.describe_pull_through_cache_rules.return_value = (
+            _create_mock_ptc_rules_response(['my-custom-cache'])
+        )
+
+        # Act
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
+            return_value=mock_client,
+        ):
+            result = await check_container_availability(
+                ctx=ctx,
+                repository_name='my-custom-cache/library/ubuntu',
+                image_tag='latest',
+                image_digest='md5:abc123def456',
+            )
+
+        # Assert
+        assert result['available'] is False
+        assert result['is_pull_through_cache'] is True
+        mock_client.describe_images.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_valid_digest_format_accepted(self, ctx):
         """Test that valid sha256: digest format is accepted."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2340,15 +2401,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest='sha256:abc123def456',
@@ -2365,7 +2424,7 @@ class TestCheckContainerAvailabilityUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_access_denied_exception(self):
+    async def test_access_denied_exception(self, ctx):
         """Test handling of AccessDeniedException."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2379,8 +2438,6 @@ class TestCheckContainerAvailabilityUnit:
             error_response, 'DescribeImages'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act & Assert
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
@@ -2388,14 +2445,14 @@ class TestCheckContainerAvailabilityUnit:
         ):
             with pytest.raises(botocore.exceptions.ClientError):
                 await check_container_availability(
-                    ctx=mock_ctx,
+                    ctx=ctx,
                     repository_name='my-repo',
                     image_tag='latest',
                     image_digest=None,
                 )
 
     @pytest.mark.asyncio
-    async def test_other_client_error(self):
+    async def test_other_client_error(self, ctx):
         """Test handling of other ClientError types."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2409,8 +2466,6 @@ class TestCheckContainerAvailabilityUnit:
             error_response, 'DescribeImages'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act & Assert
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
@@ -2418,28 +2473,26 @@ class TestCheckContainerAvailabilityUnit:
         ):
             with pytest.raises(botocore.exceptions.ClientError):
                 await check_container_availability(
-                    ctx=mock_ctx,
+                    ctx=ctx,
                     repository_name='my-repo',
                     image_tag='latest',
                     image_digest=None,
                 )
 
     @pytest.mark.asyncio
-    async def test_botocore_error(self):
+    async def test_botocore_error(self, ctx):
         """Test handling of BotoCoreError."""
         # Arrange
         mock_client = _create_mock_ecr_client()
         mock_client.describe_images.side_effect = botocore.exceptions.BotoCoreError()
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -2450,21 +2503,19 @@ class TestCheckContainerAvailabilityUnit:
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_unexpected_exception(self):
+    async def test_unexpected_exception(self, ctx):
         """Test handling of unexpected exceptions."""
         # Arrange
         mock_client = _create_mock_ecr_client()
         mock_client.describe_images.side_effect = RuntimeError('Unexpected error')
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -2479,7 +2530,7 @@ class TestCheckContainerAvailabilityUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_api_called_with_tag(self):
+    async def test_api_called_with_tag(self, ctx):
         """Test that API is called with correct tag parameter."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2494,15 +2545,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='v1.2.3',
                 image_digest=None,
@@ -2515,7 +2564,7 @@ class TestCheckContainerAvailabilityUnit:
         assert call_kwargs['imageIds'][0]['imageTag'] == 'v1.2.3'
 
     @pytest.mark.asyncio
-    async def test_api_called_with_digest_takes_precedence(self):
+    async def test_api_called_with_digest_takes_precedence(self, ctx):
         """Test that digest takes precedence over tag in API call."""
         # Arrange
         digest = 'sha256:abc123def456'
@@ -2531,15 +2580,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=digest,
@@ -2553,7 +2600,7 @@ class TestCheckContainerAvailabilityUnit:
         assert 'imageTag' not in call_kwargs['imageIds'][0]
 
     @pytest.mark.asyncio
-    async def test_default_tag_is_latest(self):
+    async def test_default_tag_is_latest(self, ctx):
         """Test that default tag is 'latest' when not specified."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2568,15 +2615,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',  # Default value
                 image_digest=None,
@@ -2588,7 +2633,7 @@ class TestCheckContainerAvailabilityUnit:
         assert call_kwargs['imageIds'][0]['imageTag'] == 'latest'
 
     @pytest.mark.asyncio
-    async def test_repository_name_trimmed(self):
+    async def test_repository_name_trimmed(self, ctx):
         """Test that repository name is trimmed of whitespace."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2603,15 +2648,13 @@ class TestCheckContainerAvailabilityUnit:
             ]
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='  my-repo  ',  # With whitespace
                 image_tag='latest',
                 image_digest=None,
@@ -2628,7 +2671,7 @@ class TestCheckContainerAvailabilityUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_healthomics_accessible_when_policy_grants_permissions(self):
+    async def test_healthomics_accessible_when_policy_grants_permissions(self, ctx):
         """Test that healthomics_accessible is 'accessible' when policy grants required permissions."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2644,15 +2687,13 @@ class TestCheckContainerAvailabilityUnit:
         }
         # Policy grants HealthOmics access (already set by _create_mock_ecr_client)
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -2664,7 +2705,7 @@ class TestCheckContainerAvailabilityUnit:
         assert result['missing_permissions'] == []
 
     @pytest.mark.asyncio
-    async def test_healthomics_not_accessible_when_no_policy(self):
+    async def test_healthomics_not_accessible_when_no_policy(self, ctx):
         """Test that healthomics_accessible is 'not_accessible' when no policy exists."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2689,15 +2730,13 @@ class TestCheckContainerAvailabilityUnit:
             error_response, 'GetRepositoryPolicy'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -2711,7 +2750,7 @@ class TestCheckContainerAvailabilityUnit:
         assert 'WARNING' in result['message']
 
     @pytest.mark.asyncio
-    async def test_healthomics_not_accessible_when_policy_missing_permissions(self):
+    async def test_healthomics_not_accessible_when_policy_missing_permissions(self, ctx):
         """Test that healthomics_accessible is 'not_accessible' when policy lacks permissions."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2742,15 +2781,13 @@ class TestCheckContainerAvailabilityUnit:
             )
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -2762,7 +2799,7 @@ class TestCheckContainerAvailabilityUnit:
         assert len(result['missing_permissions']) > 0
 
     @pytest.mark.asyncio
-    async def test_healthomics_unknown_when_policy_check_fails(self):
+    async def test_healthomics_unknown_when_policy_check_fails(self, ctx):
         """Test that healthomics_accessible is 'unknown' when policy check fails with other error."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2787,15 +2824,13 @@ class TestCheckContainerAvailabilityUnit:
             error_response, 'GetRepositoryPolicy'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -2807,7 +2842,7 @@ class TestCheckContainerAvailabilityUnit:
         assert 'could not be determined' in result['message']
 
     @pytest.mark.asyncio
-    async def test_healthomics_accessible_with_wildcard_actions(self):
+    async def test_healthomics_accessible_with_wildcard_actions(self, ctx):
         """Test that healthomics_accessible is 'accessible' when policy uses wildcard actions."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2838,15 +2873,13 @@ class TestCheckContainerAvailabilityUnit:
             )
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await check_container_availability(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
                 image_tag='latest',
                 image_digest=None,
@@ -2905,40 +2938,35 @@ def _create_template_not_found_exception():
     return botocore.exceptions.ClientError(error_response, 'DescribeRepositoryCreationTemplates')
 
 
-def _create_healthomics_registry_policy() -> str:
-    """Create a sample registry policy that grants HealthOmics access."""
-    return json.dumps(
-        {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsRegistryAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                    'Resource': '*',
-                }
-            ],
-        }
-    )
-
-
-def _create_healthomics_template_policy() -> str:
-    """Create a sample repository creation template policy that grants HealthOmics access."""
-    return json.dumps(
-        {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsTemplateAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                    'Resource': '*',
-                }
-            ],
-        }
-    )
+# Sample policies granting HealthOmics access, serialized once at import time
+_HEALTHOMICS_REGISTRY_POLICY_TEXT = json.dumps(
+    {
+        'Version': '2012-10-17',
+        'Statement': [
+            {
+                'Sid': 'HealthOmicsRegistryAccess',
+                'Effect': 'Allow',
+                'Principal': {'Service': 'omics.amazonaws.com'},
+                'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
+                'Resource': '*',
+            }
+        ],
+    }
+)
+_HEALTHOMICS_TEMPLATE_POLICY_TEXT = json.dumps(
+    {
+        'Version': '2012-10-17',
+        'Statement': [
+            {
+                'Sid': 'HealthOmicsTemplateAccess',
+                'Effect': 'Allow',
+                'Principal': {'Service': 'omics.amazonaws.com'},
+                'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
+                'Resource': '*',
+            }
+        ],
+    }
+)
 
 
 class TestListPullThroughCacheRulesUnit:
@@ -2958,7 +2986,7 @@ class TestListPullThroughCacheRulesUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_successful_listing_single_rule(self):
+    async def test_successful_listing_single_rule(self, ctx):
         """Test successful listing with a single pull-through cache rule."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -2972,15 +3000,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -2993,7 +3019,7 @@ class TestListPullThroughCacheRulesUnit:
         assert result['next_token'] is None
 
     @pytest.mark.asyncio
-    async def test_successful_listing_multiple_rules(self):
+    async def test_successful_listing_multiple_rules(self, ctx):
         """Test successful listing with multiple pull-through cache rules."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3009,15 +3035,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3030,7 +3054,7 @@ class TestListPullThroughCacheRulesUnit:
         assert 'ecr-public' in prefixes
 
     @pytest.mark.asyncio
-    async def test_rule_includes_upstream_registry_url(self):
+    async def test_rule_includes_upstream_registry_url(self, ctx):
         """Test that rules include upstream registry URL."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3044,15 +3068,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3065,7 +3087,7 @@ class TestListPullThroughCacheRulesUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_empty_rules_returns_empty_list(self):
+    async def test_empty_rules_returns_empty_list(self, ctx):
         """Test that empty rules returns empty list."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3073,15 +3095,13 @@ class TestListPullThroughCacheRulesUnit:
             'pullThroughCacheRules': [],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3091,7 +3111,7 @@ class TestListPullThroughCacheRulesUnit:
         assert result['next_token'] is None
 
     @pytest.mark.asyncio
-    async def test_empty_rules_no_registry_policy_check(self):
+    async def test_empty_rules_no_registry_policy_check(self, ctx):
         """Test that registry policy is not checked when no rules exist."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3099,15 +3119,13 @@ class TestListPullThroughCacheRulesUnit:
             'pullThroughCacheRules': [],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3120,7 +3138,7 @@ class TestListPullThroughCacheRulesUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_healthomics_usable_when_all_permissions_granted(self):
+    async def test_healthomics_usable_when_all_permissions_granted(self, ctx):
         """Test that rule is marked usable when all permissions are granted."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3130,26 +3148,24 @@ class TestListPullThroughCacheRulesUnit:
             ],
         }
         mock_client.get_registry_policy.return_value = {
-            'policyText': _create_healthomics_registry_policy(),
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT,
         }
         mock_client.describe_repository_creation_templates.return_value = {
             'repositoryCreationTemplates': [
                 {
                     'prefix': 'docker-hub',
-                    'repositoryPolicy': _create_healthomics_template_policy(),
+                    'repositoryPolicy': _HEALTHOMICS_TEMPLATE_POLICY_TEXT,
                 }
             ],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3162,7 +3178,7 @@ class TestListPullThroughCacheRulesUnit:
         assert rule['repository_template_permission_granted'] is True
 
     @pytest.mark.asyncio
-    async def test_healthomics_not_usable_no_registry_policy(self):
+    async def test_healthomics_not_usable_no_registry_policy(self, ctx):
         """Test that rule is not usable when registry policy is missing."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3176,20 +3192,18 @@ class TestListPullThroughCacheRulesUnit:
             'repositoryCreationTemplates': [
                 {
                     'prefix': 'docker-hub',
-                    'repositoryPolicy': _create_healthomics_template_policy(),
+                    'repositoryPolicy': _HEALTHOMICS_TEMPLATE_POLICY_TEXT,
                 }
             ],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3200,7 +3214,7 @@ class TestListPullThroughCacheRulesUnit:
         assert rule['registry_permission_granted'] is False
 
     @pytest.mark.asyncio
-    async def test_healthomics_not_usable_no_template(self):
+    async def test_healthomics_not_usable_no_template(self, ctx):
         """Test that rule is not usable when repository creation template is missing."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3210,21 +3224,19 @@ class TestListPullThroughCacheRulesUnit:
             ],
         }
         mock_client.get_registry_policy.return_value = {
-            'policyText': _create_healthomics_registry_policy(),
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT,
         }
         mock_client.describe_repository_creation_templates.side_effect = (
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3236,7 +3248,7 @@ class TestListPullThroughCacheRulesUnit:
         assert rule['repository_template_exists'] is False
 
     @pytest.mark.asyncio
-    async def test_healthomics_not_usable_template_missing_permissions(self):
+    async def test_healthomics_not_usable_template_missing_permissions(self, ctx):
         """Test that rule is not usable when template lacks required permissions."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3246,7 +3258,7 @@ class TestListPullThroughCacheRulesUnit:
             ],
         }
         mock_client.get_registry_policy.return_value = {
-            'policyText': _create_healthomics_registry_policy(),
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT,
         }
         # Template exists but has no policy (no permissions)
         mock_client.describe_repository_creation_templates.return_value = {
@@ -3258,15 +3270,13 @@ class TestListPullThroughCacheRulesUnit:
             ],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3278,7 +3288,7 @@ class TestListPullThroughCacheRulesUnit:
         assert rule['repository_template_permission_granted'] is False
 
     @pytest.mark.asyncio
-    async def test_registry_policy_checked_once_for_all_rules(self):
+    async def test_registry_policy_checked_once_for_all_rules(self, ctx):
         """Test that registry policy is checked only once for all rules."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3290,21 +3300,19 @@ class TestListPullThroughCacheRulesUnit:
             ],
         }
         mock_client.get_registry_policy.return_value = {
-            'policyText': _create_healthomics_registry_policy(),
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT,
         }
         mock_client.describe_repository_creation_templates.side_effect = (
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3317,7 +3325,7 @@ class TestListPullThroughCacheRulesUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_pagination_input_token_passed_to_api(self):
+    async def test_pagination_input_token_passed_to_api(self, ctx):
         """Test that input next_token is passed to the AWS API."""
         # Arrange
         input_token = 'test-pagination-token-12345'
@@ -3332,15 +3340,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=input_token,
             )
@@ -3351,7 +3357,7 @@ class TestListPullThroughCacheRulesUnit:
         assert call_kwargs['nextToken'] == input_token
 
     @pytest.mark.asyncio
-    async def test_pagination_output_token_returned(self):
+    async def test_pagination_output_token_returned(self, ctx):
         """Test that output next_token from AWS is returned in response."""
         # Arrange
         output_token = 'next-page-token-67890'
@@ -3367,15 +3373,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3384,7 +3388,7 @@ class TestListPullThroughCacheRulesUnit:
         assert result['next_token'] == output_token
 
     @pytest.mark.asyncio
-    async def test_pagination_no_token_on_last_page(self):
+    async def test_pagination_no_token_on_last_page(self, ctx):
         """Test that next_token is None when no more pages exist."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3399,15 +3403,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3416,7 +3418,7 @@ class TestListPullThroughCacheRulesUnit:
         assert result['next_token'] is None
 
     @pytest.mark.asyncio
-    async def test_max_results_passed_to_api(self):
+    async def test_max_results_passed_to_api(self, ctx):
         """Test that max_results parameter is passed to the AWS API."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3424,15 +3426,13 @@ class TestListPullThroughCacheRulesUnit:
             'pullThroughCacheRules': [],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=50,
                 next_token=None,
             )
@@ -3447,7 +3447,7 @@ class TestListPullThroughCacheRulesUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_error_access_denied_exception(self):
+    async def test_error_access_denied_exception(self, ctx):
         """Test handling of AccessDeniedException."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3461,15 +3461,13 @@ class TestListPullThroughCacheRulesUnit:
             botocore.exceptions.ClientError(error_response, 'DescribePullThroughCacheRules')
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3479,7 +3477,7 @@ class TestListPullThroughCacheRulesUnit:
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_error_other_client_error(self):
+    async def test_error_other_client_error(self, ctx):
         """Test handling of other ClientError types."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3493,15 +3491,13 @@ class TestListPullThroughCacheRulesUnit:
             botocore.exceptions.ClientError(error_response, 'DescribePullThroughCacheRules')
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3511,7 +3507,7 @@ class TestListPullThroughCacheRulesUnit:
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_error_botocore_error(self):
+    async def test_error_botocore_error(self, ctx):
         """Test handling of BotoCoreError."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3519,15 +3515,13 @@ class TestListPullThroughCacheRulesUnit:
             botocore.exceptions.BotoCoreError()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3537,7 +3531,7 @@ class TestListPullThroughCacheRulesUnit:
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_registry_policy_error_handled_gracefully(self):
+    async def test_registry_policy_error_handled_gracefully(self, ctx):
         """Test that registry policy errors are handled gracefully."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3560,15 +3554,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3578,7 +3570,7 @@ class TestListPullThroughCacheRulesUnit:
         assert result['rules'][0]['registry_permission_granted'] is False
 
     @pytest.mark.asyncio
-    async def test_template_error_handled_gracefully(self):
+    async def test_template_error_handled_gracefully(self, ctx):
         """Test that template errors are handled gracefully."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3588,7 +3580,7 @@ class TestListPullThroughCacheRulesUnit:
             ],
         }
         mock_client.get_registry_policy.return_value = {
-            'policyText': _create_healthomics_registry_policy(),
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT,
         }
         # Simulate an unexpected error when getting template
         error_response = {
@@ -3601,15 +3593,13 @@ class TestListPullThroughCacheRulesUnit:
             botocore.exceptions.ClientError(error_response, 'DescribeRepositoryCreationTemplates')
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3623,7 +3613,7 @@ class TestListPullThroughCacheRulesUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_rule_with_credential_arn(self):
+    async def test_rule_with_credential_arn(self, ctx):
         """Test that rules with credential ARN include it in response."""
         # Arrange
         credential_arn = 'arn:aws:secretsmanager:us-east-1:123456789012:secret:docker-hub-creds'
@@ -3640,15 +3630,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3657,7 +3645,7 @@ class TestListPullThroughCacheRulesUnit:
         assert result['rules'][0]['credential_arn'] == credential_arn
 
     @pytest.mark.asyncio
-    async def test_rule_without_credential_arn(self):
+    async def test_rule_without_credential_arn(self, ctx):
         """Test that rules without credential ARN have None."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -3671,15 +3659,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3688,7 +3674,7 @@ class TestListPullThroughCacheRulesUnit:
         assert result['rules'][0]['credential_arn'] is None
 
     @pytest.mark.asyncio
-    async def test_mixed_rules_with_and_without_credentials(self):
+    async def test_mixed_rules_with_and_without_credentials(self, ctx):
         """Test listing rules with mixed credential configurations."""
         # Arrange
         credential_arn = 'arn:aws:secretsmanager:us-east-1:123456789012:secret:docker-hub-creds'
@@ -3707,15 +3693,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3731,7 +3715,7 @@ class TestListPullThroughCacheRulesUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_rule_fields_populated_correctly(self):
+    async def test_rule_fields_populated_correctly(self, ctx):
         """Test that all rule fields are populated correctly."""
         # Arrange
         created_time = datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc)
@@ -3755,15 +3739,13 @@ class TestListPullThroughCacheRulesUnit:
             _create_template_not_found_exception()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
@@ -3777,8 +3759,8 @@ class TestListPullThroughCacheRulesUnit:
         assert rule['updated_at'] == updated_time
 
     @pytest.mark.asyncio
-    async def test_template_checked_for_each_rule(self):
-        """Test that repository creation template is checked for each rule."""
+    async def test_templates_fetched_for_all_rules_in_one_call(self, ctx):
+        """Test that repository creation templates for every rule are fetched together."""
         # Arrange
         mock_client = _create_mock_ecr_client()
         mock_client.describe_pull_through_cache_rules.return_value = {
@@ -3788,13 +3770,11 @@ class TestListPullThroughCacheRulesUnit:
             ],
         }
         mock_client.get_registry_policy.return_value = {
-            'policyText': _create_healthomics_registry_policy(),
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT,
+        }
+        mock_client.describe_repository_creation_templates.return_value = {
+            'repositoryCreationTemplates': [],
         }
-        mock_client.describe_repository_creation_templates.side_effect = (
-            _create_template_not_found_exception()
-        )
-
-        mock_ctx = AsyncMock()
 
         # Act
         with patch(
@@ -3802,18 +3782,15 @@ class TestListPullThroughCacheRulesUnit:
             return_value=mock_client,
         ):
             await list_pull_through_cache_rules(
-                ctx=mock_ctx,
+                ctx=ctx,
                 max_results=100,
                 next_token=None,
             )
 
-        # Assert - template should be checked for each rule
-        assert mock_client.describe_repository_creation_templates.call_count == 2
-        # Verify the prefixes were passed correctly
-        calls = mock_client.describe_repository_creation_templates.call_args_list
-        prefixes_checked = [call[1]['prefixes'][0] for call in calls]
-        assert 'docker-hub' in prefixes_checked
-        assert 'quay' in prefixes_checked
+        # Assert - one request covers the prefixes of every rule
+        mock_client.describe_repository_creation_templates.assert_called_once_with(
+            prefixes=['docker-hub', 'quay']
+        )
 
 
 # =============================================================================
@@ -4792,7 +4769,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_successful_creation_docker_hub(self):
+    async def test_successful_creation_docker_hub(self, ctx):
         """Test successful creation for Docker Hub registry."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -4809,15 +4786,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='docker-hub',
                 ecr_repository_prefix=None,
                 credential_arn='arn:aws:secretsmanager:us-east-1:123456789012:secret:docker-creds',
@@ -4833,7 +4808,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.create_pull_through_cache_rule.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_successful_creation_quay(self):
+    async def test_successful_creation_quay(self, ctx):
         """Test successful creation for Quay.io registry."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -4850,15 +4825,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -4873,7 +4846,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert result['repository_template_created'] is True
 
     @pytest.mark.asyncio
-    async def test_successful_creation_ecr_public(self):
+    async def test_successful_creation_ecr_public(self, ctx):
         """Test successful creation for ECR Public registry."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -4890,15 +4863,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='ecr-public',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -4917,14 +4888,11 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_docker_hub_requires_credential_arn(self):
+    async def test_docker_hub_requires_credential_arn(self, ctx):
         """Test that Docker Hub requires credential ARN."""
-        # Arrange
-        mock_ctx = AsyncMock()
-
         # Act - No need to mock ECR client, validation should fail first
         result = await create_pull_through_cache_for_healthomics(
-            ctx=mock_ctx,
+            ctx=ctx,
             upstream_registry='docker-hub',
             ecr_repository_prefix=None,
             credential_arn=None,
@@ -4939,7 +4907,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert 'docker' in result['message'].lower() or 'required' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_docker_hub_with_credential_arn_succeeds(self):
+    async def test_docker_hub_with_credential_arn_succeeds(self, ctx):
         """Test that Docker Hub with credential ARN succeeds."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -4957,15 +4925,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='docker-hub',
                 ecr_repository_prefix=None,
                 credential_arn=credential_arn,
@@ -4981,7 +4947,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_existing_rule_handling(self):
+    async def test_existing_rule_handling(self, ctx):
         """Test handling when pull-through cache rule already exists."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5011,15 +4977,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5034,7 +4998,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert result['repository_template_created'] is True
 
     @pytest.mark.asyncio
-    async def test_existing_rule_with_failed_describe(self):
+    async def test_existing_rule_with_failed_describe(self, ctx):
         """Test handling when rule exists but describe fails."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5055,15 +5019,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='ecr-public',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5078,7 +5040,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_registry_policy_update_failure(self):
+    async def test_registry_policy_update_failure(self, ctx):
         """Test handling when registry policy update fails."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5098,15 +5060,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         )
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5121,7 +5081,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         )
 
     @pytest.mark.asyncio
-    async def test_repository_template_creation_failure(self):
+    async def test_repository_template_creation_failure(self, ctx):
         """Test handling when repository template creation fails."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5143,15 +5103,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
             )
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5164,7 +5122,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert 'template' in result['message'].lower() or 'failed' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_both_permission_updates_fail(self):
+    async def test_both_permission_updates_fail(self, ctx):
         """Test handling when both registry policy and template creation fail."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5183,15 +5141,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
             'Template creation failed'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5208,14 +5164,11 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_invalid_registry_type(self):
+    async def test_invalid_registry_type(self, ctx):
         """Test handling of invalid registry type."""
-        # Arrange
-        mock_ctx = AsyncMock()
-
         # Act
         result = await create_pull_through_cache_for_healthomics(
-            ctx=mock_ctx,
+            ctx=ctx,
             upstream_registry='invalid-registry',
             ecr_repository_prefix=None,
             credential_arn=None,
@@ -5228,14 +5181,11 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert 'docker-hub' in result['message'].lower() or 'quay' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_empty_registry_type(self):
+    async def test_empty_registry_type(self, ctx):
         """Test handling of empty registry type."""
-        # Arrange
-        mock_ctx = AsyncMock()
-
         # Act
         result = await create_pull_through_cache_for_healthomics(
-            ctx=mock_ctx,
+            ctx=ctx,
             upstream_registry='',
             ecr_repository_prefix=None,
             credential_arn=None,
@@ -5251,7 +5201,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_access_denied_error(self):
+    async def test_access_denied_error(self, ctx):
         """Test handling of AccessDeniedException."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5265,15 +5215,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
             'CreatePullThroughCacheRule',
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5284,7 +5232,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert 'access denied' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_invalid_parameter_exception(self):
+    async def test_invalid_parameter_exception(self, ctx):
         """Test handling of InvalidParameterException."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5298,15 +5246,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
             'CreatePullThroughCacheRule',
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix='invalid/prefix!@#',
                 credential_arn=None,
@@ -5317,7 +5263,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert 'invalid parameter' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_limit_exceeded_exception(self):
+    async def test_limit_exceeded_exception(self, ctx):
         """Test handling of LimitExceededException."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5331,15 +5277,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
             'CreatePullThroughCacheRule',
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5350,7 +5294,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert 'limit exceeded' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_generic_client_error(self):
+    async def test_generic_client_error(self, ctx):
         """Test handling of generic ClientError."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5364,15 +5308,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
             'CreatePullThroughCacheRule',
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5381,14 +5323,14 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         # Assert
         assert result['success'] is False
         assert 'error' in result['message'].lower()
-        mock_ctx.error.assert_called_once()
+        assert len(ctx.errors) == 1
 
     # =========================================================================
     # Test 7: Custom prefix handling
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_custom_prefix_used(self):
+    async def test_custom_prefix_used(self, ctx):
         """Test that custom prefix is used when provided."""
         # Arrange
         custom_prefix = 'my-custom-prefix'
@@ -5406,15 +5348,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=custom_prefix,
                 credential_arn=None,
@@ -5428,7 +5368,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert call_kwargs['ecrRepositoryPrefix'] == custom_prefix
 
     @pytest.mark.asyncio
-    async def test_default_prefix_used_when_not_provided(self):
+    async def test_default_prefix_used_when_not_provided(self, ctx):
         """Test that default prefix is used when not provided."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5445,15 +5385,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5470,7 +5408,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_response_structure_on_success(self):
+    async def test_response_structure_on_success(self, ctx):
         """Test that successful response has correct structure."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5488,15 +5426,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5521,14 +5457,11 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert 'repository_template_permission_granted' in rule
 
     @pytest.mark.asyncio
-    async def test_response_structure_on_failure(self):
+    async def test_response_structure_on_failure(self, ctx):
         """Test that failure response has correct structure."""
-        # Arrange
-        mock_ctx = AsyncMock()
-
         # Act - Invalid registry type causes early failure
         result = await create_pull_through_cache_for_healthomics(
-            ctx=mock_ctx,
+            ctx=ctx,
             upstream_registry='invalid',
             ecr_repository_prefix=None,
             credential_arn=None,
@@ -5547,7 +5480,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert len(result['message']) > 0
 
     @pytest.mark.asyncio
-    async def test_healthomics_usable_flag_when_all_permissions_succeed(self):
+    async def test_healthomics_usable_flag_when_all_permissions_succeed(self, ctx):
         """Test that healthomics_usable is True when all permissions are configured."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5564,15 +5497,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5586,7 +5517,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert result['rule']['repository_template_permission_granted'] is True
 
     @pytest.mark.asyncio
-    async def test_healthomics_usable_flag_when_permissions_fail(self):
+    async def test_healthomics_usable_flag_when_permissions_fail(self, ctx):
         """Test that healthomics_usable is False when permissions fail."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5603,15 +5534,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.side_effect = Exception('Policy update failed')
         mock_client.create_repository_creation_template.side_effect = Exception('Template failed')
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5628,7 +5557,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
     # =========================================================================
 
     @pytest.mark.asyncio
-    async def test_existing_registry_policy_updated(self):
+    async def test_existing_registry_policy_updated(self, ctx):
         """Test that existing registry policy is updated correctly."""
         # Arrange
         existing_policy = {
@@ -5654,15 +5583,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5675,7 +5602,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_template_already_exists_updated(self):
+    async def test_template_already_exists_updated(self, ctx):
         """Test that existing template is updated correctly."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5704,15 +5631,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         )
         mock_client.update_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -5724,7 +5649,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.update_repository_creation_template.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_quay_with_optional_credentials(self):
+    async def test_quay_with_optional_credentials(self, ctx):
         """Test Quay.io with optional credentials provided."""
         # Arrange
         credential_arn = 'arn:aws:secretsmanager:us-east-1:123456789012:secret:quay-creds'
@@ -5742,15 +5667,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         mock_client.put_registry_policy.return_value = {}
         mock_client.create_repository_creation_template.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=credential_arn,
@@ -5764,7 +5687,7 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
         assert call_kwargs['credentialArn'] == credential_arn
 
     @pytest.mark.asyncio
-    async def test_botocore_error_handling(self):
+    async def test_botocore_error_handling(self, ctx):
         """Test handling of BotoCoreError."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -5772,15 +5695,13 @@ class TestCreatePullThroughCacheForHealthOmicsUnit:
             botocore.exceptions.BotoCoreError()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await create_pull_through_cache_for_healthomics(
-                ctx=mock_ctx,
+                ctx=ctx,
                 upstream_registry='quay',
                 ecr_repository_prefix=None,
                 credential_arn=None,
@@ -6040,10 +5961,6 @@ class TestValidationIssueRemediation:
         For any validation issue detected during configuration validation,
         the issue object SHALL contain a non-empty `remediation` field.
         """
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         ptc_rules = scenario['ptc_rules']
         registry_scenario = scenario['registry_scenario']
         template_scenarios = scenario['template_scenarios']
@@ -6121,10 +6038,6 @@ class TestValidationIssueRemediation:
         For any validation issue, the remediation field SHALL contain actionable
         guidance (indicated by containing action words or specific instructions).
         """
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         ptc_rules = scenario['ptc_rules']
         registry_scenario = scenario['registry_scenario']
         template_scenarios = scenario['template_scenarios']
@@ -6214,7 +6127,7 @@ class TestValidationIssueRemediation:
             )
 
     @pytest.mark.asyncio
-    async def test_no_ptc_rules_issue_has_remediation(self):
+    async def test_no_ptc_rules_issue_has_remediation(self, ctx):
         """Property: Info issue for no PTC rules has remediation.
 
         Feature: ecr-container-tools, Property: Validation Issue Remediation
@@ -6222,23 +6135,17 @@ class TestValidationIssueRemediation:
         When no pull-through cache rules exist, the info issue SHALL have
         a non-empty remediation field with guidance on creating rules.
         """
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Create mock ECR client with no PTC rules
         mock_client = _create_mock_ecr_client()
         mock_client.describe_pull_through_cache_rules.return_value = {
             'pullThroughCacheRules': [],
         }
 
-        mock_ctx = AsyncMock()
-
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Should have an info issue about no PTC rules
         issues = result.get('issues', [])
@@ -6262,7 +6169,7 @@ class TestValidationIssueRemediation:
         )
 
     @pytest.mark.asyncio
-    async def test_missing_registry_policy_issue_has_remediation(self):
+    async def test_missing_registry_policy_issue_has_remediation(self, ctx):
         """Property: Error issue for missing registry policy has remediation.
 
         Feature: ecr-container-tools, Property: Validation Issue Remediation
@@ -6270,10 +6177,6 @@ class TestValidationIssueRemediation:
         When registry policy is missing, the error issue SHALL have a non-empty
         remediation field with guidance on creating the policy.
         """
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Create mock ECR client with PTC rules but no registry policy
         mock_client = _create_mock_ecr_client()
         mock_client.describe_pull_through_cache_rules.return_value = {
@@ -6296,13 +6199,11 @@ class TestValidationIssueRemediation:
             )
         )
 
-        mock_ctx = AsyncMock()
-
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Find the error issue about missing registry policy
         issues = result.get('issues', [])
@@ -6319,7 +6220,7 @@ class TestValidationIssueRemediation:
         )
 
     @pytest.mark.asyncio
-    async def test_missing_template_issue_has_remediation(self):
+    async def test_missing_template_issue_has_remediation(self, ctx):
         """Property: Error issue for missing template has remediation.
 
         Feature: ecr-container-tools, Property: Validation Issue Remediation
@@ -6327,10 +6228,6 @@ class TestValidationIssueRemediation:
         When repository creation template is missing, the error issue SHALL have
         a non-empty remediation field with guidance on creating the template.
         """
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Create mock ECR client with PTC rules, valid registry policy, but no template
         mock_client = _create_mock_ecr_client()
         mock_client.describe_pull_through_cache_rules.return_value = {
@@ -6343,19 +6240,9 @@ class TestValidationIssueRemediation:
             ],
         }
         # Valid registry policy
-        registry_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsPullThroughCacheAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                    'Resource': '*',
-                }
-            ],
+        mock_client.get_registry_policy.return_value = {
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT
         }
-        mock_client.get_registry_policy.return_value = {'policyText': json.dumps(registry_policy)}
         # No template
         mock_client.describe_repository_creation_templates.side_effect = (
             botocore.exceptions.ClientError(
@@ -6364,13 +6251,11 @@ class TestValidationIssueRemediation:
             )
         )
 
-        mock_ctx = AsyncMock()
-
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Find the error issue about missing template
         issues = result.get('issues', [])
@@ -6388,7 +6273,7 @@ class TestValidationIssueRemediation:
         assert len(template_issue['remediation'].strip()) > 0, 'Remediation should not be empty'
 
     @pytest.mark.asyncio
-    async def test_valid_config_info_issue_has_remediation(self):
+    async def test_valid_config_info_issue_has_remediation(self, ctx):
         """Property: Info issue for valid config has remediation.
 
         Feature: ecr-container-tools, Property: Validation Issue Remediation
@@ -6396,10 +6281,6 @@ class TestValidationIssueRemediation:
         When configuration is valid, the info issue SHALL have a non-empty
         remediation field (even if it says 'no action required').
         """
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Create mock ECR client with fully valid configuration
         mock_client = _create_mock_ecr_client()
         mock_client.describe_pull_through_cache_rules.return_value = {
@@ -6412,48 +6293,25 @@ class TestValidationIssueRemediation:
             ],
         }
         # Valid registry policy
-        registry_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsPullThroughCacheAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                    'Resource': '*',
-                }
-            ],
+        mock_client.get_registry_policy.return_value = {
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT
         }
-        mock_client.get_registry_policy.return_value = {'policyText': json.dumps(registry_policy)}
         # Valid template with correct permissions
-        template_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsImagePullAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                }
-            ],
-        }
         mock_client.describe_repository_creation_templates.return_value = {
             'repositoryCreationTemplates': [
                 {
                     'prefix': 'docker-hub',
                     'description': 'Template for docker-hub',
-                    'repositoryPolicy': json.dumps(template_policy),
+                    'repositoryPolicy': _HEALTHOMICS_TEMPLATE_POLICY_TEXT,
                 }
             ],
         }
 
-        mock_ctx = AsyncMock()
-
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Should be valid
         assert result['valid'] is True, 'Configuration should be valid'
@@ -6488,10 +6346,6 @@ class TestValidationIssueRemediation:
         For any permission-related validation issue, the remediation SHALL
         mention HealthOmics or the HealthOmics principal to provide context.
         """
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Generate PTC rules
         ptc_rules = []
         prefixes = ['docker-hub', 'quay', 'ecr-public', 'custom-1', 'custom-2']
@@ -6594,12 +6448,8 @@ class TestValidateHealthomicsECRConfigUnit:
     """
 
     @pytest.mark.asyncio
-    async def test_fully_valid_configuration(self):
+    async def test_fully_valid_configuration(self, ctx):
         """Test validation of a fully valid ECR configuration."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange - Create a fully valid configuration
         mock_client = _create_mock_ecr_client()
 
@@ -6615,50 +6465,27 @@ class TestValidateHealthomicsECRConfigUnit:
         }
 
         # Registry policy grants HealthOmics access
-        registry_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsPullThroughCacheAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                    'Resource': '*',
-                }
-            ],
+        mock_client.get_registry_policy.return_value = {
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT
         }
-        mock_client.get_registry_policy.return_value = {'policyText': json.dumps(registry_policy)}
 
         # Repository template exists with correct permissions
-        template_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsImagePullAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                }
-            ],
-        }
         mock_client.describe_repository_creation_templates.return_value = {
             'repositoryCreationTemplates': [
                 {
                     'prefix': 'docker-hub',
                     'description': 'Template for docker-hub',
-                    'repositoryPolicy': json.dumps(template_policy),
+                    'repositoryPolicy': _HEALTHOMICS_TEMPLATE_POLICY_TEXT,
                 }
             ],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert result['valid'] is True
@@ -6668,12 +6495,47 @@ class TestValidateHealthomicsECRConfigUnit:
         assert len(info_issues) >= 1
 
     @pytest.mark.asyncio
-    async def test_missing_registry_policy(self):
-        """Test validation when registry policy is missing."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
+    async def test_batched_template_lookup_failure_checks_each_prefix(self, ctx):
+        """Test that a failed batched template lookup does not flag every rule as missing."""
+        # Arrange - two rules; only quay lacks a template
+        mock_client = _create_mock_ecr_client()
+        mock_client.describe_pull_through_cache_rules.return_value = {
+            'pullThroughCacheRules': [
+                {
+                    'ecrRepositoryPrefix': 'docker-hub',
+                    'upstreamRegistryUrl': 'registry-1.docker.io',
+                },
+                {'ecrRepositoryPrefix': 'quay', 'upstreamRegistryUrl': 'quay.io'},
+            ],
+        }
+        mock_client.get_registry_policy.return_value = {
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT
+        }
+        docker_hub_template = {
+            'prefix': 'docker-hub',
+            'repositoryPolicy': _HEALTHOMICS_TEMPLATE_POLICY_TEXT,
+        }
+        mock_client.describe_repository_creation_templates.side_effect = [
+            _create_template_not_found_exception(),
+            {'repositoryCreationTemplates': [docker_hub_template]},
+            _create_template_not_found_exception(),
+        ]
+
+        # Act
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
+            return_value=mock_client,
+        ):
+            result = await validate_healthomics_ecr_config(ctx=ctx)
+
+        # Assert - only the quay prefix is reported as missing its template
+        template_issues = [i for i in result['issues'] if i['component'] == 'repository_template']
+        assert len(template_issues) == 1
+        assert '"quay"' in template_issues[0]['message']
 
+    @pytest.mark.asyncio
+    async def test_missing_registry_policy(self, ctx):
+        """Test validation when registry policy is missing."""
         # Arrange
         mock_client = _create_mock_ecr_client()
 
@@ -6702,14 +6564,12 @@ class TestValidateHealthomicsECRConfigUnit:
             )
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert result['valid'] is False
@@ -6724,12 +6584,8 @@ class TestValidateHealthomicsECRConfigUnit:
         assert len(registry_errors[0]['remediation']) > 0
 
     @pytest.mark.asyncio
-    async def test_missing_repository_templates(self):
+    async def test_missing_repository_templates(self, ctx):
         """Test validation when repository templates are missing."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange
         mock_client = _create_mock_ecr_client()
 
@@ -6750,19 +6606,9 @@ class TestValidateHealthomicsECRConfigUnit:
         }
 
         # Registry policy exists and is valid
-        registry_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsPullThroughCacheAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                    'Resource': '*',
-                }
-            ],
+        mock_client.get_registry_policy.return_value = {
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT
         }
-        mock_client.get_registry_policy.return_value = {'policyText': json.dumps(registry_policy)}
 
         # No templates exist
         mock_client.describe_repository_creation_templates.side_effect = (
@@ -6772,14 +6618,12 @@ class TestValidateHealthomicsECRConfigUnit:
             )
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert result['valid'] is False
@@ -6795,12 +6639,8 @@ class TestValidateHealthomicsECRConfigUnit:
             assert len(error['remediation']) > 0
 
     @pytest.mark.asyncio
-    async def test_incorrect_template_permissions(self):
+    async def test_incorrect_template_permissions(self, ctx):
         """Test validation when template has incorrect permissions."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange
         mock_client = _create_mock_ecr_client()
 
@@ -6816,19 +6656,9 @@ class TestValidateHealthomicsECRConfigUnit:
         }
 
         # Registry policy exists and is valid
-        registry_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsPullThroughCacheAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                    'Resource': '*',
-                }
-            ],
+        mock_client.get_registry_policy.return_value = {
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT
         }
-        mock_client.get_registry_policy.return_value = {'policyText': json.dumps(registry_policy)}
 
         # Template exists but with incomplete permissions (missing GetDownloadUrlForLayer)
         template_policy = {
@@ -6852,14 +6682,12 @@ class TestValidateHealthomicsECRConfigUnit:
             ],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert result['valid'] is False
@@ -6879,12 +6707,8 @@ class TestValidateHealthomicsECRConfigUnit:
         assert len(template_errors[0]['remediation']) > 0
 
     @pytest.mark.asyncio
-    async def test_no_pull_through_cache_rules(self):
+    async def test_no_pull_through_cache_rules(self, ctx):
         """Test validation when no pull-through cache rules exist."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange
         mock_client = _create_mock_ecr_client()
 
@@ -6893,14 +6717,12 @@ class TestValidateHealthomicsECRConfigUnit:
             'pullThroughCacheRules': [],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert result['valid'] is True  # No rules means nothing to validate
@@ -6916,12 +6738,8 @@ class TestValidateHealthomicsECRConfigUnit:
         assert len(info_issues[0]['remediation']) > 0
 
     @pytest.mark.asyncio
-    async def test_access_denied_error(self):
+    async def test_access_denied_error(self, ctx):
         """Test handling of AccessDeniedException."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange
         mock_client = _create_mock_ecr_client()
         mock_client.describe_pull_through_cache_rules.side_effect = (
@@ -6931,52 +6749,40 @@ class TestValidateHealthomicsECRConfigUnit:
             )
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert 'error' in result
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_botocore_error_handling(self):
+    async def test_botocore_error_handling(self, ctx):
         """Test handling of BotoCoreError."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange
         mock_client = _create_mock_ecr_client()
         mock_client.describe_pull_through_cache_rules.side_effect = (
             botocore.exceptions.BotoCoreError()
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert 'error' in result
         assert 'Error' in result['error']
 
     @pytest.mark.asyncio
-    async def test_multiple_ptc_rules_validation(self):
+    async def test_multiple_ptc_rules_validation(self, ctx):
         """Test validation with multiple pull-through cache rules."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange
         mock_client = _create_mock_ecr_client()
 
@@ -7002,67 +6808,44 @@ class TestValidateHealthomicsECRConfigUnit:
         }
 
         # Registry policy exists and is valid
-        registry_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsPullThroughCacheAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                    'Resource': '*',
-                }
-            ],
+        mock_client.get_registry_policy.return_value = {
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT
         }
-        mock_client.get_registry_policy.return_value = {'policyText': json.dumps(registry_policy)}
 
         # Templates exist for all prefixes
-        template_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsImagePullAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                }
-            ],
-        }
 
         def mock_describe_templates(prefixes):
-            prefix = prefixes[0]
             return {
                 'repositoryCreationTemplates': [
                     {
                         'prefix': prefix,
                         'description': f'Template for {prefix}',
-                        'repositoryPolicy': json.dumps(template_policy),
+                        'repositoryPolicy': _HEALTHOMICS_TEMPLATE_POLICY_TEXT,
                     }
+                    for prefix in prefixes
                 ],
             }
 
         mock_client.describe_repository_creation_templates.side_effect = mock_describe_templates
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert result['valid'] is True
         assert result['pull_through_caches_checked'] == 3
+        # Templates for all prefixes are fetched in one request
+        mock_client.describe_repository_creation_templates.assert_called_once_with(
+            prefixes=['docker-hub', 'quay', 'ecr-public']
+        )
 
     @pytest.mark.asyncio
-    async def test_registry_policy_missing_actions(self):
+    async def test_registry_policy_missing_actions(self, ctx):
         """Test validation when registry policy is missing required actions."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange
         mock_client = _create_mock_ecr_client()
 
@@ -7100,14 +6883,12 @@ class TestValidateHealthomicsECRConfigUnit:
             )
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert result['valid'] is False
@@ -7121,12 +6902,8 @@ class TestValidateHealthomicsECRConfigUnit:
         assert 'missing' in registry_errors[0]['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_template_without_policy(self):
+    async def test_template_without_policy(self, ctx):
         """Test validation when template exists but has no policy."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange
         mock_client = _create_mock_ecr_client()
 
@@ -7142,19 +6919,9 @@ class TestValidateHealthomicsECRConfigUnit:
         }
 
         # Registry policy exists and is valid
-        registry_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsPullThroughCacheAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                    'Resource': '*',
-                }
-            ],
+        mock_client.get_registry_policy.return_value = {
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT
         }
-        mock_client.get_registry_policy.return_value = {'policyText': json.dumps(registry_policy)}
 
         # Template exists but has no repositoryPolicy
         mock_client.describe_repository_creation_templates.return_value = {
@@ -7167,14 +6934,12 @@ class TestValidateHealthomicsECRConfigUnit:
             ],
         }
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert result['valid'] is False
@@ -7187,12 +6952,8 @@ class TestValidateHealthomicsECRConfigUnit:
         assert len(template_errors) >= 1
 
     @pytest.mark.asyncio
-    async def test_all_issues_have_remediation(self):
+    async def test_all_issues_have_remediation(self, ctx):
         """Test that all validation issues have non-empty remediation fields."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange - Create a configuration with multiple issues
         mock_client = _create_mock_ecr_client()
 
@@ -7226,14 +6987,12 @@ class TestValidateHealthomicsECRConfigUnit:
             )
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert - All issues should have non-empty remediation
         for issue in result['issues']:
@@ -7242,12 +7001,8 @@ class TestValidateHealthomicsECRConfigUnit:
             assert len(issue['remediation'].strip()) > 0, f'Issue has empty remediation: {issue}'
 
     @pytest.mark.asyncio
-    async def test_pagination_of_ptc_rules(self):
+    async def test_pagination_of_ptc_rules(self, ctx):
         """Test that pagination is handled when listing PTC rules."""
-        from awslabs.aws_healthomics_mcp_server.tools.ecr_tools import (
-            validate_healthomics_ecr_config,
-        )
-
         # Arrange
         mock_client = _create_mock_ecr_client()
 
@@ -7281,54 +7036,32 @@ class TestValidateHealthomicsECRConfigUnit:
         mock_client.describe_pull_through_cache_rules.side_effect = mock_describe_ptc_rules
 
         # Registry policy exists and is valid
-        registry_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsPullThroughCacheAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:CreateRepository', 'ecr:BatchImportUpstreamImage'],
-                    'Resource': '*',
-                }
-            ],
+        mock_client.get_registry_policy.return_value = {
+            'policyText': _HEALTHOMICS_REGISTRY_POLICY_TEXT
         }
-        mock_client.get_registry_policy.return_value = {'policyText': json.dumps(registry_policy)}
 
         # Templates exist
-        template_policy = {
-            'Version': '2012-10-17',
-            'Statement': [
-                {
-                    'Sid': 'HealthOmicsImagePullAccess',
-                    'Effect': 'Allow',
-                    'Principal': {'Service': 'omics.amazonaws.com'},
-                    'Action': ['ecr:BatchGetImage', 'ecr:GetDownloadUrlForLayer'],
-                }
-            ],
-        }
 
         def mock_describe_templates(prefixes):
             return {
                 'repositoryCreationTemplates': [
                     {
-                        'prefix': prefixes[0],
-                        'description': f'Template for {prefixes[0]}',
-                        'repositoryPolicy': json.dumps(template_policy),
+                        'prefix': prefix,
+                        'description': f'Template for {prefix}',
+                        'repositoryPolicy': _HEALTHOMICS_TEMPLATE_POLICY_TEXT,
                     }
+                    for prefix in prefixes
                 ],
             }
 
         mock_client.describe_repository_creation_templates.side_effect = mock_describe_templates
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
-            result = await validate_healthomics_ecr_config(ctx=mock_ctx)
+            result = await validate_healthomics_ecr_config(ctx=ctx)
 
         # Assert
         assert result['valid'] is True
@@ -7356,7 +7089,7 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
     """
 
     @pytest.mark.asyncio
-    async def test_grant_access_creates_new_policy(self):
+    async def test_grant_access_creates_new_policy(self, ctx):
         """Test that a new policy is created when none exists."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -7391,15 +7124,13 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
         ]
         mock_client.set_repository_policy.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await grant_healthomics_repository_access(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
             )
 
@@ -7423,7 +7154,39 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
         )
 
     @pytest.mark.asyncio
-    async def test_grant_access_updates_existing_policy(self):
+    async def test_grant_access_verifies_by_reading_policy_back(self, ctx):
+        """Test that the reported access status comes from the policy read back from ECR."""
+        # Arrange - no policy before the write; the read-back lacks the HealthOmics grant
+        mock_client = _create_mock_ecr_client()
+        error_response = {
+            'Error': {
+                'Code': 'RepositoryPolicyNotFoundException',
+                'Message': 'Repository policy does not exist',
+            }
+        }
+        mock_client.get_repository_policy.side_effect = [
+            botocore.exceptions.ClientError(error_response, 'GetRepositoryPolicy'),
+            {'policyText': json.dumps({'Version': '2012-10-17', 'Statement': []})},
+        ]
+
+        # Act
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
+            return_value=mock_client,
+        ):
+            result = await grant_healthomics_repository_access(
+                ctx=ctx,
+                repository_name='my-repo',
+            )
+
+        # Assert
+        assert result['success'] is True
+        assert result['policy_created'] is True
+        assert result['current_healthomics_accessible'] == 'not_accessible'
+        assert mock_client.get_repository_policy.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_grant_access_updates_existing_policy(self, ctx):
         """Test that an existing policy is updated to add HealthOmics access."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -7464,15 +7227,13 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
         ]
         mock_client.set_repository_policy.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await grant_healthomics_repository_access(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
             )
 
@@ -7491,21 +7252,19 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
         assert any(stmt.get('Sid') == 'OtherAccess' for stmt in policy['Statement'])
 
     @pytest.mark.asyncio
-    async def test_grant_access_already_accessible(self):
+    async def test_grant_access_already_accessible(self, ctx):
         """Test that no changes are made when repository already has HealthOmics access."""
         # Arrange
         mock_client = _create_mock_ecr_client()
         # Policy already grants HealthOmics access (default from _create_mock_ecr_client)
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await grant_healthomics_repository_access(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
             )
 
@@ -7521,7 +7280,7 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
         mock_client.set_repository_policy.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_grant_access_repository_not_found(self):
+    async def test_grant_access_repository_not_found(self, ctx):
         """Test error handling when repository does not exist."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -7535,25 +7294,23 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
             error_response, 'GetRepositoryPolicy'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await grant_healthomics_repository_access(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='nonexistent-repo',
             )
 
         # Assert
         assert result['success'] is False
         assert 'not found' in result['message'].lower()
-        mock_ctx.error.assert_called_once()
+        assert len(ctx.errors) == 1
 
     @pytest.mark.asyncio
-    async def test_grant_access_access_denied(self):
+    async def test_grant_access_access_denied(self, ctx):
         """Test error handling when access is denied to set policy."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -7578,8 +7335,6 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
             access_denied, 'SetRepositoryPolicy'
         )
 
-        mock_ctx = AsyncMock()
-
         # Act & Assert
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
@@ -7587,22 +7342,19 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
         ):
             with pytest.raises(botocore.exceptions.ClientError):
                 await grant_healthomics_repository_access(
-                    ctx=mock_ctx,
+                    ctx=ctx,
                     repository_name='my-repo',
                 )
 
-        mock_ctx.error.assert_called_once()
-        assert 'SetRepositoryPolicy' in mock_ctx.error.call_args[0][0]
+        assert len(ctx.errors) == 1
+        assert 'SetRepositoryPolicy' in ctx.errors[0]
 
     @pytest.mark.asyncio
-    async def test_grant_access_empty_repository_name(self):
+    async def test_grant_access_empty_repository_name(self, ctx):
         """Test validation error for empty repository name."""
-        # Arrange
-        mock_ctx = AsyncMock()
-
         # Act
         result = await grant_healthomics_repository_access(
-            ctx=mock_ctx,
+            ctx=ctx,
             repository_name='',
         )
 
@@ -7611,7 +7363,7 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
         assert 'required' in result['message'].lower() or 'empty' in result['message'].lower()
 
     @pytest.mark.asyncio
-    async def test_grant_access_replaces_existing_healthomics_statement(self):
+    async def test_grant_access_replaces_existing_healthomics_statement(self, ctx):
         """Test that existing HealthOmics statements are replaced, not duplicated."""
         # Arrange
         mock_client = _create_mock_ecr_client()
@@ -7651,15 +7403,13 @@ class TestGrantHealthOmicsRepositoryAccessUnit:
         ]
         mock_client.set_repository_policy.return_value = {}
 
-        mock_ctx = AsyncMock()
-
         # Act
         with patch(
             'awslabs.aws_healthomics_mcp_server.tools.ecr_tools.get_ecr_client',
             return_value=mock_client,
         ):
             result = await grant_healthomics_repository_access(
-                ctx=mock_ctx,
+                ctx=ctx,
                 repository_name='my-repo',
             )
 
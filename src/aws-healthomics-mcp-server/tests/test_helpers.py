@@ -16,7 +16,77 @@
 
 import inspect
 from mcp.server.fastmcp import Context
-from typing import Any, Dict
+from typing import Any, Awaitable, Dict
+
+
+class FakeCtx:
+    """Minimal async MCP context stub that records reported errors."""
+
+    def __init__(self):
+        """Initialize the stub with no recorded errors."""
+        self.errors = []
+
+    async def error(self, message, **kwargs):
+        """Record an error message reported by a tool."""
+        self.errors.append(message)
+
+
+class Recorder:
+    """Callable stand-in for a boto client method that records its keyword arguments.
+
+    Calls consume ``outcomes`` in order first, raising the exceptions and returning
+    the responses in it, then fall back to raising ``exc`` or returning ``ret``.
+    """
+
+    def __init__(self, ret=None, exc=None, outcomes=()):
+        """Initialize the recorder with canned responses or exceptions."""
+        self.ret = ret
+        self.exc = exc
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        """Record the call and return the next canned response or raise the canned exception."""
+        self.calls.append(kwargs)
+        if self.outcomes:
+            outcome = self.outcomes.pop(0)
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome
+        if self.exc:
+            raise self.exc
+        return self.ret
+
+
+class FakeLogsClient:
+    """Lightweight CloudWatch Logs client stub.
+
+    Records the keyword arguments of every ``get_log_events`` call in ``calls`` (and
+    of every ``filter_log_events`` call in ``filter_calls``) and returns ``response``,
+    or raises ``side_effect`` when it is set. Unlike a ``MagicMock``, accessing an
+    API the stub does not implement fails loudly.
+    """
+
+    def __init__(self):
+        """Initialize the stub with an empty response."""
+        self.calls = []
+        self.filter_calls = []
+        self.response = {'events': []}
+        self.side_effect = None
+
+    def _respond(self, calls, kwargs):
+        calls.append(kwargs)
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.response
+
+    def get_log_events(self, **kwargs):
+        """Record the call and return the configured response."""
+        return self._respond(self.calls, kwargs)
+
+    def filter_log_events(self, **kwargs):
+        """Record the call and return the configured response."""
+        return self._respond(self.filter_calls, kwargs)
 
 
 async def call_mcp_tool_directly(tool_func, ctx: Context, **kwargs) -> Any:
@@ -62,6 +132,25 @@ async def call_mcp_tool_directly(tool_func, ctx: Context, **kwargs) -> Any:
     return await tool_func(**actual_params)
 
 
+async def assert_reported_error(
+    tool_call: Awaitable[Dict[str, Any]], ctx, operation: str
+) -> Dict[str, Any]:
+    """Await a tool call and assert it returned and reported an error for an operation.
+
+    Args:
+        tool_call: The pending tool coroutine
+        ctx: FakeCtx that records the errors reported by the tool
+        operation: Operation description expected at the start of the error message
+
+    Returns:
+        The error dictionary returned by the tool
+    """
+    result = await tool_call
+    assert result['error'].startswith(operation)
+    assert ctx.errors == [result['error']]
+    return result
+
+
 def extract_field_defaults(tool_func) -> Dict[str, Any]:
     """Extract default values from Field annotations in an MCP tool function.
 
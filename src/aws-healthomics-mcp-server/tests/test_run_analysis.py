@@ -2488,6 +2488,21 @@ class TestNormalizeRunIdsEdgeCases:
         # Assert
         assert result == ['custom-run-id']
 
+    def test_normalize_run_ids_str_subclass(self):
+        """Test normalizing run IDs given as a str subclass."""
+
+        # Arrange
+        class RunIdString(str):
+            pass
+
+        run_ids = RunIdString('run1,run2')
+
+        # Act
+        result = _normalize_run_ids(run_ids)
+
+        # Assert
+        assert result == ['run1', 'run2']
+
 
 class TestGenerateAnalysisReportOverProvisionedTasks:
     """Test report generation for over-provisioned tasks with recommendations."""
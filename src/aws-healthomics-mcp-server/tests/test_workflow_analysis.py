@@ -15,6 +15,7 @@
 """Tests for workflow analysis tools."""
 
 import botocore.exceptions
+import json
 import pytest
 from awslabs.aws_healthomics_mcp_server.tools.run_analysis import (
     _convert_datetime_to_string,
@@ -30,7 +31,7 @@ from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
 )
 from botocore.exceptions import ClientError
 from mcp.server.fastmcp import Context
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 
 @pytest.fixture
@@ -40,13 +41,6 @@ def mock_context():
     return context
 
 
-@pytest.fixture
-def mock_logs_client():
-    """Create a mock CloudWatch Logs client."""
-    client = MagicMock()
-    return client
-
-
 @pytest.fixture
 def sample_log_events():
     """Sample log events for testing."""
@@ -75,13 +69,12 @@ class TestGetRunLogs:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_logs_success(
-        self, mock_get_logs_client, mock_context, sample_log_events
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
     ):
         """Test successful run log retrieval."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
             'nextForwardToken': 'next-token-123',
         }
@@ -104,8 +97,8 @@ class TestGetRunLogs:
         assert result['nextToken'] == 'next-token-123'
 
         # Verify correct log stream name
-        mock_client.get_log_events.assert_called_once()
-        call_args = mock_client.get_log_events.call_args[1]
+        assert len(mock_logs_client.calls) == 1
+        call_args = mock_logs_client.calls[-1]
         assert call_args['logGroupName'] == '/aws/omics/WorkflowLog'
         assert call_args['logStreamName'] == 'run/run-12345'
         assert call_args['limit'] == 50
@@ -114,13 +107,12 @@ class TestGetRunLogs:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_logs_with_time_range(
-        self, mock_get_logs_client, mock_context, sample_log_events
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
     ):
         """Test run log retrieval with time range."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
         }
 
@@ -141,12 +133,13 @@ class TestGetRunLogs:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_run_logs_boto_error(self, mock_get_logs_client, mock_context):
+    async def test_get_run_logs_boto_error(
+        self, mock_get_logs_client, mock_context, mock_logs_client
+    ):
         """Test run log retrieval with boto error."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.side_effect = botocore.exceptions.ClientError(
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.side_effect = botocore.exceptions.ClientError(
             error_response={
                 'Error': {'Code': 'ResourceNotFoundException', 'Message': 'Log stream not found'}
             },
@@ -170,11 +163,12 @@ class TestGetRunLogs:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_run_logs_invalid_timestamp(self, mock_get_logs_client, mock_context):
+    async def test_get_run_logs_invalid_timestamp(
+        self, mock_get_logs_client, mock_context, mock_logs_client
+    ):
         """Test run log retrieval with invalid timestamp."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
 
         # Act
         result = await get_run_logs(
@@ -198,13 +192,12 @@ class TestGetRunManifestLogs:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_manifest_logs_with_uuid(
-        self, mock_get_logs_client, mock_context, sample_log_events
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
     ):
         """Test manifest log retrieval with run UUID."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
         }
 
@@ -225,21 +218,24 @@ class TestGetRunManifestLogs:
         assert len(result['events']) == 3
 
         # Verify correct log stream name with UUID
-        mock_client.get_log_events.assert_called_once()
-        call_args = mock_client.get_log_events.call_args[1]
+        assert len(mock_logs_client.calls) == 1
+        call_args = mock_logs_client.calls[-1]
         assert call_args['logStreamName'] == 'manifest/run/run-12345/uuid-67890'
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_manifest_logs_without_uuid(
-        self, mock_get_logs_client, mock_context, sample_log_events
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
     ):
-        """Test manifest log retrieval without run UUID."""
+        """Test manifest log retrieval without run UUID reads all manifest streams at once."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
-            'events': sample_log_events,
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
+            'events': [
+                dict(event, logStreamName='manifest/run/run-12345/uuid-67890')
+                for event in sample_log_events
+            ],
+            'nextToken': 'filter-token',
         }
 
         # Act
@@ -257,11 +253,44 @@ class TestGetRunManifestLogs:
         # Assert
         assert 'events' in result
         assert len(result['events']) == 3
+        assert set(result['events'][0]) == {'timestamp', 'message'}
+        assert result['nextToken'] == 'filter-token'
+
+        # Verify a single prefix query replaces the per-stream read
+        assert mock_logs_client.calls == []
+        assert mock_logs_client.filter_calls == [
+            {
+                'logGroupName': '/aws/omics/WorkflowLog',
+                'logStreamNamePrefix': 'manifest/run/run-12345/',
+                'limit': 100,
+            }
+        ]
 
-        # Verify correct log stream name without UUID
-        mock_client.get_log_events.assert_called_once()
-        call_args = mock_client.get_log_events.call_args[1]
-        assert call_args['logStreamName'] == 'manifest/run/run-12345'
+    @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
+    @pytest.mark.asyncio
+    async def test_get_run_manifest_logs_without_uuid_rejects_tail_read(
+        self, mock_get_logs_client, mock_context, mock_logs_client
+    ):
+        """Test that reading from the end without a run UUID is rejected explicitly."""
+        # Arrange
+        mock_get_logs_client.return_value = mock_logs_client
+
+        # Act
+        result = await get_run_manifest_logs(
+            ctx=mock_context,
+            run_id='run-12345',
+            run_uuid=None,
+            start_time=None,
+            end_time=None,
+            limit=100,
+            next_token=None,
+            start_from_head=False,
+        )
+
+        # Assert
+        assert 'start_from_head=False requires run_uuid' in result['error']
+        assert mock_logs_client.calls == []
+        assert mock_logs_client.filter_calls == []
 
 
 class TestGetRunEngineLogs:
@@ -270,13 +299,12 @@ class TestGetRunEngineLogs:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_engine_logs_success(
-        self, mock_get_logs_client, mock_context, sample_log_events
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
     ):
         """Test successful engine log retrieval."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
         }
 
@@ -296,21 +324,20 @@ class TestGetRunEngineLogs:
         assert len(result['events']) == 3
 
         # Verify correct log stream name
-        mock_client.get_log_events.assert_called_once()
-        call_args = mock_client.get_log_events.call_args[1]
+        assert len(mock_logs_client.calls) == 1
+        call_args = mock_logs_client.calls[-1]
         assert call_args['logStreamName'] == 'run/run-12345/engine'
         assert call_args['startFromHead'] is True
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_engine_logs_from_tail(
-        self, mock_get_logs_client, mock_context, sample_log_events
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
     ):
         """Test engine log retrieval from tail."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
         }
 
@@ -329,7 +356,7 @@ class TestGetRunEngineLogs:
         assert 'events' in result
 
         # Verify startFromHead parameter
-        call_args = mock_client.get_log_events.call_args[1]
+        call_args = mock_logs_client.calls[-1]
         assert call_args['startFromHead'] is False
 
 
@@ -339,13 +366,12 @@ class TestGetTaskLogs:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_task_logs_success(
-        self, mock_get_logs_client, mock_context, sample_log_events
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
     ):
         """Test successful task log retrieval."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
         }
 
@@ -366,20 +392,19 @@ class TestGetTaskLogs:
         assert len(result['events']) == 3
 
         # Verify correct log stream name
-        mock_client.get_log_events.assert_called_once()
-        call_args = mock_client.get_log_events.call_args[1]
+        assert len(mock_logs_client.calls) == 1
+        call_args = mock_logs_client.calls[-1]
         assert call_args['logStreamName'] == 'run/run-12345/task/task-67890'
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_task_logs_with_pagination(
-        self, mock_get_logs_client, mock_context, sample_log_events
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
     ):
         """Test task log retrieval with pagination."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
             'nextForwardToken': 'next-token-456',
         }
@@ -402,18 +427,47 @@ class TestGetTaskLogs:
         assert result['nextToken'] == 'next-token-456'
 
         # Verify pagination parameters
-        call_args = mock_client.get_log_events.call_args[1]
+        call_args = mock_logs_client.calls[-1]
         assert call_args['nextToken'] == 'prev-token-123'
         assert call_args['limit'] == 25
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_task_logs_unexpected_error(self, mock_get_logs_client, mock_context):
+    async def test_get_task_logs_epoch_ms_timestamps(
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
+    ):
+        """Test task log retrieval with raw epoch millisecond timestamps."""
+        # Arrange
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
+            'events': sample_log_events,
+        }
+
+        # Act
+        result = await get_task_logs(
+            ctx=mock_context,
+            run_id='run-12345',
+            task_id='task-67890',
+            start_time=None,
+            end_time=None,
+            limit=100,
+            next_token=None,
+            start_from_head=True,
+            iso_timestamps=False,
+        )
+
+        # Assert
+        assert result['events'][0]['timestamp'] == 1640995200000
+
+    @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
+    @pytest.mark.asyncio
+    async def test_get_task_logs_unexpected_error(
+        self, mock_get_logs_client, mock_context, mock_logs_client
+    ):
         """Test task log retrieval with unexpected error."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.side_effect = Exception('Unexpected error')
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.side_effect = Exception('Unexpected error')
 
         # Act
         result = await get_task_logs(
@@ -438,13 +492,12 @@ class TestParameterValidation:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_logs_with_valid_limits(
-        self, mock_get_logs_client, mock_context, sample_log_events
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
     ):
         """Test run logs with valid limit values."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
         }
 
@@ -475,13 +528,12 @@ class TestParameterValidation:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_task_logs_with_valid_limits(
-        self, mock_get_logs_client, mock_context, sample_log_events
+        self, mock_get_logs_client, mock_context, sample_log_events, mock_logs_client
     ):
         """Test task logs with valid limit values."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
         }
 
@@ -642,16 +694,14 @@ class TestGetLogsFromStream:
     """Test the _get_logs_from_stream function."""
 
     @pytest.mark.asyncio
-    async def test_get_logs_from_stream_success(self, sample_log_events):
+    async def test_get_logs_from_stream_success(self, sample_log_events, mock_logs_client):
         """Test successful log retrieval from stream."""
         # Arrange
-        mock_client = MagicMock()
-        mock_response = {'events': sample_log_events}
-        mock_client.get_log_events.return_value = mock_response
+        mock_logs_client.response = {'events': sample_log_events}
 
         # Act
         result = await _get_logs_from_stream(
-            mock_client,
+            mock_logs_client,
             '/aws/omics/WorkflowLog',
             'run-12345',
             '2024-01-01T10:00:00Z',
@@ -665,10 +715,10 @@ class TestGetLogsFromStream:
         assert 'events' in result
         assert len(result['events']) == 3
         # Don't check exact timestamp values due to timezone complexity, just verify the call was made
-        mock_client.get_log_events.assert_called_once()
+        assert len(mock_logs_client.calls) == 1
 
         # Verify the call includes the expected parameters (without checking exact timestamp values)
-        call_kwargs = mock_client.get_log_events.call_args[1]
+        call_kwargs = mock_logs_client.calls[-1]
         assert call_kwargs['logGroupName'] == '/aws/omics/WorkflowLog'
         assert call_kwargs['logStreamName'] == 'run-12345'
         assert call_kwargs['limit'] == 100
@@ -677,16 +727,14 @@ class TestGetLogsFromStream:
         assert 'endTime' in call_kwargs
 
     @pytest.mark.asyncio
-    async def test_get_logs_from_stream_no_time_filter(self, sample_log_events):
+    async def test_get_logs_from_stream_no_time_filter(self, sample_log_events, mock_logs_client):
         """Test log retrieval without time filters."""
         # Arrange
-        mock_client = MagicMock()
-        mock_response = {'events': sample_log_events}
-        mock_client.get_log_events.return_value = mock_response
+        mock_logs_client.response = {'events': sample_log_events}
 
         # Act
         result = await _get_logs_from_stream(
-            mock_client,
+            mock_logs_client,
             '/aws/omics/WorkflowLog',
             'run-12345',
             None,
@@ -699,25 +747,28 @@ class TestGetLogsFromStream:
         # Assert
         assert 'events' in result
         assert len(result['events']) == 3
-        mock_client.get_log_events.assert_called_once_with(
-            logGroupName='/aws/omics/WorkflowLog',
-            logStreamName='run-12345',
-            limit=50,
-            startFromHead=False,
-        )
+        assert mock_logs_client.calls == [
+            {
+                'logGroupName': '/aws/omics/WorkflowLog',
+                'logStreamName': 'run-12345',
+                'limit': 50,
+                'startFromHead': False,
+            }
+        ]
 
     @pytest.mark.asyncio
-    async def test_get_logs_from_stream_with_next_token(self, sample_log_events):
+    async def test_get_logs_from_stream_with_next_token(self, sample_log_events, mock_logs_client):
         """Test log retrieval with pagination token."""
         # Arrange
-        mock_client = MagicMock()
         # Use 'nextForwardToken' as that's what the function expects
-        mock_response = {'events': sample_log_events, 'nextForwardToken': 'next-token-456'}
-        mock_client.get_log_events.return_value = mock_response
+        mock_logs_client.response = {
+            'events': sample_log_events,
+            'nextForwardToken': 'next-token-456',
+        }
 
         # Act
         result = await _get_logs_from_stream(
-            mock_client,
+            mock_logs_client,
             '/aws/omics/WorkflowLog',
             'run-12345',
             None,
@@ -732,14 +783,84 @@ class TestGetLogsFromStream:
         assert 'nextToken' in result
         assert result['nextToken'] == 'next-token-456'
         assert len(result['events']) == 3
-        mock_client.get_log_events.assert_called_once_with(
-            logGroupName='/aws/omics/WorkflowLog',
-            logStreamName='run-12345',
-            nextToken='token123',
-            limit=100,
-            startFromHead=True,
+        assert mock_logs_client.calls == [
+            {
+                'logGroupName': '/aws/omics/WorkflowLog',
+                'logStreamName': 'run-12345',
+                'nextToken': 'token123',
+                'limit': 100,
+                'startFromHead': True,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_logs_from_stream_drops_unused_event_keys(self, mock_logs_client):
+        """Test that only timestamp and message are kept from raw events."""
+        # Arrange
+        mock_logs_client.response = {
+            'events': [
+                {
+                    'timestamp': 1640995200000,
+                    'message': 'Starting workflow execution',
+                    'ingestionTime': 1640995200500,
+                }
+            ]
+        }
+
+        # Act
+        result = await _get_logs_from_stream(
+            mock_logs_client,
+            '/aws/omics/WorkflowLog',
+            'run-12345',
         )
 
+        # Assert
+        assert result['events'] == [
+            {'timestamp': '2022-01-01T00:00:00Z', 'message': 'Starting workflow execution'}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_logs_from_stream_result_is_json_native(
+        self, sample_log_events, mock_logs_client
+    ):
+        """Test that the result round-trips through JSON without custom encoders."""
+        # Arrange
+        mock_logs_client.response = {'events': sample_log_events, 'nextForwardToken': 'token'}
+
+        # Act
+        result = await _get_logs_from_stream(
+            mock_logs_client,
+            '/aws/omics/WorkflowLog',
+            'run-12345',
+        )
+
+        # Assert
+        assert json.loads(json.dumps(result)) == result
+
+    @pytest.mark.asyncio
+    async def test_get_logs_from_stream_epoch_ms_timestamps(
+        self, sample_log_events, mock_logs_client
+    ):
+        """Test that timestamps are left as epoch milliseconds when requested."""
+        # Arrange
+        mock_logs_client.response = {'events': sample_log_events}
+
+        # Act
+        result = await _get_logs_from_stream(
+            mock_logs_client,
+            '/aws/omics/WorkflowLog',
+            'run-12345',
+            iso_timestamps=False,
+        )
+
+        # Assert
+        assert [event['timestamp'] for event in result['events']] == [
+            1640995200000,
+            1640995260000,
+            1640995320000,
+        ]
+        assert result['events'][0]['message'] == 'Starting workflow execution'
+
 
 class TestGetRunLogsErrorHandling:
     """Test error handling in get_run_logs function."""
@@ -752,11 +873,11 @@ class TestGetRunLogsErrorHandling:
         mock_get_logs_from_stream,
         mock_get_logs_client,
         mock_context,
+        mock_logs_client,
     ):
         """Test get_run_logs with BotoCoreError."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
         mock_get_logs_from_stream.side_effect = botocore.exceptions.BotoCoreError()
 
         # Act
@@ -782,11 +903,11 @@ class TestGetRunLogsErrorHandling:
         mock_get_logs_from_stream,
         mock_get_logs_client,
         mock_context,
+        mock_logs_client,
     ):
         """Test get_run_logs with unexpected error."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
         mock_get_logs_from_stream.side_effect = Exception('Unexpected error')
 
         # Act
@@ -812,7 +933,7 @@ class TestInternalWrapperFunctions:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis._get_logs_from_stream')
     @pytest.mark.asyncio
     async def test_get_run_manifest_logs_internal_success(
-        self, mock_get_logs_from_stream, mock_get_logs_client, sample_log_events
+        self, mock_get_logs_from_stream, mock_get_logs_client, sample_log_events, mock_logs_client
     ):
         """Test successful internal manifest log retrieval."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
@@ -820,8 +941,7 @@ class TestInternalWrapperFunctions:
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
         mock_get_logs_from_stream.return_value = {'events': sample_log_events}
 
         # Act
@@ -839,7 +959,7 @@ class TestInternalWrapperFunctions:
         assert 'events' in result
         assert len(result['events']) == 3
         mock_get_logs_from_stream.assert_called_once_with(
-            mock_client,
+            mock_logs_client,
             '/aws/omics/WorkflowLog',
             'manifest/run/run-12345/uuid-67890',
             None,
@@ -853,7 +973,7 @@ class TestInternalWrapperFunctions:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis._get_logs_from_stream')
     @pytest.mark.asyncio
     async def test_get_run_manifest_logs_internal_error(
-        self, mock_get_logs_from_stream, mock_get_logs_client
+        self, mock_get_logs_from_stream, mock_get_logs_client, mock_logs_client
     ):
         """Test internal manifest log retrieval with error."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
@@ -861,8 +981,7 @@ class TestInternalWrapperFunctions:
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
         mock_get_logs_from_stream.side_effect = Exception('Internal error')
 
         # Act & Assert
@@ -881,7 +1000,7 @@ class TestInternalWrapperFunctions:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis._get_logs_from_stream')
     @pytest.mark.asyncio
     async def test_get_run_engine_logs_internal_success(
-        self, mock_get_logs_from_stream, mock_get_logs_client, sample_log_events
+        self, mock_get_logs_from_stream, mock_get_logs_client, sample_log_events, mock_logs_client
     ):
         """Test successful internal engine log retrieval."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
@@ -889,8 +1008,7 @@ class TestInternalWrapperFunctions:
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
         mock_get_logs_from_stream.return_value = {'events': sample_log_events}
 
         # Act
@@ -907,7 +1025,7 @@ class TestInternalWrapperFunctions:
         assert 'events' in result
         assert len(result['events']) == 3
         mock_get_logs_from_stream.assert_called_once_with(
-            mock_client,
+            mock_logs_client,
             '/aws/omics/WorkflowLog',
             'run/run-12345/engine',
             None,
@@ -921,7 +1039,7 @@ class TestInternalWrapperFunctions:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis._get_logs_from_stream')
     @pytest.mark.asyncio
     async def test_get_run_engine_logs_internal_error(
-        self, mock_get_logs_from_stream, mock_get_logs_client
+        self, mock_get_logs_from_stream, mock_get_logs_client, mock_logs_client
     ):
         """Test internal engine log retrieval with error."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
@@ -929,8 +1047,7 @@ class TestInternalWrapperFunctions:
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
         mock_get_logs_from_stream.side_effect = Exception('Engine error')
 
         # Act & Assert
@@ -948,7 +1065,7 @@ class TestInternalWrapperFunctions:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis._get_logs_from_stream')
     @pytest.mark.asyncio
     async def test_get_task_logs_internal_success(
-        self, mock_get_logs_from_stream, mock_get_logs_client, sample_log_events
+        self, mock_get_logs_from_stream, mock_get_logs_client, sample_log_events, mock_logs_client
     ):
         """Test successful internal task log retrieval."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
@@ -956,8 +1073,7 @@ class TestInternalWrapperFunctions:
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
         mock_get_logs_from_stream.return_value = {'events': sample_log_events}
 
         # Act
@@ -975,7 +1091,7 @@ class TestInternalWrapperFunctions:
         assert 'events' in result
         assert len(result['events']) == 3
         mock_get_logs_from_stream.assert_called_once_with(
-            mock_client,
+            mock_logs_client,
             '/aws/omics/WorkflowLog',
             'run/run-12345/task/task-67890',
             None,
@@ -989,7 +1105,7 @@ class TestInternalWrapperFunctions:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis._get_logs_from_stream')
     @pytest.mark.asyncio
     async def test_get_task_logs_internal_error(
-        self, mock_get_logs_from_stream, mock_get_logs_client
+        self, mock_get_logs_from_stream, mock_get_logs_client, mock_logs_client
     ):
         """Test internal task log retrieval with error."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
@@ -997,8 +1113,7 @@ class TestInternalWrapperFunctions:
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
         mock_get_logs_from_stream.side_effect = Exception('Task error')
 
         # Act & Assert
@@ -1020,7 +1135,7 @@ class TestGetRunManifestLogsInternal:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_manifest_logs_internal_success(
-        self, mock_get_logs_client, sample_log_events
+        self, mock_get_logs_client, sample_log_events, mock_logs_client
     ):
         """Test successful internal manifest log retrieval."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
@@ -1028,9 +1143,8 @@ class TestGetRunManifestLogsInternal:
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
             'nextForwardToken': 'forward-token',
             'nextBackwardToken': 'backward-token',
@@ -1056,8 +1170,8 @@ class TestGetRunManifestLogsInternal:
         assert result['nextBackwardToken'] == 'backward-token'
 
         # Verify the call was made with correct parameters
-        mock_client.get_log_events.assert_called_once()
-        call_kwargs = mock_client.get_log_events.call_args[1]
+        assert len(mock_logs_client.calls) == 1
+        call_kwargs = mock_logs_client.calls[-1]
         assert call_kwargs['logGroupName'] == '/aws/omics/WorkflowLog/uuid-67890'
         assert call_kwargs['limit'] == 50
         assert call_kwargs['startFromHead'] is False
@@ -1067,16 +1181,17 @@ class TestGetRunManifestLogsInternal:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_run_manifest_logs_internal_resource_not_found(self, mock_get_logs_client):
+    async def test_get_run_manifest_logs_internal_resource_not_found(
+        self, mock_get_logs_client, mock_logs_client
+    ):
         """Test internal manifest log retrieval with ResourceNotFoundException."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
             _get_run_manifest_logs_internal,
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.side_effect = ClientError(
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.side_effect = ClientError(
             error_response={
                 'Error': {'Code': 'ResourceNotFoundException', 'Message': 'Log group not found'}
             },
@@ -1099,16 +1214,17 @@ class TestGetRunManifestLogsInternal:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_run_manifest_logs_internal_other_client_error(self, mock_get_logs_client):
+    async def test_get_run_manifest_logs_internal_other_client_error(
+        self, mock_get_logs_client, mock_logs_client
+    ):
         """Test internal manifest log retrieval with other ClientError."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
             _get_run_manifest_logs_internal,
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.side_effect = ClientError(
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.side_effect = ClientError(
             error_response={'Error': {'Code': 'AccessDenied', 'Message': 'Access denied'}},
             operation_name='GetLogEvents',
         )
@@ -1127,16 +1243,17 @@ class TestGetRunManifestLogsInternal:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_run_manifest_logs_internal_generic_exception(self, mock_get_logs_client):
+    async def test_get_run_manifest_logs_internal_generic_exception(
+        self, mock_get_logs_client, mock_logs_client
+    ):
         """Test internal manifest log retrieval with generic exception."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
             _get_run_manifest_logs_internal,
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.side_effect = Exception('Generic error')
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.side_effect = Exception('Generic error')
 
         # Act & Assert
         with pytest.raises(Exception, match='Generic error'):
@@ -1153,7 +1270,7 @@ class TestGetRunManifestLogsInternal:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_manifest_logs_internal_no_time_params(
-        self, mock_get_logs_client, sample_log_events
+        self, mock_get_logs_client, sample_log_events, mock_logs_client
     ):
         """Test internal manifest log retrieval without time parameters."""
         from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
@@ -1161,9 +1278,8 @@ class TestGetRunManifestLogsInternal:
         )
 
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.return_value = {
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.response = {
             'events': sample_log_events,
         }
 
@@ -1183,8 +1299,8 @@ class TestGetRunManifestLogsInternal:
         assert len(result['events']) == 3
 
         # Verify the call was made without time parameters
-        mock_client.get_log_events.assert_called_once()
-        call_kwargs = mock_client.get_log_events.call_args[1]
+        assert len(mock_logs_client.calls) == 1
+        call_kwargs = mock_logs_client.calls[-1]
         assert 'startTime' not in call_kwargs
         assert 'endTime' not in call_kwargs
 
@@ -1194,12 +1310,13 @@ class TestGetRunManifestLogsErrorHandling:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_run_manifest_logs_boto_error(self, mock_get_logs_client, mock_context):
+    async def test_get_run_manifest_logs_boto_error(
+        self, mock_get_logs_client, mock_context, mock_logs_client
+    ):
         """Test get_run_manifest_logs with BotoCoreError."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.side_effect = botocore.exceptions.BotoCoreError()
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.side_effect = botocore.exceptions.BotoCoreError()
 
         # Act
         result = await get_run_manifest_logs(
@@ -1220,13 +1337,12 @@ class TestGetRunManifestLogsErrorHandling:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_manifest_logs_unexpected_error(
-        self, mock_get_logs_client, mock_context
+        self, mock_get_logs_client, mock_context, mock_logs_client
     ):
         """Test get_run_manifest_logs with unexpected error."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.side_effect = Exception('Unexpected manifest error')
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.side_effect = Exception('Unexpected manifest error')
 
         # Act
         result = await get_run_manifest_logs(
@@ -1247,12 +1363,11 @@ class TestGetRunManifestLogsErrorHandling:
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
     async def test_get_run_manifest_logs_invalid_timestamp(
-        self, mock_get_logs_client, mock_context
+        self, mock_get_logs_client, mock_context, mock_logs_client
     ):
         """Test get_run_manifest_logs with invalid timestamp."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
 
         # Act
         result = await get_run_manifest_logs(
@@ -1276,12 +1391,13 @@ class TestGetRunEngineLogsErrorHandling:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_run_engine_logs_boto_error(self, mock_get_logs_client, mock_context):
+    async def test_get_run_engine_logs_boto_error(
+        self, mock_get_logs_client, mock_context, mock_logs_client
+    ):
         """Test get_run_engine_logs with BotoCoreError."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.side_effect = botocore.exceptions.BotoCoreError()
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.side_effect = botocore.exceptions.BotoCoreError()
 
         # Act
         result = await get_run_engine_logs(
@@ -1300,12 +1416,13 @@ class TestGetRunEngineLogsErrorHandling:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_run_engine_logs_unexpected_error(self, mock_get_logs_client, mock_context):
+    async def test_get_run_engine_logs_unexpected_error(
+        self, mock_get_logs_client, mock_context, mock_logs_client
+    ):
         """Test get_run_engine_logs with unexpected error."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.side_effect = Exception('Unexpected engine error')
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.side_effect = Exception('Unexpected engine error')
 
         # Act
         result = await get_run_engine_logs(
@@ -1324,11 +1441,12 @@ class TestGetRunEngineLogsErrorHandling:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_run_engine_logs_invalid_timestamp(self, mock_get_logs_client, mock_context):
+    async def test_get_run_engine_logs_invalid_timestamp(
+        self, mock_get_logs_client, mock_context, mock_logs_client
+    ):
         """Test get_run_engine_logs with invalid timestamp."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
 
         # Act
         result = await get_run_engine_logs(
@@ -1351,12 +1469,13 @@ class TestGetTaskLogsErrorHandling:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_task_logs_boto_error(self, mock_get_logs_client, mock_context):
+    async def test_get_task_logs_boto_error(
+        self, mock_get_logs_client, mock_context, mock_logs_client
+    ):
         """Test get_task_logs with BotoCoreError."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
-        mock_client.get_log_events.side_effect = botocore.exceptions.BotoCoreError()
+        mock_get_logs_client.return_value = mock_logs_client
+        mock_logs_client.side_effect = botocore.exceptions.BotoCoreError()
 
         # Act
         result = await get_task_logs(
@@ -1376,11 +1495,12 @@ class TestGetTaskLogsErrorHandling:
 
     @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
     @pytest.mark.asyncio
-    async def test_get_task_logs_invalid_timestamp(self, mock_get_logs_client, mock_context):
+    async def test_get_task_logs_invalid_timestamp(
+        self, mock_get_logs_client, mock_context, mock_logs_client
+    ):
         """Test get_task_logs with invalid timestamp."""
         # Arrange
-        mock_client = MagicMock()
-        mock_get_logs_client.return_value = mock_client
+        mock_get_logs_client.return_value = mock_logs_client
 
         # Act
         result = await get_task_logs(
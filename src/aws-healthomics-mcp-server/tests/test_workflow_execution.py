@@ -28,212 +28,222 @@ from awslabs.aws_healthomics_mcp_server.tools.workflow_execution import (
     start_run,
 )
 from datetime import datetime, timedelta, timezone
-from hypothesis import given, settings
+from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
-from tests.test_helpers import MCPToolTestWrapper
-from unittest.mock import AsyncMock, MagicMock, patch
+from tests.test_helpers import MCPToolTestWrapper, Recorder, assert_reported_error
+from unittest.mock import AsyncMock, patch
+
+
+_FROZEN = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_FROZEN_ISO = _FROZEN.isoformat()
+
+_FULL_RUN_RESPONSE = {
+    'id': 'run-12345',
+    'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-12345',
+    'name': 'test-run',
+    'status': 'COMPLETED',
+    'workflowId': 'wfl-12345',
+    'workflowType': 'WDL',
+    'workflowVersionName': 'v1.0',
+    'creationTime': _FROZEN,
+    'startTime': _FROZEN,
+    'stopTime': _FROZEN,
+    'outputUri': 's3://bucket/output/',
+    'roleArn': 'arn:aws:iam::123456789012:role/HealthOmicsRole',
+    'runOutputUri': 's3://bucket/run-output/',
+    'parameters': {'param1': 'value1'},
+    'uuid': 'abc-123-def-456',
+    'statusMessage': 'Run completed successfully',
+}
+
+_MINIMAL_RUN_RESPONSE = {
+    'id': 'run-12345',
+    'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-12345',
+    'name': 'test-run',
+    'status': 'QUEUED',
+    'workflowId': 'wfl-12345',
+    'workflowType': 'WDL',
+    'creationTime': _FROZEN,
+    'outputUri': 's3://bucket/output/',
+    'roleArn': 'arn:aws:iam::123456789012:role/HealthOmicsRole',
+    'runOutputUri': 's3://bucket/run-output/',
+}
+
+_FAILED_RUN_RESPONSE = {
+    'id': 'run-12345',
+    'status': 'FAILED',
+    'failureReason': 'Resource quota exceeded',
+    'statusMessage': 'Run failed due to resource constraints',
+    'roleArn': 'arn:aws:iam::123456789012:role/HealthOmicsRole',
+    'runOutputUri': 's3://bucket/run-output/',
+}
+
+_LIST_RESPONSE = {
+    'items': [
+        {
+            'id': 'run-12345',
+            'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-12345',
+            'name': 'test-run-1',
+            'status': 'COMPLETED',
+            'workflowId': 'wfl-12345',
+            'workflowType': 'WDL',
+            'creationTime': _FROZEN,
+            'startTime': _FROZEN,
+            'stopTime': _FROZEN,
+        },
+        {
+            'id': 'run-67890',
+            'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-67890',
+            'name': 'test-run-2',
+            'status': 'RUNNING',
+            'workflowId': 'wfl-67890',
+            'workflowType': 'CWL',
+            'creationTime': _FROZEN,
+            'startTime': _FROZEN,
+        },
+    ],
+    'nextToken': 'next-page-token',
+}
+
+_EXPECTED_FULL = {
+    **_FULL_RUN_RESPONSE,
+    'creationTime': _FROZEN_ISO,
+    'startTime': _FROZEN_ISO,
+    'stopTime': _FROZEN_ISO,
+}
+
+_EXPECTED_MINIMAL = {**_MINIMAL_RUN_RESPONSE, 'creationTime': _FROZEN_ISO}
+
+_EXPECTED_FAILED = {
+    'id': 'run-12345',
+    'arn': None,
+    'name': None,
+    'status': 'FAILED',
+    'workflowId': None,
+    'workflowType': None,
+    'creationTime': None,
+    'outputUri': None,
+    'roleArn': 'arn:aws:iam::123456789012:role/HealthOmicsRole',
+    'runOutputUri': 's3://bucket/run-output/',
+    'failureReason': 'Resource quota exceeded',
+    'statusMessage': 'Run failed due to resource constraints',
+}
+
+_EXPECTED_LIST = {
+    'runs': [
+        {
+            **_LIST_RESPONSE['items'][0],
+            'creationTime': _FROZEN_ISO,
+            'startTime': _FROZEN_ISO,
+            'stopTime': _FROZEN_ISO,
+        },
+        {
+            **_LIST_RESPONSE['items'][1],
+            'creationTime': _FROZEN_ISO,
+            'startTime': _FROZEN_ISO,
+        },
+    ],
+    'nextToken': 'next-page-token',
+}
 
+_MINIMAL_LIST_RESPONSE = {
+    'items': [
+        {
+            'id': 'run-12345',
+            'status': 'QUEUED',
+            'creationTime': _FROZEN,
+        }
+    ]
+}
 
-@pytest.mark.asyncio
-async def test_get_run_success():
-    """Test successful retrieval of run details."""
-    # Mock response data
-    creation_time = datetime.now(timezone.utc)
-    start_time = creation_time
-    stop_time = datetime.now(timezone.utc)
+_NONE_TIMESTAMPS_LIST_RESPONSE = {
+    'items': [
+        {
+            'id': 'run-12345',
+            'status': 'PENDING',
+            'creationTime': None,
+            'startTime': None,
+            'stopTime': None,
+        }
+    ]
+}
+
+
+# (list_runs keyword overrides, expected ListRuns kwargs, test id)
+_FILTER_CASES = [
+    ({}, {'maxResults': 10}, 'defaults'),
+    (
+        {'max_results': 25, 'next_token': 'previous-token', 'status': 'COMPLETED'},
+        {'maxResults': 25, 'startingToken': 'previous-token', 'status': 'COMPLETED'},
+        'status_and_token',
+    ),
+    ({'run_group_id': 'rg-12345'}, {'maxResults': 10, 'runGroupId': 'rg-12345'}, 'run_group'),
+    # Date filters are applied client-side over larger batches
+    ({'created_after': '2023-01-01T00:00:00Z'}, {'maxResults': 100}, 'created_after'),
+]
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize list_runs request tests from _FILTER_CASES."""
+    if 'filter_kwargs' in metafunc.fixturenames:
+        metafunc.parametrize(
+            'filter_kwargs,expected_call',
+            [case[:2] for case in _FILTER_CASES],
+            ids=[case[2] for case in _FILTER_CASES],
+        )
 
-    mock_response = {
-        'id': 'run-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-12345',
-        'name': 'test-run',
-        'status': 'COMPLETED',
-        'workflowId': 'wfl-12345',
-        'workflowType': 'WDL',
-        'workflowVersionName': 'v1.0',
-        'creationTime': creation_time,
-        'startTime': start_time,
-        'stopTime': stop_time,
-        'outputUri': 's3://bucket/output/',
-        'roleArn': 'arn:aws:iam::123456789012:role/HealthOmicsRole',
-        'runOutputUri': 's3://bucket/run-output/',
-        'parameters': {'param1': 'value1'},
-        'uuid': 'abc-123-def-456',
-        'statusMessage': 'Run completed successfully',
-    }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run.return_value = mock_response
+@pytest.fixture(autouse=True)
+def patched_omics_client(omics_client, monkeypatch):
+    """Route every workflow execution tool call in this module to the stub HealthOmics client."""
+    omics_client.start_run = Recorder()
+    omics_client.list_run_tasks = Recorder()
+    omics_client.get_run_task = Recorder()
+    monkeypatch.setattr(_workflow_execution, 'get_omics_client', lambda **kwargs: omics_client)
+    return omics_client
+
+
+@pytest.mark.parametrize(
+    'response,expected',
+    [
+        (_FULL_RUN_RESPONSE, _EXPECTED_FULL),
+        (_MINIMAL_RUN_RESPONSE, _EXPECTED_MINIMAL),
+        (_FAILED_RUN_RESPONSE, _EXPECTED_FAILED),
+    ],
+    ids=['full', 'minimal', 'failed'],
+)
+async def test_get_run_success(omics_client, response, expected, ctx):
+    """Test retrieval of run details for full, minimal and failed run responses."""
+    omics_client.get_run.ret = response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run(mock_ctx, run_id='run-12345')
+    result = await get_run(ctx, run_id='run-12345')
 
     # Verify client was called correctly
-    mock_client.get_run.assert_called_once_with(id='run-12345')
+    assert omics_client.get_run.calls == [{'id': 'run-12345'}]
 
-    # Verify result contains all expected fields
-    assert result['id'] == 'run-12345'
-    assert result['arn'] == 'arn:aws:omics:us-east-1:123456789012:run/run-12345'
-    assert result['name'] == 'test-run'
-    assert result['status'] == 'COMPLETED'
-    assert result['workflowId'] == 'wfl-12345'
-    assert result['workflowType'] == 'WDL'
-    assert result['workflowVersionName'] == 'v1.0'
-    assert result['creationTime'] == creation_time.isoformat()
-    assert result['startTime'] == start_time.isoformat()
-    assert result['stopTime'] == stop_time.isoformat()
-    assert result['outputUri'] == 's3://bucket/output/'
-    assert result['roleArn'] == 'arn:aws:iam::123456789012:role/HealthOmicsRole'
-    assert result['runOutputUri'] == 's3://bucket/run-output/'
-    assert result['parameters'] == {'param1': 'value1'}
-    assert result['uuid'] == 'abc-123-def-456'
-    assert result['statusMessage'] == 'Run completed successfully'
-
-
-@pytest.mark.asyncio
-async def test_get_run_minimal_response():
-    """Test run retrieval with minimal response fields."""
-    # Mock response with minimal fields
-    creation_time = datetime.now(timezone.utc)
-    mock_response = {
-        'id': 'run-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-12345',
-        'name': 'test-run',
-        'status': 'QUEUED',
-        'workflowId': 'wfl-12345',
-        'workflowType': 'WDL',
-        'creationTime': creation_time,
-        'outputUri': 's3://bucket/output/',
-        'roleArn': 'arn:aws:iam::123456789012:role/HealthOmicsRole',
-        'runOutputUri': 's3://bucket/run-output/',
-    }
-
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run.return_value = mock_response
+    # Verify result contains exactly the expected fields
+    assert result == expected
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run(mock_ctx, run_id='run-12345')
-
-    # Verify required fields
-    assert result['id'] == 'run-12345'
-    assert result['status'] == 'QUEUED'
-    assert result['creationTime'] == creation_time.isoformat()
-    assert result['roleArn'] == 'arn:aws:iam::123456789012:role/HealthOmicsRole'
-    assert result['runOutputUri'] == 's3://bucket/run-output/'
-
-    # Verify optional fields are not present
-    assert 'startTime' not in result
-    assert 'stopTime' not in result
-    assert 'parameters' not in result
-    assert 'statusMessage' not in result
-    assert 'failureReason' not in result
-
-
-@pytest.mark.asyncio
-async def test_get_run_failed_status():
-    """Test run retrieval with failed status and failure reason."""
-    # Mock response for failed run
-    mock_response = {
-        'id': 'run-12345',
-        'status': 'FAILED',
-        'failureReason': 'Resource quota exceeded',
-        'statusMessage': 'Run failed due to resource constraints',
-        'roleArn': 'arn:aws:iam::123456789012:role/HealthOmicsRole',
-        'runOutputUri': 's3://bucket/run-output/',
-    }
-
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run(mock_ctx, run_id='run-12345')
 
-    # Verify failure information
-    assert result['status'] == 'FAILED'
-    assert result['failureReason'] == 'Resource quota exceeded'
-    assert result['statusMessage'] == 'Run failed due to resource constraints'
-
-
-@pytest.mark.asyncio
-async def test_get_run_boto_error():
-    """Test handling of BotoCoreError."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run.side_effect = botocore.exceptions.BotoCoreError()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run(mock_ctx, run_id='run-12345')
-        assert 'error' in result
-        assert 'Error getting run' in result['error']
-
-    # Verify error was reported to context
-    mock_ctx.error.assert_called_once()
-    assert 'Error getting run' in mock_ctx.error.call_args[0][0]
-
-
-@pytest.mark.asyncio
-async def test_get_run_client_error():
-    """Test handling of ClientError."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run.side_effect = botocore.exceptions.ClientError(
-        {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'Run not found'}}, 'GetRun'
-    )
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run(mock_ctx, run_id='run-12345')
-        assert 'error' in result
-        assert 'Error getting run' in result['error']
-
-    # Verify error was reported to context
-    mock_ctx.error.assert_called_once()
-    assert 'Error getting run' in mock_ctx.error.call_args[0][0]
-
-
-@pytest.mark.asyncio
-async def test_get_run_unexpected_error():
-    """Test handling of unexpected errors."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run.side_effect = Exception('Unexpected error')
+@pytest.mark.parametrize(
+    'error',
+    [
+        botocore.exceptions.BotoCoreError(),
+        botocore.exceptions.ClientError(
+            {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'Run not found'}}, 'GetRun'
+        ),
+        Exception('Unexpected error'),
+    ],
+    ids=['boto_error', 'client_error', 'unexpected_error'],
+)
+async def test_get_run_errors(omics_client, error, ctx):
+    """Test handling of errors raised by the get_run API."""
+    omics_client.get_run.exc = error
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run(mock_ctx, run_id='run-12345')
+    await assert_reported_error(get_run(ctx, run_id='run-12345'), ctx, 'Error getting run')
 
-    # Verify error was reported to context and returned
-    mock_ctx.error.assert_called_once()
-    assert 'error' in result
-    assert 'Error getting run' in result['error']
 
-
-@pytest.mark.asyncio
-async def test_get_run_none_timestamps():
+async def test_get_run_none_timestamps(omics_client, ctx):
     """Test handling of None values for timestamps."""
     # Mock response with None timestamps
     mock_response = {
@@ -246,16 +256,9 @@ async def test_get_run_none_timestamps():
         'runOutputUri': 's3://bucket/run-output/',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run.return_value = mock_response
+    omics_client.get_run.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run(mock_ctx, run_id='run-12345')
+    result = await get_run(ctx, run_id='run-12345')
 
     # Verify timestamp handling
     assert result['creationTime'] is None
@@ -266,154 +269,69 @@ async def test_get_run_none_timestamps():
 # Tests for list_runs function
 
 
-@pytest.mark.asyncio
-async def test_list_runs_success():
+async def test_list_runs_success(omics_client, ctx):
     """Test successful listing of runs."""
-    # Mock response data
-    creation_time = datetime.now(timezone.utc)
-    start_time = datetime.now(timezone.utc)
-    stop_time = datetime.now(timezone.utc)
+    omics_client.list_runs.ret = _LIST_RESPONSE
 
-    mock_response = {
-        'items': [
-            {
-                'id': 'run-12345',
-                'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-12345',
-                'name': 'test-run-1',
-                'status': 'COMPLETED',
-                'workflowId': 'wfl-12345',
-                'workflowType': 'WDL',
-                'creationTime': creation_time,
-                'startTime': start_time,
-                'stopTime': stop_time,
-            },
-            {
-                'id': 'run-67890',
-                'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-67890',
-                'name': 'test-run-2',
-                'status': 'RUNNING',
-                'workflowId': 'wfl-67890',
-                'workflowType': 'CWL',
-                'creationTime': creation_time,
-                'startTime': start_time,
-            },
-        ],
-        'nextToken': 'next-page-token',
-    }
-
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after=None,
-            created_before=None,
-            run_group_id=None,
-        )
+    result = await list_runs(
+        ctx=ctx,
+        max_results=10,
+        next_token=None,
+        status=None,
+        created_after=None,
+        created_before=None,
+        run_group_id=None,
+    )
 
     # Verify client was called correctly
-    mock_client.list_runs.assert_called_once_with(maxResults=10)
+    assert omics_client.list_runs.calls == [{'maxResults': 10}]
 
-    # Verify result structure
-    assert 'runs' in result
-    assert 'nextToken' in result
-    assert result['nextToken'] == 'next-page-token'
-    assert len(result['runs']) == 2
+    # Verify result structure; the second run has no stopTime
+    assert result == _EXPECTED_LIST
 
-    # Verify first run
-    run1 = result['runs'][0]
-    assert run1['id'] == 'run-12345'
-    assert run1['name'] == 'test-run-1'
-    assert run1['status'] == 'COMPLETED'
-    assert run1['workflowId'] == 'wfl-12345'
-    assert run1['workflowType'] == 'WDL'
-    assert run1['creationTime'] == creation_time.isoformat()
-    assert run1['startTime'] == start_time.isoformat()
-    assert run1['stopTime'] == stop_time.isoformat()
-
-    # Verify second run (no stopTime)
-    run2 = result['runs'][1]
-    assert run2['id'] == 'run-67890'
-    assert run2['status'] == 'RUNNING'
-    assert 'stopTime' not in run2
-
-
-@pytest.mark.asyncio
-async def test_list_runs_with_filters():
-    """Test listing runs with status filter (no date filters)."""
-    mock_response = {'items': []}
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
+async def test_list_runs_request_params(omics_client, ctx, filter_kwargs, expected_call):
+    """Test that list_runs forwards only the server-side filters to ListRuns."""
+    omics_client.list_runs.ret = {'items': []}
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        await list_runs(
-            ctx=mock_ctx,
-            max_results=25,
-            next_token='previous-token',
-            status='COMPLETED',
-            created_after=None,
-            created_before=None,
-            run_group_id=None,
-        )
+    kwargs = {
+        'max_results': 10,
+        'next_token': None,
+        'status': None,
+        'created_after': None,
+        'created_before': None,
+        'run_group_id': None,
+        **filter_kwargs,
+    }
+    await list_runs(ctx=ctx, **kwargs)
 
-    # Verify client was called with status filter only (no date filters)
-    mock_client.list_runs.assert_called_once_with(
-        maxResults=25,
-        startingToken='previous-token',
-        status='COMPLETED',
-    )
+    assert omics_client.list_runs.calls == [expected_call]
 
 
-@pytest.mark.asyncio
-async def test_list_runs_empty_response():
+async def test_list_runs_empty_response(omics_client, ctx):
     """Test listing runs with empty response."""
     mock_response = {'items': []}
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
+    omics_client.list_runs.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after=None,
-            created_before=None,
-        )
+    result = await list_runs(
+        ctx=ctx,
+        max_results=10,
+        next_token=None,
+        status=None,
+        created_after=None,
+        created_before=None,
+    )
 
     # Verify empty result
     assert result['runs'] == []
     assert 'nextToken' not in result
 
 
-@pytest.mark.asyncio
-async def test_list_runs_invalid_status():
+async def test_list_runs_invalid_status(ctx):
     """Test listing runs with invalid status."""
-    mock_ctx = AsyncMock()
-
     result = await list_runs(
-        ctx=mock_ctx,
+        ctx=ctx,
         max_results=10,
         next_token=None,
         status='INVALID_STATUS',
@@ -421,137 +339,60 @@ async def test_list_runs_invalid_status():
         created_before=None,
     )
     assert 'error' in result
-    assert 'Invalid run status' in result['error']
+    assert result['error'].startswith('Invalid run status')
 
     # Verify error was reported to context
-    mock_ctx.error.assert_called_once()
-    assert 'Invalid run status' in mock_ctx.error.call_args[0][0]
+    assert len(ctx.errors) == 1
+    assert ctx.errors[0].startswith('Invalid run status')
 
 
-@pytest.mark.asyncio
-async def test_list_runs_boto_error():
-    """Test handling of BotoCoreError in list_runs."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.side_effect = botocore.exceptions.BotoCoreError()
+@pytest.mark.parametrize(
+    'error',
+    [
+        botocore.exceptions.BotoCoreError(),
+        botocore.exceptions.ClientError(
+            {'Error': {'Code': 'AccessDenied', 'Message': 'Access denied'}}, 'ListRuns'
+        ),
+        Exception('Unexpected error'),
+    ],
+    ids=['boto_error', 'client_error', 'unexpected_error'],
+)
+async def test_list_runs_errors(omics_client, error, ctx):
+    """Test handling of errors raised by the list_runs API."""
+    omics_client.list_runs.exc = error
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_runs(
-            ctx=mock_ctx,
+    await assert_reported_error(
+        list_runs(
+            ctx=ctx,
             max_results=10,
             next_token=None,
             status=None,
             created_after=None,
             created_before=None,
-        )
-        assert 'error' in result
-        assert 'Error listing runs' in result['error']
-
-    # Verify error was reported to context
-    mock_ctx.error.assert_called_once()
-    assert 'Error listing runs' in mock_ctx.error.call_args[0][0]
-
-
-@pytest.mark.asyncio
-async def test_list_runs_client_error():
-    """Test handling of ClientError in list_runs."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.side_effect = botocore.exceptions.ClientError(
-        {'Error': {'Code': 'AccessDenied', 'Message': 'Access denied'}}, 'ListRuns'
+        ),
+        ctx,
+        'Error listing runs',
     )
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after=None,
-            created_before=None,
-        )
-        assert 'error' in result
-        assert 'Error listing runs' in result['error']
 
-    # Verify error was reported to context
-    mock_ctx.error.assert_called_once()
-    assert 'Error listing runs' in mock_ctx.error.call_args[0][0]
-
-
-@pytest.mark.asyncio
-async def test_list_runs_unexpected_error():
-    """Test handling of unexpected errors in list_runs."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.side_effect = Exception('Unexpected error')
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after=None,
-            created_before=None,
-        )
-        assert 'error' in result
-        assert 'Error listing runs' in result['error']
-
-    # Verify error was reported to context
-    mock_ctx.error.assert_called_once()
-    assert 'Error listing runs' in mock_ctx.error.call_args[0][0]
-
-
-@pytest.mark.asyncio
-async def test_list_runs_minimal_run_data():
+async def test_list_runs_minimal_run_data(omics_client, ctx):
     """Test listing runs with minimal run data."""
-    # Mock response with minimal fields
-    creation_time = datetime.now(timezone.utc)
-    mock_response = {
-        'items': [
-            {
-                'id': 'run-12345',
-                'status': 'QUEUED',
-                'creationTime': creation_time,
-            }
-        ]
-    }
+    omics_client.list_runs.ret = _MINIMAL_LIST_RESPONSE
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after=None,
-            created_before=None,
-        )
+    result = await list_runs(
+        ctx=ctx,
+        max_results=10,
+        next_token=None,
+        status=None,
+        created_after=None,
+        created_before=None,
+    )
 
     # Verify minimal run data
     run = result['runs'][0]
     assert run['id'] == 'run-12345'
     assert run['status'] == 'QUEUED'
-    assert run['creationTime'] == creation_time.isoformat()
+    assert run['creationTime'] == _FROZEN_ISO
 
     # Verify optional fields are not present
     assert run.get('arn') is None
@@ -562,39 +403,18 @@ async def test_list_runs_minimal_run_data():
     assert 'stopTime' not in run
 
 
-@pytest.mark.asyncio
-async def test_list_runs_none_timestamps():
+async def test_list_runs_none_timestamps(omics_client, ctx):
     """Test listing runs with None timestamps."""
-    # Mock response with None timestamps
-    mock_response = {
-        'items': [
-            {
-                'id': 'run-12345',
-                'status': 'PENDING',
-                'creationTime': None,
-                'startTime': None,
-                'stopTime': None,
-            }
-        ]
-    }
+    omics_client.list_runs.ret = _NONE_TIMESTAMPS_LIST_RESPONSE
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after=None,
-            created_before=None,
-        )
+    result = await list_runs(
+        ctx=ctx,
+        max_results=10,
+        next_token=None,
+        status=None,
+        created_after=None,
+        created_before=None,
+    )
 
     # Verify timestamp handling
     run = result['runs'][0]
@@ -603,36 +423,7 @@ async def test_list_runs_none_timestamps():
     assert 'stopTime' not in run
 
 
-@pytest.mark.asyncio
-async def test_list_runs_default_parameters():
-    """Test list_runs with default parameters."""
-    mock_response = {'items': []}
-
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after=None,
-            created_before=None,
-            run_group_id=None,
-        )
-
-    # Verify client was called with default parameters only
-    mock_client.list_runs.assert_called_once_with(maxResults=10)
-
-
-@pytest.mark.asyncio
-async def test_list_runs_with_date_filters():
+async def test_list_runs_with_date_filters(omics_client, ctx):
     """Test listing runs with client-side date filtering."""
     # Create test data with different creation times
     base_time = datetime(2023, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
@@ -666,37 +457,29 @@ async def test_list_runs_with_date_filters():
         ]
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        # Test filtering with created_after
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after='2023-06-10T00:00:00Z',
-            created_before=None,
-            run_group_id=None,
-        )
-
+    omics_client.list_runs.ret = mock_response
+
+    # Test filtering with created_after
+    result = await list_runs(
+        ctx=ctx,
+        max_results=10,
+        next_token=None,
+        status=None,
+        created_after='2023-06-10T00:00:00Z',
+        created_before=None,
+        run_group_id=None,
+    )
+
     # Should return runs created after 2023-06-10 (run-2 and run-3)
     assert len(result['runs']) == 2
     assert result['runs'][0]['id'] == 'run-2'
     assert result['runs'][1]['id'] == 'run-3'
 
     # Verify client was called with larger batch size for filtering
-    mock_client.list_runs.assert_called_once_with(maxResults=100)
+    assert omics_client.list_runs.calls == [{'maxResults': 100}]
 
 
-@pytest.mark.asyncio
-async def test_list_runs_with_created_before_filter():
+async def test_list_runs_with_created_before_filter(omics_client, ctx):
     """Test listing runs with created_before filter."""
     base_time = datetime(2023, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
 
@@ -729,23 +512,17 @@ async def test_list_runs_with_created_before_filter():
         ]
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
+    omics_client.list_runs.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        # Test filtering with created_before
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after=None,
-            created_before='2023-06-20T00:00:00Z',
-        )
+    # Test filtering with created_before
+    result = await list_runs(
+        ctx=ctx,
+        max_results=10,
+        next_token=None,
+        status=None,
+        created_after=None,
+        created_before='2023-06-20T00:00:00Z',
+    )
 
     # Should return runs created before 2023-06-20 (run-1 and run-2)
     assert len(result['runs']) == 2
@@ -753,8 +530,7 @@ async def test_list_runs_with_created_before_filter():
     assert result['runs'][1]['id'] == 'run-2'
 
 
-@pytest.mark.asyncio
-async def test_list_runs_with_both_date_filters():
+async def test_list_runs_with_both_date_filters(omics_client, ctx):
     """Test listing runs with both created_after and created_before filters."""
     base_time = datetime(2023, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
 
@@ -787,36 +563,27 @@ async def test_list_runs_with_both_date_filters():
         ]
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
+    omics_client.list_runs.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        # Test filtering with both date filters
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after='2023-06-10T00:00:00Z',
-            created_before='2023-06-20T00:00:00Z',
-        )
+    # Test filtering with both date filters
+    result = await list_runs(
+        ctx=ctx,
+        max_results=10,
+        next_token=None,
+        status=None,
+        created_after='2023-06-10T00:00:00Z',
+        created_before='2023-06-20T00:00:00Z',
+    )
 
     # Should return only run-2 (created between the two dates)
     assert len(result['runs']) == 1
     assert result['runs'][0]['id'] == 'run-2'
 
 
-@pytest.mark.asyncio
-async def test_list_runs_invalid_created_after():
+async def test_list_runs_invalid_created_after(ctx):
     """Test list_runs with invalid created_after datetime."""
-    mock_ctx = AsyncMock()
-
     result = await list_runs(
-        ctx=mock_ctx,
+        ctx=ctx,
         max_results=10,
         next_token=None,
         status=None,
@@ -826,16 +593,13 @@ async def test_list_runs_invalid_created_after():
     assert 'error' in result
 
     # Verify error was reported to context
-    mock_ctx.error.assert_called_once()
+    assert len(ctx.errors) == 1
 
 
-@pytest.mark.asyncio
-async def test_list_runs_invalid_created_before():
+async def test_list_runs_invalid_created_before(ctx):
     """Test list_runs with invalid created_before datetime."""
-    mock_ctx = AsyncMock()
-
     result = await list_runs(
-        ctx=mock_ctx,
+        ctx=ctx,
         max_results=10,
         next_token=None,
         status=None,
@@ -845,11 +609,10 @@ async def test_list_runs_invalid_created_before():
     assert 'error' in result
 
     # Verify error was reported to context
-    mock_ctx.error.assert_called_once()
+    assert len(ctx.errors) == 1
 
 
-@pytest.mark.asyncio
-async def test_list_runs_date_filter_no_matching_runs():
+async def test_list_runs_date_filter_no_matching_runs(omics_client, ctx):
     """Test date filtering when no runs match the criteria."""
     base_time = datetime(2023, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
 
@@ -866,31 +629,24 @@ async def test_list_runs_date_filter_no_matching_runs():
         ]
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
+    omics_client.list_runs.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        # Filter for runs after the only run's creation time
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after='2023-06-10T00:00:00Z',
-            created_before=None,
-        )
+    # Filter for runs after the only run's creation time
+    result = await list_runs(
+        ctx=ctx,
+        max_results=10,
+        next_token=None,
+        status=None,
+        created_after='2023-06-10T00:00:00Z',
+        created_before=None,
+    )
 
     # Should return empty list
     assert len(result['runs']) == 0
     assert 'nextToken' not in result
 
 
-@pytest.mark.asyncio
-async def test_list_runs_date_filter_with_missing_creation_time():
+async def test_list_runs_date_filter_with_missing_creation_time(omics_client, ctx):
     """Test date filtering when some runs have missing creation times."""
     base_time = datetime(2023, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
 
@@ -915,29 +671,22 @@ async def test_list_runs_date_filter_with_missing_creation_time():
         ]
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_runs.return_value = mock_response
+    omics_client.list_runs.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after='2023-06-10T00:00:00Z',
-            created_before=None,
-        )
+    result = await list_runs(
+        ctx=ctx,
+        max_results=10,
+        next_token=None,
+        status=None,
+        created_after='2023-06-10T00:00:00Z',
+        created_before=None,
+    )
 
     # Should return only the run with a valid creation time
     assert len(result['runs']) == 1
     assert result['runs'][0]['id'] == 'run-1'
 
 
-@pytest.mark.asyncio
 async def test_parse_iso_datetime_various_formats():
     """Test the parse_iso_datetime helper function with various formats."""
     from awslabs.aws_healthomics_mcp_server.tools.workflow_execution import parse_iso_datetime
@@ -962,7 +711,6 @@ async def test_parse_iso_datetime_various_formats():
         assert 'Invalid datetime format' in str(e)
 
 
-@pytest.mark.asyncio
 async def test_filter_runs_by_creation_time():
     """Test the filter_runs_by_creation_time helper function."""
     from awslabs.aws_healthomics_mcp_server.tools.workflow_execution import (
@@ -1010,8 +758,7 @@ async def test_filter_runs_by_creation_time():
     assert result[0]['id'] == 'run-2'
 
 
-@pytest.mark.asyncio
-async def test_start_run_success():
+async def test_start_run_success(omics_client):
     """Test successful workflow run start."""
     # Mock response data
     mock_response = {
@@ -1026,42 +773,39 @@ async def test_start_run_success():
 
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await start_run(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-            name='test-run',
-            output_uri='s3://my-bucket/outputs/',
-            parameters={'param1': 'value1'},
-            workflow_version_name=None,
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            cache_id=None,
-            cache_behavior=None,
-            run_group_id=None,
-            networking_mode=None,
-            configuration_name=None,
-            scratch_storage_mode=None,
-        )
+    omics_client.start_run.ret = mock_response
 
-    # Verify client was called correctly
-    mock_client.start_run.assert_called_once_with(
-        workflowId='wfl-12345',
-        roleArn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+    result = await start_run(
+        mock_ctx,
+        workflow_id='wfl-12345',
+        role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
         name='test-run',
-        outputUri='s3://my-bucket/outputs/',
+        output_uri='s3://my-bucket/outputs/',
         parameters={'param1': 'value1'},
-        storageType='DYNAMIC',
-        scratchStorageMode='LOCAL',
+        workflow_version_name=None,
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        cache_id=None,
+        cache_behavior=None,
+        run_group_id=None,
+        networking_mode=None,
+        configuration_name=None,
+        scratch_storage_mode=None,
     )
 
+    # Verify client was called correctly
+    assert omics_client.start_run.calls == [
+        {
+            'workflowId': 'wfl-12345',
+            'roleArn': 'arn:aws:iam::123456789012:role/HealthOmicsRole',
+            'name': 'test-run',
+            'outputUri': 's3://my-bucket/outputs/',
+            'parameters': {'param1': 'value1'},
+            'storageType': 'DYNAMIC',
+            'scratchStorageMode': 'LOCAL',
+        }
+    ]
+
     # Verify result contains expected fields
     assert result['id'] == 'run-12345'
     assert result['status'] == 'PENDING'
@@ -1073,8 +817,7 @@ async def test_start_run_success():
     assert result['networkingMode'] == 'RESTRICTED'
 
 
-@pytest.mark.asyncio
-async def test_start_run_null_response_fields():
+async def test_start_run_null_response_fields(omics_client):
     """Test start_run handles null/missing uuid and tags in API response."""
     mock_response = {
         'id': 'run-99999',
@@ -1083,30 +826,25 @@ async def test_start_run_null_response_fields():
     }
 
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.return_value = mock_response
+    omics_client.start_run.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await start_run(
-            mock_ctx,
-            workflow_id='wfl-99999',
-            role_arn='arn:aws:iam::123456789012:role/OmicsRole',
-            name='null-test-run',
-            output_uri='s3://bucket/output/',
-            parameters=None,
-            workflow_version_name=None,
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            cache_id=None,
-            cache_behavior=None,
-            run_group_id=None,
-            networking_mode=None,
-            configuration_name=None,
-            scratch_storage_mode=None,
-        )
+    result = await start_run(
+        mock_ctx,
+        workflow_id='wfl-99999',
+        role_arn='arn:aws:iam::123456789012:role/OmicsRole',
+        name='null-test-run',
+        output_uri='s3://bucket/output/',
+        parameters=None,
+        workflow_version_name=None,
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        cache_id=None,
+        cache_behavior=None,
+        run_group_id=None,
+        networking_mode=None,
+        configuration_name=None,
+        scratch_storage_mode=None,
+    )
 
     assert result['id'] == 'run-99999'
     assert result['tags'] == {}
@@ -1114,8 +852,7 @@ async def test_start_run_null_response_fields():
     assert result['networkingMode'] == 'RESTRICTED'
 
 
-@pytest.mark.asyncio
-async def test_start_run_with_static_storage():
+async def test_start_run_with_static_storage(omics_client):
     """Test workflow run start with static storage."""
     # Mock response data
     mock_response = {
@@ -1128,45 +865,41 @@ async def test_start_run_with_static_storage():
 
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        await start_run(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-            name='test-run',
-            output_uri='s3://my-bucket/outputs/',
-            parameters={'param1': 'value1'},
-            workflow_version_name=None,
-            storage_type='STATIC',
-            storage_capacity=1000,
-            cache_id=None,
-            cache_behavior=None,
-            run_group_id=None,
-            networking_mode=None,
-            configuration_name=None,
-            scratch_storage_mode=None,
-        )
+    omics_client.start_run.ret = mock_response
 
-    # Verify client was called with static storage parameters
-    mock_client.start_run.assert_called_once_with(
-        workflowId='wfl-12345',
-        roleArn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+    await start_run(
+        mock_ctx,
+        workflow_id='wfl-12345',
+        role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
         name='test-run',
-        outputUri='s3://my-bucket/outputs/',
+        output_uri='s3://my-bucket/outputs/',
         parameters={'param1': 'value1'},
-        storageType='STATIC',
-        storageCapacity=1000,
-        scratchStorageMode='LOCAL',
+        workflow_version_name=None,
+        storage_type='STATIC',
+        storage_capacity=1000,
+        cache_id=None,
+        cache_behavior=None,
+        run_group_id=None,
+        networking_mode=None,
+        configuration_name=None,
+        scratch_storage_mode=None,
     )
 
+    # Verify client was called with static storage parameters
+    assert omics_client.start_run.calls == [
+        {
+            'workflowId': 'wfl-12345',
+            'roleArn': 'arn:aws:iam::123456789012:role/HealthOmicsRole',
+            'name': 'test-run',
+            'outputUri': 's3://my-bucket/outputs/',
+            'parameters': {'param1': 'value1'},
+            'storageType': 'STATIC',
+            'storageCapacity': 1000,
+            'scratchStorageMode': 'LOCAL',
+        }
+    ]
+
 
-@pytest.mark.asyncio
 async def test_start_run_static_without_capacity():
     """Test workflow run start with static storage but no capacity."""
     # Mock context
@@ -1190,8 +923,7 @@ async def test_start_run_static_without_capacity():
     assert 'error' in result
 
 
-@pytest.mark.asyncio
-async def test_start_run_with_cache():
+async def test_start_run_with_cache(omics_client):
     """Test workflow run start with caching enabled."""
     # Mock response data
     mock_response = {
@@ -1204,107 +936,90 @@ async def test_start_run_with_cache():
 
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.return_value = mock_response
+    omics_client.start_run.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        await start_run(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-            name='test-run',
-            output_uri='s3://my-bucket/outputs/',
-            parameters={'param1': 'value1'},
-            workflow_version_name=None,
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            cache_id='cache-12345',
-            cache_behavior='CACHE_ALWAYS',
-            networking_mode=None,
-            configuration_name=None,
-            scratch_storage_mode=None,
-        )
+    await start_run(
+        mock_ctx,
+        workflow_id='wfl-12345',
+        role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+        name='test-run',
+        output_uri='s3://my-bucket/outputs/',
+        parameters={'param1': 'value1'},
+        workflow_version_name=None,
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        cache_id='cache-12345',
+        cache_behavior='CACHE_ALWAYS',
+        networking_mode=None,
+        configuration_name=None,
+        scratch_storage_mode=None,
+    )
 
     # Verify client was called with cache parameters
-    expected_call = mock_client.start_run.call_args[1]
+    expected_call = omics_client.start_run.calls[-1]
     assert expected_call['cacheId'] == 'cache-12345'
     assert expected_call['cacheBehavior'] == 'CACHE_ALWAYS'
 
 
-@pytest.mark.asyncio
-async def test_start_run_boto_error():
+async def test_start_run_boto_error(omics_client):
     """Test handling of BotoCoreError in start_run."""
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.side_effect = botocore.exceptions.BotoCoreError()
+    omics_client.start_run.exc = botocore.exceptions.BotoCoreError()
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await start_run(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-            name='test-run',
-            output_uri='s3://my-bucket/outputs/',
-            parameters={'param1': 'value1'},
-            workflow_version_name=None,
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            cache_id=None,
-            cache_behavior=None,
-            networking_mode=None,
-            configuration_name=None,
-            scratch_storage_mode=None,
-        )
+    result = await start_run(
+        mock_ctx,
+        workflow_id='wfl-12345',
+        role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+        name='test-run',
+        output_uri='s3://my-bucket/outputs/',
+        parameters={'param1': 'value1'},
+        workflow_version_name=None,
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        cache_id=None,
+        cache_behavior=None,
+        networking_mode=None,
+        configuration_name=None,
+        scratch_storage_mode=None,
+    )
 
     # Verify error was reported to context and returned
     mock_ctx.error.assert_called_once()
     assert 'error' in result
-    assert 'Error starting run' in result['error']
-
-
-@pytest.mark.asyncio
-async def test_start_run_client_error():
-    """Test handling of ClientError (e.g., ValidationException) in start_run."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-
-    # Simulate ValidationException for S3 object not found
-    error_response = {
-        'Error': {
-            'Code': 'ValidationException',
-            'Message': 'S3 object not found: s3://example-genomics-bucket/reference/genome.fasta',
-        }
-    }
-    mock_client.start_run.side_effect = botocore.exceptions.ClientError(error_response, 'StartRun')
+    assert result['error'].startswith('Error starting run')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await start_run(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-            name='test-run',
-            output_uri='s3://my-bucket/outputs/',
-            parameters={'reference_fasta': 's3://example-genomics-bucket/reference/genome.fasta'},
-            workflow_version_name=None,
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            cache_id=None,
-            cache_behavior=None,
-            networking_mode=None,
-            configuration_name=None,
-            scratch_storage_mode=None,
-        )
+
+async def test_start_run_client_error(omics_client):
+    """Test handling of ClientError (e.g., ValidationException) in start_run."""
+    # Mock context and client
+    mock_ctx = AsyncMock()
+
+    # Simulate ValidationException for S3 object not found
+    error_response = {
+        'Error': {
+            'Code': 'ValidationException',
+            'Message': 'S3 object not found: s3://example-genomics-bucket/reference/genome.fasta',
+        }
+    }
+    omics_client.start_run.exc = botocore.exceptions.ClientError(error_response, 'StartRun')
+
+    result = await start_run(
+        mock_ctx,
+        workflow_id='wfl-12345',
+        role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+        name='test-run',
+        output_uri='s3://my-bucket/outputs/',
+        parameters={'reference_fasta': 's3://example-genomics-bucket/reference/genome.fasta'},
+        workflow_version_name=None,
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        cache_id=None,
+        cache_behavior=None,
+        networking_mode=None,
+        configuration_name=None,
+        scratch_storage_mode=None,
+    )
 
     # Verify error was reported to context and returned with the S3 error message
     mock_ctx.error.assert_called_once()
@@ -1312,14 +1027,9 @@ async def test_start_run_client_error():
     assert 'S3 object not found' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_list_run_tasks_success():
+async def test_list_run_tasks_success(omics_client):
     """Test successful listing of run tasks."""
     # Mock response data
-    creation_time = datetime.now(timezone.utc)
-    start_time = creation_time
-    stop_time = datetime.now(timezone.utc)
-
     mock_response = {
         'items': [
             {
@@ -1328,8 +1038,8 @@ async def test_list_run_tasks_success():
                 'name': 'test-task',
                 'cpus': 2,
                 'memory': 4096,
-                'startTime': start_time,
-                'stopTime': stop_time,
+                'startTime': _FROZEN,
+                'stopTime': _FROZEN,
             },
             {
                 'taskId': 'task-67890',
@@ -1337,7 +1047,7 @@ async def test_list_run_tasks_success():
                 'name': 'test-task-2',
                 'cpus': 4,
                 'memory': 8192,
-                'startTime': start_time,
+                'startTime': _FROZEN,
             },
         ],
         'nextToken': 'next-token-123',
@@ -1345,28 +1055,21 @@ async def test_list_run_tasks_success():
 
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_run_tasks.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_run_tasks(
-            mock_ctx,
-            run_id='run-12345',
-            max_results=10,
-            next_token=None,
-            status='COMPLETED',
-        )
+    omics_client.list_run_tasks.ret = mock_response
 
-    # Verify client was called correctly
-    mock_client.list_run_tasks.assert_called_once_with(
-        id='run-12345',
-        maxResults=10,
+    result = await list_run_tasks(
+        mock_ctx,
+        run_id='run-12345',
+        max_results=10,
+        next_token=None,
         status='COMPLETED',
     )
 
+    # Verify client was called correctly
+    assert omics_client.list_run_tasks.calls == [
+        {'id': 'run-12345', 'maxResults': 10, 'status': 'COMPLETED'}
+    ]
+
     # Verify result structure
     assert 'tasks' in result
     assert 'nextToken' in result
@@ -1379,74 +1082,60 @@ async def test_list_run_tasks_success():
     assert task1['name'] == 'test-task'
     assert task1['cpus'] == 2
     assert task1['memory'] == 4096
-    assert task1['startTime'] == start_time.isoformat()
-    assert task1['stopTime'] == stop_time.isoformat()
+    assert task1['startTime'] == _FROZEN_ISO
+    assert task1['stopTime'] == _FROZEN_ISO
 
     # Verify second task (no stopTime since it's still running)
     task2 = result['tasks'][1]
     assert task2['taskId'] == 'task-67890'
     assert task2['status'] == 'RUNNING'
-    assert task2['startTime'] == start_time.isoformat()
+    assert task2['startTime'] == _FROZEN_ISO
     assert 'stopTime' not in task2
 
 
-@pytest.mark.asyncio
-async def test_list_run_tasks_empty_response():
+async def test_list_run_tasks_empty_response(omics_client):
     """Test listing run tasks with empty response."""
     # Mock empty response
     mock_response = {'items': []}
 
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_run_tasks.return_value = mock_response
+    omics_client.list_run_tasks.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_run_tasks(
-            mock_ctx,
-            run_id='run-12345',
-            max_results=10,
-            next_token=None,
-            status=None,
-        )
+    result = await list_run_tasks(
+        mock_ctx,
+        run_id='run-12345',
+        max_results=10,
+        next_token=None,
+        status=None,
+    )
 
     # Verify result structure
     assert result['tasks'] == []
     assert 'nextToken' not in result
 
 
-@pytest.mark.asyncio
-async def test_list_run_tasks_boto_error():
+async def test_list_run_tasks_boto_error(omics_client):
     """Test handling of BotoCoreError in list_run_tasks."""
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_run_tasks.side_effect = botocore.exceptions.BotoCoreError()
+    omics_client.list_run_tasks.exc = botocore.exceptions.BotoCoreError()
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_run_tasks(
-            mock_ctx,
-            run_id='run-12345',
-            max_results=10,
-            next_token=None,
-            status=None,
-        )
+    result = await list_run_tasks(
+        mock_ctx,
+        run_id='run-12345',
+        max_results=10,
+        next_token=None,
+        status=None,
+    )
     assert 'error' in result
-    assert 'Error listing tasks for run' in mock_ctx.error.call_args[0][0]
+    assert mock_ctx.error.call_args.args[0].startswith('Error listing tasks for run')
 
 
-@pytest.mark.asyncio
-async def test_list_runs_with_invalid_creation_time():
+async def test_list_runs_with_invalid_creation_time(omics_client):
     """Test list_runs handling of runs with invalid creation times."""
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
 
     # Create a mock datetime object that will fail when isoformat() is called
     class MockInvalidDateTime:
@@ -1466,26 +1155,22 @@ async def test_list_runs_with_invalid_creation_time():
                 'id': 'run-67890',
                 'name': 'test-run-2',
                 'status': 'COMPLETED',
-                'creationTime': datetime.now(timezone.utc),  # Valid datetime
+                'creationTime': _FROZEN,  # Valid datetime
             },
         ],
         'nextToken': None,
     }
-    mock_client.list_runs.return_value = mock_response
+    omics_client.list_runs.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        # This should return an error due to the invalid datetime
-        result = await list_runs(
-            ctx=mock_ctx,
-            max_results=10,
-            next_token=None,
-            status=None,
-            created_after=None,
-            created_before=None,
-        )
+    # This should return an error due to the invalid datetime
+    result = await list_runs(
+        ctx=mock_ctx,
+        max_results=10,
+        next_token=None,
+        status=None,
+        created_after=None,
+        created_before=None,
+    )
     assert 'error' in result
 
 
@@ -1493,7 +1178,6 @@ async def test_list_runs_with_invalid_creation_time():
 # is now centralized in aws_utils.py
 
 
-@pytest.mark.asyncio
 async def test_start_run_invalid_storage_type():
     """Test start_run with invalid storage type."""
     mock_ctx = AsyncMock()
@@ -1516,7 +1200,6 @@ async def test_start_run_invalid_storage_type():
     assert 'error' in result
 
 
-@pytest.mark.asyncio
 async def test_start_run_static_storage_without_capacity():
     """Test start_run with STATIC storage but no capacity."""
     mock_ctx = AsyncMock()
@@ -1539,7 +1222,6 @@ async def test_start_run_static_storage_without_capacity():
     assert 'error' in result
 
 
-@pytest.mark.asyncio
 async def test_start_run_invalid_cache_behavior():
     """Test start_run with invalid cache behavior."""
     mock_ctx = AsyncMock()
@@ -1560,14 +1242,13 @@ async def test_start_run_invalid_cache_behavior():
         configuration_name=None,
     )
     assert 'error' in result
-    assert 'Invalid cache behavior' in result['error']
+    assert result['error'].startswith('Invalid cache behavior')
 
     # Verify error was reported to context
     mock_ctx.error.assert_called_once()
-    assert 'Invalid cache behavior' in mock_ctx.error.call_args[0][0]
+    assert mock_ctx.error.call_args.args[0].startswith('Invalid cache behavior')
 
 
-@pytest.mark.asyncio
 async def test_start_run_cache_behavior_without_cache_id():
     """Test start_run with cache_behavior but no cache_id."""
     mock_ctx = AsyncMock()
@@ -1590,14 +1271,11 @@ async def test_start_run_cache_behavior_without_cache_id():
     assert 'error' in result
 
 
-@pytest.mark.asyncio
 async def test_start_run_invalid_s3_uri():
     """Test start_run with invalid S3 URI."""
     mock_ctx = AsyncMock()
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.ensure_s3_uri_ends_with_slash'
-    ) as mock_ensure_s3_uri:
+    with patch.object(_workflow_execution, 'ensure_s3_uri_ends_with_slash') as mock_ensure_s3_uri:
         mock_ensure_s3_uri.side_effect = ValueError('Invalid S3 URI format')
 
         result = await start_run(
@@ -1618,214 +1296,170 @@ async def test_start_run_invalid_s3_uri():
     assert 'error' in result
 
 
-@pytest.mark.asyncio
-async def test_start_run_boto_error_new():
+async def test_start_run_boto_error_new(omics_client):
     """Test start_run with BotoCoreError."""
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.side_effect = botocore.exceptions.BotoCoreError()
+    omics_client.start_run.exc = botocore.exceptions.BotoCoreError()
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
+    with patch.object(
+        _workflow_execution,
+        'ensure_s3_uri_ends_with_slash',
+        return_value='s3://bucket/output/',
     ):
-        with patch(
-            'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.ensure_s3_uri_ends_with_slash',
-            return_value='s3://bucket/output/',
-        ):
-            result = await start_run(
-                ctx=mock_ctx,
-                workflow_id='wfl-12345',
-                role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-                name='test-run',
-                output_uri='s3://bucket/output/',
-                parameters={'param1': 'value1'},
-                workflow_version_name=None,
-                storage_type='DYNAMIC',
-                storage_capacity=None,
-                cache_id=None,
-                cache_behavior=None,
-                networking_mode=None,
-                configuration_name=None,
-                scratch_storage_mode=None,
-            )
+        result = await start_run(
+            ctx=mock_ctx,
+            workflow_id='wfl-12345',
+            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+            name='test-run',
+            output_uri='s3://bucket/output/',
+            parameters={'param1': 'value1'},
+            workflow_version_name=None,
+            storage_type='DYNAMIC',
+            storage_capacity=None,
+            cache_id=None,
+            cache_behavior=None,
+            networking_mode=None,
+            configuration_name=None,
+            scratch_storage_mode=None,
+        )
 
     # Verify error was reported to context and returned
     mock_ctx.error.assert_called_once()
     assert 'error' in result
-    assert 'Error starting run' in result['error']
+    assert result['error'].startswith('Error starting run')
 
 
-@pytest.mark.asyncio
-async def test_start_run_unexpected_error_new():
+async def test_start_run_unexpected_error_new(omics_client):
     """Test start_run with unexpected error."""
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.side_effect = Exception('Unexpected error')
+    omics_client.start_run.exc = Exception('Unexpected error')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
+    with patch.object(
+        _workflow_execution,
+        'ensure_s3_uri_ends_with_slash',
+        return_value='s3://bucket/output/',
     ):
-        with patch(
-            'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.ensure_s3_uri_ends_with_slash',
-            return_value='s3://bucket/output/',
-        ):
-            result = await start_run(
-                ctx=mock_ctx,
-                workflow_id='wfl-12345',
-                role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-                name='test-run',
-                output_uri='s3://bucket/output/',
-                parameters={'param1': 'value1'},
-                workflow_version_name=None,
-                storage_type='DYNAMIC',
-                storage_capacity=None,
-                cache_id=None,
-                cache_behavior=None,
-                networking_mode=None,
-                configuration_name=None,
-                scratch_storage_mode=None,
-            )
+        result = await start_run(
+            ctx=mock_ctx,
+            workflow_id='wfl-12345',
+            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+            name='test-run',
+            output_uri='s3://bucket/output/',
+            parameters={'param1': 'value1'},
+            workflow_version_name=None,
+            storage_type='DYNAMIC',
+            storage_capacity=None,
+            cache_id=None,
+            cache_behavior=None,
+            networking_mode=None,
+            configuration_name=None,
+            scratch_storage_mode=None,
+        )
 
     # Verify error was reported to context and returned
     mock_ctx.error.assert_called_once()
     assert 'error' in result
-    assert 'Error starting run' in result['error']
+    assert result['error'].startswith('Error starting run')
     assert 'Unexpected error' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_list_run_tasks_invalid_status():
+async def test_list_run_tasks_invalid_status(omics_client):
     """Test list_run_tasks with invalid status."""
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
 
     # Mock the client to raise a ValidationException for invalid status
-    mock_client.list_run_tasks.side_effect = botocore.exceptions.ClientError(
+    omics_client.list_run_tasks.exc = botocore.exceptions.ClientError(
         {'Error': {'Code': 'ValidationException', 'Message': 'Invalid status value'}},
         'ListRunTasks',
     )
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_run_tasks(
-            ctx=mock_ctx,
-            run_id='1234567890',  # Use valid run ID format
-            max_results=10,
-            next_token=None,
-            status='INVALID_STATUS',  # Invalid task status
-        )
-        assert 'error' in result
-        assert 'Error listing tasks for run' in result['error']
+    result = await list_run_tasks(
+        ctx=mock_ctx,
+        run_id='1234567890',  # Use valid run ID format
+        max_results=10,
+        next_token=None,
+        status='INVALID_STATUS',  # Invalid task status
+    )
+    assert 'error' in result
+    assert result['error'].startswith('Error listing tasks for run')
 
     # Verify error was reported to context
     mock_ctx.error.assert_called_once()
-    assert 'Error listing tasks for run' in mock_ctx.error.call_args[0][0]
+    assert mock_ctx.error.call_args.args[0].startswith('Error listing tasks for run')
 
 
-@pytest.mark.asyncio
-async def test_get_run_boto_error_new():
+async def test_get_run_boto_error_new(omics_client):
     """Test get_run with BotoCoreError."""
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run.side_effect = botocore.exceptions.BotoCoreError()
+    omics_client.get_run.exc = botocore.exceptions.BotoCoreError()
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run(ctx=mock_ctx, run_id='run-12345')
+    result = await get_run(ctx=mock_ctx, run_id='run-12345')
     assert 'error' in result
 
 
-@pytest.mark.asyncio
-async def test_get_run_unexpected_error_new():
+async def test_get_run_unexpected_error_new(omics_client):
     """Test get_run with unexpected error."""
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run.side_effect = Exception('Unexpected error')
+    omics_client.get_run.exc = Exception('Unexpected error')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run(ctx=mock_ctx, run_id='run-12345')
-        assert 'error' in result
-        assert 'Error getting run' in result['error']
+    result = await get_run(ctx=mock_ctx, run_id='run-12345')
+    assert 'error' in result
+    assert result['error'].startswith('Error getting run')
 
     # Verify error was reported to context
     mock_ctx.error.assert_called_once()
-    assert 'Error getting run' in mock_ctx.error.call_args[0][0]
+    assert mock_ctx.error.call_args.args[0].startswith('Error getting run')
 
 
-@pytest.mark.asyncio
-async def test_list_run_tasks_boto_error_new():
+async def test_list_run_tasks_boto_error_new(omics_client):
     """Test list_run_tasks with BotoCoreError."""
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_run_tasks.side_effect = botocore.exceptions.BotoCoreError()
+    omics_client.list_run_tasks.exc = botocore.exceptions.BotoCoreError()
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_run_tasks(
-            ctx=mock_ctx,
-            run_id='1234567890',
-            max_results=10,
-            next_token=None,
-            status=None,
-        )
+    result = await list_run_tasks(
+        ctx=mock_ctx,
+        run_id='1234567890',
+        max_results=10,
+        next_token=None,
+        status=None,
+    )
     assert 'error' in result
 
 
-@pytest.mark.asyncio
-async def test_list_run_tasks_unexpected_error():
+async def test_list_run_tasks_unexpected_error(omics_client):
     """Test list_run_tasks with unexpected error."""
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_run_tasks.side_effect = Exception('Unexpected error')
+    omics_client.list_run_tasks.exc = Exception('Unexpected error')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_run_tasks(
-            ctx=mock_ctx,
-            run_id='1234567890',
-            max_results=10,
-            next_token=None,
-            status=None,
-        )
-        assert 'error' in result
-        assert 'Error listing tasks for run' in result['error']
+    result = await list_run_tasks(
+        ctx=mock_ctx,
+        run_id='1234567890',
+        max_results=10,
+        next_token=None,
+        status=None,
+    )
+    assert 'error' in result
+    assert result['error'].startswith('Error listing tasks for run')
 
     # Verify error was reported to context
     mock_ctx.error.assert_called_once()
-    assert 'Error listing tasks for run' in mock_ctx.error.call_args[0][0]
+    assert mock_ctx.error.call_args.args[0].startswith('Error listing tasks for run')
 
 
 # Tests for get_run_task function
 
 
-@pytest.mark.asyncio
-async def test_get_run_task_success():
+async def test_get_run_task_success(omics_client):
     """Test successful retrieval of task details."""
     # Mock response data with all possible fields
-    start_time = datetime.now(timezone.utc)
-    stop_time = datetime.now(timezone.utc)
-
     mock_response = {
         'taskId': 'task-12345',
         'status': 'COMPLETED',
         'name': 'test-task',
         'cpus': 4,
         'memory': 8192,
-        'startTime': start_time,
-        'stopTime': stop_time,
+        'startTime': _FROZEN,
+        'stopTime': _FROZEN,
         'statusMessage': 'Task completed successfully',
         'logStream': 'log-stream-name',
         'imageDetails': {
@@ -1836,17 +1470,12 @@ async def test_get_run_task_success():
 
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run_task.return_value = mock_response
+    omics_client.get_run_task.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
+    result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
 
     # Verify client was called correctly
-    mock_client.get_run_task.assert_called_once_with(id='run-12345', taskId='task-12345')
+    assert omics_client.get_run_task.calls == [{'id': 'run-12345', 'taskId': 'task-12345'}]
 
     # Verify result contains all expected fields
     assert result['taskId'] == 'task-12345'
@@ -1854,8 +1483,8 @@ async def test_get_run_task_success():
     assert result['name'] == 'test-task'
     assert result['cpus'] == 4
     assert result['memory'] == 8192
-    assert result['startTime'] == start_time.isoformat()
-    assert result['stopTime'] == stop_time.isoformat()
+    assert result['startTime'] == _FROZEN_ISO
+    assert result['stopTime'] == _FROZEN_ISO
     assert result['statusMessage'] == 'Task completed successfully'
     assert result['logStream'] == 'log-stream-name'
     assert result['imageDetails'] == {
@@ -1864,8 +1493,7 @@ async def test_get_run_task_success():
     }
 
 
-@pytest.mark.asyncio
-async def test_get_run_task_minimal_response():
+async def test_get_run_task_minimal_response(omics_client):
     """Test task retrieval with minimal response fields."""
     # Mock response with minimal required fields
     mock_response = {
@@ -1878,14 +1506,9 @@ async def test_get_run_task_minimal_response():
 
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run_task.return_value = mock_response
+    omics_client.get_run_task.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
+    result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
 
     # Verify required fields
     assert result['taskId'] == 'task-12345'
@@ -1902,8 +1525,7 @@ async def test_get_run_task_minimal_response():
     assert 'imageDetails' not in result
 
 
-@pytest.mark.asyncio
-async def test_get_run_task_with_image_details():
+async def test_get_run_task_with_image_details(omics_client):
     """Test task retrieval specifically focusing on imageDetails field."""
     # Mock response with imageDetails
     mock_response = {
@@ -1922,14 +1544,9 @@ async def test_get_run_task_with_image_details():
 
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run_task.return_value = mock_response
+    omics_client.get_run_task.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
+    result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
 
     # Verify imageDetails is properly returned
     assert 'imageDetails' in result
@@ -1942,8 +1559,7 @@ async def test_get_run_task_with_image_details():
     assert result['imageDetails']['repositoryName'] == 'biocontainers/samtools'
 
 
-@pytest.mark.asyncio
-async def test_get_run_task_failed_status():
+async def test_get_run_task_failed_status(omics_client):
     """Test task retrieval with failed status."""
     # Mock response for failed task
     mock_response = {
@@ -1957,83 +1573,66 @@ async def test_get_run_task_failed_status():
 
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run_task.return_value = mock_response
+    omics_client.get_run_task.ret = mock_response
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
+    result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
 
     # Verify failure information
     assert result['status'] == 'FAILED'
     assert result['statusMessage'] == 'Task failed due to resource constraints'
 
 
-@pytest.mark.asyncio
-async def test_get_run_task_boto_error():
+async def test_get_run_task_boto_error(omics_client):
     """Test handling of BotoCoreError."""
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run_task.side_effect = botocore.exceptions.BotoCoreError()
+    omics_client.get_run_task.exc = botocore.exceptions.BotoCoreError()
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
-        assert 'error' in result
-        assert 'Error getting task' in result['error']
+    result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
+    assert 'error' in result
+    assert result['error'].startswith('Error getting task')
 
     # Verify error was reported to context
     mock_ctx.error.assert_called_once()
-    assert 'Error getting task task-12345 for run run-12345' in mock_ctx.error.call_args[0][0]
+    assert mock_ctx.error.call_args.args[0].startswith(
+        'Error getting task task-12345 for run run-12345'
+    )
 
 
-@pytest.mark.asyncio
-async def test_get_run_task_client_error():
+async def test_get_run_task_client_error(omics_client):
     """Test handling of ClientError."""
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run_task.side_effect = botocore.exceptions.ClientError(
+    omics_client.get_run_task.exc = botocore.exceptions.ClientError(
         {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'Task not found'}}, 'GetRunTask'
     )
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
-        assert 'error' in result
-        assert 'Error getting task' in result['error']
+    result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
+    assert 'error' in result
+    assert result['error'].startswith('Error getting task')
 
     # Verify error was reported to context
     mock_ctx.error.assert_called_once()
-    assert 'Error getting task task-12345 for run run-12345' in mock_ctx.error.call_args[0][0]
+    assert mock_ctx.error.call_args.args[0].startswith(
+        'Error getting task task-12345 for run run-12345'
+    )
 
 
-@pytest.mark.asyncio
-async def test_get_run_task_unexpected_error():
+async def test_get_run_task_unexpected_error(omics_client):
     """Test handling of unexpected errors."""
     # Mock context and client
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_run_task.side_effect = Exception('Unexpected error')
+    omics_client.get_run_task.exc = Exception('Unexpected error')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
-        assert 'error' in result
-        assert 'Error getting task' in result['error']
+    result = await get_run_task(mock_ctx, run_id='run-12345', task_id='task-12345')
+    assert 'error' in result
+    assert result['error'].startswith('Error getting task')
 
     # Verify error was reported to context
     mock_ctx.error.assert_called_once()
-    assert 'Error getting task task-12345 for run run-12345' in mock_ctx.error.call_args[0][0]
+    assert mock_ctx.error.call_args.args[0].startswith(
+        'Error getting task task-12345 for run run-12345'
+    )
 
 
 # Feature: local-temp-storage, Property: start_run forwards the effective scratch storage mode
@@ -2057,21 +1656,23 @@ class TestStartRunForwardsEffectiveScratchStorageMode:
     }
 
     @given(scratch_storage_mode=st.one_of(st.sampled_from(['LOCAL', 'SHARED']), st.none()))
-    @settings(max_examples=100)
-    @pytest.mark.asyncio
-    async def test_start_run_forwards_effective_scratch_storage_mode(self, scratch_storage_mode):
+    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    async def test_start_run_forwards_effective_scratch_storage_mode(
+        self, omics_client, scratch_storage_mode
+    ):
         """The scratchStorageMode kwarg passed to the API equals the effective mode."""
         mock_ctx = AsyncMock()
-        mock_client = MagicMock()
-        mock_client.start_run.return_value = {
-            'id': 'run-12345',
-            'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-12345',
-            'status': 'PENDING',
-            'name': 'test-run',
-            'workflowId': 'wfl-12345',
-            'uuid': 'uuid-abc-123',
-            'tags': {},
-        }
+        omics_client.start_run = Recorder(
+            ret={
+                'id': 'run-12345',
+                'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-12345',
+                'status': 'PENDING',
+                'name': 'test-run',
+                'workflowId': 'wfl-12345',
+                'uuid': 'uuid-abc-123',
+                'tags': {},
+            }
+        )
 
         start_run_wrapper = MCPToolTestWrapper(start_run)
 
@@ -2081,21 +1682,17 @@ class TestStartRunForwardsEffectiveScratchStorageMode:
             else DEFAULT_SCRATCH_STORAGE_MODE
         )
 
-        with patch(
-            'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-            return_value=mock_client,
-        ):
-            result = await start_run_wrapper.call(
-                ctx=mock_ctx,
-                **self._base_params,
-                scratch_storage_mode=scratch_storage_mode,
-            )
+        result = await start_run_wrapper.call(
+            ctx=mock_ctx,
+            **self._base_params,
+            scratch_storage_mode=scratch_storage_mode,
+        )
 
         assert 'error' not in result, (
             f'Unexpected error for scratch_storage_mode={scratch_storage_mode!r}: {result}'
         )
-        mock_client.start_run.assert_called_once()
-        call_kwargs = mock_client.start_run.call_args.kwargs
+        assert len(omics_client.start_run.calls) == 1
+        call_kwargs = omics_client.start_run.calls[-1]
         assert 'scratchStorageMode' in call_kwargs, (
             'scratchStorageMode should always be forwarded to the API'
         )
@@ -2124,23 +1721,23 @@ class TestStartRunResponseReportsEffectiveScratchStorageMode:
     }
 
     @given(scratch_storage_mode=st.one_of(st.sampled_from(['LOCAL', 'SHARED']), st.none()))
-    @settings(max_examples=100)
-    @pytest.mark.asyncio
+    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
     async def test_start_run_response_reports_effective_scratch_storage_mode(
-        self, scratch_storage_mode
+        self, omics_client, scratch_storage_mode
     ):
         """The response scratchStorageMode equals the effective mode and the API value."""
         mock_ctx = AsyncMock()
-        mock_client = MagicMock()
-        mock_client.start_run.return_value = {
-            'id': 'run-12345',
-            'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-12345',
-            'status': 'PENDING',
-            'name': 'test-run',
-            'workflowId': 'wfl-12345',
-            'uuid': 'uuid-abc-123',
-            'tags': {},
-        }
+        omics_client.start_run = Recorder(
+            ret={
+                'id': 'run-12345',
+                'arn': 'arn:aws:omics:us-east-1:123456789012:run/run-12345',
+                'status': 'PENDING',
+                'name': 'test-run',
+                'workflowId': 'wfl-12345',
+                'uuid': 'uuid-abc-123',
+                'tags': {},
+            }
+        )
 
         start_run_wrapper = MCPToolTestWrapper(start_run)
 
@@ -2150,15 +1747,11 @@ class TestStartRunResponseReportsEffectiveScratchStorageMode:
             else DEFAULT_SCRATCH_STORAGE_MODE
         )
 
-        with patch(
-            'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-            return_value=mock_client,
-        ):
-            result = await start_run_wrapper.call(
-                ctx=mock_ctx,
-                **self._base_params,
-                scratch_storage_mode=scratch_storage_mode,
-            )
+        result = await start_run_wrapper.call(
+            ctx=mock_ctx,
+            **self._base_params,
+            scratch_storage_mode=scratch_storage_mode,
+        )
 
         assert 'error' not in result, (
             f'Unexpected error for scratch_storage_mode={scratch_storage_mode!r}: {result}'
@@ -2166,8 +1759,8 @@ class TestStartRunResponseReportsEffectiveScratchStorageMode:
         # The response reports the effective mode.
         assert result['scratchStorageMode'] == expected_mode
         # And it matches the value forwarded to the HealthOmics API.
-        mock_client.start_run.assert_called_once()
-        call_kwargs = mock_client.start_run.call_args.kwargs
+        assert len(omics_client.start_run.calls) == 1
+        call_kwargs = omics_client.start_run.calls[-1]
         assert result['scratchStorageMode'] == call_kwargs['scratchStorageMode']
 
 
@@ -2207,10 +1800,10 @@ class TestStartRunResponsePreservesPreScratchStorageSchema:
             st.dictionaries(keys=_text, values=_text, max_size=3),
         ),
     )
-    @settings(max_examples=100)
-    @pytest.mark.asyncio
+    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
     async def test_start_run_response_preserves_legacy_schema(
         self,
+        omics_client,
         scratch_storage_mode,
         run_id,
         arn,
@@ -2224,7 +1817,6 @@ class TestStartRunResponsePreservesPreScratchStorageSchema:
     ):
         """Every legacy field is present with unchanged name/type/value, plus the new field."""
         mock_ctx = AsyncMock()
-        mock_client = MagicMock()
 
         # Build the API response. tags is omitted entirely when None to exercise the
         # response.get('tags', {}) default path.
@@ -2236,7 +1828,7 @@ class TestStartRunResponsePreservesPreScratchStorageSchema:
         }
         if tags is not None:
             api_response['tags'] = tags
-        mock_client.start_run.return_value = api_response
+        omics_client.start_run = Recorder(ret=api_response)
 
         # output_uri already ends with '/' so ensure_s3_uri_ends_with_slash leaves it stable.
         output_uri = 's3://my-bucket/outputs/'
@@ -2270,15 +1862,11 @@ class TestStartRunResponsePreservesPreScratchStorageSchema:
 
         wrapper = MCPToolTestWrapper(start_run)
 
-        with patch(
-            'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-            return_value=mock_client,
-        ):
-            result = await wrapper.call(
-                ctx=mock_ctx,
-                scratch_storage_mode=scratch_storage_mode,
-                **call_params,
-            )
+        result = await wrapper.call(
+            ctx=mock_ctx,
+            scratch_storage_mode=scratch_storage_mode,
+            **call_params,
+        )
 
         assert 'error' not in result, (
             f'Unexpected error for scratch_storage_mode={scratch_storage_mode!r}: {result}'
@@ -2315,121 +1903,96 @@ def _build_start_run_response():
     }
 
 
-@pytest.mark.asyncio
-async def test_start_run_scratch_storage_mode_local_happy_path():
+async def test_start_run_scratch_storage_mode_local_happy_path(omics_client):
     """LOCAL is forwarded to the API and echoed in the response.
 
     Validates: Requirements Scratch storage mode parameter on the single-run tool,
     Exposing the scratch storage mode in tool responses.
     """
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.return_value = _build_start_run_response()
+    omics_client.start_run.ret = _build_start_run_response()
     wrapper = MCPToolTestWrapper(start_run)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await wrapper.call(
-            mock_ctx,
-            workflow_id='wfl-scratch',
-            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-            name='scratch-run',
-            output_uri='s3://my-bucket/outputs/',
-            parameters={'param1': 'value1'},
-            scratch_storage_mode='LOCAL',
-        )
+    result = await wrapper.call(
+        mock_ctx,
+        workflow_id='wfl-scratch',
+        role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+        name='scratch-run',
+        output_uri='s3://my-bucket/outputs/',
+        parameters={'param1': 'value1'},
+        scratch_storage_mode='LOCAL',
+    )
 
     # The HealthOmics API received scratchStorageMode=LOCAL
-    call_kwargs = mock_client.start_run.call_args.kwargs
+    call_kwargs = omics_client.start_run.calls[-1]
     assert call_kwargs['scratchStorageMode'] == 'LOCAL'
     # And the tool echoes the effective mode back to the caller
     assert result['scratchStorageMode'] == 'LOCAL'
 
 
-@pytest.mark.asyncio
-async def test_start_run_scratch_storage_mode_shared_happy_path():
+async def test_start_run_scratch_storage_mode_shared_happy_path(omics_client):
     """SHARED is forwarded to the API and echoed in the response.
 
     Validates: Requirements Scratch storage mode parameter on the single-run tool,
     Exposing the scratch storage mode in tool responses.
     """
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.return_value = _build_start_run_response()
+    omics_client.start_run.ret = _build_start_run_response()
     wrapper = MCPToolTestWrapper(start_run)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await wrapper.call(
-            mock_ctx,
-            workflow_id='wfl-scratch',
-            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-            name='scratch-run',
-            output_uri='s3://my-bucket/outputs/',
-            parameters={'param1': 'value1'},
-            scratch_storage_mode='SHARED',
-        )
+    result = await wrapper.call(
+        mock_ctx,
+        workflow_id='wfl-scratch',
+        role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+        name='scratch-run',
+        output_uri='s3://my-bucket/outputs/',
+        parameters={'param1': 'value1'},
+        scratch_storage_mode='SHARED',
+    )
 
-    call_kwargs = mock_client.start_run.call_args.kwargs
+    call_kwargs = omics_client.start_run.calls[-1]
     assert call_kwargs['scratchStorageMode'] == 'SHARED'
     assert result['scratchStorageMode'] == 'SHARED'
 
 
-@pytest.mark.asyncio
-async def test_start_run_scratch_storage_mode_omitted_defaults_to_local():
+async def test_start_run_scratch_storage_mode_omitted_defaults_to_local(omics_client):
     """Omitting scratch_storage_mode applies the MCP default LOCAL.
 
     Validates: Requirements MCP server defaults to LOCAL scratch storage,
     Backward compatibility.
     """
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.return_value = _build_start_run_response()
+    omics_client.start_run.ret = _build_start_run_response()
     wrapper = MCPToolTestWrapper(start_run)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await wrapper.call(
-            mock_ctx,
-            workflow_id='wfl-scratch',
-            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-            name='scratch-run',
-            output_uri='s3://my-bucket/outputs/',
-            parameters={'param1': 'value1'},
-            # scratch_storage_mode intentionally omitted -> defaults to LOCAL
-        )
+    result = await wrapper.call(
+        mock_ctx,
+        workflow_id='wfl-scratch',
+        role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+        name='scratch-run',
+        output_uri='s3://my-bucket/outputs/',
+        parameters={'param1': 'value1'},
+        # scratch_storage_mode intentionally omitted -> defaults to LOCAL
+    )
 
-    call_kwargs = mock_client.start_run.call_args.kwargs
+    call_kwargs = omics_client.start_run.calls[-1]
     assert call_kwargs['scratchStorageMode'] == 'LOCAL'
     assert result['scratchStorageMode'] == 'LOCAL'
 
 
-@pytest.mark.asyncio
-async def test_start_run_scratch_storage_misconfigured_default_rejected():
+async def test_start_run_scratch_storage_misconfigured_default_rejected(omics_client):
     """A misconfigured (invalid) MCP default is rejected without calling the API.
 
     Validates: Requirements Backward compatibility (misconfigured default rejection).
     """
     mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.start_run.return_value = _build_start_run_response()
+    omics_client.start_run.ret = _build_start_run_response()
     wrapper = MCPToolTestWrapper(start_run)
 
-    with (
-        patch(
-            'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-            return_value=mock_client,
-        ),
-        patch(
-            'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.DEFAULT_SCRATCH_STORAGE_MODE',
-            'INVALID',
-        ),
+    with patch.object(
+        _workflow_execution,
+        'DEFAULT_SCRATCH_STORAGE_MODE',
+        'INVALID',
     ):
         result = await wrapper.call(
             mock_ctx,
@@ -2444,7 +2007,7 @@ async def test_start_run_scratch_storage_misconfigured_default_rejected():
     # The request is rejected with an error and the API is never invoked
     assert 'error' in result
     assert 'INVALID' in result['error']
-    mock_client.start_run.assert_not_called()
+    assert omics_client.start_run.calls == []
 
 
 def test_start_run_scratch_storage_mode_parameter_description():
@@ -2502,12 +2065,12 @@ class TestStartRunRejectsInvalidScratchStorageMode:
             ),
         )
     )
-    @settings(max_examples=100)
-    @pytest.mark.asyncio
-    async def test_rejects_invalid_mode_without_calling_api(self, scratch_storage_mode):
+    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    async def test_rejects_invalid_mode_without_calling_api(
+        self, omics_client, scratch_storage_mode
+    ):
         """Invalid modes are rejected; API not called; caller inputs unchanged."""
         mock_ctx = AsyncMock()
-        mock_client = MagicMock()
 
         # Caller-provided run inputs that must be left unchanged.
         parameters = {'param1': 'value1'}
@@ -2515,19 +2078,15 @@ class TestStartRunRejectsInvalidScratchStorageMode:
 
         start_run_wrapper = MCPToolTestWrapper(start_run)
 
-        with patch(
-            'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-            return_value=mock_client,
-        ):
-            result = await start_run_wrapper.call(
-                ctx=mock_ctx,
-                workflow_id='wfl-12345',
-                role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
-                name='test-run',
-                output_uri='s3://my-bucket/outputs/',
-                parameters=parameters,
-                scratch_storage_mode=scratch_storage_mode,
-            )
+        result = await start_run_wrapper.call(
+            ctx=mock_ctx,
+            workflow_id='wfl-12345',
+            role_arn='arn:aws:iam::123456789012:role/HealthOmicsRole',
+            name='test-run',
+            output_uri='s3://my-bucket/outputs/',
+            parameters=parameters,
+            scratch_storage_mode=scratch_storage_mode,
+        )
 
         # An error response is returned.
         assert 'error' in result, f'Expected an error response, got: {result}'
@@ -2539,7 +2098,7 @@ class TestStartRunRejectsInvalidScratchStorageMode:
         assert 'SHARED' in error_message
 
         # The HealthOmics start_run API was never called.
-        mock_client.start_run.assert_not_called()
+        assert omics_client.start_run.calls == []
 
         # Caller-provided run inputs are left unchanged.
         assert parameters == original_parameters
@@ -2568,12 +2127,11 @@ class TestGetRunPassesScratchStorageModeThrough:
             st.text(),
         ),
     )
-    @settings(max_examples=100)
-    @pytest.mark.asyncio
-    async def test_get_run_passes_scratch_storage_mode_through(self, scratch_storage_mode):
+    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    async def test_get_run_passes_scratch_storage_mode_through(
+        self, omics_client, scratch_storage_mode
+    ):
         """get_run includes scratchStorageMode only when the API response contains it."""
-        creation_time = datetime.now(timezone.utc)
-
         # Build the HealthOmics get_run API response with the fields get_run reads.
         mock_response = {
             'id': 'run-12345',
@@ -2582,7 +2140,7 @@ class TestGetRunPassesScratchStorageModeThrough:
             'status': 'COMPLETED',
             'workflowId': 'wfl-12345',
             'workflowType': 'WDL',
-            'creationTime': creation_time,
+            'creationTime': _FROZEN,
             'outputUri': 's3://bucket/output/',
             'roleArn': 'arn:aws:iam::123456789012:role/HealthOmicsRole',
             'runOutputUri': 's3://bucket/run-output/',
@@ -2594,14 +2152,9 @@ class TestGetRunPassesScratchStorageModeThrough:
             mock_response['scratchStorageMode'] = scratch_storage_mode
 
         mock_ctx = AsyncMock()
-        mock_client = MagicMock()
-        mock_client.get_run.return_value = mock_response
-
-        with patch(
-            'awslabs.aws_healthomics_mcp_server.tools.workflow_execution.get_omics_client',
-            return_value=mock_client,
-        ):
-            result = await get_run(mock_ctx, run_id='run-12345')
+        omics_client.get_run = Recorder(ret=mock_response)
+
+        result = await get_run(mock_ctx, run_id='run-12345')
 
         assert 'error' not in result, f'Unexpected error response: {result}'
 
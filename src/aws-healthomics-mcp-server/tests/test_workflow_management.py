@@ -25,6 +25,7 @@ from awslabs.aws_healthomics_mcp_server.models.core import (
     StorageType,
     WorkflowEngine,
 )
+from awslabs.aws_healthomics_mcp_server.tools import workflow_management
 from awslabs.aws_healthomics_mcp_server.tools.workflow_management import (
     create_workflow,
     create_workflow_version,
@@ -36,26 +37,83 @@ from awslabs.aws_healthomics_mcp_server.utils.validation_utils import parse_tags
 from datetime import datetime, timezone
 from hypothesis import assume, given, settings
 from hypothesis import strategies as st
-from unittest.mock import AsyncMock, MagicMock, patch
+from tests.test_helpers import FakeCtx, Recorder, assert_reported_error
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
 
 
-@pytest.mark.asyncio
-async def test_list_workflows_success():
+# Fixed workflow creation timestamp shared by the mocked API responses
+CREATION_TIME = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+CREATION_TIME_ISO = CREATION_TIME.isoformat()
+
+# ARN of the wfl-12345 workflow used across the mocked API responses
+WORKFLOW_ARN = 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345'
+
+# Version creation timestamps as ListWorkflowVersions returns them (already ISO strings)
+VERSION_1_CREATION_ISO = '2023-01-01T00:00:00Z'
+VERSION_2_CREATION_ISO = '2023-02-01T00:00:00Z'
+
+# Minimal GetWorkflow response, read-only; tests extend a copy with the fields they exercise
+_MINIMAL_WORKFLOW = MappingProxyType(
+    {
+        'id': 'wfl-12345',
+        'arn': WORKFLOW_ARN,
+        'name': 'test-workflow',
+        'status': 'ACTIVE',
+        'type': 'WDL',
+        'creationTime': CREATION_TIME,
+    }
+)
+
+# Private-workflow variant used by the get_workflow parameter and response field tests
+_PRIVATE_WORKFLOW = MappingProxyType({**_MINIMAL_WORKFLOW, 'type': 'PRIVATE'})
+
+# Expected request kwargs for the default list and get calls
+_LIST_DEFAULT_REQUEST = MappingProxyType({'maxResults': 10})
+_GET_WORKFLOW_REQUEST = MappingProxyType({'id': 'wfl-12345'})
+
+
+@pytest.fixture(autouse=True)
+def patched_omics_client(monkeypatch):
+    """Route every workflow management tool call in this module to a stub HealthOmics client."""
+    client = SimpleNamespace(
+        create_workflow=Recorder(),
+        create_workflow_version=Recorder(),
+        get_workflow=Recorder(),
+        list_workflow_versions=Recorder(),
+        list_workflows=Recorder(),
+    )
+    monkeypatch.setattr(workflow_management, 'get_omics_client', lambda **kwargs: client)
+    return client
+
+
+@pytest.fixture
+def omics_client_factory(patched_omics_client):
+    """Return a builder that sets canned responses on the stub HealthOmics client."""
+
+    def _make(**responses):
+        for method, response in responses.items():
+            getattr(patched_omics_client, method).ret = response
+        return patched_omics_client
+
+    return _make
+
+
+async def test_list_workflows_success(ctx, omics_client_factory):
     """Test successful listing of workflows."""
     # Mock response data
-    creation_time = datetime.now(timezone.utc)
     mock_response = {
         'items': [
             {
                 'id': 'wfl-12345',
-                'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+                'arn': WORKFLOW_ARN,
                 'name': 'test-workflow-1',
                 'description': 'Test workflow 1',
                 'status': 'ACTIVE',
                 'parameters': {'param1': 'value1'},
                 'storageType': 'DYNAMIC',
                 'type': 'WDL',
-                'creationTime': creation_time,
+                'creationTime': CREATION_TIME,
             },
             {
                 'id': 'wfl-67890',
@@ -65,26 +123,19 @@ async def test_list_workflows_success():
                 'storageType': 'STATIC',
                 'storageCapacity': 100,
                 'type': 'CWL',
-                'creationTime': creation_time,
+                'creationTime': CREATION_TIME,
             },
         ],
         'nextToken': 'next-page-token',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_workflows.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(list_workflows=mock_response)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_workflows(ctx=mock_ctx, max_results=10, next_token=None)
+    result = await list_workflows(ctx=ctx, max_results=10, next_token=None)
 
     # Verify client was called correctly
-    mock_client.list_workflows.assert_called_once_with(maxResults=10)
-
+    assert client.list_workflows.calls == [_LIST_DEFAULT_REQUEST]
     # Verify result structure
     assert 'workflows' in result
     assert 'nextToken' in result
@@ -100,7 +151,7 @@ async def test_list_workflows_success():
     assert wf1['parameters'] == {'param1': 'value1'}
     assert wf1['storageType'] == 'DYNAMIC'
     assert wf1['type'] == 'WDL'
-    assert wf1['creationTime'] == creation_time.isoformat()
+    assert wf1['creationTime'] == CREATION_TIME_ISO
 
     # Verify second workflow
     wf2 = result['workflows'][1]
@@ -110,136 +161,199 @@ async def test_list_workflows_success():
     assert wf2['storageCapacity'] == 100
 
 
-@pytest.mark.asyncio
-async def test_list_workflows_empty_response():
-    """Test listing workflows with empty response."""
-    mock_response = {'items': []}
-
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_workflows.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_workflows(ctx=mock_ctx, max_results=10, next_token=None)
-
-    # Verify empty result
-    assert result['workflows'] == []
-    assert 'nextToken' not in result
-
-
-@pytest.mark.asyncio
-async def test_list_workflows_with_pagination():
-    """Test listing workflows with pagination."""
-    mock_response = {
-        'items': [{'id': 'wfl-12345', 'name': 'test-workflow'}],
+@pytest.mark.parametrize(
+    'next_token, expected_request, items, out_token',
+    [
+        (None, _LIST_DEFAULT_REQUEST, [_MINIMAL_WORKFLOW], 'next-page-token'),
+        (None, _LIST_DEFAULT_REQUEST, [], None),
+        (
+            'current-token',
+            {**_LIST_DEFAULT_REQUEST, 'startingToken': 'current-token'},
+            [_MINIMAL_WORKFLOW],
+            None,
+        ),
+    ],
+    ids=['first-page', 'empty', 'last-page'],
+)
+async def test_list_workflows_request_and_result_shape(
+    ctx, omics_client_factory, next_token, expected_request, items, out_token
+):
+    """Test list_workflows request arguments and result shape for each page position."""
+    response = {'items': items}
+    if out_token:
+        response['nextToken'] = out_token
+    client = omics_client_factory(list_workflows=response)
+
+    result = await list_workflows(ctx=ctx, max_results=10, next_token=next_token)
+
+    assert client.list_workflows.calls == [expected_request]
+    assert [workflow['id'] for workflow in result['workflows']] == [item['id'] for item in items]
+    assert result.get('nextToken') == out_token
+    assert ('nextToken' in result) == (out_token is not None)
+
+
+@pytest.mark.parametrize(
+    'tool, method, tool_kwargs, request_kwargs',
+    [
+        (list_workflows, 'list_workflows', {}, {}),
+        (
+            list_workflow_versions,
+            'list_workflow_versions',
+            {'workflow_id': 'wfl-12345'},
+            {'workflowId': 'wfl-12345'},
+        ),
+    ],
+)
+async def test_list_tools_pagination(
+    ctx, patched_omics_client, tool, method, tool_kwargs, request_kwargs
+):
+    """Test that the list tools forward the next token and return the following one."""
+    getattr(patched_omics_client, method).ret = {
+        'items': [_MINIMAL_WORKFLOW],
         'nextToken': 'next-page-token',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_workflows.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_workflows(ctx=mock_ctx, max_results=10, next_token='current-token')
+    result = await tool(ctx=ctx, max_results=10, next_token='current-token', **tool_kwargs)
 
-    # Verify pagination parameters
-    mock_client.list_workflows.assert_called_once_with(
-        maxResults=10, startingToken='current-token'
-    )
+    assert getattr(patched_omics_client, method).calls == [
+        {**request_kwargs, **_LIST_DEFAULT_REQUEST, 'startingToken': 'current-token'}
+    ]
     assert result['nextToken'] == 'next-page-token'
 
 
-@pytest.mark.asyncio
-async def test_list_workflows_boto_error():
-    """Test handling of BotoCoreError in list_workflows."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_workflows.side_effect = botocore.exceptions.BotoCoreError()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_workflows(ctx=mock_ctx, max_results=10, next_token=None)
-
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error listing workflows' in result['error']
-
-
-@pytest.mark.asyncio
-async def test_list_workflows_unexpected_error():
-    """Test handling of unexpected errors in list_workflows."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_workflows.side_effect = Exception('Unexpected error')
+# Client failures shared by the error handling tests
+_BOTO_ERROR = botocore.exceptions.BotoCoreError()
+_UNEXPECTED_ERROR = Exception('Unexpected error')
+_NOT_FOUND_ERROR = botocore.exceptions.ClientError(
+    {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'Workflow not found'}},
+    'ListWorkflowVersions',
+)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_workflows(ctx=mock_ctx, max_results=10, next_token=None)
 
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error listing workflows' in result['error']
+@pytest.mark.parametrize(
+    'tool,client_method,kwargs,error,expected_message',
+    [
+        pytest.param(
+            list_workflows,
+            'list_workflows',
+            {'max_results': 10, 'next_token': None},
+            _BOTO_ERROR,
+            'Error listing workflows',
+            id='list-workflows-boto-error',
+        ),
+        pytest.param(
+            list_workflows,
+            'list_workflows',
+            {'max_results': 10, 'next_token': None},
+            _UNEXPECTED_ERROR,
+            'Error listing workflows',
+            id='list-workflows-unexpected-error',
+        ),
+        pytest.param(
+            get_workflow,
+            'get_workflow',
+            {'workflow_id': 'wfl-12345', 'export_definition': False},
+            _BOTO_ERROR,
+            'Error getting workflow',
+            id='get-workflow-boto-error',
+        ),
+        pytest.param(
+            get_workflow,
+            'get_workflow',
+            {'workflow_id': 'wfl-12345', 'export_definition': False},
+            _UNEXPECTED_ERROR,
+            'Error getting workflow',
+            id='get-workflow-unexpected-error',
+        ),
+        pytest.param(
+            list_workflow_versions,
+            'list_workflow_versions',
+            {'workflow_id': 'nonexistent-id'},
+            _NOT_FOUND_ERROR,
+            'Error listing workflow versions',
+            id='list-versions-client-error',
+        ),
+        pytest.param(
+            list_workflow_versions,
+            'list_workflow_versions',
+            {'workflow_id': 'wfl-12345'},
+            _BOTO_ERROR,
+            'Error listing workflow versions',
+            id='list-versions-boto-error',
+        ),
+        pytest.param(
+            list_workflow_versions,
+            'list_workflow_versions',
+            {'workflow_id': 'abc123'},
+            _UNEXPECTED_ERROR,
+            'Error listing workflow versions',
+            id='list-versions-unexpected-error',
+        ),
+    ],
+)
+async def test_read_tools_return_error_dict(
+    ctx, patched_omics_client, tool, client_method, kwargs, error, expected_message
+):
+    """Test that list/get workflow tools report client failures as an error dict."""
+    getattr(patched_omics_client, client_method).exc = error
 
+    await assert_reported_error(tool(ctx, **kwargs), ctx, expected_message)
 
-@pytest.mark.asyncio
-async def test_get_workflow_success():
-    """Test successful retrieval of workflow details."""
-    # Mock response data
-    creation_time = datetime.now(timezone.utc)
-    mock_response = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'name': 'test-workflow',
-        'status': 'ACTIVE',
-        'statusMessage': 'Workflow is ready for execution',
-        'type': 'WDL',
-        'description': 'Test workflow description',
-        'parameterTemplate': {'param1': {'type': 'string'}},
-        'creationTime': creation_time,
-    }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = mock_response
+@pytest.mark.parametrize(
+    'response, expected, absent',
+    [
+        pytest.param(
+            {
+                **_MINIMAL_WORKFLOW,
+                'statusMessage': 'Workflow is ready for execution',
+                'description': 'Test workflow description',
+                'parameterTemplate': {'param1': {'type': 'string'}},
+            },
+            {
+                'id': 'wfl-12345',
+                'arn': WORKFLOW_ARN,
+                'name': 'test-workflow',
+                'status': 'ACTIVE',
+                'statusMessage': 'Workflow is ready for execution',
+                'type': 'WDL',
+                'description': 'Test workflow description',
+                'parameterTemplate': {'param1': {'type': 'string'}},
+                'creationTime': CREATION_TIME_ISO,
+            },
+            (),
+            id='full',
+        ),
+        pytest.param(
+            _MINIMAL_WORKFLOW,
+            {'id': 'wfl-12345', 'status': 'ACTIVE', 'creationTime': CREATION_TIME_ISO},
+            ('description', 'parameterTemplate', 'definition'),
+            id='minimal',
+        ),
+        pytest.param(
+            {**_MINIMAL_WORKFLOW, 'creationTime': None},
+            {'creationTime': None},
+            (),
+            id='none-timestamp',
+        ),
+    ],
+)
+async def test_get_workflow_success(ctx, omics_client_factory, response, expected, absent):
+    """Test successful retrieval of workflow details for full and sparse responses."""
+    client = omics_client_factory(get_workflow=response)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     # Verify client was called correctly
-    mock_client.get_workflow.assert_called_once_with(id='wfl-12345')
-
-    # Verify result contains all expected fields
-    assert result['id'] == 'wfl-12345'
-    assert result['arn'] == 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345'
-    assert result['name'] == 'test-workflow'
-    assert result['status'] == 'ACTIVE'
-    assert result['statusMessage'] == 'Workflow is ready for execution'
-    assert result['type'] == 'WDL'
-    assert result['description'] == 'Test workflow description'
-    assert result['parameterTemplate'] == {'param1': {'type': 'string'}}
-    assert result['creationTime'] == creation_time.isoformat()
+    assert client.get_workflow.calls == [_GET_WORKFLOW_REQUEST]
+    # Verify expected fields and that optional fields absent from the response stay absent
+    for field, value in expected.items():
+        assert result[field] == value
+    for field in absent:
+        assert field not in result
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_with_export():
+async def test_get_workflow_with_export(ctx, omics_client_factory):
     """Test workflow retrieval with export definition."""
     # Mock response data with presigned URL (as returned by AWS API)
     mock_response = {
@@ -248,55 +362,35 @@ async def test_get_workflow_with_export():
         'definition': 'https://s3.amazonaws.com/bucket/workflow-definition.zip?X-Amz-Algorithm=AWS4-HMAC-SHA256&X-Amz-Credential=...',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(get_workflow=mock_response)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=True)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=True)
 
     # Verify export parameter was passed
-    mock_client.get_workflow.assert_called_once_with(id='wfl-12345', export=['DEFINITION'])
+    assert client.get_workflow.calls == [{**_GET_WORKFLOW_REQUEST, 'export': ['DEFINITION']}]
 
     # Verify presigned URL was included in result
     assert result['definition'].startswith('https://s3.amazonaws.com/')
     assert 'X-Amz-Algorithm' in result['definition']
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_without_export():
+async def test_get_workflow_without_export(ctx, omics_client_factory):
     """Test workflow retrieval without export definition."""
     # Mock response data without definition field (normal response)
-    creation_time = datetime.now(timezone.utc)
     mock_response = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'name': 'test-workflow',
-        'status': 'ACTIVE',
-        'type': 'WDL',
+        **_MINIMAL_WORKFLOW,
         'description': 'Test workflow description',
         'parameterTemplate': {'param1': {'type': 'string'}},
-        'creationTime': creation_time,
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(get_workflow=mock_response)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     # Verify export parameter was NOT passed
-    mock_client.get_workflow.assert_called_once_with(id='wfl-12345')
-
+    assert client.get_workflow.calls == [_GET_WORKFLOW_REQUEST]
     # Verify no definition field in result
     assert 'definition' not in result
 
@@ -304,143 +398,28 @@ async def test_get_workflow_without_export():
     assert result['parameterTemplate'] == {'param1': {'type': 'string'}}
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_minimal_response():
-    """Test workflow retrieval with minimal response fields."""
-    # Mock response with minimal fields
-    creation_time = datetime.now(timezone.utc)
-    mock_response = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'name': 'test-workflow',
-        'status': 'ACTIVE',
-        'type': 'WDL',
-        'creationTime': creation_time,
-    }
-
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
-
-    # Verify required fields
-    assert result['id'] == 'wfl-12345'
-    assert result['status'] == 'ACTIVE'
-    assert result['creationTime'] == creation_time.isoformat()
-
-    # Verify optional fields are not present
-    assert 'description' not in result
-    assert 'parameterTemplate' not in result
-    assert 'definition' not in result
-
-
-@pytest.mark.asyncio
-async def test_get_workflow_boto_error():
-    """Test handling of BotoCoreError in get_workflow."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.side_effect = botocore.exceptions.BotoCoreError()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
-
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error getting workflow' in result['error']
-
-
-@pytest.mark.asyncio
-async def test_get_workflow_unexpected_error():
-    """Test handling of unexpected errors in get_workflow."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.side_effect = Exception('Unexpected error')
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
-
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error getting workflow' in result['error']
-
-
-@pytest.mark.asyncio
-async def test_get_workflow_none_timestamp():
-    """Test handling of None timestamp in get_workflow."""
-    # Mock response with None timestamp
-    mock_response = {
-        'id': 'wfl-12345',
-        'name': 'test-workflow',
-        'status': 'ACTIVE',
-        'type': 'WDL',
-        'creationTime': None,
-    }
-
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
-
-    # Verify timestamp handling
-    assert result['creationTime'] is None
-
-
-@pytest.mark.asyncio
-async def test_get_workflow_with_status_message():
+async def test_get_workflow_with_status_message(ctx, omics_client_factory):
     """Test workflow retrieval with status message."""
     # Mock response with status message
-    creation_time = datetime.now(timezone.utc)
     mock_response = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'name': 'test-workflow',
+        **_MINIMAL_WORKFLOW,
         'status': 'FAILED',
         'statusMessage': 'Workflow validation failed: Invalid WDL syntax',
-        'type': 'WDL',
-        'creationTime': creation_time,
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = mock_response
+    # Mock client
+    omics_client_factory(get_workflow=mock_response)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     # Verify status message is included
     assert result['status'] == 'FAILED'
     assert result['statusMessage'] == 'Workflow validation failed: Invalid WDL syntax'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_with_container_registry_map():
+async def test_get_workflow_with_container_registry_map(ctx, omics_client_factory):
     """Test workflow retrieval with container registry map."""
     # Mock response with container registry map
-    creation_time = datetime.now(timezone.utc)
     container_registry_map = {
         'registryMappings': [
             {'upstreamRegistryUrl': 'registry-1.docker.io', 'ecrRepositoryPrefix': 'docker-hub'},
@@ -448,27 +427,16 @@ async def test_get_workflow_with_container_registry_map():
         ]
     }
     mock_response = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'name': 'test-workflow',
-        'status': 'ACTIVE',
-        'type': 'WDL',
+        **_MINIMAL_WORKFLOW,
         'description': 'Test workflow with container registry map',
         'parameterTemplate': {'param1': {'type': 'string'}},
         'containerRegistryMap': container_registry_map,
-        'creationTime': creation_time,
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = mock_response
+    # Mock client
+    omics_client_factory(get_workflow=mock_response)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     # Verify container registry map is included
     assert result['containerRegistryMap'] == container_registry_map
@@ -491,32 +459,19 @@ async def test_get_workflow_with_container_registry_map():
     assert result['description'] == 'Test workflow with container registry map'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_without_container_registry_map():
+async def test_get_workflow_without_container_registry_map(ctx, omics_client_factory):
     """Test workflow retrieval without container registry map."""
     # Mock response without container registry map
-    creation_time = datetime.now(timezone.utc)
     mock_response = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'name': 'test-workflow',
-        'status': 'ACTIVE',
-        'type': 'WDL',
+        **_MINIMAL_WORKFLOW,
         'description': 'Test workflow without container registry map',
         'parameterTemplate': {'param1': {'type': 'string'}},
-        'creationTime': creation_time,
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = mock_response
+    # Mock client
+    omics_client_factory(get_workflow=mock_response)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     # Verify container registry map is not present
     assert 'containerRegistryMap' not in result
@@ -527,55 +482,11 @@ async def test_get_workflow_without_container_registry_map():
     assert result['description'] == 'Test workflow without container registry map'
 
 
-@pytest.mark.asyncio
-async def test_list_workflow_versions_success(mock_omics_client, mock_context):
+async def test_list_workflow_versions_success(ctx, omics_client_factory):
     """Test successful listing of workflow versions."""
     # Mock response from AWS
-    mock_omics_client.list_workflow_versions.return_value = {
-        'items': [
-            {
-                'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/abc123/1.0',
-                'id': 'abc123',
-                'status': 'ACTIVE',
-                'type': 'WDL',
-                'name': 'Test Workflow',
-                'versionName': '1.0',
-                'creationTime': '2023-01-01T00:00:00Z',
-            },
-            {
-                'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/abc123/2.0',
-                'id': 'abc123',
-                'status': 'ACTIVE',
-                'type': 'WDL',
-                'name': 'Test Workflow',
-                'versionName': '2.0',
-                'creationTime': '2023-02-01T00:00:00Z',
-            },
-        ],
-        'nextToken': None,
-    }
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_omics_client,
-    ):
-        # Call the function
-        result = await list_workflow_versions(mock_context, workflow_id='abc123', max_results=10)
-
-    # Assertions
-    assert 'versions' in result
-    assert len(result['versions']) == 2
-    assert result['versions'][0]['versionName'] == '1.0'
-    assert result['versions'][1]['versionName'] == '2.0'
-    assert result['nextToken'] is None
-
-
-@pytest.mark.asyncio
-async def test_list_workflow_versions_with_pagination(mock_omics_client, mock_context):
-    """Test listing workflow versions with pagination."""
-    # First call response with nextToken
-    mock_omics_client.list_workflow_versions.side_effect = [
-        {
+    omics_client_factory(
+        list_workflow_versions={
             'items': [
                 {
                     'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/abc123/1.0',
@@ -584,13 +495,8 @@ async def test_list_workflow_versions_with_pagination(mock_omics_client, mock_co
                     'type': 'WDL',
                     'name': 'Test Workflow',
                     'versionName': '1.0',
-                    'creationTime': '2023-01-01T00:00:00Z',
-                }
-            ],
-            'nextToken': 'next-page-token',
-        },
-        {
-            'items': [
+                    'creationTime': VERSION_1_CREATION_ISO,
+                },
                 {
                     'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/abc123/2.0',
                     'id': 'abc123',
@@ -598,53 +504,40 @@ async def test_list_workflow_versions_with_pagination(mock_omics_client, mock_co
                     'type': 'WDL',
                     'name': 'Test Workflow',
                     'versionName': '2.0',
-                    'creationTime': '2023-02-01T00:00:00Z',
-                }
+                    'creationTime': VERSION_2_CREATION_ISO,
+                },
             ],
             'nextToken': None,
-        },
-    ]
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_omics_client,
-    ):
-        # First call
-        result1 = await list_workflow_versions(mock_context, workflow_id='abc123', max_results=1)
-
-        # Second call with next token
-        result2 = await list_workflow_versions(
-            mock_context, workflow_id='abc123', max_results=1, next_token=result1['nextToken']
-        )
+        }
+    )
 
-    # Assertions for first call
-    assert 'versions' in result1
-    assert len(result1['versions']) == 1
-    assert result1['versions'][0]['versionName'] == '1.0'
-    assert result1['nextToken'] == 'next-page-token'
+    # Call the function
+    result = await list_workflow_versions(ctx, workflow_id='abc123', max_results=10)
 
-    # Assertions for second call
-    assert 'versions' in result2
-    assert len(result2['versions']) == 1
-    assert result2['versions'][0]['versionName'] == '2.0'
-    assert result2['nextToken'] is None
+    # Assertions
+    assert 'versions' in result
+    assert len(result['versions']) == 2
+    assert result['versions'][0]['versionName'] == '1.0'
+    assert result['versions'][1]['versionName'] == '2.0'
+    assert [version['creationTime'] for version in result['versions']] == [
+        VERSION_1_CREATION_ISO,
+        VERSION_2_CREATION_ISO,
+    ]
+    assert result['nextToken'] is None
 
 
-@pytest.mark.asyncio
-async def test_list_workflow_versions_empty_result(mock_omics_client, mock_context):
+async def test_list_workflow_versions_empty_result(ctx, omics_client_factory):
     """Test listing workflow versions with empty result."""
     # Mock empty response
-    mock_omics_client.list_workflow_versions.return_value = {
-        'items': [],
-        'nextToken': None,
-    }
+    omics_client_factory(
+        list_workflow_versions={
+            'items': [],
+            'nextToken': None,
+        }
+    )
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_omics_client,
-    ):
-        # Call the function
-        result = await list_workflow_versions(mock_context, workflow_id='abc123', max_results=10)
+    # Call the function
+    result = await list_workflow_versions(ctx, workflow_id='abc123', max_results=10)
 
     # Assertions
     assert 'versions' in result
@@ -653,138 +546,82 @@ async def test_list_workflow_versions_empty_result(mock_omics_client, mock_conte
         assert result['nextToken'] is None
 
 
-@pytest.mark.asyncio
-async def test_list_workflow_versions_client_error(mock_omics_client, mock_context):
-    """Test handling of client error when listing workflow versions."""
-    from botocore.exceptions import ClientError
-
-    # Mock client error
-    error_response = {
-        'Error': {'Code': 'ResourceNotFoundException', 'Message': 'Workflow not found'}
-    }
-    mock_omics_client.list_workflow_versions.side_effect = ClientError(
-        error_response,  # type: ignore
-        'ListWorkflowVersions',
-    )
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_omics_client,
-    ):
-        result = await list_workflow_versions(mock_context, workflow_id='nonexistent-id')
-
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error listing workflow versions' in result['error']
-
-
-@pytest.mark.asyncio
-async def test_list_workflow_versions_general_exception(mock_omics_client, mock_context):
-    """Test handling of general exception when listing workflow versions."""
-    # Mock general exception
-    mock_omics_client.list_workflow_versions.side_effect = Exception('Unexpected error')
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_omics_client,
-    ):
-        result = await list_workflow_versions(mock_context, workflow_id='abc123')
-
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error listing workflow versions' in result['error']
-
-
-@pytest.mark.asyncio
-async def test_create_workflow_success():
+async def test_create_workflow_success(ctx, omics_client_factory):
     """Test successful workflow creation."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'description': 'Test workflow description',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            description='Test workflow description',
-            parameter_template={'param1': {'type': 'string'}},
-            container_registry_map=None,
-            container_registry_map_uri=None,
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        description='Test workflow description',
+        parameter_template={'param1': {'type': 'string'}},
+        container_registry_map=None,
+        container_registry_map_uri=None,
+    )
 
     # Verify client was called correctly
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'test-workflow'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content'
-    assert expected_call.kwargs['description'] == 'Test workflow description'
-    assert expected_call.kwargs['parameterTemplate'] == {'param1': {'type': 'string'}}
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'test-workflow'
+    assert expected_call['definitionZip'] == b'test workflow content'
+    assert expected_call['description'] == 'Test workflow description'
+    assert expected_call['parameterTemplate'] == {'param1': {'type': 'string'}}
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
-    assert result['arn'] == 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345'
+    assert result['arn'] == WORKFLOW_ARN
     assert result['status'] == 'ACTIVE'
     assert result['name'] == 'test-workflow'
     assert result['description'] == 'Test workflow description'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_minimal():
+async def test_create_workflow_minimal(ctx, omics_client_factory):
     """Test workflow creation with minimal required parameters."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            description=None,
-            parameter_template=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        description=None,
+        parameter_template=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+    )
 
     # Verify client was called with only required parameters
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'test-workflow'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content'
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'test-workflow'
+    assert expected_call['definitionZip'] == b'test workflow content'
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -793,14 +630,10 @@ async def test_create_workflow_minimal():
     assert result.get('description') is None
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_invalid_base64():
+async def test_create_workflow_invalid_base64(ctx):
     """Test workflow creation with invalid base64 content."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64='invalid base64!',
         description=None,
@@ -814,82 +647,46 @@ async def test_create_workflow_invalid_base64():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_boto_error():
-    """Test handling of BotoCoreError in create_workflow."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.side_effect = botocore.exceptions.BotoCoreError()
-
-    # Create base64 encoded workflow definition
-    definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            description=None,
-            parameter_template=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-        )
-
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error creating workflow' in result['error']
-
-
-@pytest.mark.asyncio
-async def test_create_workflow_unexpected_error():
-    """Test handling of unexpected errors in create_workflow."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.side_effect = Exception('Unexpected error')
+@pytest.mark.parametrize(
+    'error',
+    [_BOTO_ERROR, _UNEXPECTED_ERROR],
+    ids=['boto-error', 'unexpected-error'],
+)
+async def test_create_workflow_client_failure(ctx, patched_omics_client, error):
+    """Test that create_workflow reports client failures as an error dict."""
+    patched_omics_client.create_workflow.exc = error
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
+    await assert_reported_error(
+        create_workflow(
+            ctx,
             name='test-workflow',
             definition_zip_base64=definition_zip_base64,
             description=None,
             parameter_template=None,
             container_registry_map=None,
             container_registry_map_uri=None,
-        )
-
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error creating workflow' in result['error']
+        ),
+        ctx,
+        'Error creating workflow',
+    )
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_container_registry_map():
+async def test_create_workflow_with_container_registry_map(ctx, omics_client_factory):
     """Test workflow creation with container registry map."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'description': 'Test workflow with container registry map',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
@@ -931,99 +728,85 @@ async def test_create_workflow_with_container_registry_map():
         'imageMappings': [],
     }
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            description='Test workflow with container registry map',
-            parameter_template={'param1': {'type': 'string'}},
-            container_registry_map=container_registry_map,
-            container_registry_map_uri=None,
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        description='Test workflow with container registry map',
+        parameter_template={'param1': {'type': 'string'}},
+        container_registry_map=container_registry_map,
+        container_registry_map_uri=None,
+    )
 
     # Verify client was called correctly with container registry map
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'test-workflow'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content'
-    assert expected_call.kwargs['description'] == 'Test workflow with container registry map'
-    assert expected_call.kwargs['parameterTemplate'] == {'param1': {'type': 'string'}}
-    assert expected_call.kwargs['containerRegistryMap'] == expected_registry_map
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'test-workflow'
+    assert expected_call['definitionZip'] == b'test workflow content'
+    assert expected_call['description'] == 'Test workflow with container registry map'
+    assert expected_call['parameterTemplate'] == {'param1': {'type': 'string'}}
+    assert expected_call['containerRegistryMap'] == expected_registry_map
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
-    assert result['arn'] == 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345'
+    assert result['arn'] == WORKFLOW_ARN
     assert result['status'] == 'ACTIVE'
     assert result['name'] == 'test-workflow'
     assert result['description'] == 'Test workflow with container registry map'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_without_container_registry_map():
+async def test_create_workflow_without_container_registry_map(ctx, omics_client_factory):
     """Test workflow creation without container registry map."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            description=None,
-            parameter_template=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        description=None,
+        parameter_template=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+    )
 
     # Verify client was called without container registry map
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'test-workflow'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content'
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'test-workflow'
+    assert expected_call['definitionZip'] == b'test workflow content'
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
     assert result['name'] == 'test-workflow'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_container_registry_map_uri():
+async def test_create_workflow_with_container_registry_map_uri(ctx, omics_client_factory):
     """Test workflow creation with container registry map URI."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'description': 'Test workflow with container registry map URI',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
@@ -1031,44 +814,36 @@ async def test_create_workflow_with_container_registry_map_uri():
     # S3 URI for container registry map
     container_registry_map_uri = 's3://my-bucket/registry-mappings.json'
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            description='Test workflow with container registry map URI',
-            parameter_template={'param1': {'type': 'string'}},
-            container_registry_map=None,
-            container_registry_map_uri=container_registry_map_uri,
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        description='Test workflow with container registry map URI',
+        parameter_template={'param1': {'type': 'string'}},
+        container_registry_map=None,
+        container_registry_map_uri=container_registry_map_uri,
+    )
 
     # Verify client was called correctly with container registry map URI
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'test-workflow'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content'
-    assert expected_call.kwargs['description'] == 'Test workflow with container registry map URI'
-    assert expected_call.kwargs['parameterTemplate'] == {'param1': {'type': 'string'}}
-    assert expected_call.kwargs['containerRegistryMapUri'] == container_registry_map_uri
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'test-workflow'
+    assert expected_call['definitionZip'] == b'test workflow content'
+    assert expected_call['description'] == 'Test workflow with container registry map URI'
+    assert expected_call['parameterTemplate'] == {'param1': {'type': 'string'}}
+    assert expected_call['containerRegistryMapUri'] == container_registry_map_uri
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
-    assert result['arn'] == 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345'
+    assert result['arn'] == WORKFLOW_ARN
     assert result['status'] == 'ACTIVE'
     assert result['name'] == 'test-workflow'
     assert result['description'] == 'Test workflow with container registry map URI'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_invalid_container_registry_map():
+async def test_create_workflow_invalid_container_registry_map(ctx):
     """Test workflow creation with invalid container registry map structure."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
@@ -1080,7 +855,7 @@ async def test_create_workflow_invalid_container_registry_map():
     }
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         container_registry_map=invalid_container_registry_map,
@@ -1092,12 +867,8 @@ async def test_create_workflow_invalid_container_registry_map():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_both_container_registry_params_error():
+async def test_create_workflow_both_container_registry_params_error(ctx):
     """Test workflow creation fails when both container registry parameters are provided."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
@@ -1112,7 +883,7 @@ async def test_create_workflow_both_container_registry_params_error():
     container_registry_map_uri = 's3://my-bucket/registry-mappings.json'
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         description=None,
@@ -1126,53 +897,46 @@ async def test_create_workflow_both_container_registry_params_error():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_success():
+async def test_create_workflow_version_success(ctx, omics_client_factory):
     """Test successful workflow version creation."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description='Version 2.0 of test workflow',
-            parameter_template={'param1': {'type': 'string'}},
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        description='Version 2.0 of test workflow',
+        parameter_template={'param1': {'type': 'string'}},
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+    )
 
     # Verify client was called correctly
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content v2'
-    assert expected_call.kwargs['description'] == 'Version 2.0 of test workflow'
-    assert expected_call.kwargs['parameterTemplate'] == {'param1': {'type': 'string'}}
-    assert expected_call.kwargs['storageType'] == 'DYNAMIC'
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionZip'] == b'test workflow content v2'
+    assert expected_call['description'] == 'Version 2.0 of test workflow'
+    assert expected_call['parameterTemplate'] == {'param1': {'type': 'string'}}
+    assert expected_call['storageType'] == 'DYNAMIC'
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -1180,65 +944,54 @@ async def test_create_workflow_version_success():
     assert result['status'] == 'ACTIVE'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_static_storage():
+async def test_create_workflow_version_with_static_storage(ctx, omics_client_factory):
     """Test workflow version creation with static storage."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description=None,
-            parameter_template=None,
-            storage_type='STATIC',
-            storage_capacity=1000,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        description=None,
+        parameter_template=None,
+        storage_type='STATIC',
+        storage_capacity=1000,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+    )
 
     # Verify client was called with static storage parameters
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content v2'
-    assert expected_call.kwargs['storageType'] == 'STATIC'
-    assert expected_call.kwargs['storageCapacity'] == 1000
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionZip'] == b'test workflow content v2'
+    assert expected_call['storageType'] == 'STATIC'
+    assert expected_call['storageCapacity'] == 1000
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_static_without_capacity():
+async def test_create_workflow_version_static_without_capacity(ctx):
     """Test workflow version creation with static storage but no capacity."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=definition_zip_base64,
@@ -1255,14 +1008,10 @@ async def test_create_workflow_version_static_without_capacity():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_invalid_base64():
+async def test_create_workflow_version_invalid_base64(ctx):
     """Test workflow version creation with invalid base64 content."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64='invalid base64!',
@@ -1279,23 +1028,21 @@ async def test_create_workflow_version_invalid_base64():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_boto_error():
-    """Test handling of BotoCoreError in create_workflow_version."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.side_effect = botocore.exceptions.BotoCoreError()
+@pytest.mark.parametrize(
+    'error',
+    [_BOTO_ERROR, _UNEXPECTED_ERROR],
+    ids=['boto-error', 'unexpected-error'],
+)
+async def test_create_workflow_version_client_failure(ctx, patched_omics_client, error):
+    """Test that create_workflow_version reports client failures as an error dict."""
+    patched_omics_client.create_workflow_version.exc = error
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
+    await assert_reported_error(
+        create_workflow_version(
+            ctx,
             workflow_id='wfl-12345',
             version_name='v2.0',
             definition_zip_base64=definition_zip_base64,
@@ -1305,29 +1052,25 @@ async def test_create_workflow_version_boto_error():
             storage_capacity=None,
             container_registry_map=None,
             container_registry_map_uri=None,
-        )
-
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error creating workflow version' in result['error']
+        ),
+        ctx,
+        'Error creating workflow version',
+    )
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_container_registry_map():
+async def test_create_workflow_version_with_container_registry_map(ctx, omics_client_factory):
     """Test workflow version creation with container registry map."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
@@ -1369,34 +1112,30 @@ async def test_create_workflow_version_with_container_registry_map():
         'imageMappings': [],
     }
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description='Version 2.0 with container registry map',
-            parameter_template={'param1': {'type': 'string'}},
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            container_registry_map=container_registry_map,
-            container_registry_map_uri=None,
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        description='Version 2.0 with container registry map',
+        parameter_template={'param1': {'type': 'string'}},
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        container_registry_map=container_registry_map,
+        container_registry_map_uri=None,
+    )
 
     # Verify client was called correctly with container registry map
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content v2'
-    assert expected_call.kwargs['description'] == 'Version 2.0 with container registry map'
-    assert expected_call.kwargs['parameterTemplate'] == {'param1': {'type': 'string'}}
-    assert expected_call.kwargs['storageType'] == 'DYNAMIC'
-    assert expected_call.kwargs['containerRegistryMap'] == expected_registry_map
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionZip'] == b'test workflow content v2'
+    assert expected_call['description'] == 'Version 2.0 with container registry map'
+    assert expected_call['parameterTemplate'] == {'param1': {'type': 'string'}}
+    assert expected_call['storageType'] == 'DYNAMIC'
+    assert expected_call['containerRegistryMap'] == expected_registry_map
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -1404,53 +1143,46 @@ async def test_create_workflow_version_with_container_registry_map():
     assert result['status'] == 'ACTIVE'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_without_container_registry_map():
+async def test_create_workflow_version_without_container_registry_map(ctx, omics_client_factory):
     """Test workflow version creation without container registry map."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description='Version 2.0 without container registry map',
-            parameter_template={'param1': {'type': 'string'}},
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        description='Version 2.0 without container registry map',
+        parameter_template={'param1': {'type': 'string'}},
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+    )
 
     # Verify client was called without container registry map
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content v2'
-    assert expected_call.kwargs['description'] == 'Version 2.0 without container registry map'
-    assert expected_call.kwargs['parameterTemplate'] == {'param1': {'type': 'string'}}
-    assert expected_call.kwargs['storageType'] == 'DYNAMIC'
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionZip'] == b'test workflow content v2'
+    assert expected_call['description'] == 'Version 2.0 without container registry map'
+    assert expected_call['parameterTemplate'] == {'param1': {'type': 'string'}}
+    assert expected_call['storageType'] == 'DYNAMIC'
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -1458,22 +1190,21 @@ async def test_create_workflow_version_without_container_registry_map():
     assert result['status'] == 'ACTIVE'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_static_storage_and_container_registry_map():
+async def test_create_workflow_version_with_static_storage_and_container_registry_map(
+    ctx, omics_client_factory
+):
     """Test workflow version creation with both static storage and container registry map."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
@@ -1503,37 +1234,33 @@ async def test_create_workflow_version_with_static_storage_and_container_registr
         'imageMappings': [],
     }
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description='Version 2.0 with static storage and container registry map',
-            parameter_template=None,
-            storage_type='STATIC',
-            storage_capacity=2000,
-            container_registry_map=container_registry_map,
-            container_registry_map_uri=None,
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        description='Version 2.0 with static storage and container registry map',
+        parameter_template=None,
+        storage_type='STATIC',
+        storage_capacity=2000,
+        container_registry_map=container_registry_map,
+        container_registry_map_uri=None,
+    )
 
     # Verify client was called with both static storage and container registry map
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content v2'
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionZip'] == b'test workflow content v2'
     assert (
-        expected_call.kwargs['description']
+        expected_call['description']
         == 'Version 2.0 with static storage and container registry map'
     )
-    assert expected_call.kwargs['storageType'] == 'STATIC'
-    assert expected_call.kwargs['storageCapacity'] == 2000
-    assert expected_call.kwargs['containerRegistryMap'] == expected_registry_map
+    assert expected_call['storageType'] == 'STATIC'
+    assert expected_call['storageCapacity'] == 2000
+    assert expected_call['containerRegistryMap'] == expected_registry_map
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -1541,22 +1268,19 @@ async def test_create_workflow_version_with_static_storage_and_container_registr
     assert result['status'] == 'ACTIVE'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_container_registry_map_uri():
+async def test_create_workflow_version_with_container_registry_map_uri(ctx, omics_client_factory):
     """Test workflow version creation with container registry map URI."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
@@ -1564,34 +1288,30 @@ async def test_create_workflow_version_with_container_registry_map_uri():
     # S3 URI for container registry map
     container_registry_map_uri = 's3://my-bucket/registry-mappings.json'
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description='Version 2.0 with container registry map URI',
-            parameter_template={'param1': {'type': 'string'}},
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            container_registry_map=None,
-            container_registry_map_uri=container_registry_map_uri,
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        description='Version 2.0 with container registry map URI',
+        parameter_template={'param1': {'type': 'string'}},
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        container_registry_map=None,
+        container_registry_map_uri=container_registry_map_uri,
+    )
 
     # Verify client was called correctly with container registry map URI
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content v2'
-    assert expected_call.kwargs['description'] == 'Version 2.0 with container registry map URI'
-    assert expected_call.kwargs['parameterTemplate'] == {'param1': {'type': 'string'}}
-    assert expected_call.kwargs['storageType'] == 'DYNAMIC'
-    assert expected_call.kwargs['containerRegistryMapUri'] == container_registry_map_uri
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionZip'] == b'test workflow content v2'
+    assert expected_call['description'] == 'Version 2.0 with container registry map URI'
+    assert expected_call['parameterTemplate'] == {'param1': {'type': 'string'}}
+    assert expected_call['storageType'] == 'DYNAMIC'
+    assert expected_call['containerRegistryMapUri'] == container_registry_map_uri
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -1599,12 +1319,8 @@ async def test_create_workflow_version_with_container_registry_map_uri():
     assert result['status'] == 'ACTIVE'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_both_container_registry_params_error():
+async def test_create_workflow_version_both_container_registry_params_error(ctx):
     """Test workflow version creation fails when both container registry parameters are provided."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
@@ -1619,7 +1335,7 @@ async def test_create_workflow_version_both_container_registry_params_error():
     container_registry_map_uri = 's3://my-bucket/registry-mappings.json'
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=definition_zip_base64,
@@ -1639,66 +1355,55 @@ async def test_create_workflow_version_both_container_registry_params_error():
 # Tests for S3 URI support in create_workflow
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_s3_uri():
+async def test_create_workflow_with_s3_uri(ctx, omics_client_factory):
     """Test successful workflow creation with S3 URI."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'description': 'Test workflow description',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=None,
-            description='Test workflow description',
-            parameter_template={'param1': {'type': 'string'}},
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri='s3://my-bucket/workflow-definition.zip',
-        )
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
+
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=None,
+        description='Test workflow description',
+        parameter_template={'param1': {'type': 'string'}},
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri='s3://my-bucket/workflow-definition.zip',
+    )
 
     # Verify client was called correctly with S3 URI
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'test-workflow'
-    assert expected_call.kwargs['definitionUri'] == 's3://my-bucket/workflow-definition.zip'
-    assert expected_call.kwargs['description'] == 'Test workflow description'
-    assert expected_call.kwargs['parameterTemplate'] == {'param1': {'type': 'string'}}
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'test-workflow'
+    assert expected_call['definitionUri'] == 's3://my-bucket/workflow-definition.zip'
+    assert expected_call['description'] == 'Test workflow description'
+    assert expected_call['parameterTemplate'] == {'param1': {'type': 'string'}}
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
-    assert result['arn'] == 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345'
+    assert result['arn'] == WORKFLOW_ARN
     assert result['status'] == 'ACTIVE'
     assert result['name'] == 'test-workflow'
     assert result['description'] == 'Test workflow description'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_both_definition_sources_error():
+async def test_create_workflow_both_definition_sources_error(ctx):
     """Test error when both definition_zip_base64 and definition_uri are provided."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         description=None,
@@ -1713,14 +1418,10 @@ async def test_create_workflow_both_definition_sources_error():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_no_definition_source_error():
+async def test_create_workflow_no_definition_source_error(ctx):
     """Test error when neither definition_zip_base64 nor definition_uri are provided."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=None,
         description=None,
@@ -1735,14 +1436,10 @@ async def test_create_workflow_no_definition_source_error():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_invalid_s3_uri():
+async def test_create_workflow_invalid_s3_uri(ctx):
     """Test error when definition_uri is not a valid S3 URI."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=None,
         description=None,
@@ -1760,73 +1457,62 @@ async def test_create_workflow_invalid_s3_uri():
 # Tests for S3 URI support in create_workflow_version
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_s3_uri():
+async def test_create_workflow_version_with_s3_uri(ctx, omics_client_factory):
     """Test successful workflow version creation with S3 URI."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
         'description': 'Test workflow version description',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=None,
-            description='Test workflow version description',
-            parameter_template={'param1': {'type': 'string'}},
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri='s3://my-bucket/workflow-definition-v2.zip',
-        )
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
+
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=None,
+        description='Test workflow version description',
+        parameter_template={'param1': {'type': 'string'}},
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri='s3://my-bucket/workflow-definition-v2.zip',
+    )
 
     # Verify client was called correctly with S3 URI
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionUri'] == 's3://my-bucket/workflow-definition-v2.zip'
-    assert expected_call.kwargs['description'] == 'Test workflow version description'
-    assert expected_call.kwargs['parameterTemplate'] == {'param1': {'type': 'string'}}
-    assert expected_call.kwargs['storageType'] == 'DYNAMIC'
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionUri'] == 's3://my-bucket/workflow-definition-v2.zip'
+    assert expected_call['description'] == 'Test workflow version description'
+    assert expected_call['parameterTemplate'] == {'param1': {'type': 'string'}}
+    assert expected_call['storageType'] == 'DYNAMIC'
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
-    assert result['arn'] == 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345'
+    assert result['arn'] == WORKFLOW_ARN
     assert result['status'] == 'ACTIVE'
     assert result['name'] == 'test-workflow'
     assert result['versionName'] == 'v2.0'
     assert result['description'] == 'Test workflow version description'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_both_definition_sources_error():
+async def test_create_workflow_version_both_definition_sources_error(ctx):
     """Test error when both definition_zip_base64 and definition_uri are provided for version creation."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=definition_zip_base64,
@@ -1844,14 +1530,10 @@ async def test_create_workflow_version_both_definition_sources_error():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_no_definition_source_error():
+async def test_create_workflow_version_no_definition_source_error(ctx):
     """Test error when neither definition_zip_base64 nor definition_uri are provided for version creation."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=None,
@@ -1869,12 +1551,8 @@ async def test_create_workflow_version_no_definition_source_error():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_invalid_container_registry_map():
+async def test_create_workflow_version_invalid_container_registry_map(ctx):
     """Test workflow version creation with invalid container registry map structure."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
@@ -1886,7 +1564,7 @@ async def test_create_workflow_version_invalid_container_registry_map():
     }
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=definition_zip_base64,
@@ -1904,14 +1582,10 @@ async def test_create_workflow_version_invalid_container_registry_map():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_invalid_s3_uri():
+async def test_create_workflow_version_invalid_s3_uri(ctx):
     """Test error when definition_uri is not a valid S3 URI for version creation."""
-    # Mock context
-    mock_ctx = AsyncMock()
-
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=None,
@@ -1929,77 +1603,36 @@ async def test_create_workflow_version_invalid_s3_uri():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_unexpected_error():
-    """Test handling of unexpected errors in create_workflow_version."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.side_effect = Exception('Unexpected error')
-
-    # Create base64 encoded workflow definition
-    definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description=None,
-            parameter_template=None,
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri=None,
-        )
-
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error creating workflow version' in result['error']
-
-
-@pytest.mark.asyncio
-async def test_create_workflow_s3_uri_minimal():
+async def test_create_workflow_s3_uri_minimal(ctx, omics_client_factory):
     """Test workflow creation with S3 URI and minimal parameters."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=None,
-            description=None,
-            parameter_template=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri='s3://my-bucket/workflow-definition.zip',
-        )
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
+
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=None,
+        description=None,
+        parameter_template=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri='s3://my-bucket/workflow-definition.zip',
+    )
 
     # Verify client was called with only required parameters
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'test-workflow'
-    assert expected_call.kwargs['definitionUri'] == 's3://my-bucket/workflow-definition.zip'
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'test-workflow'
+    assert expected_call['definitionUri'] == 's3://my-bucket/workflow-definition.zip'
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -2007,120 +1640,87 @@ async def test_create_workflow_s3_uri_minimal():
     assert result.get('description') is None
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_s3_uri_with_static_storage():
+async def test_create_workflow_version_s3_uri_with_static_storage(ctx, omics_client_factory):
     """Test workflow version creation with S3 URI and STATIC storage."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=None,
-            description=None,
-            parameter_template=None,
-            storage_type='STATIC',
-            storage_capacity=100,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri='s3://my-bucket/workflow-definition-v2.zip',
-        )
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
+
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=None,
+        description=None,
+        parameter_template=None,
+        storage_type='STATIC',
+        storage_capacity=100,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri='s3://my-bucket/workflow-definition-v2.zip',
+    )
 
     # Verify client was called with STATIC storage parameters
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionUri'] == 's3://my-bucket/workflow-definition-v2.zip'
-    assert expected_call.kwargs['storageType'] == 'STATIC'
-    assert expected_call.kwargs['storageCapacity'] == 100
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionUri'] == 's3://my-bucket/workflow-definition-v2.zip'
+    assert expected_call['storageType'] == 'STATIC'
+    assert expected_call['storageCapacity'] == 100
     # path_to_main should not be passed when None
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
     assert result['versionName'] == 'v2.0'
 
 
-@pytest.mark.asyncio
-async def test_list_workflow_versions_botocore_error():
-    """Test handling of BotoCoreError when listing workflow versions."""
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_workflow_versions.side_effect = botocore.exceptions.BotoCoreError()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_workflow_versions(mock_ctx, workflow_id='wfl-12345')
-
-    # Verify error dict is returned
-    assert 'error' in result
-    assert 'Error listing workflow versions' in result['error']
-
-
 # Tests for path_to_main parameter
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_path_to_main():
+async def test_create_workflow_with_path_to_main(ctx, omics_client_factory):
     """Test workflow creation with path_to_main parameter."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'description': 'Test workflow with path_to_main',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            description='Test workflow with path_to_main',
-            parameter_template=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri=None,
-            path_to_main='workflows/main.wdl',
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        description='Test workflow with path_to_main',
+        parameter_template=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri=None,
+        path_to_main='workflows/main.wdl',
+    )
 
     # Verify client was called correctly with path_to_main
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'test-workflow'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content'
-    assert expected_call.kwargs['description'] == 'Test workflow with path_to_main'
-    assert expected_call.kwargs['main'] == 'workflows/main.wdl'
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'test-workflow'
+    assert expected_call['definitionZip'] == b'test workflow content'
+    assert expected_call['description'] == 'Test workflow with path_to_main'
+    assert expected_call['main'] == 'workflows/main.wdl'
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -2128,45 +1728,38 @@ async def test_create_workflow_with_path_to_main():
     assert result['description'] == 'Test workflow with path_to_main'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_path_to_main_s3_uri():
+async def test_create_workflow_with_path_to_main_s3_uri(ctx, omics_client_factory):
     """Test workflow creation with path_to_main parameter and S3 URI."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'description': 'Test workflow with path_to_main and S3 URI',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=None,
-            description='Test workflow with path_to_main and S3 URI',
-            parameter_template=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri='s3://my-bucket/workflow-definition.zip',
-            path_to_main='src/main.cwl',
-        )
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
+
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=None,
+        description='Test workflow with path_to_main and S3 URI',
+        parameter_template=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri='s3://my-bucket/workflow-definition.zip',
+        path_to_main='src/main.cwl',
+    )
 
     # Verify client was called correctly with path_to_main and S3 URI
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'test-workflow'
-    assert expected_call.kwargs['definitionUri'] == 's3://my-bucket/workflow-definition.zip'
-    assert expected_call.kwargs['description'] == 'Test workflow with path_to_main and S3 URI'
-    assert expected_call.kwargs['main'] == 'src/main.cwl'
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'test-workflow'
+    assert expected_call['definitionUri'] == 's3://my-bucket/workflow-definition.zip'
+    assert expected_call['description'] == 'Test workflow with path_to_main and S3 URI'
+    assert expected_call['main'] == 'src/main.cwl'
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -2174,229 +1767,198 @@ async def test_create_workflow_with_path_to_main_s3_uri():
     assert result['description'] == 'Test workflow with path_to_main and S3 URI'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_path_to_main_nextflow():
+async def test_create_workflow_with_path_to_main_nextflow(ctx, omics_client_factory):
     """Test workflow creation with path_to_main parameter for Nextflow."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'nextflow-workflow',
         'description': 'Test Nextflow workflow with path_to_main',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'nextflow workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='nextflow-workflow',
-            definition_zip_base64=definition_zip_base64,
-            description='Test Nextflow workflow with path_to_main',
-            parameter_template=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri=None,
-            path_to_main='pipelines/main.nf',
-        )
+    result = await create_workflow(
+        ctx,
+        name='nextflow-workflow',
+        definition_zip_base64=definition_zip_base64,
+        description='Test Nextflow workflow with path_to_main',
+        parameter_template=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri=None,
+        path_to_main='pipelines/main.nf',
+    )
 
     # Verify client was called correctly with Nextflow path_to_main
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'nextflow-workflow'
-    assert expected_call.kwargs['definitionZip'] == b'nextflow workflow content'
-    assert expected_call.kwargs['description'] == 'Test Nextflow workflow with path_to_main'
-    assert expected_call.kwargs['main'] == 'pipelines/main.nf'
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'nextflow-workflow'
+    assert expected_call['definitionZip'] == b'nextflow workflow content'
+    assert expected_call['description'] == 'Test Nextflow workflow with path_to_main'
+    assert expected_call['main'] == 'pipelines/main.nf'
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
     assert result['name'] == 'nextflow-workflow'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_path_to_main():
+async def test_create_workflow_version_with_path_to_main(ctx, omics_client_factory):
     """Test workflow version creation with path_to_main parameter."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description='Version 2.0 with path_to_main',
-            parameter_template=None,
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri=None,
-            path_to_main='workflows/v2/main.wdl',
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        description='Version 2.0 with path_to_main',
+        parameter_template=None,
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri=None,
+        path_to_main='workflows/v2/main.wdl',
+    )
 
     # Verify client was called correctly with path_to_main
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content v2'
-    assert expected_call.kwargs['description'] == 'Version 2.0 with path_to_main'
-    assert expected_call.kwargs['storageType'] == 'DYNAMIC'
-    assert expected_call.kwargs['main'] == 'workflows/v2/main.wdl'
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionZip'] == b'test workflow content v2'
+    assert expected_call['description'] == 'Version 2.0 with path_to_main'
+    assert expected_call['storageType'] == 'DYNAMIC'
+    assert expected_call['main'] == 'workflows/v2/main.wdl'
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
     assert result['versionName'] == 'v2.0'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_path_to_main_s3_uri():
+async def test_create_workflow_version_with_path_to_main_s3_uri(ctx, omics_client_factory):
     """Test workflow version creation with path_to_main parameter and S3 URI."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=None,
-            description='Version 2.0 with path_to_main and S3 URI',
-            parameter_template=None,
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri='s3://my-bucket/workflow-definition-v2.zip',
-            path_to_main='src/v2/main.cwl',
-        )
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
+
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=None,
+        description='Version 2.0 with path_to_main and S3 URI',
+        parameter_template=None,
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri='s3://my-bucket/workflow-definition-v2.zip',
+        path_to_main='src/v2/main.cwl',
+    )
 
     # Verify client was called correctly with path_to_main and S3 URI
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionUri'] == 's3://my-bucket/workflow-definition-v2.zip'
-    assert expected_call.kwargs['description'] == 'Version 2.0 with path_to_main and S3 URI'
-    assert expected_call.kwargs['storageType'] == 'DYNAMIC'
-    assert expected_call.kwargs['main'] == 'src/v2/main.cwl'
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionUri'] == 's3://my-bucket/workflow-definition-v2.zip'
+    assert expected_call['description'] == 'Version 2.0 with path_to_main and S3 URI'
+    assert expected_call['storageType'] == 'DYNAMIC'
+    assert expected_call['main'] == 'src/v2/main.cwl'
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
     assert result['versionName'] == 'v2.0'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_path_to_main_static_storage():
+async def test_create_workflow_version_with_path_to_main_static_storage(ctx, omics_client_factory):
     """Test workflow version creation with path_to_main parameter and static storage."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description='Version 2.0 with path_to_main and static storage',
-            parameter_template=None,
-            storage_type='STATIC',
-            storage_capacity=500,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri=None,
-            path_to_main='workflows/static/main.wdl',
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        description='Version 2.0 with path_to_main and static storage',
+        parameter_template=None,
+        storage_type='STATIC',
+        storage_capacity=500,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri=None,
+        path_to_main='workflows/static/main.wdl',
+    )
 
     # Verify client was called correctly with path_to_main and static storage
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content v2'
-    assert (
-        expected_call.kwargs['description'] == 'Version 2.0 with path_to_main and static storage'
-    )
-    assert expected_call.kwargs['storageType'] == 'STATIC'
-    assert expected_call.kwargs['storageCapacity'] == 500
-    assert expected_call.kwargs['main'] == 'workflows/static/main.wdl'
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionZip'] == b'test workflow content v2'
+    assert expected_call['description'] == 'Version 2.0 with path_to_main and static storage'
+    assert expected_call['storageType'] == 'STATIC'
+    assert expected_call['storageCapacity'] == 500
+    assert expected_call['main'] == 'workflows/static/main.wdl'
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
     assert result['versionName'] == 'v2.0'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_path_to_main_and_container_registry():
+async def test_create_workflow_version_with_path_to_main_and_container_registry(
+    ctx, omics_client_factory
+):
     """Test workflow version creation with path_to_main parameter and container registry map."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
@@ -2426,137 +1988,116 @@ async def test_create_workflow_version_with_path_to_main_and_container_registry(
         'imageMappings': [],
     }
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description='Version 2.0 with path_to_main and container registry',
-            parameter_template=None,
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            container_registry_map=container_registry_map,
-            container_registry_map_uri=None,
-            definition_uri=None,
-            path_to_main='workflows/containerized/main.wdl',
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        description='Version 2.0 with path_to_main and container registry',
+        parameter_template=None,
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        container_registry_map=container_registry_map,
+        container_registry_map_uri=None,
+        definition_uri=None,
+        path_to_main='workflows/containerized/main.wdl',
+    )
 
     # Verify client was called correctly with path_to_main and container registry map
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content v2'
-    assert (
-        expected_call.kwargs['description']
-        == 'Version 2.0 with path_to_main and container registry'
-    )
-    assert expected_call.kwargs['storageType'] == 'DYNAMIC'
-    assert expected_call.kwargs['containerRegistryMap'] == expected_registry_map
-    assert expected_call.kwargs['main'] == 'workflows/containerized/main.wdl'
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionZip'] == b'test workflow content v2'
+    assert expected_call['description'] == 'Version 2.0 with path_to_main and container registry'
+    assert expected_call['storageType'] == 'DYNAMIC'
+    assert expected_call['containerRegistryMap'] == expected_registry_map
+    assert expected_call['main'] == 'workflows/containerized/main.wdl'
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
     assert result['versionName'] == 'v2.0'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_path_to_main_empty_string():
+async def test_create_workflow_with_path_to_main_empty_string(ctx, omics_client_factory):
     """Test workflow creation with empty string path_to_main parameter."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            description=None,
-            parameter_template=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri=None,
-            path_to_main='',  # Empty string should be treated as None
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        description=None,
+        parameter_template=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri=None,
+        path_to_main='',  # Empty string should be treated as None
+    )
 
     # Verify client was called correctly - empty string should not be passed
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['name'] == 'test-workflow'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content'
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['name'] == 'test-workflow'
+    assert expected_call['definitionZip'] == b'test workflow content'
     # Empty string path_to_main should not be passed to AWS API
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
     assert result['name'] == 'test-workflow'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_path_to_main_empty_string():
+async def test_create_workflow_version_with_path_to_main_empty_string(ctx, omics_client_factory):
     """Test workflow version creation with empty string path_to_main parameter."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            description=None,
-            parameter_template=None,
-            storage_type='DYNAMIC',
-            storage_capacity=None,
-            container_registry_map=None,
-            container_registry_map_uri=None,
-            definition_uri=None,
-            path_to_main='',  # Empty string should be treated as None
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        description=None,
+        parameter_template=None,
+        storage_type='DYNAMIC',
+        storage_capacity=None,
+        container_registry_map=None,
+        container_registry_map_uri=None,
+        definition_uri=None,
+        path_to_main='',  # Empty string should be treated as None
+    )
 
     # Verify client was called correctly - empty string should not be passed
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['workflowId'] == 'wfl-12345'
-    assert expected_call.kwargs['versionName'] == 'v2.0'
-    assert expected_call.kwargs['definitionZip'] == b'test workflow content v2'
-    assert expected_call.kwargs['storageType'] == 'DYNAMIC'
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['workflowId'] == 'wfl-12345'
+    assert expected_call['versionName'] == 'v2.0'
+    assert expected_call['definitionZip'] == b'test workflow content v2'
+    assert expected_call['storageType'] == 'DYNAMIC'
     # Empty string path_to_main should not be passed to AWS API
-    assert 'main' not in expected_call.kwargs
+    assert 'main' not in expected_call
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -2566,14 +2107,12 @@ async def test_create_workflow_version_with_path_to_main_empty_string():
 # Tests for path_to_main validation integration
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_invalid_path_to_main_absolute():
+async def test_create_workflow_with_invalid_path_to_main_absolute(ctx):
     """Test workflow creation fails with absolute path_to_main."""
-    mock_ctx = AsyncMock()
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         path_to_main='/absolute/path/main.wdl',
@@ -2584,14 +2123,12 @@ async def test_create_workflow_with_invalid_path_to_main_absolute():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_invalid_path_to_main_traversal():
+async def test_create_workflow_with_invalid_path_to_main_traversal(ctx):
     """Test workflow creation fails with directory traversal in path_to_main."""
-    mock_ctx = AsyncMock()
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         path_to_main='../main.wdl',
@@ -2602,14 +2139,12 @@ async def test_create_workflow_with_invalid_path_to_main_traversal():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_invalid_path_to_main_extension():
+async def test_create_workflow_with_invalid_path_to_main_extension(ctx):
     """Test workflow creation fails with invalid file extension in path_to_main."""
-    mock_ctx = AsyncMock()
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         path_to_main='workflows/script.py',
@@ -2620,14 +2155,12 @@ async def test_create_workflow_with_invalid_path_to_main_extension():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_invalid_path_to_main_absolute():
+async def test_create_workflow_version_with_invalid_path_to_main_absolute(ctx):
     """Test workflow version creation fails with absolute path_to_main."""
-    mock_ctx = AsyncMock()
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=definition_zip_base64,
@@ -2640,14 +2173,12 @@ async def test_create_workflow_version_with_invalid_path_to_main_absolute():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_invalid_path_to_main_traversal():
+async def test_create_workflow_version_with_invalid_path_to_main_traversal(ctx):
     """Test workflow version creation fails with directory traversal in path_to_main."""
-    mock_ctx = AsyncMock()
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=definition_zip_base64,
@@ -2660,14 +2191,12 @@ async def test_create_workflow_version_with_invalid_path_to_main_traversal():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_invalid_path_to_main_extension():
+async def test_create_workflow_version_with_invalid_path_to_main_extension(ctx):
     """Test workflow version creation fails with invalid file extension in path_to_main."""
-    mock_ctx = AsyncMock()
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=definition_zip_base64,
@@ -2680,81 +2209,67 @@ async def test_create_workflow_version_with_invalid_path_to_main_extension():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_path_normalization():
+async def test_create_workflow_with_path_normalization(ctx, omics_client_factory):
     """Test workflow creation normalizes valid path_to_main."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            path_to_main='./workflows/main.wdl',  # Should be normalized to 'workflows/main.wdl'
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        path_to_main='./workflows/main.wdl',  # Should be normalized to 'workflows/main.wdl'
+    )
 
     # Verify client was called with normalized path
-    expected_call = mock_client.create_workflow.call_args
-    assert expected_call.kwargs['main'] == 'workflows/main.wdl'  # Normalized path
+    expected_call = client.create_workflow.calls[-1]
+    assert expected_call['main'] == 'workflows/main.wdl'  # Normalized path
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
     assert result['name'] == 'test-workflow'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_path_normalization():
+async def test_create_workflow_version_with_path_normalization(ctx, omics_client_factory):
     """Test workflow version creation normalizes valid path_to_main."""
     # Mock response data
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'ACTIVE',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    # Mock context and client
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    # Mock client
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     # Create base64 encoded workflow definition
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            path_to_main='./src/pipeline.cwl',  # Should be normalized to 'src/pipeline.cwl'
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        path_to_main='./src/pipeline.cwl',  # Should be normalized to 'src/pipeline.cwl'
+    )
 
     # Verify client was called with normalized path
-    expected_call = mock_client.create_workflow_version.call_args
-    assert expected_call.kwargs['main'] == 'src/pipeline.cwl'  # Normalized path
+    expected_call = client.create_workflow_version.calls[-1]
+    assert expected_call['main'] == 'src/pipeline.cwl'  # Normalized path
 
     # Verify result contains expected fields
     assert result['id'] == 'wfl-12345'
@@ -2764,15 +2279,12 @@ async def test_create_workflow_version_with_path_normalization():
 # Tests for path_to_main validation integration
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_path_to_main_validation_absolute_path():
+async def test_create_workflow_path_to_main_validation_absolute_path(ctx):
     """Test that create_workflow rejects absolute paths in path_to_main."""
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         path_to_main='/absolute/path/main.wdl',
@@ -2783,15 +2295,12 @@ async def test_create_workflow_path_to_main_validation_absolute_path():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_path_to_main_validation_directory_traversal():
+async def test_create_workflow_path_to_main_validation_directory_traversal(ctx):
     """Test that create_workflow rejects directory traversal in path_to_main."""
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         path_to_main='../main.wdl',
@@ -2802,15 +2311,12 @@ async def test_create_workflow_path_to_main_validation_directory_traversal():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_path_to_main_validation_invalid_extension():
+async def test_create_workflow_path_to_main_validation_invalid_extension(ctx):
     """Test that create_workflow rejects invalid file extensions in path_to_main."""
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         path_to_main='main.txt',
@@ -2821,15 +2327,12 @@ async def test_create_workflow_path_to_main_validation_invalid_extension():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_path_to_main_validation_absolute_path():
+async def test_create_workflow_version_path_to_main_validation_absolute_path(ctx):
     """Test that create_workflow_version rejects absolute paths in path_to_main."""
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=definition_zip_base64,
@@ -2842,15 +2345,12 @@ async def test_create_workflow_version_path_to_main_validation_absolute_path():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_path_to_main_validation_directory_traversal():
+async def test_create_workflow_version_path_to_main_validation_directory_traversal(ctx):
     """Test that create_workflow_version rejects directory traversal in path_to_main."""
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=definition_zip_base64,
@@ -2863,15 +2363,12 @@ async def test_create_workflow_version_path_to_main_validation_directory_travers
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_path_to_main_validation_invalid_extension():
+async def test_create_workflow_version_path_to_main_validation_invalid_extension(ctx):
     """Test that create_workflow_version rejects invalid file extensions in path_to_main."""
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2.0',
         definition_zip_base64=definition_zip_base64,
@@ -2887,144 +2384,124 @@ async def test_create_workflow_version_path_to_main_validation_invalid_extension
 # Tests for README parameter support
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_readme_s3_uri():
+async def test_create_workflow_with_readme_s3_uri(ctx, omics_client_factory):
     """Test create_workflow with readme as S3 URI."""
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'CREATING',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'CREATING',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            readme='s3://my-bucket/docs/readme.md',
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        readme='s3://my-bucket/docs/readme.md',
+    )
 
     # Verify the client was called with readmeUri parameter
-    call_args = mock_client.create_workflow.call_args
-    assert 'readmeUri' in call_args.kwargs
-    assert call_args.kwargs['readmeUri'] == 's3://my-bucket/docs/readme.md'
-    assert 'readmeMarkdown' not in call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
+    assert 'readmeUri' in call_kwargs
+    assert call_kwargs['readmeUri'] == 's3://my-bucket/docs/readme.md'
+    assert 'readmeMarkdown' not in call_kwargs
 
     assert result['id'] == 'wfl-12345'
     assert result['status'] == 'CREATING'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_readme_markdown_content():
+async def test_create_workflow_with_readme_markdown_content(ctx, omics_client_factory):
     """Test create_workflow with readme as markdown content."""
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'CREATING',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'CREATING',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
     markdown_content = '# My Workflow\n\nThis is documentation.'
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            readme=markdown_content,
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        readme=markdown_content,
+    )
 
     # Verify the client was called with readmeMarkdown parameter
-    call_args = mock_client.create_workflow.call_args
-    assert 'readmeMarkdown' in call_args.kwargs
-    assert call_args.kwargs['readmeMarkdown'] == markdown_content
-    assert 'readmeUri' not in call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
+    assert 'readmeMarkdown' in call_kwargs
+    assert call_kwargs['readmeMarkdown'] == markdown_content
+    assert 'readmeUri' not in call_kwargs
 
     assert result['id'] == 'wfl-12345'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_readme_s3_uri():
+async def test_create_workflow_version_with_readme_s3_uri(ctx, omics_client_factory):
     """Test create_workflow_version with readme as S3 URI."""
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'CREATING',
-        'name': 'test-workflow',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'CREATING',
+            'name': 'test-workflow',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            readme='s3://my-bucket/docs/readme.md',
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        readme='s3://my-bucket/docs/readme.md',
+    )
 
     # Verify the client was called with readmeUri parameter
-    call_args = mock_client.create_workflow_version.call_args
-    assert 'readmeUri' in call_args.kwargs
-    assert call_args.kwargs['readmeUri'] == 's3://my-bucket/docs/readme.md'
-    assert 'readmeMarkdown' not in call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
+    assert 'readmeUri' in call_kwargs
+    assert call_kwargs['readmeUri'] == 's3://my-bucket/docs/readme.md'
+    assert 'readmeMarkdown' not in call_kwargs
 
     assert result['id'] == 'wfl-12345'
     assert result['versionName'] == 'v2.0'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_readme_markdown_content():
+async def test_create_workflow_version_with_readme_markdown_content(ctx, omics_client_factory):
     """Test create_workflow_version with readme as markdown content."""
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'CREATING',
-        'name': 'test-workflow',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'CREATING',
+            'name': 'test-workflow',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
     markdown_content = '# My Workflow v2\n\nUpdated documentation.'
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            readme=markdown_content,
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        readme=markdown_content,
+    )
 
     # Verify the client was called with readmeMarkdown parameter
-    call_args = mock_client.create_workflow_version.call_args
-    assert 'readmeMarkdown' in call_args.kwargs
-    assert call_args.kwargs['readmeMarkdown'] == markdown_content
-    assert 'readmeUri' not in call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
+    assert 'readmeMarkdown' in call_kwargs
+    assert call_kwargs['readmeMarkdown'] == markdown_content
+    assert 'readmeUri' not in call_kwargs
 
     assert result['id'] == 'wfl-12345'
 
@@ -3032,56 +2509,46 @@ async def test_create_workflow_version_with_readme_markdown_content():
 # Tests for create_workflow with definition_uri and definition_repository
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_definition_uri():
+async def test_create_workflow_with_definition_uri(ctx, omics_client_factory):
     """Test workflow creation with definition_uri (S3 URI source)."""
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'CREATING',
         'name': 'test-workflow',
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    client = omics_client_factory(create_workflow=mock_response)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=None,
-            definition_uri='s3://my-bucket/workflows/workflow.zip',
-            definition_repository=None,
-            description='Test workflow from S3',
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=None,
+        definition_uri='s3://my-bucket/workflows/workflow.zip',
+        definition_repository=None,
+        description='Test workflow from S3',
+    )
 
     # Verify client was called with definitionUri
-    call_args = mock_client.create_workflow.call_args
-    assert 'definitionUri' in call_args.kwargs
-    assert call_args.kwargs['definitionUri'] == 's3://my-bucket/workflows/workflow.zip'
-    assert 'definitionZip' not in call_args.kwargs
-    assert 'definitionRepository' not in call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
+    assert 'definitionUri' in call_kwargs
+    assert call_kwargs['definitionUri'] == 's3://my-bucket/workflows/workflow.zip'
+    assert 'definitionZip' not in call_kwargs
+    assert 'definitionRepository' not in call_kwargs
 
     assert result['id'] == 'wfl-12345'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_definition_repository():
+async def test_create_workflow_with_definition_repository(ctx, omics_client_factory):
     """Test workflow creation with definition_repository (Git source)."""
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'CREATING',
         'name': 'test-workflow',
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    client = omics_client_factory(create_workflow=mock_response)
 
     definition_repository = {
         'connection_arn': 'arn:aws:codeconnections:us-east-1:123456789012:connection/abc-123',
@@ -3089,49 +2556,42 @@ async def test_create_workflow_with_definition_repository():
         'source_reference': {'type': 'BRANCH', 'value': 'main'},
     }
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=None,
-            definition_uri=None,
-            definition_repository=definition_repository,
-            description='Test workflow from Git',
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=None,
+        definition_uri=None,
+        definition_repository=definition_repository,
+        description='Test workflow from Git',
+    )
 
     # Verify client was called with definitionRepository
-    call_args = mock_client.create_workflow.call_args
-    assert 'definitionRepository' in call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
+    assert 'definitionRepository' in call_kwargs
     assert (
-        call_args.kwargs['definitionRepository']['connectionArn']
+        call_kwargs['definitionRepository']['connectionArn']
         == definition_repository['connection_arn']
     )
     assert (
-        call_args.kwargs['definitionRepository']['fullRepositoryId']
+        call_kwargs['definitionRepository']['fullRepositoryId']
         == definition_repository['full_repository_id']
     )
-    assert 'definitionZip' not in call_args.kwargs
-    assert 'definitionUri' not in call_args.kwargs
+    assert 'definitionZip' not in call_kwargs
+    assert 'definitionUri' not in call_kwargs
 
     assert result['id'] == 'wfl-12345'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_with_repository_path_params():
+async def test_create_workflow_with_repository_path_params(ctx, omics_client_factory):
     """Test workflow creation with repository-specific path parameters."""
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'CREATING',
         'name': 'test-workflow',
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = mock_response
+    client = omics_client_factory(create_workflow=mock_response)
 
     definition_repository = {
         'connection_arn': 'arn:aws:codeconnections:us-east-1:123456789012:connection/abc-123',
@@ -3139,26 +2599,22 @@ async def test_create_workflow_with_repository_path_params():
         'source_reference': {'type': 'TAG', 'value': 'v1.0.0'},
     }
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=None,
-            definition_uri=None,
-            definition_repository=definition_repository,
-            parameter_template_path='config/params.json',
-            readme_path='docs/README.md',
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=None,
+        definition_uri=None,
+        definition_repository=definition_repository,
+        parameter_template_path='config/params.json',
+        readme_path='docs/README.md',
+    )
 
     # Verify client was called with parameterTemplatePath and readmePath
-    call_args = mock_client.create_workflow.call_args
-    assert 'parameterTemplatePath' in call_args.kwargs
-    assert call_args.kwargs['parameterTemplatePath'] == 'config/params.json'
-    assert 'readmePath' in call_args.kwargs
-    assert call_args.kwargs['readmePath'] == 'docs/README.md'
+    call_kwargs = client.create_workflow.calls[-1]
+    assert 'parameterTemplatePath' in call_kwargs
+    assert call_kwargs['parameterTemplatePath'] == 'config/params.json'
+    assert 'readmePath' in call_kwargs
+    assert call_kwargs['readmePath'] == 'docs/README.md'
 
     assert result['id'] == 'wfl-12345'
 
@@ -3166,61 +2622,51 @@ async def test_create_workflow_with_repository_path_params():
 # Tests for create_workflow_version with definition_uri and definition_repository
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_definition_uri():
+async def test_create_workflow_version_with_definition_uri(ctx, omics_client_factory):
     """Test workflow version creation with definition_uri (S3 URI source)."""
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'CREATING',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    client = omics_client_factory(create_workflow_version=mock_response)
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=None,
-            definition_uri='s3://my-bucket/workflows/workflow-v2.zip',
-            definition_repository=None,
-            storage_type='DYNAMIC',
-            description='Version 2.0 from S3',
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=None,
+        definition_uri='s3://my-bucket/workflows/workflow-v2.zip',
+        definition_repository=None,
+        storage_type='DYNAMIC',
+        description='Version 2.0 from S3',
+    )
 
     # Verify client was called with definitionUri
-    call_args = mock_client.create_workflow_version.call_args
-    assert 'definitionUri' in call_args.kwargs
-    assert call_args.kwargs['definitionUri'] == 's3://my-bucket/workflows/workflow-v2.zip'
-    assert 'definitionZip' not in call_args.kwargs
-    assert 'definitionRepository' not in call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
+    assert 'definitionUri' in call_kwargs
+    assert call_kwargs['definitionUri'] == 's3://my-bucket/workflows/workflow-v2.zip'
+    assert 'definitionZip' not in call_kwargs
+    assert 'definitionRepository' not in call_kwargs
 
     assert result['id'] == 'wfl-12345'
     assert result['versionName'] == 'v2.0'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_definition_repository():
+async def test_create_workflow_version_with_definition_repository(ctx, omics_client_factory):
     """Test workflow version creation with definition_repository (Git source)."""
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'CREATING',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     definition_repository = {
         'connection_arn': 'arn:aws:codeconnections:us-east-1:123456789012:connection/abc-123',
@@ -3228,49 +2674,42 @@ async def test_create_workflow_version_with_definition_repository():
         'source_reference': {'type': 'TAG', 'value': 'v2.0.0'},
     }
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=None,
-            definition_uri=None,
-            definition_repository=definition_repository,
-            storage_type='DYNAMIC',
-            description='Version 2.0 from Git',
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=None,
+        definition_uri=None,
+        definition_repository=definition_repository,
+        storage_type='DYNAMIC',
+        description='Version 2.0 from Git',
+    )
 
     # Verify client was called with definitionRepository
-    call_args = mock_client.create_workflow_version.call_args
-    assert 'definitionRepository' in call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
+    assert 'definitionRepository' in call_kwargs
     assert (
-        call_args.kwargs['definitionRepository']['connectionArn']
+        call_kwargs['definitionRepository']['connectionArn']
         == definition_repository['connection_arn']
     )
-    assert 'definitionZip' not in call_args.kwargs
-    assert 'definitionUri' not in call_args.kwargs
+    assert 'definitionZip' not in call_kwargs
+    assert 'definitionUri' not in call_kwargs
 
     assert result['id'] == 'wfl-12345'
     assert result['versionName'] == 'v2.0'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_with_repository_path_params():
+async def test_create_workflow_version_with_repository_path_params(ctx, omics_client_factory):
     """Test workflow version creation with repository-specific path parameters."""
     mock_response = {
         'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
+        'arn': WORKFLOW_ARN,
         'status': 'CREATING',
         'name': 'test-workflow',
         'versionName': 'v2.0',
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = mock_response
+    client = omics_client_factory(create_workflow_version=mock_response)
 
     definition_repository = {
         'connection_arn': 'arn:aws:codeconnections:us-east-1:123456789012:connection/abc-123',
@@ -3278,28 +2717,24 @@ async def test_create_workflow_version_with_repository_path_params():
         'source_reference': {'type': 'COMMIT_ID', 'value': 'a1b2c3d4e5f6'},
     }
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2.0',
-            definition_zip_base64=None,
-            definition_uri=None,
-            definition_repository=definition_repository,
-            storage_type='DYNAMIC',
-            parameter_template_path='config/params-v2.json',
-            readme_path='docs/README-v2.md',
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2.0',
+        definition_zip_base64=None,
+        definition_uri=None,
+        definition_repository=definition_repository,
+        storage_type='DYNAMIC',
+        parameter_template_path='config/params-v2.json',
+        readme_path='docs/README-v2.md',
+    )
 
     # Verify client was called with parameterTemplatePath and readmePath
-    call_args = mock_client.create_workflow_version.call_args
-    assert 'parameterTemplatePath' in call_args.kwargs
-    assert call_args.kwargs['parameterTemplatePath'] == 'config/params-v2.json'
-    assert 'readmePath' in call_args.kwargs
-    assert call_args.kwargs['readmePath'] == 'docs/README-v2.md'
+    call_kwargs = client.create_workflow_version.calls[-1]
+    assert 'parameterTemplatePath' in call_kwargs
+    assert call_kwargs['parameterTemplatePath'] == 'config/params-v2.json'
+    assert 'readmePath' in call_kwargs
+    assert call_kwargs['readmePath'] == 'docs/README-v2.md'
 
     assert result['id'] == 'wfl-12345'
     assert result['versionName'] == 'v2.0'
@@ -3539,172 +2974,144 @@ class TestTagParsingRejectsInvalidJSON:
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_engine_wdl():
+async def test_create_workflow_engine_wdl(ctx, omics_client_factory):
     """Test create_workflow forwards WDL engine to boto3.
 
     Validates: Requirement CreateWorkflow Engine Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            engine='WDL',
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        engine='WDL',
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert call_kwargs['engine'] == 'WDL'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_engine_nextflow():
+async def test_create_workflow_engine_nextflow(ctx, omics_client_factory):
     """Test create_workflow forwards NEXTFLOW engine to boto3.
 
     Validates: Requirement CreateWorkflow Engine Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            engine='NEXTFLOW',
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        engine='NEXTFLOW',
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert call_kwargs['engine'] == 'NEXTFLOW'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_engine_cwl():
+async def test_create_workflow_engine_cwl(ctx, omics_client_factory):
     """Test create_workflow forwards CWL engine to boto3.
 
     Validates: Requirement CreateWorkflow Engine Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            engine='CWL',
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        engine='CWL',
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert call_kwargs['engine'] == 'CWL'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_engine_wdl_lenient():
+async def test_create_workflow_engine_wdl_lenient(ctx, omics_client_factory):
     """Test create_workflow forwards WDL_LENIENT engine to boto3.
 
     Validates: Requirement CreateWorkflow Engine Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            engine='WDL_LENIENT',
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        engine='WDL_LENIENT',
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert call_kwargs['engine'] == 'WDL_LENIENT'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_engine_omitted_when_not_provided():
+async def test_create_workflow_engine_omitted_when_not_provided(ctx, omics_client_factory):
     """Test create_workflow omits engine from API call when not provided.
 
     Validates: Requirement CreateWorkflow Engine Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert 'engine' not in call_kwargs
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_invalid_engine_error():
+async def test_create_workflow_invalid_engine_error(ctx):
     """Test create_workflow returns error for invalid engine value.
 
     Validates: Requirement CreateWorkflow Engine Parameter
     """
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         engine='INVALID_ENGINE',
@@ -3714,83 +3121,70 @@ async def test_create_workflow_invalid_engine_error():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_static_storage_with_capacity():
+async def test_create_workflow_static_storage_with_capacity(ctx, omics_client_factory):
     """Test create_workflow forwards STATIC storage type with capacity to boto3.
 
     Validates: Requirement CreateWorkflow Storage Parameters
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='STATIC',
-            storage_capacity=100,
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='STATIC',
+        storage_capacity=100,
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert call_kwargs['storageType'] == 'STATIC'
     assert call_kwargs['storageCapacity'] == 100
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_dynamic_storage_without_capacity():
+async def test_create_workflow_dynamic_storage_without_capacity(ctx, omics_client_factory):
     """Test create_workflow forwards DYNAMIC storage type and omits capacity.
 
     Validates: Requirement CreateWorkflow Storage Parameters
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert call_kwargs['storageType'] == 'DYNAMIC'
     assert 'storageCapacity' not in call_kwargs
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_static_storage_without_capacity_error():
+async def test_create_workflow_static_storage_without_capacity_error(ctx):
     """Test create_workflow returns error when STATIC storage has no capacity.
 
     Validates: Requirement CreateWorkflow Storage Parameters
     """
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         storage_type='STATIC',
@@ -3801,18 +3195,15 @@ async def test_create_workflow_static_storage_without_capacity_error():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_invalid_storage_type_error():
+async def test_create_workflow_invalid_storage_type_error(ctx):
     """Test create_workflow returns error for invalid storage_type value.
 
     Validates: Requirement CreateWorkflow Storage Parameters
     """
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         storage_type='INVALID_STORAGE',
@@ -3822,173 +3213,145 @@ async def test_create_workflow_invalid_storage_type_error():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_tags_dict_forwarded():
+async def test_create_workflow_tags_dict_forwarded(ctx, omics_client_factory):
     """Test create_workflow forwards dict tags to boto3.
 
     Validates: Requirement CreateWorkflow Tags Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
     tags = {'project': 'genomics', 'team': 'research'}
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            tags=tags,
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        tags=tags,
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert call_kwargs['tags'] == {'project': 'genomics', 'team': 'research'}
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_tags_json_string_forwarded():
+async def test_create_workflow_tags_json_string_forwarded(ctx, omics_client_factory):
     """Test create_workflow parses and forwards JSON string tags to boto3.
 
     Validates: Requirement CreateWorkflow Tags Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
     tags_json = json.dumps({'project': 'genomics', 'team': 'research'})
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            tags=tags_json,
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        tags=tags_json,
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert call_kwargs['tags'] == {'project': 'genomics', 'team': 'research'}
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_tags_omitted_when_not_provided():
+async def test_create_workflow_tags_omitted_when_not_provided(ctx, omics_client_factory):
     """Test create_workflow omits tags from API call when not provided.
 
     Validates: Requirement CreateWorkflow Tags Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert 'tags' not in call_kwargs
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_gpu_accelerator_forwarded():
+async def test_create_workflow_gpu_accelerator_forwarded(ctx, omics_client_factory):
     """Test create_workflow forwards GPU accelerator to boto3.
 
     Validates: Requirement CreateWorkflow Accelerators Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            accelerators='GPU',
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        accelerators='GPU',
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert call_kwargs['accelerators'] == 'GPU'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_accelerator_omitted_when_not_provided():
+async def test_create_workflow_accelerator_omitted_when_not_provided(ctx, omics_client_factory):
     """Test create_workflow omits accelerators from API call when not provided.
 
     Validates: Requirement CreateWorkflow Accelerators Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert 'accelerators' not in call_kwargs
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_invalid_accelerator_error():
+async def test_create_workflow_invalid_accelerator_error(ctx):
     """Test create_workflow returns error for invalid accelerator value.
 
     Validates: Requirement CreateWorkflow Accelerators Parameter
     """
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
     result = await create_workflow(
-        mock_ctx,
+        ctx,
         name='test-workflow',
         definition_zip_base64=definition_zip_base64,
         accelerators='TPU',
@@ -3998,124 +3361,106 @@ async def test_create_workflow_invalid_accelerator_error():
     assert 'Error creating workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_bucket_owner_id_forwarded():
+async def test_create_workflow_bucket_owner_id_forwarded(ctx, omics_client_factory):
     """Test create_workflow forwards workflow_bucket_owner_id to boto3.
 
     Validates: Requirement CreateWorkflow Workflow Bucket Owner ID Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-            workflow_bucket_owner_id='123456789012',
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+        workflow_bucket_owner_id='123456789012',
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert call_kwargs['workflowBucketOwnerId'] == '123456789012'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_bucket_owner_id_omitted_when_not_provided():
+async def test_create_workflow_bucket_owner_id_omitted_when_not_provided(
+    ctx, omics_client_factory
+):
     """Test create_workflow omits workflowBucketOwnerId from API call when not provided.
 
     Validates: Requirement CreateWorkflow Workflow Bucket Owner ID Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-        )
+    await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+    )
 
-    call_kwargs = mock_client.create_workflow.call_args.kwargs
+    call_kwargs = client.create_workflow.calls[-1]
     assert 'workflowBucketOwnerId' not in call_kwargs
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_response_tags_and_uuid():
+async def test_create_workflow_response_tags_and_uuid(ctx, omics_client_factory):
     """Test create_workflow includes tags and uuid in response when present.
 
     Validates: Requirement CreateWorkflow Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-        'tags': {'project': 'genomics'},
-        'uuid': 'abc-def-123-456',
-    }
+    omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+            'tags': {'project': 'genomics'},
+            'uuid': 'abc-def-123-456',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+    )
 
     assert result['tags'] == {'project': 'genomics'}
     assert result['uuid'] == 'abc-def-123-456'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_response_tags_and_uuid_absent():
+async def test_create_workflow_response_tags_and_uuid_absent(ctx, omics_client_factory):
     """Test create_workflow result has None for tags and uuid when not in response.
 
     Validates: Requirement CreateWorkflow Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    omics_client_factory(
+        create_workflow={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow(
-            mock_ctx,
-            name='test-workflow',
-            definition_zip_base64=definition_zip_base64,
-        )
+    result = await create_workflow(
+        ctx,
+        name='test-workflow',
+        definition_zip_base64=definition_zip_base64,
+    )
 
     assert result.get('tags') is None
     assert result.get('uuid') is None
@@ -4170,7 +3515,6 @@ class TestGetWorkflowResponseFieldCompleteness:
         )
     )
     @settings(max_examples=100)
-    @pytest.mark.asyncio
     async def test_all_present_optional_fields_appear_in_result(self, selected_fields: list):
         """Property: GetWorkflow response field completeness.
 
@@ -4180,29 +3524,17 @@ class TestGetWorkflowResponseFieldCompleteness:
 
         Validates: Requirement GetWorkflow Additional Response Fields
         """
-        creation_time = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
-
         # Build mock boto3 response with base required fields plus selected optional fields
-        mock_response = {
-            'id': 'wfl-12345',
-            'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-            'name': 'test-workflow',
-            'status': 'ACTIVE',
-            'type': 'PRIVATE',
-            'creationTime': creation_time,
-        }
+        mock_response = dict(_PRIVATE_WORKFLOW)
 
         for field_name in selected_fields:
             mock_response[field_name] = self.OPTIONAL_FIELDS[field_name]
 
-        mock_ctx = AsyncMock()
-        mock_client = MagicMock()
-        mock_client.get_workflow.return_value = mock_response
+        mock_ctx: Any = FakeCtx()
+        mock_client = SimpleNamespace(get_workflow=Recorder(ret=mock_response))
 
-        with patch(
-            'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-            return_value=mock_client,
-        ):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(workflow_management, 'get_omics_client', lambda **kwargs: mock_client)
             result = await get_workflow(
                 ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False
             )
@@ -4227,82 +3559,55 @@ class TestGetWorkflowResponseFieldCompleteness:
 
 def _make_get_workflow_base_response(**overrides):
     """Helper to create a base get_workflow mock response with optional overrides."""
-    creation_time = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
-    response = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'name': 'test-workflow',
-        'status': 'ACTIVE',
-        'type': 'PRIVATE',
-        'creationTime': creation_time,
-    }
-    response.update(overrides)
-    return response
+    return {**_PRIVATE_WORKFLOW, **overrides}
 
 
 # --- workflow_type parameter tests ---
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_private_type_forwarded():
+async def test_get_workflow_private_type_forwarded(ctx, omics_client_factory):
     """Test get_workflow forwards PRIVATE workflow_type to boto3.
 
     Validates: Requirement GetWorkflow Type Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await get_workflow(
-            ctx=mock_ctx,
-            workflow_id='wfl-12345',
-            export_definition=False,
-            workflow_type='PRIVATE',
-        )
+    client = omics_client_factory(get_workflow=_make_get_workflow_base_response())
+
+    await get_workflow(
+        ctx=ctx,
+        workflow_id='wfl-12345',
+        export_definition=False,
+        workflow_type='PRIVATE',
+    )
 
-    call_kwargs = mock_client.get_workflow.call_args.kwargs
+    call_kwargs = client.get_workflow.calls[-1]
     assert call_kwargs['type'] == 'PRIVATE'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_ready2run_type_forwarded():
+async def test_get_workflow_ready2run_type_forwarded(ctx, omics_client_factory):
     """Test get_workflow forwards READY2RUN workflow_type to boto3.
 
     Validates: Requirement GetWorkflow Type Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await get_workflow(
-            ctx=mock_ctx,
-            workflow_id='wfl-12345',
-            export_definition=False,
-            workflow_type='READY2RUN',
-        )
+    client = omics_client_factory(get_workflow=_make_get_workflow_base_response())
+
+    await get_workflow(
+        ctx=ctx,
+        workflow_id='wfl-12345',
+        export_definition=False,
+        workflow_type='READY2RUN',
+    )
 
-    call_kwargs = mock_client.get_workflow.call_args.kwargs
+    call_kwargs = client.get_workflow.calls[-1]
     assert call_kwargs['type'] == 'READY2RUN'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_invalid_type_error():
+async def test_get_workflow_invalid_type_error(ctx):
     """Test get_workflow returns error for invalid workflow_type value.
 
     Validates: Requirement GetWorkflow Type Parameter
     """
-    mock_ctx = AsyncMock()
-
     result = await get_workflow(
-        ctx=mock_ctx,
+        ctx=ctx,
         workflow_id='wfl-12345',
         export_definition=False,
         workflow_type='INVALID_TYPE',
@@ -4312,218 +3617,161 @@ async def test_get_workflow_invalid_type_error():
     assert 'Error getting workflow' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_type_omitted_when_not_provided():
+async def test_get_workflow_type_omitted_when_not_provided(ctx, omics_client_factory):
     """Test get_workflow omits type from API call when workflow_type not provided.
 
     Validates: Requirement GetWorkflow Type Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await get_workflow(
-            ctx=mock_ctx,
-            workflow_id='wfl-12345',
-            export_definition=False,
-        )
+    client = omics_client_factory(get_workflow=_make_get_workflow_base_response())
+
+    await get_workflow(
+        ctx=ctx,
+        workflow_id='wfl-12345',
+        export_definition=False,
+    )
 
-    call_kwargs = mock_client.get_workflow.call_args.kwargs
+    call_kwargs = client.get_workflow.calls[-1]
     assert 'type' not in call_kwargs
 
 
 # --- workflow_owner_id parameter tests ---
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_owner_id_forwarded():
+async def test_get_workflow_owner_id_forwarded(ctx, omics_client_factory):
     """Test get_workflow forwards workflow_owner_id to boto3.
 
     Validates: Requirement GetWorkflow Owner ID Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await get_workflow(
-            ctx=mock_ctx,
-            workflow_id='wfl-12345',
-            export_definition=False,
-            workflow_owner_id='987654321098',
-        )
+    client = omics_client_factory(get_workflow=_make_get_workflow_base_response())
+
+    await get_workflow(
+        ctx=ctx,
+        workflow_id='wfl-12345',
+        export_definition=False,
+        workflow_owner_id='987654321098',
+    )
 
-    call_kwargs = mock_client.get_workflow.call_args.kwargs
+    call_kwargs = client.get_workflow.calls[-1]
     assert call_kwargs['workflowOwnerId'] == '987654321098'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_owner_id_omitted_when_not_provided():
+async def test_get_workflow_owner_id_omitted_when_not_provided(ctx, omics_client_factory):
     """Test get_workflow omits workflowOwnerId from API call when not provided.
 
     Validates: Requirement GetWorkflow Owner ID Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await get_workflow(
-            ctx=mock_ctx,
-            workflow_id='wfl-12345',
-            export_definition=False,
-        )
-
-    call_kwargs = mock_client.get_workflow.call_args.kwargs
-    assert 'workflowOwnerId' not in call_kwargs
-
+    client = omics_client_factory(get_workflow=_make_get_workflow_base_response())
+
+    await get_workflow(
+        ctx=ctx,
+        workflow_id='wfl-12345',
+        export_definition=False,
+    )
+
+    call_kwargs = client.get_workflow.calls[-1]
+    assert 'workflowOwnerId' not in call_kwargs
+
 
 # --- export parameter tests ---
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_export_definition_only():
+async def test_get_workflow_export_definition_only(ctx, omics_client_factory):
     """Test get_workflow forwards export list with DEFINITION to boto3.
 
     Validates: Requirement GetWorkflow Enhanced Export Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await get_workflow(
-            ctx=mock_ctx,
-            workflow_id='wfl-12345',
-            export_definition=False,
-            export=['DEFINITION'],
-        )
+    client = omics_client_factory(get_workflow=_make_get_workflow_base_response())
+
+    await get_workflow(
+        ctx=ctx,
+        workflow_id='wfl-12345',
+        export_definition=False,
+        export=['DEFINITION'],
+    )
 
-    call_kwargs = mock_client.get_workflow.call_args.kwargs
+    call_kwargs = client.get_workflow.calls[-1]
     assert call_kwargs['export'] == ['DEFINITION']
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_export_readme_only():
+async def test_get_workflow_export_readme_only(ctx, omics_client_factory):
     """Test get_workflow forwards export list with README to boto3.
 
     Validates: Requirement GetWorkflow Enhanced Export Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await get_workflow(
-            ctx=mock_ctx,
-            workflow_id='wfl-12345',
-            export_definition=False,
-            export=['README'],
-        )
+    client = omics_client_factory(get_workflow=_make_get_workflow_base_response())
 
-    call_kwargs = mock_client.get_workflow.call_args.kwargs
+    await get_workflow(
+        ctx=ctx,
+        workflow_id='wfl-12345',
+        export_definition=False,
+        export=['README'],
+    )
+
+    call_kwargs = client.get_workflow.calls[-1]
     assert call_kwargs['export'] == ['README']
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_export_definition_and_readme():
+async def test_get_workflow_export_definition_and_readme(ctx, omics_client_factory):
     """Test get_workflow forwards export list with both DEFINITION and README to boto3.
 
     Validates: Requirement GetWorkflow Enhanced Export Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await get_workflow(
-            ctx=mock_ctx,
-            workflow_id='wfl-12345',
-            export_definition=False,
-            export=['DEFINITION', 'README'],
-        )
+    client = omics_client_factory(get_workflow=_make_get_workflow_base_response())
+
+    await get_workflow(
+        ctx=ctx,
+        workflow_id='wfl-12345',
+        export_definition=False,
+        export=['DEFINITION', 'README'],
+    )
 
-    call_kwargs = mock_client.get_workflow.call_args.kwargs
+    call_kwargs = client.get_workflow.calls[-1]
     assert call_kwargs['export'] == ['DEFINITION', 'README']
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_export_backward_compat_export_definition_true():
+async def test_get_workflow_export_backward_compat_export_definition_true(
+    ctx, omics_client_factory
+):
     """Test get_workflow backward compatibility: export_definition=True treated as export=['DEFINITION'].
 
     Validates: Requirement GetWorkflow Enhanced Export Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await get_workflow(
-            ctx=mock_ctx,
-            workflow_id='wfl-12345',
-            export_definition=True,
-        )
+    client = omics_client_factory(get_workflow=_make_get_workflow_base_response())
+
+    await get_workflow(
+        ctx=ctx,
+        workflow_id='wfl-12345',
+        export_definition=True,
+    )
 
-    call_kwargs = mock_client.get_workflow.call_args.kwargs
+    call_kwargs = client.get_workflow.calls[-1]
     assert call_kwargs['export'] == ['DEFINITION']
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_export_neither_provided():
+async def test_get_workflow_export_neither_provided(ctx, omics_client_factory):
     """Test get_workflow omits export from API call when neither export nor export_definition provided.
 
     Validates: Requirement GetWorkflow Enhanced Export Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response()
-
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await get_workflow(
-            ctx=mock_ctx,
-            workflow_id='wfl-12345',
-            export_definition=False,
-        )
+    client = omics_client_factory(get_workflow=_make_get_workflow_base_response())
 
-    call_kwargs = mock_client.get_workflow.call_args.kwargs
+    await get_workflow(
+        ctx=ctx,
+        workflow_id='wfl-12345',
+        export_definition=False,
+    )
+
+    call_kwargs = client.get_workflow.calls[-1]
     assert 'export' not in call_kwargs
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_export_invalid_type_error():
+async def test_get_workflow_export_invalid_type_error(ctx):
     """Test get_workflow returns error for invalid export type value.
 
     Validates: Requirement GetWorkflow Enhanced Export Parameter
     """
-    mock_ctx = AsyncMock()
-
     result = await get_workflow(
-        ctx=mock_ctx,
+        ctx=ctx,
         workflow_id='wfl-12345',
         export_definition=False,
         export=['INVALID_EXPORT'],
@@ -4536,209 +3784,136 @@ async def test_get_workflow_export_invalid_type_error():
 # --- New response field tests ---
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_engine():
+async def test_get_workflow_response_engine(ctx, omics_client_factory):
     """Test get_workflow includes engine in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(engine='WDL')
+    omics_client_factory(get_workflow=_make_get_workflow_base_response(engine='WDL'))
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['engine'] == 'WDL'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_main():
+async def test_get_workflow_response_main(ctx, omics_client_factory):
     """Test get_workflow includes main in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(main='main.wdl')
+    omics_client_factory(get_workflow=_make_get_workflow_base_response(main='main.wdl'))
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['main'] == 'main.wdl'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_digest():
+async def test_get_workflow_response_digest(ctx, omics_client_factory):
     """Test get_workflow includes digest in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(
-        digest='sha256:abc123'
-    )
+    omics_client_factory(get_workflow=_make_get_workflow_base_response(digest='sha256:abc123'))
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['digest'] == 'sha256:abc123'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_storage_capacity():
+async def test_get_workflow_response_storage_capacity(ctx, omics_client_factory):
     """Test get_workflow includes storageCapacity in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(storageCapacity=100)
+    omics_client_factory(get_workflow=_make_get_workflow_base_response(storageCapacity=100))
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['storageCapacity'] == 100
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_storage_type():
+async def test_get_workflow_response_storage_type(ctx, omics_client_factory):
     """Test get_workflow includes storageType in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(storageType='DYNAMIC')
+    omics_client_factory(get_workflow=_make_get_workflow_base_response(storageType='DYNAMIC'))
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['storageType'] == 'DYNAMIC'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_tags():
+async def test_get_workflow_response_tags(ctx, omics_client_factory):
     """Test get_workflow includes tags in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(
-        tags={'project': 'genomics', 'env': 'prod'}
+    omics_client_factory(
+        get_workflow=_make_get_workflow_base_response(tags={'project': 'genomics', 'env': 'prod'})
     )
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['tags'] == {'project': 'genomics', 'env': 'prod'}
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_metadata():
+async def test_get_workflow_response_metadata(ctx, omics_client_factory):
     """Test get_workflow includes metadata as dict in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(
-        metadata={'key1': 'value1', 'key2': 'value2'}
+    omics_client_factory(
+        get_workflow=_make_get_workflow_base_response(
+            metadata={'key1': 'value1', 'key2': 'value2'}
+        )
     )
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['metadata'] == {'key1': 'value1', 'key2': 'value2'}
     assert isinstance(result['metadata'], dict)
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_accelerators():
+async def test_get_workflow_response_accelerators(ctx, omics_client_factory):
     """Test get_workflow includes accelerators in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(accelerators='GPU')
+    omics_client_factory(get_workflow=_make_get_workflow_base_response(accelerators='GPU'))
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['accelerators'] == 'GPU'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_uuid():
+async def test_get_workflow_response_uuid(ctx, omics_client_factory):
     """Test get_workflow includes uuid in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(
-        uuid='abc-def-123-456'
-    )
+    omics_client_factory(get_workflow=_make_get_workflow_base_response(uuid='abc-def-123-456'))
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['uuid'] == 'abc-def-123-456'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_readme():
+async def test_get_workflow_response_readme(ctx, omics_client_factory):
     """Test get_workflow includes readme in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(
-        readme='# My Workflow\nThis is a readme.'
+    omics_client_factory(
+        get_workflow=_make_get_workflow_base_response(readme='# My Workflow\nThis is a readme.')
     )
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['readme'] == '# My Workflow\nThis is a readme.'
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_definition_repository_details():
+async def test_get_workflow_response_definition_repository_details(ctx, omics_client_factory):
     """Test get_workflow includes definitionRepositoryDetails in result when present.
 
     Validates: Requirement GetWorkflow Additional Response Fields
@@ -4751,17 +3926,11 @@ async def test_get_workflow_response_definition_repository_details():
         'providerEndpoint': 'https://github.com',
     }
 
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(
-        definitionRepositoryDetails=repo_details
+    omics_client_factory(
+        get_workflow=_make_get_workflow_base_response(definitionRepositoryDetails=repo_details)
     )
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['definitionRepositoryDetails'] == repo_details
     assert result['definitionRepositoryDetails']['connectionArn'] == repo_details['connectionArn']
@@ -4772,23 +3941,16 @@ async def test_get_workflow_response_definition_repository_details():
     }
 
 
-@pytest.mark.asyncio
-async def test_get_workflow_response_readme_path():
+async def test_get_workflow_response_readme_path(ctx, omics_client_factory):
     """Test get_workflow includes readmePath in result when present in boto3 response.
 
     Validates: Requirement GetWorkflow Additional Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.get_workflow.return_value = _make_get_workflow_base_response(
-        readmePath='docs/README.md'
+    omics_client_factory(
+        get_workflow=_make_get_workflow_base_response(readmePath='docs/README.md')
     )
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await get_workflow(ctx=mock_ctx, workflow_id='wfl-12345', export_definition=False)
+    result = await get_workflow(ctx=ctx, workflow_id='wfl-12345', export_definition=False)
 
     assert result['readmePath'] == 'docs/README.md'
 
@@ -4805,182 +3967,154 @@ async def test_get_workflow_response_readme_path():
 # --- engine parameter tests ---
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_engine_wdl():
+async def test_create_workflow_version_engine_wdl(ctx, omics_client_factory):
     """Test create_workflow_version forwards WDL engine to boto3.
 
     Validates: Requirement CreateWorkflowVersion Engine Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            engine='WDL',
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        engine='WDL',
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert call_kwargs['engine'] == 'WDL'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_engine_nextflow():
+async def test_create_workflow_version_engine_nextflow(ctx, omics_client_factory):
     """Test create_workflow_version forwards NEXTFLOW engine to boto3.
 
     Validates: Requirement CreateWorkflowVersion Engine Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            engine='NEXTFLOW',
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        engine='NEXTFLOW',
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert call_kwargs['engine'] == 'NEXTFLOW'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_engine_cwl():
+async def test_create_workflow_version_engine_cwl(ctx, omics_client_factory):
     """Test create_workflow_version forwards CWL engine to boto3.
 
     Validates: Requirement CreateWorkflowVersion Engine Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            engine='CWL',
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        engine='CWL',
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert call_kwargs['engine'] == 'CWL'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_engine_wdl_lenient():
+async def test_create_workflow_version_engine_wdl_lenient(ctx, omics_client_factory):
     """Test create_workflow_version forwards WDL_LENIENT engine to boto3.
 
     Validates: Requirement CreateWorkflowVersion Engine Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            engine='WDL_LENIENT',
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        engine='WDL_LENIENT',
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert call_kwargs['engine'] == 'WDL_LENIENT'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_engine_omitted_when_not_provided():
+async def test_create_workflow_version_engine_omitted_when_not_provided(ctx, omics_client_factory):
     """Test create_workflow_version omits engine from API call when not provided.
 
     Validates: Requirement CreateWorkflowVersion Engine Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert 'engine' not in call_kwargs
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_invalid_engine_error():
+async def test_create_workflow_version_invalid_engine_error(ctx):
     """Test create_workflow_version returns error for invalid engine value.
 
     Validates: Requirement CreateWorkflowVersion Engine Parameter
     """
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2',
         definition_zip_base64=definition_zip_base64,
@@ -4995,118 +4129,100 @@ async def test_create_workflow_version_invalid_engine_error():
 # --- tags parameter tests ---
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_tags_dict_forwarded():
+async def test_create_workflow_version_tags_dict_forwarded(ctx, omics_client_factory):
     """Test create_workflow_version forwards dict tags to boto3.
 
     Validates: Requirement CreateWorkflowVersion Tags Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
     tags = {'project': 'genomics', 'team': 'research'}
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            tags=tags,
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        tags=tags,
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert call_kwargs['tags'] == {'project': 'genomics', 'team': 'research'}
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_tags_json_string_forwarded():
+async def test_create_workflow_version_tags_json_string_forwarded(ctx, omics_client_factory):
     """Test create_workflow_version parses and forwards JSON string tags to boto3.
 
     Validates: Requirement CreateWorkflowVersion Tags Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
     tags_json = json.dumps({'project': 'genomics', 'team': 'research'})
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            tags=tags_json,
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        tags=tags_json,
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert call_kwargs['tags'] == {'project': 'genomics', 'team': 'research'}
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_tags_omitted_when_not_provided():
+async def test_create_workflow_version_tags_omitted_when_not_provided(ctx, omics_client_factory):
     """Test create_workflow_version omits tags from API call when not provided.
 
     Validates: Requirement CreateWorkflowVersion Tags Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert 'tags' not in call_kwargs
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_invalid_tags_error():
+async def test_create_workflow_version_invalid_tags_error(ctx):
     """Test create_workflow_version returns error for invalid tags JSON string.
 
     Validates: Requirement CreateWorkflowVersion Tags Parameter
     """
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2',
         definition_zip_base64=definition_zip_base64,
@@ -5121,83 +4237,72 @@ async def test_create_workflow_version_invalid_tags_error():
 # --- accelerators parameter tests ---
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_gpu_accelerator_forwarded():
+async def test_create_workflow_version_gpu_accelerator_forwarded(ctx, omics_client_factory):
     """Test create_workflow_version forwards GPU accelerator to boto3.
 
     Validates: Requirement CreateWorkflowVersion Accelerators Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            accelerators='GPU',
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        accelerators='GPU',
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert call_kwargs['accelerators'] == 'GPU'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_accelerator_omitted_when_not_provided():
+async def test_create_workflow_version_accelerator_omitted_when_not_provided(
+    ctx, omics_client_factory
+):
     """Test create_workflow_version omits accelerators from API call when not provided.
 
     Validates: Requirement CreateWorkflowVersion Accelerators Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert 'accelerators' not in call_kwargs
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_invalid_accelerator_error():
+async def test_create_workflow_version_invalid_accelerator_error(ctx):
     """Test create_workflow_version returns error for invalid accelerator value.
 
     Validates: Requirement CreateWorkflowVersion Accelerators Parameter
     """
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2',
         definition_zip_base64=definition_zip_base64,
@@ -5212,136 +4317,118 @@ async def test_create_workflow_version_invalid_accelerator_error():
 # --- workflow_bucket_owner_id parameter tests ---
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_bucket_owner_id_forwarded():
+async def test_create_workflow_version_bucket_owner_id_forwarded(ctx, omics_client_factory):
     """Test create_workflow_version forwards workflow_bucket_owner_id to boto3.
 
     Validates: Requirement CreateWorkflowVersion Workflow Bucket Owner ID Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-            workflow_bucket_owner_id='123456789012',
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+        workflow_bucket_owner_id='123456789012',
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert call_kwargs['workflowBucketOwnerId'] == '123456789012'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_bucket_owner_id_omitted_when_not_provided():
+async def test_create_workflow_version_bucket_owner_id_omitted_when_not_provided(
+    ctx, omics_client_factory
+):
     """Test create_workflow_version omits workflowBucketOwnerId from API call when not provided.
 
     Validates: Requirement CreateWorkflowVersion Workflow Bucket Owner ID Parameter
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    client = omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-        )
+    await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+    )
 
-    call_kwargs = mock_client.create_workflow_version.call_args.kwargs
+    call_kwargs = client.create_workflow_version.calls[-1]
     assert 'workflowBucketOwnerId' not in call_kwargs
 
 
 # --- response fields tests ---
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_response_tags_and_uuid():
+async def test_create_workflow_version_response_tags_and_uuid(ctx, omics_client_factory):
     """Test create_workflow_version includes tags and uuid in response when present.
 
     Validates: Requirement CreateWorkflowVersion Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-        'name': 'test-workflow',
-        'tags': {'project': 'genomics'},
-        'uuid': 'abc-def-123-456',
-    }
+    omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+            'name': 'test-workflow',
+            'tags': {'project': 'genomics'},
+            'uuid': 'abc-def-123-456',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+    )
 
     assert result['tags'] == {'project': 'genomics'}
     assert result['uuid'] == 'abc-def-123-456'
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_response_tags_and_uuid_absent():
+async def test_create_workflow_version_response_tags_and_uuid_absent(ctx, omics_client_factory):
     """Test create_workflow_version result has None for tags and uuid when not in response.
 
     Validates: Requirement CreateWorkflowVersion Response Fields
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.create_workflow_version.return_value = {
-        'id': 'wfl-12345',
-        'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/wfl-12345',
-        'status': 'ACTIVE',
-    }
+    omics_client_factory(
+        create_workflow_version={
+            'id': 'wfl-12345',
+            'arn': WORKFLOW_ARN,
+            'status': 'ACTIVE',
+        }
+    )
 
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await create_workflow_version(
-            mock_ctx,
-            workflow_id='wfl-12345',
-            version_name='v2',
-            definition_zip_base64=definition_zip_base64,
-            storage_type='DYNAMIC',
-        )
+    result = await create_workflow_version(
+        ctx,
+        workflow_id='wfl-12345',
+        version_name='v2',
+        definition_zip_base64=definition_zip_base64,
+        storage_type='DYNAMIC',
+    )
 
     assert result.get('tags') is None
     assert result.get('uuid') is None
@@ -5350,18 +4437,15 @@ async def test_create_workflow_version_response_tags_and_uuid_absent():
 # --- invalid storage_type error test ---
 
 
-@pytest.mark.asyncio
-async def test_create_workflow_version_invalid_storage_type_error():
+async def test_create_workflow_version_invalid_storage_type_error(ctx):
     """Test create_workflow_version returns error for invalid storage_type value.
 
     Validates: Requirement CreateWorkflowVersion Engine Parameter
     """
-    mock_ctx = AsyncMock()
-
     definition_zip_base64 = base64.b64encode(b'test workflow content v2').decode('utf-8')
 
     result = await create_workflow_version(
-        mock_ctx,
+        ctx,
         workflow_id='wfl-12345',
         version_name='v2',
         definition_zip_base64=definition_zip_base64,
@@ -5372,53 +4456,48 @@ async def test_create_workflow_version_invalid_storage_type_error():
     assert 'Error creating workflow version' in result['error']
 
 
-@pytest.mark.asyncio
-async def test_list_workflow_versions_description_field():
+async def test_list_workflow_versions_description_field(ctx, omics_client_factory):
     """Test description appears in version entries when present in boto3 response.
 
     Validates: Requirement ListWorkflowVersions Description Response Field
     """
-    mock_ctx = AsyncMock()
-    mock_client = MagicMock()
-    mock_client.list_workflow_versions.return_value = {
-        'items': [
-            {
-                'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/abc123/1.0',
-                'id': 'abc123',
-                'status': 'ACTIVE',
-                'type': 'WDL',
-                'name': 'Test Workflow',
-                'versionName': '1.0',
-                'description': 'First version of the workflow',
-                'creationTime': '2023-01-01T00:00:00Z',
-            },
-            {
-                'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/abc123/2.0',
-                'id': 'abc123',
-                'status': 'ACTIVE',
-                'type': 'WDL',
-                'name': 'Test Workflow',
-                'versionName': '2.0',
-                'description': 'Updated version with improvements',
-                'creationTime': '2023-02-01T00:00:00Z',
-            },
-            {
-                'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/abc123/3.0',
-                'id': 'abc123',
-                'status': 'ACTIVE',
-                'type': 'WDL',
-                'name': 'Test Workflow',
-                'versionName': '3.0',
-                'creationTime': '2023-03-01T00:00:00Z',
-            },
-        ],
-    }
+    omics_client_factory(
+        list_workflow_versions={
+            'items': [
+                {
+                    'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/abc123/1.0',
+                    'id': 'abc123',
+                    'status': 'ACTIVE',
+                    'type': 'WDL',
+                    'name': 'Test Workflow',
+                    'versionName': '1.0',
+                    'description': 'First version of the workflow',
+                    'creationTime': VERSION_1_CREATION_ISO,
+                },
+                {
+                    'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/abc123/2.0',
+                    'id': 'abc123',
+                    'status': 'ACTIVE',
+                    'type': 'WDL',
+                    'name': 'Test Workflow',
+                    'versionName': '2.0',
+                    'description': 'Updated version with improvements',
+                    'creationTime': VERSION_2_CREATION_ISO,
+                },
+                {
+                    'arn': 'arn:aws:omics:us-east-1:123456789012:workflow/abc123/3.0',
+                    'id': 'abc123',
+                    'status': 'ACTIVE',
+                    'type': 'WDL',
+                    'name': 'Test Workflow',
+                    'versionName': '3.0',
+                    'creationTime': '2023-03-01T00:00:00Z',
+                },
+            ],
+        }
+    )
 
-    with patch(
-        'awslabs.aws_healthomics_mcp_server.tools.workflow_management.get_omics_client',
-        return_value=mock_client,
-    ):
-        result = await list_workflow_versions(mock_ctx, workflow_id='abc123', max_results=10)
+    result = await list_workflow_versions(ctx, workflow_id='abc123', max_results=10)
 
     assert 'versions' in result
     assert len(result['versions']) == 3